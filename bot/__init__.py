@@ -12,6 +12,7 @@ from .monitor import ProductMonitor
 from .cart import CartManager
 from .checkout import CheckoutManager
 from .store_monitor import StoreMonitor
+from .multi_monitor import MultiProductMonitor
 
-__all__ = ['ProductMonitor', 'CartManager', 'CheckoutManager', 'StoreMonitor']
+__all__ = ['ProductMonitor', 'CartManager', 'CheckoutManager', 'StoreMonitor', 'MultiProductMonitor']
 
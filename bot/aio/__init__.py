@@ -0,0 +1,24 @@
+"""
+Lazada Sniper Bot - asyncio
+===========================
+
+playwright.async_api versions of the bot components. Each class subclasses
+its sync counterpart and keeps the same public surface, with awaitable
+browser methods.
+"""
+
+from .monitor import AsyncProductMonitor
+from .cart import AsyncCartManager
+from .checkout import AsyncCheckoutManager
+from .store_monitor import AsyncStoreMonitor
+from .network_detector import AsyncNetworkStockDetector
+from .catalog_capture import AsyncCatalogCapture
+from .reload_scheduler import AsyncReloadScheduler
+from .resource_blocker import AsyncResourceBlocker
+from .runner import run
+
+__all__ = [
+    'AsyncProductMonitor', 'AsyncCartManager', 'AsyncCheckoutManager',
+    'AsyncStoreMonitor', 'AsyncNetworkStockDetector', 'AsyncCatalogCapture',
+    'AsyncReloadScheduler', 'AsyncResourceBlocker', 'run'
+]
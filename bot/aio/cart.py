@@ -0,0 +1,339 @@
+"""
+Async Cart Manager
+==================
+
+CartManager for playwright.async_api pages. Same public surface, awaited.
+"""
+
+import asyncio
+import time
+from typing import Optional, List
+from playwright.async_api import Page
+
+from ..cart import (
+    CartManager, CART_ITEM_FIELDS, MODAL_WAIT, CLICK_TIMEOUT, ADD_TO_CART_DEADLINE, ADD_TO_CART_ATTEMPTS,
+    CLICK_CONFIRM_WAIT
+)
+from ..extractor import extract_items_async
+from ..retry import ElementNotFound, classify_error
+from ..selector_engine import SelectorEngine
+from ..selector_registry import get_selectors, family_locator
+from ..utils import (
+    log_success, log_error, log_info, log_warning,
+    save_screenshot_async, get_timestamp
+)
+
+
+class AsyncCartManager(CartManager):
+    """
+    Manages cart operations for the sniper bot (asyncio).
+    
+    Usage:
+        cart = AsyncCartManager(page)
+        success = await cart.add_to_cart_fast()
+        await cart.go_to_cart()
+    """
+    
+    def __init__(
+        self,
+        page: Page,
+        selector_engine: Optional[SelectorEngine] = None,
+        modal_wait: float = MODAL_WAIT
+    ):
+        """
+        Initialize async cart manager.
+        
+        Args:
+            page: Async Playwright page object
+            selector_engine: Learns selector order (None = shared engine)
+            modal_wait: Seconds to wait for the cart modal after clicking
+        """
+        super().__init__(page, selector_engine=selector_engine, modal_wait=modal_wait)
+    
+    async def find_add_to_cart_button(self):
+        """
+        Find the Add to Cart button.
+        
+        Returns:
+            Locator: The button locator if found, None otherwise
+        """
+        return await self.selector_engine.find_async(self.page, 'add_to_cart', self.add_to_cart_selectors)
+    
+    async def find_buy_now_button(self):
+        """
+        Find the Buy Now button.
+        
+        Returns:
+            Locator: The button locator if found, None otherwise
+        """
+        return await self.selector_engine.find_async(self.page, 'buy_now', self.buy_now_selectors)
+    
+    async def _click_add_to_cart(self, use_buy_now: bool = False, timeout: float = CLICK_TIMEOUT) -> bool:
+        """
+        One add-to-cart attempt: find the button and click it.
+        
+        Args:
+            use_buy_now: If True, click Buy Now instead of Add to Cart
+            timeout: Seconds the click may take
+        
+        Returns:
+            bool: True once clicked
+        
+        Raises:
+            ElementNotFound: The button is not on the page
+            playwright Error: The click failed or timed out
+        """
+        if use_buy_now:
+            button = await self.find_buy_now_button()
+            button_type = "Buy Now"
+        else:
+            button = await self.find_add_to_cart_button()
+            button_type = "Add to Cart"
+        
+        if not button:
+            raise ElementNotFound(f"{button_type} button not found")
+        
+        await button.click(force=True, timeout=timeout * 1000)
+        
+        elapsed = self.timer.elapsed()
+        log_success(f"[{get_timestamp()}] Clicked {button_type} in {elapsed*1000:.0f}ms!")
+        
+        await self._handle_cart_modal()
+        
+        return True
+    
+    async def add_to_cart_fast(self, use_buy_now: bool = False) -> bool:
+        """
+        Add product to cart as fast as possible.
+        
+        Args:
+            use_buy_now: If True, click Buy Now instead of Add to Cart
+        
+        Returns:
+            bool: True if successful
+        """
+        self.timer.start()
+        log_info(f"[{get_timestamp()}] Attempting to add to cart...")
+        
+        try:
+            return await self._click_add_to_cart(use_buy_now)
+        except Exception as e:
+            log_error(f"Failed to add to cart: {e}")
+            await save_screenshot_async(self.page, f"cart_error_{int(time.time())}.png")
+            return False
+    
+    async def _handle_cart_modal(self):
+        """Handle cart confirmation modals/popups"""
+        try:
+            await asyncio.sleep(self.modal_wait)
+            
+            close_btn = await self.selector_engine.find_async(
+                self.page, 'cart_modal_close', get_selectors('cart_modal_close')
+            )
+            if close_btn:
+                await close_btn.click(timeout=1000)
+                log_info("Closed cart modal")
+        
+        except:
+            pass  # No modal or already closed
+    
+    async def _cart_count(self) -> Optional[int]:
+        """Items on the header cart badge, None if there is no readable badge"""
+        try:
+            badge = family_locator(self.page, 'cart_count').first
+            if await badge.count() > 0:
+                return int((await badge.inner_text()).strip())
+        except Exception:
+            pass
+        return None
+    
+    async def _click_registered(self, count_before: Optional[int], url_before: str, wait: float) -> bool:
+        """Check whether a click that timed out added the item anyway (see CartManager)"""
+        end = time.perf_counter() + wait
+        while True:
+            try:
+                if self.page.url != url_before:
+                    return True
+                if await family_locator(self.page, 'cart_success', self.success_indicators).count() > 0:
+                    return True
+            except Exception:
+                pass
+            count = await self._cart_count()
+            if count is not None and count > (count_before or 0):
+                return True
+            if time.perf_counter() >= end:
+                return False
+            await asyncio.sleep(0.05)
+    
+    async def _added_after_timeout(self) -> bool:
+        """Log a timed-out click that added the item, close its modal, return True"""
+        log_success(f"[{get_timestamp()}] Click timed out but the item was added - not clicking again")
+        await self._handle_cart_modal()
+        return True
+    
+    async def add_to_cart_with_retry(
+        self,
+        use_buy_now: bool = False,
+        max_attempts: int = ADD_TO_CART_ATTEMPTS,
+        deadline: float = ADD_TO_CART_DEADLINE
+    ) -> bool:
+        """
+        Add to cart, retrying within a deadline (see bot/retry.py).
+        An attempt still running at the deadline is cancelled. A click that
+        timed out is only repeated when it provably added nothing.
+        
+        Args:
+            use_buy_now: If True, use Buy Now instead
+            max_attempts: Attempts in total
+            deadline: Seconds after which no new attempt starts
+        
+        Returns:
+            bool: True if successful
+        """
+        self.timer.start()
+        log_info(f"[{get_timestamp()}] Attempting to add to cart...")
+        
+        engine = self._retry_engine(max_attempts, deadline)
+        count_before, url_before = await self._cart_count(), self.page.url
+        
+        async def attempt():
+            try:
+                return await self._click_add_to_cart(
+                    use_buy_now, timeout=min(CLICK_TIMEOUT, max(engine.remaining(), 0.001))
+                )
+            except Exception as e:
+                # Only retry a timed-out click if it provably added nothing
+                wait = min(CLICK_CONFIRM_WAIT, engine.remaining())
+                if classify_error(e) == 'timeout' and await self._click_registered(count_before, url_before, wait):
+                    return await self._added_after_timeout()
+                raise
+        
+        try:
+            return await engine.run_async(attempt)
+        except Exception as e:
+            # An attempt cancelled at the deadline had no time left to check
+            if classify_error(e) == 'timeout' and await self._click_registered(count_before, url_before, CLICK_CONFIRM_WAIT):
+                return await self._added_after_timeout()
+            stats = engine.stats()
+            log_error(f"Failed to add to cart after {stats['attempts']} attempt(s) "
+                      f"({stats['gave_up']}): {e}")
+            await save_screenshot_async(self.page, f"cart_error_{int(time.time())}.png")
+            return False
+    
+    async def verify_in_cart(self) -> bool:
+        """
+        Verify that item was successfully added to cart.
+        
+        Returns:
+            bool: True if item is in cart
+        """
+        try:
+            cart_count = family_locator(self.page, 'cart_count').first
+            if await cart_count.count() > 0:
+                count_text = await cart_count.inner_text()
+                if count_text and int(count_text) > 0:
+                    log_success(f"Cart contains {count_text} item(s)")
+                    return True
+            
+            if await family_locator(self.page, 'cart_success', self.success_indicators).count() > 0:
+                log_success("Found success indicator")
+                return True
+            
+            return await self._check_cart_page()
+        
+        except Exception as e:
+            log_warning(f"Error verifying cart: {e}")
+            return False
+    
+    async def _check_cart_page(self) -> bool:
+        """Check cart by navigating to cart page"""
+        try:
+            await self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
+            
+            if await family_locator(self.page, 'cart_empty').count() > 0:
+                log_warning("Cart is empty")
+                return False
+            
+            log_success("Items found in cart")
+            return True
+        
+        except Exception as e:
+            log_error(f"Error checking cart page: {e}")
+            return False
+    
+    async def go_to_cart(self) -> bool:
+        """
+        Navigate to cart page.
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            log_info("Navigating to cart...")
+            
+            try:
+                cart_icon = family_locator(self.page, 'cart_icon').first
+                if await cart_icon.count() > 0:
+                    await cart_icon.click()
+                    await self.page.wait_for_load_state("domcontentloaded")
+                    log_success("Navigated to cart via icon")
+                    return True
+            except:
+                pass
+            
+            await self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
+            log_success("Navigated to cart via URL")
+            return True
+        
+        except Exception as e:
+            log_error(f"Failed to navigate to cart: {e}")
+            return False
+    
+    async def get_cart_items(self, budget: float = 2.0) -> List[dict]:
+        """
+        Get list of items currently in cart (one evaluation, time-budgeted).
+        
+        Args:
+            budget: Maximum seconds to wait for cart rows to render
+        
+        Returns:
+            List[dict]: List of cart items with details
+        """
+        ordered = self.selector_engine.order('cart_item', get_selectors('cart_item'))
+        items, selector = await extract_items_async(self.page, ordered, CART_ITEM_FIELDS, budget=budget)
+        
+        if selector:
+            self.selector_engine.record_winner('cart_item', ordered, selector)
+        log_info(f"Found {len(items)} item(s) in cart")
+        return items
+    
+    async def clear_cart(self) -> bool:
+        """
+        Clear all items from cart.
+        WARNING: This will remove ALL items!
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            log_warning("Clearing cart...")
+            
+            await self.go_to_cart()
+            
+            for selector in get_selectors('cart_delete'):
+                try:
+                    for button in await self.page.locator(selector).all():
+                        try:
+                            await button.click()
+                            await asyncio.sleep(0.5)
+                        except:
+                            pass
+                except:
+                    continue
+            
+            log_success("Cart cleared")
+            return True
+        
+        except Exception as e:
+            log_error(f"Failed to clear cart: {e}")
+            return False
@@ -0,0 +1,77 @@
+"""
+Async Store Catalog Capture
+===========================
+
+CatalogCapture for playwright.async_api pages. URL filtering and payload
+parsing are inherited; body reads and waits are awaited.
+"""
+
+import time
+from typing import AsyncIterator, List
+from playwright.async_api import Response, TimeoutError as PlaywrightTimeout
+
+from ..catalog_capture import CatalogCapture
+from ..utils import log_warning
+
+
+class AsyncCatalogCapture(CatalogCapture):
+    """
+    Collects store products from async page responses.
+    
+    Usage:
+        capture = AsyncCatalogCapture(page)
+        capture.attach()
+        await page.reload(wait_until="commit")
+        async for batch in capture.batches(max_wait=10):
+            ...
+    """
+    
+    async def handle_response(self, response: Response) -> List[dict]:
+        """
+        Parse one response.
+        
+        Returns:
+            List of products it carried (empty if none)
+        """
+        if not self._is_json(response):
+            return []
+        try:
+            text = await response.text()
+        except Exception:
+            return []  # Body gone (navigation) or not readable
+        return self.apply_body(text, response.url)
+    
+    async def batches(self, max_wait: float = 10.0, settle: float = 0.3) -> AsyncIterator[List[dict]]:
+        """
+        Yield products response by response as they land.
+        
+        Args:
+            max_wait: Maximum seconds to wait for the first response
+            settle: Quiet period that ends the capture after the first one
+        
+        Yields:
+            List of products from one response
+        """
+        self.attach()
+        deadline = time.perf_counter() + max_wait
+        
+        while True:
+            while self._pending:
+                products = await self.handle_response(self._pending.pop(0))
+                if products:
+                    deadline = time.perf_counter() + settle
+                    yield products
+            
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            
+            try:
+                await self.page.wait_for_event(
+                    "response", predicate=self.matches, timeout=max(remaining, 0.001) * 1000
+                )
+            except PlaywrightTimeout:
+                pass  # Deadline check above ends the capture
+            except Exception as e:
+                log_warning(f"Catalog wait interrupted: {e}")
+                return
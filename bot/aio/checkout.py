@@ -0,0 +1,256 @@
+"""
+Async Checkout Manager
+======================
+
+CheckoutManager for playwright.async_api pages. Same public surface, awaited.
+
+⚠️  WARNING: This automates the purchase process!
+Only use with AUTO_PURCHASE=True if you're absolutely sure!
+"""
+
+import asyncio
+import time
+from typing import Dict
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from ..checkout import CheckoutManager
+from ..selector_registry import get_selectors, family_locator
+from ..utils import (
+    log_success, log_error, log_info, log_warning,
+    save_screenshot_async, get_timestamp
+)
+
+
+class AsyncCheckoutManager(CheckoutManager):
+    """
+    Manages checkout and purchase process (asyncio).
+    
+    Usage:
+        checkout = AsyncCheckoutManager(page, auto_purchase=False)
+        await checkout.proceed_to_checkout()
+        await checkout.complete_purchase()  # Only if auto_purchase=True
+    """
+    
+    async def proceed_to_checkout(self) -> bool:
+        """
+        Navigate from cart to checkout page.
+        
+        Returns:
+            bool: True if successful
+        """
+        self.timer.start()
+        log_info(f"[{get_timestamp()}] Proceeding to checkout...")
+        
+        try:
+            if '/cart' not in self.page.url:
+                await self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
+            
+            checkout_button = await self.selector_engine.find_async(
+                self.page, 'checkout', self.checkout_selectors
+            )
+            
+            if not checkout_button:
+                log_error("Checkout button not found!")
+                await save_screenshot_async(self.page, f"checkout_error_{int(time.time())}.png")
+                return False
+            
+            await checkout_button.click(force=True)
+            await self.page.wait_for_load_state("domcontentloaded")
+            
+            elapsed = self.timer.elapsed()
+            log_success(f"[{get_timestamp()}] Reached checkout page in {elapsed*1000:.0f}ms!")
+            
+            return True
+        
+        except Exception as e:
+            log_error(f"Failed to proceed to checkout: {e}")
+            await save_screenshot_async(self.page, f"checkout_error_{int(time.time())}.png")
+            return False
+    
+    async def verify_shipping_address(self) -> bool:
+        """
+        Verify that shipping address is set.
+        
+        Returns:
+            bool: True if address is set
+        """
+        try:
+            if await family_locator(self.page, 'shipping_address').count() > 0:
+                log_success("Shipping address found")
+                return True
+            
+            log_warning("No shipping address found - may need to set one")
+            return False
+        
+        except Exception as e:
+            log_warning(f"Error verifying address: {e}")
+            return False
+    
+    async def select_payment_method(self, method: str = 'cod') -> bool:
+        """
+        Select payment method.
+        
+        Args:
+            method: Payment method ('cod', 'credit_card', 'online_banking')
+        
+        Returns:
+            bool: True if successful
+        """
+        try:
+            log_info(f"Selecting payment method: {method}")
+            
+            if method not in self.payment_selectors:
+                log_warning(f"Unknown payment method: {method}, using COD")
+                method = 'cod'
+            
+            payment_option = self.page.locator(self.payment_selectors[method]).first
+            
+            if await payment_option.count() > 0:
+                await payment_option.click()
+                log_success(f"Selected {method}")
+                return True
+            else:
+                log_warning(f"Payment method {method} not found")
+                return False
+        
+        except Exception as e:
+            log_error(f"Failed to select payment method: {e}")
+            return False
+    
+    async def get_order_summary(self) -> Dict:
+        """
+        Extract order summary information.
+        
+        Returns:
+            dict: Order details (subtotal, shipping, total)
+        """
+        summary = {
+            'subtotal': None,
+            'shipping': None,
+            'discount': None,
+            'total': None,
+            'items': []
+        }
+        
+        try:
+            total_elem = await self.selector_engine.find_async(
+                self.page, 'order_total', get_selectors('order_total')
+            )
+            if total_elem:
+                summary['total'] = await total_elem.inner_text()
+            
+            if summary['total']:
+                log_info(f"Order total: {summary['total']}")
+        
+        except Exception as e:
+            log_warning(f"Error getting order summary: {e}")
+        
+        return summary
+    
+    async def _wait_for_confirmation(self) -> bool:
+        """True once a success indicator is on the page, False after the budget"""
+        try:
+            await family_locator(self.page, 'order_success').first.wait_for(
+                state="attached", timeout=self.confirmation_budget() * 1000
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    async def complete_purchase(self) -> bool:
+        """
+        Complete the purchase by clicking Place Order.
+        
+        ⚠️  WARNING: This will actually place an order!
+        Only runs if auto_purchase=True
+        
+        Returns:
+            bool: True if successful
+        """
+        if not self.auto_purchase:
+            log_warning("⚠️  AUTO_PURCHASE is disabled. Not placing order.")
+            log_info("💡 Set auto_purchase=True to enable automatic purchase")
+            log_info("📋 Order is ready - you can complete manually!")
+            return False
+        
+        log_warning("⚠️  ATTEMPTING TO PLACE ORDER!")
+        log_warning("⚠️  This will complete a real purchase!")
+        
+        # Safety pause
+        log_info("⏸️  5 second safety pause... (Ctrl+C to abort)")
+        await asyncio.sleep(5)
+        
+        try:
+            summary = await self.get_order_summary()
+            if summary['total']:
+                log_warning(f"💰 ORDER TOTAL: {summary['total']}")
+            
+            place_order_button = await self.selector_engine.find_async(
+                self.page, 'place_order', self.place_order_selectors
+            )
+            
+            if not place_order_button:
+                log_error("Place Order button not found!")
+                await save_screenshot_async(self.page, f"place_order_error_{int(time.time())}.png")
+                return False
+            
+            log_warning("🛒 Clicking Place Order...")
+            await place_order_button.click(force=True)
+            
+            # Wait for confirmation (returns as soon as it shows)
+            if await self._wait_for_confirmation():
+                log_success("✅ ORDER PLACED SUCCESSFULLY!")
+                await save_screenshot_async(self.page, f"order_success_{int(time.time())}.png")
+                return True
+            
+            log_warning("Order submitted but confirmation unclear")
+            await save_screenshot_async(self.page, f"order_status_{int(time.time())}.png")
+            return True
+        
+        except Exception as e:
+            log_error(f"Failed to place order: {e}")
+            await save_screenshot_async(self.page, f"place_order_error_{int(time.time())}.png")
+            return False
+    
+    async def handle_otp(self, timeout: float = 60) -> bool:
+        """
+        Handle OTP/2FA verification.
+        This requires manual user input.
+        
+        Args:
+            timeout: Seconds to wait for OTP
+        
+        Returns:
+            bool: True if OTP handled successfully
+        """
+        log_warning("⚠️  OTP/2FA required!")
+        log_info(f"Please enter OTP in the browser (waiting {timeout}s)")
+        
+        try:
+            start = time.time()
+            while time.time() - start < timeout:
+                if 'otp' not in self.page.url.lower():
+                    log_success("OTP verification completed")
+                    return True
+                
+                await asyncio.sleep(1)
+            
+            log_warning("OTP timeout - verification not completed")
+            return False
+        
+        except Exception as e:
+            log_error(f"Error handling OTP: {e}")
+            return False
+    
+    async def take_confirmation_screenshot(self, filename: str = None):
+        """
+        Take screenshot of confirmation page.
+        
+        Args:
+            filename: Custom filename (optional)
+        """
+        if not filename:
+            filename = f"order_confirmation_{int(time.time())}.png"
+        
+        await save_screenshot_async(self.page, filename)
+        log_success(f"Confirmation screenshot saved: {filename}")
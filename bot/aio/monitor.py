@@ -0,0 +1,456 @@
+"""
+Async Product Monitor
+=====================
+
+ProductMonitor for playwright.async_api pages. Same public surface, but every
+browser call is awaited, so probes, reloads and other work share one event loop.
+Verdict bookkeeping and logging are pure Python and inherited unchanged.
+"""
+
+import asyncio
+import json
+import time
+from typing import Optional, Callable, List
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
+
+from ..http_probe import HttpAvailabilityProbe
+from ..deadline_scheduler import DeadlineScheduler
+from ..extractor import extract_fields_async
+from ..monitor import ProductMonitor, PROBE_SCRIPT, OBSERVER_SCRIPT
+from ..selector_engine import SelectorEngine
+from ..selector_registry import get_selectors
+from ..utils import (
+    log_success, log_error, log_info, log_warning, Timer
+)
+from .network_detector import AsyncNetworkStockDetector
+from .reload_scheduler import AsyncReloadScheduler
+
+
+class AsyncProductMonitor(ProductMonitor):
+    """
+    Monitors a product page for availability (asyncio).
+    
+    Usage:
+        monitor = AsyncProductMonitor(page, check_interval=0.05)
+        is_available = await monitor.wait_for_availability(max_wait=300)
+    """
+    
+    def __init__(
+        self,
+        page: Page,
+        check_interval: float = 0.1,
+        probe_mode: str = 'evaluate',
+        detection_mode: str = 'poll',
+        reload_interval: Optional[float] = None,
+        selector_engine: Optional[SelectorEngine] = None
+    ):
+        """
+        Initialize async product monitor (arguments as ProductMonitor).
+        
+        Args:
+            page: Async Playwright page object
+            check_interval: Seconds between checks
+            probe_mode: 'evaluate' or 'locator'
+            detection_mode: 'poll', 'push' or 'network'
+            reload_interval: Base seconds between page reloads (None = never)
+            selector_engine: Learns selector order (None = shared engine)
+        """
+        super().__init__(
+            page,
+            check_interval=check_interval,
+            probe_mode=probe_mode,
+            detection_mode=detection_mode,
+            selector_engine=selector_engine
+        )
+        self.reloader = AsyncReloadScheduler(page, interval=reload_interval) if reload_interval else None
+    
+    async def probe(self) -> dict:
+        """
+        Evaluate every selector family inside the page in ONE round trip.
+        
+        Returns:
+            dict: Verdict with keys 'button', 'selector', 'disabled', 'out_of_stock'
+        """
+        ordered = self._ordered_selectors()
+        self._count_call()
+        verdict = await self.page.evaluate(PROBE_SCRIPT, self._selector_families(ordered))
+        self._record_probe(ordered, verdict)
+        return verdict
+    
+    async def is_product_available(self) -> bool:
+        """
+        Check if product is currently available for purchase.
+        
+        Returns:
+            bool: True if Add to Cart or Buy Now button is clickable
+        """
+        self.last_check_calls = 0
+        
+        if self.probe_mode == 'evaluate':
+            try:
+                return self._verdict_available(await self.probe())
+            except Exception as e:
+                log_warning(f"Error checking availability: {e}")
+                return False
+        
+        return await self._is_product_available_locators()
+    
+    async def _is_product_available_locators(self) -> bool:
+        """
+        Legacy availability check: one locator query per selector.
+        
+        Returns:
+            bool: True if Add to Cart or Buy Now button is clickable
+        """
+        try:
+            ordered = self._ordered_selectors()
+            
+            for family in ('add_to_cart', 'buy_now'):
+                for selector in ordered[family]:
+                    try:
+                        button = self.page.locator(selector).first
+                        self._count_call()
+                        if await button.count() > 0:
+                            self._count_call()
+                            is_disabled = await button.get_attribute('disabled')
+                            if not is_disabled:
+                                self._record_locator_hit(family, ordered, selector)
+                                return True
+                    except:
+                        continue
+            
+            for selector in ordered['out_of_stock']:
+                try:
+                    self._count_call()
+                    if await self.page.locator(selector).count() > 0:
+                        return False
+                except:
+                    continue
+            
+            return False
+        
+        except Exception as e:
+            log_warning(f"Error checking availability: {e}")
+            return False
+    
+    async def wait_for_availability(
+        self,
+        max_wait: float = 300,
+        on_check: Optional[Callable] = None
+    ) -> bool:
+        """
+        Wait for product to become available.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Optional callback (sync or async) called on each check (polling only)
+        
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        self._log_reload_cadence()
+        self.schedule = None
+        
+        try:
+            if self.detection_mode == 'network':
+                detector = self.attach_network_detector()
+                return await detector.wait_for_stock(max_wait, reloader=self.reloader)
+            
+            if self.detection_mode == 'http':
+                return await self._wait_by_http(max_wait, on_check)
+            
+            if self.detection_mode == 'push' and await self.attach_observer():
+                return await self._wait_for_push(max_wait, on_check)
+            
+            return await self._wait_by_polling(max_wait, on_check)
+        finally:
+            if self.schedule:
+                self.schedule.log_stats()
+            if self.reloader:
+                self.reloader.log_stats()
+    
+    async def _wait_by_polling(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Poll is_product_available() on a fixed check_interval cadence.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Optional callback (sync or async) called on each check
+        
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        log_info(f"Starting product monitoring (checking every {self.check_interval}s)")
+        log_info(f"Maximum wait time: {max_wait}s")
+        
+        self.timer.start()
+        self.schedule = DeadlineScheduler(self.check_interval)
+        checks = 0
+        
+        while self.timer.elapsed() < max_wait:
+            # Yields to the event loop until the next deadline
+            tick = await self.schedule.wait_next_async()
+            checks += 1
+            
+            if self.reloader:
+                await self.reloader.maybe_reload()
+            
+            available = await self.is_product_available()
+            self.schedule.record_check(time.perf_counter() - tick)
+            if available:
+                log_success(f"Product available after {self.timer} ({checks} checks)")
+                return True
+            
+            if on_check:
+                result = on_check(checks, self.timer.elapsed())
+                if asyncio.iscoroutine(result):
+                    await result
+            
+            self._log_poll_progress(checks)
+        
+        log_error(f"Timeout after {self.timer} ({checks} checks)")
+        return False
+    
+    async def attach_observer(self) -> bool:
+        """
+        Install the in-page MutationObserver and the Python callback binding.
+        
+        Returns:
+            bool: True if the observer is running on the current page
+        """
+        if self.observer_attached:
+            return True
+        
+        try:
+            script = OBSERVER_SCRIPT.replace(
+                '__FAMILIES__', json.dumps(self._selector_families())
+            )
+            await self.page.expose_binding('__sniperNotify', self._on_push)
+            await self.page.add_init_script(script)
+            await self.page.evaluate(script)
+            self.observer_attached = True
+            log_success("Availability observer attached")
+            return True
+        except Exception as e:
+            log_warning(f"Could not attach observer, falling back to polling: {e}")
+            return False
+    
+    def attach_network_detector(
+        self,
+        url_patterns: Optional[List[str]] = None,
+        sku_id: Optional[str] = None
+    ) -> AsyncNetworkStockDetector:
+        """
+        Start parsing the page's stock/SKU JSON responses.
+        
+        Args:
+            url_patterns: URL fragments of stock responses (None = defaults)
+            sku_id: Only trust stock entries for this SKU/item id
+        
+        Returns:
+            AsyncNetworkStockDetector: The attached detector
+        """
+        if self.network_detector is None:
+            self.network_detector = AsyncNetworkStockDetector(
+                self.page, url_patterns=url_patterns, sku_id=sku_id
+            )
+        self.network_detector.attach()
+        return self.network_detector
+    
+    async def attach_http_probe(
+        self,
+        url: Optional[str] = None,
+        sku_id: Optional[str] = None,
+        min_interval: float = 0.5
+    ) -> HttpAvailabilityProbe:
+        """
+        Create the out-of-browser HTTP probe, sharing this page's cookies.
+        
+        Args:
+            url: Product page or stock endpoint to poll (None = current page URL)
+            sku_id: Only trust stock entries for this SKU/item id
+            min_interval: Seconds between HTTP requests (politely bounded)
+        
+        Returns:
+            HttpAvailabilityProbe: The probe
+        """
+        if self.http_probe is None:
+            headers = {'Referer': self.page.url}
+            try:
+                headers['User-Agent'] = await self.page.evaluate("() => navigator.userAgent")
+            except:
+                pass
+            self.http_probe = HttpAvailabilityProbe(
+                url or self.page.url,
+                cookies=await self.page.context.cookies(),
+                headers=headers,
+                sku_id=sku_id,
+                min_interval=min_interval
+            )
+        return self.http_probe
+    
+    async def _wait_by_http(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Wait on the HTTP probe (in a worker thread), then reload once so the
+        browser can click.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Passed on to the polling used after the reload
+        
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        timer = Timer().start()
+        probe = await self.attach_http_probe()
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(None, probe.wait_for_stock, max_wait):
+            return False
+        
+        await self.refresh_page()
+        return await self._wait_by_polling(max(max_wait - timer.elapsed(), 10), on_check)
+    
+    async def _wait_for_push(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Wait until the observer reports availability.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Passed on to the polling fallback
+        
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        log_info("Waiting for availability push from page observer")
+        log_info(f"Maximum wait time: {max_wait}s")
+        
+        self.timer.start()
+        while True:
+            remaining = max_wait - self.timer.elapsed()
+            if remaining <= 0:
+                log_error(f"Timeout after {self.timer} (push mode)")
+                return False
+            
+            wait_for = self._push_wait_time(remaining)
+            
+            try:
+                await self.page.wait_for_function(
+                    "() => document.documentElement.hasAttribute('data-sniper-available')",
+                    polling='mutation',
+                    timeout=max(wait_for, 0.001) * 1000
+                )
+                break
+            except PlaywrightTimeout:
+                if self.reloader:
+                    await self.reloader.maybe_reload()
+            except Exception as e:
+                remaining = max_wait - self.timer.elapsed()
+                log_warning(f"Push wait failed ({e}), polling for remaining {remaining:.1f}s")
+                return await self._wait_by_polling(max(remaining, 0), on_check)
+        
+        self._log_push_result()
+        return True
+    
+    async def continuous_monitor(
+        self,
+        callback: Callable,
+        check_interval: Optional[float] = None
+    ):
+        """
+        Continuously monitor and call callback (sync or async) when available.
+        Runs until callback returns False or the task is cancelled.
+        
+        Args:
+            callback: Function to call when product becomes available
+            check_interval: Override default check interval
+        """
+        interval = check_interval or self.check_interval
+        log_info("Starting continuous monitoring (cancel task to stop)")
+        self.schedule = DeadlineScheduler(interval)
+        
+        try:
+            while True:
+                tick = await self.schedule.wait_next_async()
+                if self.reloader:
+                    await self.reloader.maybe_reload()
+                
+                available = await self.is_product_available()
+                self.schedule.record_check(time.perf_counter() - tick)
+                if available:
+                    should_continue = callback()
+                    if asyncio.iscoroutine(should_continue):
+                        should_continue = await should_continue
+                    if not should_continue:
+                        break
+        
+        except asyncio.CancelledError:
+            log_warning("Monitoring stopped")
+            raise
+        finally:
+            self.schedule.log_stats()
+    
+    async def refresh_page(self, wait_until: str = "domcontentloaded"):
+        """
+        Refresh the product page once.
+        
+        Args:
+            wait_until: Load state to wait for ("commit" returns earliest)
+        """
+        try:
+            log_info("Refreshing page...")
+            timer = Timer().start()
+            await self.page.reload(wait_until=wait_until)
+            log_success(f"Page refreshed in {timer}")
+        except Exception as e:
+            log_error(f"Failed to refresh page: {e}")
+    
+    async def get_product_info(self, budget: float = 2.0) -> dict:
+        """
+        Extract product information from page (one evaluation, time-budgeted).
+        
+        Args:
+            budget: Maximum seconds to wait for title/price to render
+        
+        Returns:
+            dict: Product info (title, price, availability)
+        """
+        info = self._empty_product_info()
+        
+        try:
+            info.update(await extract_fields_async(self.page, {
+                'title': get_selectors('product_title'),
+                'price': get_selectors('product_price'),
+            }, budget=budget))
+            
+            info['available'] = await self.is_product_available()
+        
+        except Exception as e:
+            log_warning(f"Error extracting product info: {e}")
+        
+        return info
+    
+    async def pre_load(self, url: str) -> dict:
+        """
+        Pre-load product page before monitoring starts.
+        
+        Args:
+            url: Product URL to load
+        
+        Returns:
+            dict: Product info read while pre-loading (see get_product_info)
+        """
+        log_info(f"Pre-loading product page...")
+        if self.detection_mode == 'network':
+            self.attach_network_detector()
+        
+        try:
+            await self.page.goto(url, wait_until="domcontentloaded")
+            log_success("Product page loaded")
+            
+            info = await self.get_product_info()
+            self._log_product_info(info)
+            return info
+        
+        except Exception as e:
+            log_error(f"Failed to load product page: {e}")
+            raise
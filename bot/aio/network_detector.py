@@ -0,0 +1,103 @@
+"""
+Async Network Stock Detector
+============================
+
+NetworkStockDetector for playwright.async_api pages. URL filtering and
+payload parsing are inherited; body reads and waits are awaited.
+"""
+
+import asyncio
+from typing import Optional
+from playwright.async_api import Response, TimeoutError as PlaywrightTimeout
+
+from ..network_detector import NetworkStockDetector
+from ..utils import log_success, log_info, log_warning, get_timestamp
+from .reload_scheduler import AsyncReloadScheduler
+
+
+class AsyncNetworkStockDetector(NetworkStockDetector):
+    """
+    Watches async page responses for stock/SKU JSON.
+    
+    Usage:
+        detector = AsyncNetworkStockDetector(page)
+        detector.attach()
+        is_available = await detector.wait_for_stock(max_wait=60)
+    """
+    
+    async def handle_response(self, response: Response) -> Optional[bool]:
+        """
+        Parse one response and update the detector state.
+        
+        Returns:
+            bool or None: Stock verdict carried by the response
+        """
+        if not self._is_json(response):
+            return None
+        try:
+            text = await response.text()
+        except Exception:
+            return None  # Body gone (navigation) or not readable
+        return self.apply_body(text, response.url)
+    
+    async def process_pending(self) -> bool:
+        """
+        Parse queued responses.
+        
+        Returns:
+            bool: True if any of them reported stock
+        """
+        found = False
+        while self._pending:
+            if await self.handle_response(self._pending.pop(0)):
+                found = True
+        return found
+    
+    async def wait_for_stock(
+        self,
+        max_wait: float = 300,
+        reloader: Optional[AsyncReloadScheduler] = None
+    ) -> bool:
+        """
+        Wait until a stock payload says the product is available.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            reloader: Optional scheduler; reloads make the page re-fetch stock
+        
+        Returns:
+            bool: True if stock was reported, False if timeout
+        """
+        self.attach()
+        self.timer.start()
+        log_info(f"Waiting for stock data in network responses (max {max_wait}s)")
+        
+        while True:
+            if await self.process_pending():
+                log_success(
+                    f"[{get_timestamp()}] Stock reported by network after {self.timer} "
+                    f"({self.source_url})"
+                )
+                return True
+            
+            remaining = max_wait - self.timer.elapsed()
+            if remaining <= 0:
+                break
+            
+            wait_for = remaining
+            if reloader:
+                wait_for = min(remaining, reloader.time_until_due())
+            
+            try:
+                await self.page.wait_for_event(
+                    "response", predicate=self.matches, timeout=max(wait_for, 0.001) * 1000
+                )
+            except PlaywrightTimeout:
+                if reloader:
+                    await reloader.maybe_reload()
+            except Exception as e:
+                log_warning(f"Network wait interrupted: {e}")
+                await asyncio.sleep(0.05)
+        
+        log_warning(f"No in-stock payload after {self.timer} ({self.payloads_parsed} stock payloads seen)")
+        return False
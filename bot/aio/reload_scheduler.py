@@ -0,0 +1,58 @@
+"""
+Async Reload Scheduler
+======================
+
+ReloadScheduler for playwright.async_api pages. Cadence, adaptation and
+statistics are inherited; only the reload itself is awaited.
+"""
+
+import time
+from typing import Optional
+
+from ..reload_scheduler import ReloadScheduler
+from ..utils import log_warning
+
+
+class AsyncReloadScheduler(ReloadScheduler):
+    """
+    Reloads an async page on a configurable, adaptive cadence.
+    
+    Usage:
+        reloader = AsyncReloadScheduler(page, interval=2.0)
+        await reloader.maybe_reload()
+    """
+    
+    async def maybe_reload(self) -> Optional[float]:
+        """
+        Reload if due.
+        
+        Returns:
+            float: Reload duration in seconds, None if no (successful) reload
+        """
+        if not self.due():
+            return None
+        return await self.reload()
+    
+    async def reload(self) -> Optional[float]:
+        """
+        Reload the page now.
+        
+        Returns:
+            float: Reload duration in seconds, None if the reload failed
+        """
+        start = time.perf_counter()
+        try:
+            await self.page.reload(wait_until=self.wait_until, timeout=self.timeout * 1000)
+        except Exception as e:
+            self.failures += 1
+            self.last_reload_at = time.perf_counter()
+            self._adapt(None)
+            log_warning(f"Reload failed ({e}), next in {self.interval:.1f}s")
+            return None
+        
+        duration = time.perf_counter() - start
+        self.reloads += 1
+        self.durations.add(duration)
+        self.last_reload_at = time.perf_counter()
+        self._adapt(duration)
+        return duration
@@ -0,0 +1,107 @@
+"""
+Async Resource Blocker
+======================
+
+ResourceBlocker for playwright.async_api pages and contexts. Profiles,
+URL rules and statistics are inherited; DevTools and routing calls are
+awaited.
+"""
+
+import asyncio
+
+from ..resource_blocker import ResourceBlocker, BLOCKABLE_RE, block_patterns
+from ..retry import classify_error
+from ..utils import log_warning
+
+
+class AsyncResourceBlocker(ResourceBlocker):
+    """
+    Blocks unneeded requests on an async page or browser context by profile.
+    
+    Usage:
+        blocker = AsyncResourceBlocker(context, profile='monitor')
+        await blocker.attach()
+        blocker.use('checkout')
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the blocker (arguments as ResourceBlocker)"""
+        self._updates = set()   # Block list updates sent by use(), still running
+        super().__init__(*args, **kwargs)
+    
+    async def attach(self) -> 'AsyncResourceBlocker':
+        """Install the block list (or the fallback route) and the request listeners"""
+        if not self.attached:
+            self.target.on("request", self._on_request)
+            self.target.on("requestfailed", self._on_request_failed)
+            self.target.on("response", self._on_response)
+            if self._is_chromium():
+                for page in self._pages():
+                    await self._open_session(page)
+                if hasattr(self.target, 'pages'):
+                    self.target.on("page", self._open_session)
+            else:
+                await self.target.route(BLOCKABLE_RE, self._handle_route)
+                self.routed = True
+            self.attached = True
+        return self
+    
+    async def detach(self):
+        """Remove the block list (or route) and the listeners"""
+        if self.attached:
+            try:
+                if self.routed:
+                    await self.target.unroute(BLOCKABLE_RE, self._handle_route)
+                for session in self.sessions:
+                    await session.send("Network.setBlockedURLs", {"urls": []})
+                    await session.detach()
+                if hasattr(self.target, 'pages') and not self.routed:
+                    self.target.remove_listener("page", self._open_session)
+                self.target.remove_listener("request", self._on_request)
+                self.target.remove_listener("requestfailed", self._on_request_failed)
+                self.target.remove_listener("response", self._on_response)
+            except Exception as e:
+                log_warning(f"Could not remove resource blocking: {e}")
+            self.sessions = []
+            self.routed = False
+            self.attached = False
+    
+    async def _open_session(self, page):
+        """Give one page the block list of the current profile"""
+        try:
+            session = await self._context().new_cdp_session(page)
+            await session.send("Network.enable")
+            await session.send("Network.setBlockedURLs", {"urls": block_patterns(self.profile)})
+            self.sessions.append(session)
+        except Exception as e:
+            if classify_error(e) != 'closed':
+                log_warning(f"Could not set the resource block list: {e}")
+    
+    def _update_sessions(self):
+        """Send the new block list in the background, so use() stays a plain call"""
+        task = asyncio.ensure_future(self._send_block_list(block_patterns(self.profile)))
+        self._updates.add(task)
+        task.add_done_callback(self._updates.discard)
+    
+    async def _send_block_list(self, patterns: list):
+        """Send a block list to every page"""
+        for session in list(self.sessions):
+            try:
+                await session.send("Network.setBlockedURLs", {"urls": patterns})
+            except Exception:
+                self.sessions.remove(session)  # Page closed
+    
+    async def _handle_route(self, route):
+        """Fallback route handler (blockable URLs only): abort or let through"""
+        try:
+            blocked = self.block_reason(route.request.url) is not None
+        except Exception:
+            blocked = False  # Never leave a request hanging on a bad decision
+        try:
+            if blocked:
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+        except Exception as e:
+            if classify_error(e) != 'closed':
+                log_warning(f"Resource blocking route failed: {e}")
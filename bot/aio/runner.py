@@ -0,0 +1,42 @@
+"""
+Async Runner
+============
+
+Runs an async entry point, on uvloop when it is installed.
+uvloop is optional: pip install uvloop (not available on Windows).
+"""
+
+import asyncio
+from typing import Awaitable
+
+from ..utils import log_info
+
+
+def uvloop_available() -> bool:
+    """Check whether uvloop can be imported"""
+    try:
+        import uvloop  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def run(main: Awaitable, use_uvloop: bool = True):
+    """
+    Run a coroutine to completion.
+    
+    Args:
+        main: Coroutine to run (e.g. sniper.run())
+        use_uvloop: Use uvloop's event loop if it is installed
+    
+    Returns:
+        Whatever the coroutine returns
+    """
+    if use_uvloop and uvloop_available():
+        import uvloop
+        log_info("Event loop: uvloop")
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return asyncio.run(main)
+    
+    log_info("Event loop: asyncio")
+    return asyncio.run(main)
@@ -0,0 +1,299 @@
+"""
+Async Store Monitor
+===================
+
+StoreMonitor for playwright.async_api pages. Same public surface, awaited.
+Keyword matching, id extraction and the scan bookkeeping (frontier, seen
+set, grid fingerprint) are pure Python and inherited unchanged.
+"""
+
+import asyncio
+from typing import List, Optional
+
+from ..store_monitor import StoreMonitor, SCROLL_SCRIPT, GRID_FINGERPRINT_SCRIPT
+from ..store_bootstrap import StoreBootstrap, MAX_CATALOG_PAGES
+from ..extractor import extract_items_async, extract_items_until_async
+from .catalog_capture import AsyncCatalogCapture
+from ..utils import log_success, log_error, log_info, log_warning
+
+
+class AsyncStoreMonitor(StoreMonitor):
+    """
+    Monitors a Lazada store page for new products (asyncio).
+    
+    Usage:
+        monitor = AsyncStoreMonitor(page, store_url, product_keywords)
+        product_url = await monitor.wait_for_product(max_wait=300)
+    """
+    
+    catalog_capture_class = AsyncCatalogCapture
+    
+    async def load_store_page(self):
+        """Load the store page"""
+        try:
+            log_info(f"Loading store page...")
+            if self.catalog:
+                self.catalog.attach()
+                await self.page.goto(self.scan_url, wait_until="commit")
+                found = 0
+                async for batch in self.catalog.batches(max_wait=self.catalog_timeout):
+                    found += len(batch)
+                if found:
+                    log_success(f"Store page loaded ({found} products from catalog responses)")
+                    return
+                log_warning("No catalog responses seen - using DOM scans")
+                await self.page.wait_for_load_state("domcontentloaded")
+            else:
+                await self.page.goto(self.scan_url, wait_until="domcontentloaded")
+            await asyncio.sleep(2)  # Wait for products to load
+            log_success("Store page loaded")
+        except Exception as e:
+            log_error(f"Failed to load store page: {e}")
+            raise
+    
+    async def get_all_products(self, budget: float = 1.0) -> List[dict]:
+        """
+        Get all products currently visible on the store page.
+        
+        Args:
+            budget: Maximum seconds to wait for cards to render
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id'
+        """
+        item_selectors = self.selector_engine.order('store_item', self.product_item_selectors)
+        rows, selector = await extract_items_async(
+            self.page, item_selectors, self._card_fields(),
+            budget=budget, required=['url', 'title']
+        )
+        return self._scanned_products(rows, item_selectors, selector, log_found=True)
+    
+    async def get_new_products(self, budget: float = 1.0) -> List[dict]:
+        """
+        Get the products listed above the first already-seen one.
+        
+        Args:
+            budget: Maximum seconds to wait for cards to render
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id', newest first
+        """
+        item_selectors = self.selector_engine.order('store_item', self.product_item_selectors)
+        rows, selector, stopped = await extract_items_until_async(
+            self.page, item_selectors, self._card_fields(), self._stop_marker(),
+            budget=budget, required=['url', 'title']
+        )
+        return self._new_since_frontier(self._scanned_products(rows, item_selectors, selector), stopped)
+    
+    async def grid_fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint the product grid in one cheap evaluation.
+        
+        Returns:
+            str: 'count:hash' of the product ids on the grid, None if no
+                 card is rendered (or the page could not be evaluated)
+        """
+        try:
+            return await self.page.evaluate(GRID_FINGERPRINT_SCRIPT, self._fingerprint_arg())
+        except Exception:
+            return None
+    
+    async def scroll_to_end(self, max_rounds: int = 100, settle: float = 1.5) -> int:
+        """
+        Scroll an infinite-scroll store page until no more cards load.
+        
+        Args:
+            max_rounds: Maximum scrolls
+            settle: Seconds to wait for more cards after each scroll
+        
+        Returns:
+            int: Product cards rendered at the end
+        """
+        css = ', '.join(self.product_item_selectors)
+        count = 0
+        for _ in range(max_rounds):
+            try:
+                count = await self.page.evaluate(SCROLL_SCRIPT, css)
+                await self.page.wait_for_function(
+                    "([css, n]) => document.querySelectorAll(css).length > n",
+                    arg=[css, count], timeout=settle * 1000
+                )
+            except Exception:
+                break  # Nothing more loaded within settle
+        return count
+    
+    async def bootstrap(self, workers: int = 4, max_pages: int = MAX_CATALOG_PAGES) -> int:
+        """
+        Mark the store's whole catalog as seen before monitoring.
+        
+        The HTTP workers run in a thread so the event loop stays free.
+        
+        Args:
+            workers: Catalog pages fetched at the same time
+            max_pages: Never fetch more pages than this
+        
+        Returns:
+            int: Products now marked as seen
+        """
+        if self.resumed:
+            log_info(f"📚 Baseline already in place ({len(self.seen_products)} products) - skipping bootstrap")
+            return len(self.seen_products)
+        log_info(f"📚 Bootstrapping store catalog ({workers} workers)...")
+        headers = {'Referer': self.scan_url}
+        try:
+            headers['User-Agent'] = await self.page.evaluate("() => navigator.userAgent")
+        except:
+            pass
+        boot = StoreBootstrap(
+            self.scan_url,
+            cookies=await self.page.context.cookies(),
+            headers=headers,
+            workers=workers
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            products = await loop.run_in_executor(None, boot.run, max_pages)
+        finally:
+            boot.close()
+        
+        if not products:
+            log_warning("No catalog JSON - scrolling the store page instead")
+            await self.load_store_page()
+            cards = await self.scroll_to_end()
+            products = await self.get_all_products()
+            log_info(f"Scrolled to {cards} cards")
+        
+        self._remember(products)
+        # The baseline replaces wait_for_product's initial scan
+        self.resumed = len(self.seen_products) > 0
+        log_success(f"Baseline: {len(self.seen_products)} products marked as seen")
+        return len(products)
+    
+    async def current_products(self) -> List[dict]:
+        """
+        Products on the store right now: captured from catalog responses in
+        network mode, otherwise a DOM scan.
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id'
+        """
+        if self.catalog and self.catalog.products:
+            return list(self.catalog.products.values())
+        return await self.get_all_products()
+    
+    async def find_matching_product(self) -> Optional[dict]:
+        """
+        Find a product that matches the keywords.
+        
+        Returns:
+            dict with product info if found, None otherwise
+        """
+        return self._match_new(await self.current_products())
+    
+    async def _check_catalog(self) -> Optional[dict]:
+        """
+        Refresh and match products from catalog responses as each one lands.
+        
+        Returns:
+            dict with product info if found, None otherwise
+        """
+        self.catalog.discard_pending()
+        try:
+            log_info(f"🔄 Refreshing store page...")
+            await self.page.reload(wait_until="commit")
+        except Exception as e:
+            log_warning(f"Refresh failed: {e}")
+            return None
+        
+        scan = self._catalog_scan()
+        product = None
+        async for batch in self.catalog.batches(max_wait=self.catalog_timeout):
+            product, done = self._take_catalog_batch(batch, scan)
+            if done:
+                break
+        
+        if scan['batches']:
+            self._finish_catalog_scan(scan)
+            return product
+        
+        log_warning("No catalog response after refresh - scanning DOM")
+        await self.page.wait_for_load_state("domcontentloaded")
+        if self.incremental:
+            return await self._check_new_cards()
+        return self._match_new(await self.get_all_products())
+    
+    async def _check_new_cards(self) -> Optional[dict]:
+        """
+        Match only the cards listed since the last scan (incremental mode).
+        
+        Returns:
+            dict with product info if found, None otherwise
+        """
+        return self._match_new(await self.get_new_products())
+    
+    async def wait_for_product(self, max_wait: float = 300, initial_scan_only: bool = False) -> Optional[str]:
+        """
+        Wait for a matching product to appear.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            initial_scan_only: If True, only scan once without monitoring
+        
+        Returns:
+            str: Product URL if found, None if timeout
+        """
+        self._log_monitoring_start(" (async)")
+        self.timer.start()
+        checks = 0
+        
+        if not initial_scan_only and not self.resumed:
+            log_info("\n📋 Initial scan - identifying existing products...")
+            self._seed_seen(await self.current_products())
+        elif self.resumed:
+            log_info(f"\n👀 {len(self.seen_products)} products already known - monitoring for NEW products...\n")
+        
+        while self.timer.elapsed() < max_wait:
+            checks += 1
+            unchanged = False
+            
+            if self.catalog and checks > 1:
+                product = await self._check_catalog()
+            else:
+                if checks > 1:  # Skip refresh on first check
+                    try:
+                        log_info(f"🔄 Refreshing store page...")
+                        await self.page.reload(wait_until="domcontentloaded")
+                        await asyncio.sleep(2)  # Wait for products to load
+                    except Exception as e:
+                        log_warning(f"Refresh failed: {e}")
+                
+                unchanged = not self.catalog and self._grid_unchanged(await self.grid_fingerprint())
+                if unchanged:
+                    product = None
+                elif self.incremental:
+                    product = await self._check_new_cards()
+                else:
+                    product = await self.find_matching_product()
+            
+            if product:
+                self._log_found(checks)
+                return product['url']
+            
+            if initial_scan_only:
+                log_warning("No matching products found in initial scan")
+                return None
+            
+            self._log_no_match(checks, unchanged)
+            await asyncio.sleep(self.check_interval)
+        
+        self._log_timeout(checks)
+        return None
+    
+    async def scan_current_products(self) -> List[dict]:
+        """
+        Just scan and return current products without monitoring.
+        
+        Returns:
+            List of matching products
+        """
+        return self._matching(await self.current_products())
@@ -12,8 +12,35 @@ from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
 from .utils import (
     log_success, log_error, log_info, log_warning, 
-    Timer, retry_on_failure, save_screenshot, get_timestamp
+    Timer, save_screenshot, get_timestamp
 )
+from .selector_engine import SelectorEngine, get_selector_engine
+from .selector_registry import get_selectors, family_locator
+from .extractor import extract_items
+from .retry import RetryEngine, ElementNotFound, classify_error
+
+
+# Seconds to let the add-to-cart modal animate in before looking for it
+MODAL_WAIT = 0.3
+
+# Longest wait for one add-to-cart click (seconds)
+CLICK_TIMEOUT = 5.0
+
+# Stop retrying add to cart this long after the first attempt (seconds)
+ADD_TO_CART_DEADLINE = 3.0
+
+# Add-to-cart attempts in total (the first retries are milliseconds apart)
+ADD_TO_CART_ATTEMPTS = 8
+
+# After a click times out, look this long for proof it added the item (seconds)
+CLICK_CONFIRM_WAIT = 1.0
+
+# Fields read from each cart row
+CART_ITEM_FIELDS = {
+    'name': get_selectors('cart_item_name'),
+    'price': get_selectors('cart_item_price'),
+    'quantity': get_selectors('cart_item_quantity'),
+}
 
 
 class CartManager:
@@ -26,78 +53,86 @@ class CartManager:
         cart.go_to_cart()
     """
     
-    def __init__(self, page: Page):
+    def __init__(
+        self,
+        page: Page,
+        selector_engine: Optional[SelectorEngine] = None,
+        modal_wait: float = MODAL_WAIT
+    ):
         """
         Initialize cart manager.
         
         Args:
             page: Playwright page object
+            selector_engine: Learns selector order (None = shared engine)
+            modal_wait: Seconds to wait for the cart modal after clicking
+                        (render-lite pages: LITE_MODAL_WAIT, no animation)
         """
         self.page = page
+        self.modal_wait = modal_wait
         self.timer = Timer()
+        self.selector_engine = selector_engine or get_selector_engine()
         
-        # Add to Cart button selectors (priority order)
-        self.add_to_cart_selectors = [
-            'button.add-to-cart-buy-now-btn',
-            'button[class*="add-to-cart"]',
-            'button:has-text("Add to Cart")',
-            'button:has-text("ADD TO CART")',
-            '.pdp-button-add-to-cart',
-            '[data-spm-anchor-id*="cart"]',
-        ]
-        
-        # Buy Now button selectors
-        self.buy_now_selectors = [
-            'button.buy-now-btn',
-            'button[class*="buy-now"]',
-            'button:has-text("Buy Now")',
-            'button:has-text("BUY NOW")',
-            '.pdp-button-buy-now',
-        ]
-        
-        # Cart-related selectors
-        self.cart_icon_selector = '.cart-icon, [class*="cart-icon"], a[href*="/cart"]'
-        self.cart_count_selector = '.cart-num, [class*="cart-num"], .cart-count'
-        
-        # Success indicators
-        self.success_indicators = [
-            'text=Added to Cart',
-            'text=Item added',
-            'text=Successfully added',
-            '.success-message',
-        ]
+        # Selectors come from the shared registry (bot/selector_registry.py)
+        self.add_to_cart_selectors = get_selectors('add_to_cart')
+        self.buy_now_selectors = get_selectors('buy_now')
+        self.success_indicators = get_selectors('cart_success')
     
     def find_add_to_cart_button(self):
         """
         Find the Add to Cart button using multiple selectors.
+        Tries the selector that worked before first.
         
         Returns:
             Locator: The button locator if found, None otherwise
         """
-        for selector in self.add_to_cart_selectors:
-            try:
-                button = self.page.locator(selector).first
-                if button.count() > 0:
-                    return button
-            except:
-                continue
-        return None
+        return self.selector_engine.find(self.page, 'add_to_cart', self.add_to_cart_selectors)
     
     def find_buy_now_button(self):
         """
         Find the Buy Now button using multiple selectors.
+        Tries the selector that worked before first.
         
         Returns:
             Locator: The button locator if found, None otherwise
         """
-        for selector in self.buy_now_selectors:
-            try:
-                button = self.page.locator(selector).first
-                if button.count() > 0:
-                    return button
-            except:
-                continue
-        return None
+        return self.selector_engine.find(self.page, 'buy_now', self.buy_now_selectors)
+    
+    def _click_add_to_cart(self, use_buy_now: bool = False, timeout: float = CLICK_TIMEOUT) -> bool:
+        """
+        One add-to-cart attempt: find the button and click it.
+        
+        Args:
+            use_buy_now: If True, click Buy Now instead of Add to Cart
+            timeout: Seconds the click may take
+        
+        Returns:
+            bool: True once clicked
+        
+        Raises:
+            ElementNotFound: The button is not on the page
+            playwright Error: The click failed or timed out
+        """
+        if use_buy_now:
+            button = self.find_buy_now_button()
+            button_type = "Buy Now"
+        else:
+            button = self.find_add_to_cart_button()
+            button_type = "Add to Cart"
+        
+        if not button:
+            raise ElementNotFound(f"{button_type} button not found")
+        
+        # Click with force=True for maximum speed
+        button.click(force=True, timeout=timeout * 1000)
+        
+        elapsed = self.timer.elapsed()
+        log_success(f"[{get_timestamp()}] Clicked {button_type} in {elapsed*1000:.0f}ms!")
+        
+        # Handle any popups/modals quickly
+        self._handle_cart_modal()
+        
+        return True
     
     def add_to_cart_fast(self, use_buy_now: bool = False) -> bool:
         """
@@ -106,7 +141,7 @@ class CartManager:
         
         Args:
             use_buy_now: If True, click Buy Now instead of Add to Cart
-            
+        
         Returns:
             bool: True if successful
         """
@@ -114,29 +149,7 @@ class CartManager:
         log_info(f"[{get_timestamp()}] Attempting to add to cart...")
         
         try:
-            if use_buy_now:
-                button = self.find_buy_now_button()
-                button_type = "Buy Now"
-            else:
-                button = self.find_add_to_cart_button()
-                button_type = "Add to Cart"
-            
-            if not button:
-                log_error(f"{button_type} button not found!")
-                save_screenshot(self.page, f"cart_error_{int(time.time())}.png")
-                return False
-            
-            # Click with force=True for maximum speed
-            button.click(force=True, timeout=5000)
-            
-            elapsed = self.timer.elapsed()
-            log_success(f"[{get_timestamp()}] Clicked {button_type} in {elapsed*1000:.0f}ms!")
-            
-            # Handle any popups/modals quickly
-            self._handle_cart_modal()
-            
-            return True
-            
+            return self._click_add_to_cart(use_buy_now)
         except Exception as e:
             log_error(f"Failed to add to cart: {e}")
             save_screenshot(self.page, f"cart_error_{int(time.time())}.png")
@@ -148,42 +161,122 @@ class CartManager:
         Some sites show a modal after adding to cart.
         """
         try:
-            # Common modal close buttons
-            modal_close_selectors = [
-                'button:has-text("Continue Shopping")',
-                'button:has-text("Close")',
-                '.modal-close',
-                '[class*="close-button"]',
-            ]
-            
             # Wait briefly for modal
-            time.sleep(0.3)
+            time.sleep(self.modal_wait)
             
-            for selector in modal_close_selectors:
-                try:
-                    close_btn = self.page.locator(selector).first
-                    if close_btn.count() > 0:
-                        close_btn.click(timeout=1000)
-                        log_info("Closed cart modal")
-                        return
-                except:
-                    continue
-                    
+            close_btn = self.selector_engine.find(
+                self.page, 'cart_modal_close', get_selectors('cart_modal_close')
+            )
+            if close_btn:
+                close_btn.click(timeout=1000)
+                log_info("Closed cart modal")
+        
         except:
             pass  # No modal or already closed
     
-    @retry_on_failure(max_attempts=3)
-    def add_to_cart_with_retry(self, use_buy_now: bool = False) -> bool:
+    def _cart_count(self) -> Optional[int]:
+        """Items on the header cart badge, None if there is no readable badge"""
+        try:
+            badge = family_locator(self.page, 'cart_count').first
+            if badge.count() > 0:
+                return int(badge.inner_text().strip())
+        except Exception:
+            pass
+        return None
+    
+    def _click_registered(self, count_before: Optional[int], url_before: str, wait: float) -> bool:
         """
-        Add to cart with automatic retry on failure.
+        Check whether a click that timed out added the item anyway.
+        
+        The add-to-cart request may still be in flight when the click times
+        out, so this keeps looking for up to `wait` seconds.
+        
+        Args:
+            count_before: Cart badge count before the first click (None = no badge)
+            url_before: Page URL before the first click
+            wait: Seconds to keep looking
+        
+        Returns:
+            bool: True if the confirmation showed, the cart badge went up or
+                  the page navigated away (Buy Now); False if none did
+        """
+        end = time.perf_counter() + wait
+        while True:
+            try:
+                if self.page.url != url_before:
+                    return True
+                if family_locator(self.page, 'cart_success', self.success_indicators).count() > 0:
+                    return True
+            except Exception:
+                pass
+            count = self._cart_count()
+            if count is not None and count > (count_before or 0):
+                return True
+            if time.perf_counter() >= end:
+                return False
+            time.sleep(0.05)
+    
+    def _added_after_timeout(self) -> bool:
+        """Log a timed-out click that added the item, close its modal, return True"""
+        log_success(f"[{get_timestamp()}] Click timed out but the item was added - not clicking again")
+        self._handle_cart_modal()
+        return True
+    
+    def _retry_engine(self, max_attempts: int, deadline: float) -> RetryEngine:
+        """Retry engine for one add-to-cart stage"""
+        return RetryEngine(max_attempts=max_attempts, deadline=deadline, name="Add to cart")
+    
+    def add_to_cart_with_retry(
+        self,
+        use_buy_now: bool = False,
+        max_attempts: int = ADD_TO_CART_ATTEMPTS,
+        deadline: float = ADD_TO_CART_DEADLINE
+    ) -> bool:
+        """
+        Add to cart, retrying within a deadline (see bot/retry.py).
+        A missing button, a timeout or a navigation race is retried within
+        milliseconds; a closed page is not retried. A click that timed out
+        may still have been dispatched, so it is only repeated when neither
+        the confirmation nor the cart badge shows that it added the item.
         
         Args:
             use_buy_now: If True, use Buy Now instead
-            
+            max_attempts: Attempts in total
+            deadline: Seconds after which no new attempt starts
+        
         Returns:
             bool: True if successful
         """
-        return self.add_to_cart_fast(use_buy_now=use_buy_now)
+        self.timer.start()
+        log_info(f"[{get_timestamp()}] Attempting to add to cart...")
+        
+        engine = self._retry_engine(max_attempts, deadline)
+        count_before, url_before = self._cart_count(), self.page.url
+        
+        def attempt():
+            try:
+                # Each click may only use what is left of the stage's deadline
+                return self._click_add_to_cart(
+                    use_buy_now, timeout=min(CLICK_TIMEOUT, max(engine.remaining(), 0.001))
+                )
+            except Exception as e:
+                # Only retry a timed-out click if it provably added nothing
+                wait = min(CLICK_CONFIRM_WAIT, engine.remaining())
+                if classify_error(e) == 'timeout' and self._click_registered(count_before, url_before, wait):
+                    return self._added_after_timeout()
+                raise
+        
+        try:
+            return engine.run(attempt)
+        except Exception as e:
+            # The last click may have timed out at the deadline with no time left to check
+            if classify_error(e) == 'timeout' and self._click_registered(count_before, url_before, CLICK_CONFIRM_WAIT):
+                return self._added_after_timeout()
+            stats = engine.stats()
+            log_error(f"Failed to add to cart after {stats['attempts']} attempt(s) "
+                      f"({stats['gave_up']}): {e}")
+            save_screenshot(self.page, f"cart_error_{int(time.time())}.png")
+            return False
     
     def verify_in_cart(self) -> bool:
         """
@@ -194,22 +287,21 @@ class CartManager:
         """
         try:
             # Method 1: Check cart count
-            cart_count = self.page.locator(self.cart_count_selector).first
+            cart_count = family_locator(self.page, 'cart_count').first
             if cart_count.count() > 0:
                 count_text = cart_count.inner_text()
                 if count_text and int(count_text) > 0:
                     log_success(f"Cart contains {count_text} item(s)")
                     return True
             
-            # Method 2: Check for success message
-            for selector in self.success_indicators:
-                if self.page.locator(selector).count() > 0:
-                    log_success("Found success indicator")
-                    return True
+            # Method 2: Check for success message (one query for all indicators)
+            if family_locator(self.page, 'cart_success', self.success_indicators).count() > 0:
+                log_success("Found success indicator")
+                return True
             
             # Method 3: Navigate to cart and check
             return self._check_cart_page()
-            
+        
         except Exception as e:
             log_warning(f"Error verifying cart: {e}")
             return False
@@ -221,20 +313,13 @@ class CartManager:
             self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
             
             # Check if cart has items
-            empty_indicators = [
-                'text=Your shopping cart is empty',
-                'text=No items',
-                '.empty-cart',
-            ]
-            
-            for selector in empty_indicators:
-                if self.page.locator(selector).count() > 0:
-                    log_warning("Cart is empty")
-                    return False
+            if family_locator(self.page, 'cart_empty').count() > 0:
+                log_warning("Cart is empty")
+                return False
             
             log_success("Items found in cart")
             return True
-            
+        
         except Exception as e:
             log_error(f"Error checking cart page: {e}")
             return False
@@ -251,7 +336,7 @@ class CartManager:
             
             # Try clicking cart icon first
             try:
-                cart_icon = self.page.locator(self.cart_icon_selector).first
+                cart_icon = family_locator(self.page, 'cart_icon').first
                 if cart_icon.count() > 0:
                     cart_icon.click()
                     self.page.wait_for_load_state("domcontentloaded")
@@ -264,61 +349,28 @@ class CartManager:
             self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
             log_success("Navigated to cart via URL")
             return True
-            
+        
         except Exception as e:
             log_error(f"Failed to navigate to cart: {e}")
             return False
     
-    def get_cart_items(self) -> List[dict]:
+    def get_cart_items(self, budget: float = 2.0) -> List[dict]:
         """
         Get list of items currently in cart.
+        Every row is read in one evaluation; missing fields are None.
+        
+        Args:
+            budget: Maximum seconds to wait for cart rows to render
         
         Returns:
             List[dict]: List of cart items with details
         """
-        items = []
-        
-        try:
-            # Common cart item container selectors
-            item_selectors = [
-                '.cart-item',
-                '[class*="cart-item"]',
-                '.item-container',
-            ]
-            
-            for selector in item_selectors:
-                try:
-                    item_elements = self.page.locator(selector).all()
-                    
-                    if item_elements:
-                        for elem in item_elements:
-                            item_info = {
-                                'name': None,
-                                'price': None,
-                                'quantity': None,
-                            }
-                            
-                            try:
-                                # Extract item details
-                                item_info['name'] = elem.locator('.item-title, [class*="title"]').first.inner_text()
-                                item_info['price'] = elem.locator('.item-price, [class*="price"]').first.inner_text()
-                                item_info['quantity'] = elem.locator('input[type="number"]').first.input_value()
-                            except:
-                                pass
-                            
-                            items.append(item_info)
-                        
-                        if items:
-                            break
-                            
-                except:
-                    continue
-            
-            log_info(f"Found {len(items)} item(s) in cart")
-            
-        except Exception as e:
-            log_warning(f"Error getting cart items: {e}")
+        ordered = self.selector_engine.order('cart_item', get_selectors('cart_item'))
+        items, selector = extract_items(self.page, ordered, CART_ITEM_FIELDS, budget=budget)
         
+        if selector:
+            self.selector_engine.record_winner('cart_item', ordered, selector)
+        log_info(f"Found {len(items)} item(s) in cart")
         return items
     
     def clear_cart(self) -> bool:
@@ -336,14 +388,7 @@ class CartManager:
             self.go_to_cart()
             
             # Find and click delete buttons
-            delete_selectors = [
-                'button:has-text("Delete")',
-                'button:has-text("Remove")',
-                '.delete-btn',
-                '[class*="delete"]',
-            ]
-            
-            for selector in delete_selectors:
+            for selector in get_selectors('cart_delete'):
                 try:
                     buttons = self.page.locator(selector).all()
                     for button in buttons:
@@ -357,7 +402,7 @@ class CartManager:
             
             log_success("Cart cleared")
             return True
-            
+        
         except Exception as e:
             log_error(f"Failed to clear cart: {e}")
             return False
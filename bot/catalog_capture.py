@@ -0,0 +1,225 @@
+"""
+Store Catalog Capture
+=====================
+
+Reads a store's product list from the JSON responses that fill its product
+grid, instead of waiting for the grid to render and scraping it. Products
+are available as soon as each response body lands, so a refresh does not
+need a settle delay or a DOM scan.
+"""
+
+import time
+from typing import Any, Iterator, List, Optional
+from urllib.parse import urljoin
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeout
+
+from .network_detector import load_json_body
+from .utils import log_warning
+
+
+# URL fragments of responses that may carry the store's product list
+DEFAULT_CATALOG_URL_PATTERNS = [
+    'mtop.lazada',
+    'ajax=true',
+    'catalog',
+    'listitems',
+]
+
+# Keys identifying a product in a catalog entry
+PRODUCT_ID_KEYS = ['itemId', 'item_id', 'nid', 'productId']
+
+# Keys holding the product title
+PRODUCT_TITLE_KEYS = ['name', 'title', 'productTitle', 'itemName']
+
+# Keys holding the product page URL
+PRODUCT_URL_KEYS = ['productUrl', 'itemUrl', 'url', 'link']
+
+# Product page when an entry has no URL of its own
+FALLBACK_PRODUCT_URL = "https://www.lazada.sg/products/i{id}.html"
+
+
+def _first_value(data: dict, keys: List[str]) -> Optional[str]:
+    """First non-empty scalar among keys, as a string"""
+    for key in keys:
+        value = data.get(key)
+        if isinstance(value, (str, int)) and not isinstance(value, bool) and str(value).strip():
+            return str(value).strip()
+    return None
+
+
+def parse_catalog_payload(data: Any, base_url: Optional[str] = None) -> List[dict]:
+    """
+    Find product entries anywhere in a catalog JSON payload.
+    
+    A product entry is a dict with an id key and a title key (e.g. Lazada's
+    mods.listItems[] with itemId/name/productUrl).
+    
+    Args:
+        data: Parsed JSON
+        base_url: URL of the response, for relative product URLs
+    
+    Returns:
+        List of dicts with 'id', 'title', 'url' in payload order
+    """
+    products = []
+    
+    def walk(node):
+        if isinstance(node, dict):
+            product_id = _first_value(node, PRODUCT_ID_KEYS)
+            title = _first_value(node, PRODUCT_TITLE_KEYS)
+            if product_id and title:
+                url = _first_value(node, PRODUCT_URL_KEYS) or FALLBACK_PRODUCT_URL.format(id=product_id)
+                if base_url:
+                    url = urljoin(base_url, url)  # '/products/..' and '//www.lazada..'
+                products.append({'id': product_id, 'title': title, 'url': url})
+                return  # Nested dicts are SKUs/variants of this product
+            for value in node.values():
+                if isinstance(value, (dict, list)):
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+    
+    walk(data)
+    return products
+
+
+class CatalogCapture:
+    """
+    Collects store products from catalog responses.
+    
+    Usage:
+        capture = CatalogCapture(page)
+        capture.attach()
+        page.reload(wait_until="commit")
+        for batch in capture.batches(max_wait=10):
+            ...  # Products from one response, as soon as it lands
+    """
+    
+    def __init__(self, page: Page, url_patterns: Optional[List[str]] = None):
+        """
+        Initialize catalog capture.
+        
+        Args:
+            page: Playwright page object
+            url_patterns: URL fragments of responses worth parsing
+        """
+        self.page = page
+        self.url_patterns = url_patterns or DEFAULT_CATALOG_URL_PATTERNS
+        
+        self.attached = False
+        self.products = {}          # id -> product, everything seen so far
+        self.payloads_parsed = 0
+        self.last_batch_at = None   # time.time() when the last product batch landed
+        self._pending = []          # Matching responses not parsed yet
+    
+    def matches(self, response: Response) -> bool:
+        """
+        Cheap filter: could this response carry the product list?
+        Only looks at data already known to Python (no browser round trip).
+        """
+        if response.request.resource_type not in ('xhr', 'fetch', 'script'):
+            return False
+        url = response.url.lower()
+        return any(pattern.lower() in url for pattern in self.url_patterns)
+    
+    def attach(self):
+        """Start listening to page responses"""
+        if not self.attached:
+            self.page.on("response", self._on_response)
+            self.attached = True
+    
+    def detach(self):
+        """Stop listening to page responses"""
+        if self.attached:
+            self.page.remove_listener("response", self._on_response)
+            self.attached = False
+    
+    def discard_pending(self):
+        """Drop responses queued from an earlier page load"""
+        self._pending.clear()
+    
+    def _on_response(self, response: Response):
+        """Queue matching responses; bodies are read by batches()"""
+        if self.matches(response):
+            self._pending.append(response)
+    
+    @staticmethod
+    def _is_json(response: Response) -> bool:
+        """True if the response declares a JSON/JSONP body"""
+        content_type = response.headers.get('content-type', '')
+        return 'json' in content_type or 'javascript' in content_type
+    
+    def handle_response(self, response: Response) -> List[dict]:
+        """
+        Parse one response.
+        
+        Returns:
+            List of products it carried (empty if none)
+        """
+        if not self._is_json(response):
+            return []
+        try:
+            text = response.text()
+        except Exception:
+            return []  # Body gone (navigation) or not readable
+        return self.apply_body(text, response.url)
+    
+    def apply_body(self, text: str, url: Optional[str] = None) -> List[dict]:
+        """
+        Parse a response body and remember its products.
+        
+        Args:
+            text: Response body
+            url: Response URL (resolves relative product URLs)
+        
+        Returns:
+            List of products it carried (empty if none)
+        """
+        products = parse_catalog_payload(load_json_body(text), url)
+        if products:
+            self.payloads_parsed += 1
+            self.last_batch_at = time.time()
+            for product in products:
+                self.products[product['id']] = product
+        return products
+    
+    def batches(self, max_wait: float = 10.0, settle: float = 0.3) -> Iterator[List[dict]]:
+        """
+        Yield products response by response as they land.
+        
+        Waits up to max_wait for the first catalog response, then keeps
+        going while further responses (more pages) arrive within settle
+        seconds of each other.
+        
+        Args:
+            max_wait: Maximum seconds to wait for the first response
+            settle: Quiet period that ends the capture after the first one
+        
+        Yields:
+            List of products from one response
+        """
+        self.attach()
+        deadline = time.perf_counter() + max_wait
+        
+        while True:
+            while self._pending:
+                products = self.handle_response(self._pending.pop(0))
+                if products:
+                    deadline = time.perf_counter() + settle
+                    yield products
+            
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            
+            try:
+                # The listener also receives this response and queues it
+                self.page.wait_for_event(
+                    "response", predicate=self.matches, timeout=max(remaining, 0.001) * 1000
+                )
+            except PlaywrightTimeout:
+                pass  # Deadline check above ends the capture
+            except Exception as e:
+                log_warning(f"Catalog wait interrupted: {e}")
+                return
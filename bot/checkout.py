@@ -17,6 +17,15 @@ from .utils import (
     log_success, log_error, log_info, log_warning,
     Timer, save_screenshot, get_timestamp
 )
+from .selector_engine import SelectorEngine, get_selector_engine
+from .selector_registry import get_selectors, family_locator, PAYMENT_SELECTORS
+
+
+# Wait at least this long for the order confirmation (seconds)
+CONFIRM_WAIT = 3.0
+
+# ...or this many round trips, on a slow connection
+CONFIRM_ROUND_TRIPS = 10
 
 
 class CheckoutManager:
@@ -29,47 +38,35 @@ class CheckoutManager:
         checkout.complete_purchase()  # Only if auto_purchase=True
     """
     
-    def __init__(self, page: Page, auto_purchase: bool = False):
+    def __init__(
+        self,
+        page: Page,
+        auto_purchase: bool = False,
+        selector_engine: Optional[SelectorEngine] = None,
+        latency=None
+    ):
         """
         Initialize checkout manager.
         
         Args:
             page: Playwright page object
             auto_purchase: If True, automatically complete purchase (DANGEROUS!)
+            selector_engine: Learns selector order (None = shared engine)
+            latency: LatencySampler, to size the confirmation wait (None = CONFIRM_WAIT)
         """
         self.page = page
         self.auto_purchase = auto_purchase
+        self.latency = latency
         self.timer = Timer()
+        self.selector_engine = selector_engine or get_selector_engine()
         
         if auto_purchase:
             log_warning("⚠️  AUTO-PURCHASE IS ENABLED! Bot will complete purchases!")
         
-        # Checkout button selectors
-        self.checkout_selectors = [
-            'button:has-text("Proceed to Checkout")',
-            'button:has-text("Checkout")',
-            'button:has-text("CHECK OUT")',
-            '.checkout-button',
-            '[class*="checkout-btn"]',
-            'button[data-spm*="checkout"]',
-        ]
-        
-        # Place Order button selectors
-        self.place_order_selectors = [
-            'button:has-text("Place Order")',
-            'button:has-text("PLACE ORDER")',
-            'button:has-text("Confirm Order")',
-            '.place-order-btn',
-            '[class*="place-order"]',
-            'button.next-btn',
-        ]
-        
-        # Payment method selectors
-        self.payment_selectors = {
-            'cod': 'text=Cash on Delivery',
-            'credit_card': 'text=Credit/Debit Card',
-            'online_banking': 'text=Online Banking',
-        }
+        # Selectors come from the shared registry (bot/selector_registry.py)
+        self.checkout_selectors = get_selectors('checkout')
+        self.place_order_selectors = get_selectors('place_order')
+        self.payment_selectors = dict(PAYMENT_SELECTORS)
     
     def proceed_to_checkout(self) -> bool:
         """
@@ -87,15 +84,7 @@ class CheckoutManager:
                 self.page.goto("https://www.lazada.sg/cart", wait_until="domcontentloaded")
             
             # Find and click checkout button
-            checkout_button = None
-            for selector in self.checkout_selectors:
-                try:
-                    button = self.page.locator(selector).first
-                    if button.count() > 0:
-                        checkout_button = button
-                        break
-                except:
-                    continue
+            checkout_button = self.selector_engine.find(self.page, 'checkout', self.checkout_selectors)
             
             if not checkout_button:
                 log_error("Checkout button not found!")
@@ -112,7 +101,7 @@ class CheckoutManager:
             log_success(f"[{get_timestamp()}] Reached checkout page in {elapsed*1000:.0f}ms!")
             
             return True
-            
+        
         except Exception as e:
             log_error(f"Failed to proceed to checkout: {e}")
             save_screenshot(self.page, f"checkout_error_{int(time.time())}.png")
@@ -126,25 +115,14 @@ class CheckoutManager:
             bool: True if address is set
         """
         try:
-            # Look for address information
-            address_selectors = [
-                '.delivery-address',
-                '[class*="address"]',
-                'text=/.*Street.*/',
-                'text=/.*Postal Code.*/',
-            ]
-            
-            for selector in address_selectors:
-                try:
-                    if self.page.locator(selector).count() > 0:
-                        log_success("Shipping address found")
-                        return True
-                except:
-                    continue
+            # Look for address information (one query for the whole family)
+            if family_locator(self.page, 'shipping_address').count() > 0:
+                log_success("Shipping address found")
+                return True
             
             log_warning("No shipping address found - may need to set one")
             return False
-            
+        
         except Exception as e:
             log_warning(f"Error verifying address: {e}")
             return False
@@ -155,7 +133,7 @@ class CheckoutManager:
         
         Args:
             method: Payment method ('cod', 'credit_card', 'online_banking')
-            
+        
         Returns:
             bool: True if successful
         """
@@ -176,7 +154,7 @@ class CheckoutManager:
             else:
                 log_warning(f"Payment method {method} not found")
                 return False
-                
+        
         except Exception as e:
             log_error(f"Failed to select payment method: {e}")
             return False
@@ -198,29 +176,34 @@ class CheckoutManager:
         
         try:
             # Get total price (most important!)
-            total_selectors = [
-                '.order-total',
-                '[class*="total-price"]',
-                'text=/Total.*SGD/',
-            ]
-            
-            for selector in total_selectors:
-                try:
-                    total_elem = self.page.locator(selector).first
-                    if total_elem.count() > 0:
-                        summary['total'] = total_elem.inner_text()
-                        break
-                except:
-                    continue
+            total_elem = self.selector_engine.find(self.page, 'order_total', get_selectors('order_total'))
+            if total_elem:
+                summary['total'] = total_elem.inner_text()
             
             if summary['total']:
                 log_info(f"Order total: {summary['total']}")
-            
+        
         except Exception as e:
             log_warning(f"Error getting order summary: {e}")
         
         return summary
     
+    def confirmation_budget(self) -> float:
+        """Seconds to wait for the order confirmation: CONFIRM_WAIT, more on a slow connection"""
+        if self.latency:
+            return self.latency.budget(CONFIRM_ROUND_TRIPS, floor=CONFIRM_WAIT)
+        return CONFIRM_WAIT
+    
+    def _wait_for_confirmation(self) -> bool:
+        """True once a success indicator is on the page, False after the budget"""
+        try:
+            family_locator(self.page, 'order_success').first.wait_for(
+                state="attached", timeout=self.confirmation_budget() * 1000
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+    
     def complete_purchase(self) -> bool:
         """
         Complete the purchase by clicking Place Order.
@@ -251,15 +234,7 @@ class CheckoutManager:
                 log_warning(f"💰 ORDER TOTAL: {summary['total']}")
             
             # Find Place Order button
-            place_order_button = None
-            for selector in self.place_order_selectors:
-                try:
-                    button = self.page.locator(selector).first
-                    if button.count() > 0:
-                        place_order_button = button
-                        break
-                except:
-                    continue
+            place_order_button = self.selector_engine.find(self.page, 'place_order', self.place_order_selectors)
             
             if not place_order_button:
                 log_error("Place Order button not found!")
@@ -270,27 +245,16 @@ class CheckoutManager:
             log_warning("🛒 Clicking Place Order...")
             place_order_button.click(force=True)
             
-            # Wait for confirmation
-            time.sleep(3)
-            
-            # Check for success indicators
-            success_indicators = [
-                'text=Order Placed',
-                'text=Thank you for your order',
-                'text=Order confirmed',
-                '.order-success',
-            ]
-            
-            for selector in success_indicators:
-                if self.page.locator(selector).count() > 0:
-                    log_success("✅ ORDER PLACED SUCCESSFULLY!")
-                    save_screenshot(self.page, f"order_success_{int(time.time())}.png")
-                    return True
+            # Wait for confirmation (returns as soon as it shows)
+            if self._wait_for_confirmation():
+                log_success("✅ ORDER PLACED SUCCESSFULLY!")
+                save_screenshot(self.page, f"order_success_{int(time.time())}.png")
+                return True
             
             log_warning("Order submitted but confirmation unclear")
             save_screenshot(self.page, f"order_status_{int(time.time())}.png")
             return True
-            
+        
         except Exception as e:
             log_error(f"Failed to place order: {e}")
             save_screenshot(self.page, f"place_order_error_{int(time.time())}.png")
@@ -303,7 +267,7 @@ class CheckoutManager:
         
         Args:
             timeout: Seconds to wait for OTP
-            
+        
         Returns:
             bool: True if OTP handled successfully
         """
@@ -323,7 +287,7 @@ class CheckoutManager:
             
             log_warning("OTP timeout - verification not completed")
             return False
-            
+        
         except Exception as e:
             log_error(f"Error handling OTP: {e}")
             return False
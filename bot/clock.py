@@ -0,0 +1,307 @@
+"""
+Clock Service
+=============
+
+Keeps the offset between the local monotonic clock and NTP time in memory,
+so reading the accurate time costs a clock read instead of a network round
+trip.
+
+On start, a burst of NTP samples is taken. Each sample measures the server
+time against time.monotonic_ns() (immune to system clock steps) and the
+round trip it took. The offset is the RTT-weighted median of the samples,
+after dropping the slowest half: a sample's error is bounded by half its
+round trip, so quick answers are trusted most. A background thread repeats
+the burst every refresh_interval to follow the drift of the local
+oscillator; a failed refresh keeps the last good offset.
+
+Until the first successful sync the system clock is used, exactly as
+get_accurate_time() always fell back to it.
+
+Usage:
+    clock = ClockService().start()
+    clock.now()        # datetime, from memory
+    clock.now_ns()     # Unix time in nanoseconds
+"""
+
+import socket
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import ntplib
+
+from .utils import log_info, log_success, log_warning
+
+
+NTP_SERVERS = ['pool.ntp.org', 'time.google.com', 'time.cloudflare.com']
+NTP_PORT = 123
+
+
+def weighted_median(values: List[float], weights: List[float]) -> float:
+    """
+    Value at which half of the total weight lies on each side.
+    
+    Args:
+        values: Sample values
+        weights: Positive weight per value
+    
+    Returns:
+        float: Weighted median
+    """
+    pairs = sorted(zip(values, weights))
+    half = sum(weights) / 2
+    running = 0.0
+    for value, weight in pairs:
+        running += weight
+        if running >= half:
+            return value
+    return pairs[-1][0]
+
+
+def filter_offset(samples: List[Tuple[int, int]]) -> Optional[int]:
+    """
+    Combine NTP samples into one offset.
+    
+    Args:
+        samples: (offset_ns, delay_ns) pairs
+    
+    Returns:
+        int: Offset in nanoseconds, None if there are no samples
+    """
+    if not samples:
+        return None
+    best = sorted(samples, key=lambda s: s[1])[:max(1, (len(samples) + 1) // 2)]
+    weights = [1.0 / max(delay, 1000) for _, delay in best]  # Floor: 1 us
+    return int(weighted_median([offset for offset, _ in best], weights))
+
+
+class ClockService:
+    """
+    NTP-disciplined clock served from memory.
+    
+    Usage:
+        clock = ClockService(samples=8, refresh_interval=300).start()
+        remaining = target.timestamp() - clock.time()
+        clock.stop()
+    """
+    
+    def __init__(
+        self,
+        servers: Optional[List[str]] = None,
+        port: int = NTP_PORT,
+        samples: int = 8,
+        refresh_interval: float = 300.0,
+        timeout: float = 1.0,
+        spacing: float = 0.05
+    ):
+        """
+        Initialize the clock.
+        
+        Args:
+            servers: NTP servers, sampled in turn (None = NTP_SERVERS)
+            port: NTP port (a local stand-in responder uses another one)
+            samples: Samples per sync burst
+            refresh_interval: Seconds between background syncs (0 = never)
+            timeout: Seconds to wait for one NTP answer
+            spacing: Seconds between samples of a burst
+        """
+        self.servers = list(servers or NTP_SERVERS)
+        self.port = port
+        self.samples = max(1, samples)
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self.spacing = spacing
+        
+        # Unix time = monotonic + offset. System clock until the first sync.
+        self.offset_ns = time.time_ns() - time.monotonic_ns()
+        self.synced = False
+        self.last_sync = None   # monotonic seconds of the last good sync
+        self.last_delay_ns = None
+        self.median_delay_ns = None
+        self.syncs = 0
+        self.failures = 0
+        self.history = deque(maxlen=20)  # (monotonic s, offset ns) per sync
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def sample(self, server: str) -> Tuple[int, int]:
+        """
+        Take one NTP sample.
+        
+        Args:
+            server: NTP server host
+        
+        Returns:
+            (offset_ns, delay_ns): server Unix time minus monotonic time, and
+            the round trip minus the server's processing time
+        
+        Raises:
+            OSError, ValueError: Server unreachable or bogus answer
+        """
+        family, _, _, _, address = socket.getaddrinfo(server, self.port, 0, socket.SOCK_DGRAM)[0]
+        request = ntplib.NTPPacket(version=3, mode=3,
+                                   tx_timestamp=ntplib.system_to_ntp_time(time.time()))
+        
+        with socket.socket(family, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(self.timeout)
+            sent = time.monotonic_ns()
+            sock.sendto(request.to_data(), address)
+            while True:
+                data, source = sock.recvfrom(256)
+                received = time.monotonic_ns()
+                if source[0] == address[0]:
+                    break
+        
+        answer = ntplib.NTPPacket()
+        answer.from_data(data)
+        if answer.mode != 4 or answer.stratum == 0 or answer.tx_timestamp == 0:
+            raise ValueError(f"not a usable NTP answer (mode {answer.mode}, stratum {answer.stratum})")
+        if abs(answer.orig_timestamp - request.tx_timestamp) > 1e-6:
+            raise ValueError("answer does not match the request")
+        
+        server_rx = int(ntplib.ntp_to_system_time(answer.recv_timestamp) * 1e9)
+        server_tx = int(ntplib.ntp_to_system_time(answer.tx_timestamp) * 1e9)
+        offset = ((server_rx - sent) + (server_tx - received)) // 2
+        delay = max(0, (received - sent) - (server_tx - server_rx))
+        return offset, delay
+    
+    def sync(self) -> bool:
+        """
+        Take a burst of samples and update the offset.
+        
+        A server that fails twice (or does not resolve) is skipped for the
+        rest of the burst, so a single lost packet is retried but an
+        unreachable server costs at most two timeouts.
+        
+        Returns:
+            bool: True if the offset was updated
+        """
+        samples = []
+        servers = list(self.servers)
+        failed = {}
+        errors = []
+        for n in range(self.samples):
+            if not servers:
+                break
+            server = servers[n % len(servers)]
+            try:
+                samples.append(self.sample(server))
+            except (OSError, ValueError) as e:
+                errors.append(f"{server}: {e}")
+                failed[server] = failed.get(server, 0) + 1
+                if failed[server] >= 2 or isinstance(e, socket.gaierror):
+                    servers.remove(server)
+            if self.spacing and n < self.samples - 1:
+                time.sleep(self.spacing)
+        
+        offset = filter_offset(samples)
+        if offset is None:
+            self.failures += 1
+            log_warning(f"NTP sync failed ({'; '.join(errors) or 'no servers'}) - "
+                        f"keeping {'last offset' if self.synced else 'system clock'}")
+            return False
+        
+        with self._lock:
+            self.offset_ns = offset
+            self.synced = True
+            self.last_sync = time.monotonic()
+            delays = sorted(delay for _, delay in samples)
+            self.last_delay_ns = delays[0]
+            self.median_delay_ns = delays[len(delays) // 2]
+            self.syncs += 1
+            self.history.append((self.last_sync, offset))
+        return True
+    
+    def start(self) -> 'ClockService':
+        """
+        Sync now (blocking), then keep syncing in a background thread.
+        
+        Returns:
+            ClockService: self
+        """
+        if self.sync():
+            log_success(
+                f"Clock synced: system clock {self.system_offset() * 1000:+.1f}ms off NTP "
+                f"(best RTT {self.last_delay_ns / 1e6:.1f}ms)"
+            )
+        if self.refresh_interval and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='clock-sync', daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop background syncing"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout * self.samples + 1)
+            self._thread = None
+    
+    def _run(self):
+        """Background loop: sync every refresh_interval"""
+        while not self._stop.wait(self.refresh_interval):
+            self.sync()
+    
+    def now_ns(self) -> int:
+        """Current Unix time in nanoseconds (no I/O)"""
+        return time.monotonic_ns() + self.offset_ns
+    
+    def time(self) -> float:
+        """Current Unix time in seconds, like time.time() (no I/O)"""
+        return self.now_ns() / 1e9
+    
+    def now(self) -> datetime:
+        """Current local time, like datetime.now() (no I/O)"""
+        return datetime.fromtimestamp(self.time())
+    
+    def system_offset(self) -> float:
+        """Seconds the system clock is behind (+) or ahead (-) of NTP time"""
+        return (self.now_ns() - time.time_ns()) / 1e9
+    
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Sync state.
+        
+        Returns:
+            dict: synced, syncs, failures, system_offset_ms, best_rtt_ms,
+                  median_rtt_ms (of the last burst), sync_age (seconds since the last good sync) and
+                  drift_ppm (offset change rate between the last two syncs)
+        """
+        drift = None
+        if len(self.history) >= 2:
+            (t0, o0), (t1, o1) = self.history[-2], self.history[-1]
+            if t1 > t0:
+                drift = (o1 - o0) / ((t1 - t0) * 1e9) * 1e6
+        return {
+            'synced': self.synced,
+            'syncs': self.syncs,
+            'failures': self.failures,
+            'system_offset_ms': self.system_offset() * 1000,
+            'best_rtt_ms': self.last_delay_ns / 1e6 if self.last_delay_ns is not None else None,
+            'median_rtt_ms': self.median_delay_ns / 1e6 if self.median_delay_ns is not None else None,
+            'sync_age': time.monotonic() - self.last_sync if self.last_sync is not None else None,
+            'drift_ppm': drift,
+        }
+
+
+_shared_clock = None
+_shared_lock = threading.Lock()
+
+
+def get_clock() -> ClockService:
+    """
+    Get the clock shared by all bot components (started on first use).
+    
+    Returns:
+        ClockService: Shared, running instance
+    """
+    global _shared_clock
+    with _shared_lock:
+        if _shared_clock is None:
+            log_info("Syncing clock with NTP...")
+            _shared_clock = ClockService().start()
+    return _shared_clock
@@ -0,0 +1,206 @@
+"""
+Deadline Scheduler
+==================
+
+Keeps a polling loop on a fixed cadence. Deadlines are laid out on
+time.perf_counter (start, start + interval, start + 2*interval, ...) and the
+loop sleeps until the next one, so the period does not stretch by however
+long each check took. If a check overruns, the missed slots are counted and
+skipped instead of being fired in a burst.
+
+Check duration, the gap between check starts and lateness against the
+deadline are kept as histograms for p50/p95/p99 reporting.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+from .utils import log_info
+
+
+class LatencyHistogram:
+    """
+    Keeps the most recent samples (seconds) and reports percentiles.
+    
+    Usage:
+        hist = LatencyHistogram()
+        hist.add(0.012)
+        hist.percentile(95)
+    """
+    
+    def __init__(self, maxlen: int = 10000):
+        """
+        Initialize histogram.
+        
+        Args:
+            maxlen: Samples kept (oldest are dropped)
+        """
+        self.samples = deque(maxlen=maxlen)
+        self.count = 0
+    
+    def add(self, value: float):
+        """Record one sample in seconds"""
+        self.samples.append(value)
+        self.count += 1
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Get a percentile of the kept samples.
+        
+        Args:
+            p: Percentile (0-100)
+        
+        Returns:
+            float: Value in seconds, None if empty
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+    
+    def summary(self) -> dict:
+        """
+        Summarise in milliseconds.
+        
+        Returns:
+            dict: count, p50, p95, p99, max (ms, None if empty)
+        """
+        if not self.samples:
+            return {'count': 0, 'p50': None, 'p95': None, 'p99': None, 'max': None}
+        ordered = sorted(self.samples)
+        
+        def pct(p):
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+        
+        return {
+            'count': self.count,
+            'p50': pct(50),
+            'p95': pct(95),
+            'p99': pct(99),
+            'max': ordered[-1] * 1000,
+        }
+
+
+class DeadlineScheduler:
+    """
+    Fixed-cadence loop timing.
+    
+    Usage:
+        schedule = DeadlineScheduler(interval=0.05)
+        while monitoring:
+            schedule.wait_next()
+            start = time.perf_counter()
+            check()
+            schedule.record_check(time.perf_counter() - start)
+        schedule.log_stats()
+    """
+    
+    def __init__(self, interval: float):
+        """
+        Initialize scheduler.
+        
+        Args:
+            interval: Seconds between check starts (0 = back to back)
+        """
+        self.interval = interval
+        self.next_deadline = None
+        self.last_tick = None
+        
+        self.ticks = 0
+        self.missed = 0  # Deadlines skipped because a check overran
+        self.check_times = LatencyHistogram()
+        self.gaps = LatencyHistogram()
+        self.lateness = LatencyHistogram()
+    
+    def _sleep_for(self) -> float:
+        """Seconds until the next deadline (0 on the first tick)"""
+        if self.next_deadline is None:
+            self.next_deadline = time.perf_counter()
+        return self.next_deadline - time.perf_counter()
+    
+    def _tick(self) -> float:
+        """Record the tick that just started and lay out the next deadline"""
+        now = time.perf_counter()
+        self.ticks += 1
+        self.lateness.add(max(0.0, now - self.next_deadline))
+        if self.last_tick is not None:
+            self.gaps.add(now - self.last_tick)
+        self.last_tick = now
+        
+        if self.interval <= 0:
+            # No cadence: the next check is due at once, nothing can be missed
+            self.next_deadline = now
+            return now
+        
+        # Stay phase-locked: skip whole slots we are already past
+        self.next_deadline += self.interval
+        if now > self.next_deadline:
+            skipped = int((now - self.next_deadline) / self.interval) + 1
+            self.missed += skipped
+            self.next_deadline += skipped * self.interval
+        return now
+    
+    def wait_next(self) -> float:
+        """
+        Sleep until the next deadline.
+        
+        Returns:
+            float: perf_counter() at the tick
+        """
+        remaining = self._sleep_for()
+        if remaining > 0:
+            time.sleep(remaining)
+        return self._tick()
+    
+    async def wait_next_async(self) -> float:
+        """
+        Async version of wait_next (yields to the event loop while waiting).
+        
+        Returns:
+            float: perf_counter() at the tick
+        """
+        remaining = self._sleep_for()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return self._tick()
+    
+    def record_check(self, duration: float):
+        """Record how long one check took (seconds)"""
+        self.check_times.add(duration)
+    
+    def stats(self) -> dict:
+        """
+        Loop timing for this run.
+        
+        Returns:
+            dict: interval, ticks, missed, and check/gap/late summaries in ms
+        """
+        return {
+            'interval': self.interval,
+            'ticks': self.ticks,
+            'missed': self.missed,
+            'check': self.check_times.summary(),
+            'gap': self.gaps.summary(),
+            'late': self.lateness.summary(),
+        }
+    
+    def log_stats(self):
+        """Print loop timing percentiles"""
+        s = self.stats()
+        if not s['ticks']:
+            return
+        
+        def fmt(summary):
+            if summary['p50'] is None:
+                return "n/a"
+            return f"p50 {summary['p50']:.1f} / p95 {summary['p95']:.1f} / p99 {summary['p99']:.1f}ms"
+        
+        log_info(
+            f"Loop timing: {s['ticks']} checks at {self.interval*1000:.0f}ms cadence, "
+            f"{s['missed']} deadlines missed"
+        )
+        log_info(f"  check duration: {fmt(s['check'])}")
+        log_info(f"  inter-check gap: {fmt(s['gap'])}")
+        log_info(f"  lateness: {fmt(s['late'])}")
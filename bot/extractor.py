@@ -0,0 +1,309 @@
+"""
+Bulk Field Extractor
+====================
+
+Reads several page fields (title, price, ...) in ONE in-page evaluation
+under a strict time budget. A missing field costs nothing: the script
+returns null for it instead of a locator waiting out the default timeout.
+
+A field selector may end in '@attr' to read an attribute instead of the
+text, e.g. 'a[href*="/products/"]@href'.
+
+Item containers are read in document order, and extract_items_until() can
+stop at the first container whose key is already known, so a newest-first
+listing costs only as much as its new entries.
+
+If some fields are not rendered yet, the script is re-run every 100ms
+until everything is found or the budget runs out, and then returns
+whatever it has (partial results, never a long block).
+"""
+
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .utils import log_warning, to_dom_query, DOM_QUERY_JS
+
+
+# Resolves every field (optionally per item container) and returns null
+# until the result is complete or the deadline has passed, so it can be
+# driven by wait_for_function.
+EXTRACT_SCRIPT = """
+({fields, items, required, limit, stop, deadline}) => {
+""" + DOM_QUERY_JS + """
+    const value = (el, q) => {
+        if (!el) return null;
+        const tag = el.tagName;
+        let v;
+        if (q.attr) v = el.getAttribute(q.attr);
+        else if (tag === 'INPUT' || tag === 'SELECT' || tag === 'TEXTAREA') v = el.value;
+        else if (tag === 'IMG') v = el.getAttribute('alt');
+        else v = el.innerText || el.textContent;
+        v = (v || '').trim();
+        return v || null;
+    };
+    const read = (root) => {
+        const out = {};
+        for (const [name, queries] of Object.entries(fields)) {
+            out[name] = null;
+            for (const q of queries) {
+                const v = value(__query(q, root), q);
+                if (v !== null) { out[name] = v; break; }
+            }
+        }
+        return out;
+    };
+    const expired = Date.now() >= deadline;
+    const stopKeys = stop ? new Set(stop.values) : null;
+    const stopRe = stop ? new RegExp(stop.pattern) : null;
+    const isKnown = (row) => {
+        if (!stopKeys) return false;
+        const match = stopRe.exec(row[stop.field] || '');
+        return !!match && stopKeys.has(match[1]);
+    };
+    
+    if (!items) {
+        const values = read(document);
+        const complete = Object.values(values).every((v) => v !== null);
+        return complete || expired ? {values, complete} : null;
+    }
+    
+    for (const q of items) {
+        let els;
+        try { els = document.querySelectorAll(q.css); } catch (e) { continue; }
+        if (!els.length) continue;
+        const rows = [];
+        let stopped = false;
+        for (const el of els) {
+            if (limit && rows.length >= limit) break;
+            const row = read(el);
+            if (!required.every((name) => row[name] !== null)) continue;
+            if (isKnown(row)) { stopped = true; break; }
+            rows.push(row);
+        }
+        if (!rows.length && !stopped) continue;
+        return {items: rows, selector: q.selector, stopped, complete: true};
+    }
+    return expired ? {items: [], selector: null, stopped: false, complete: false} : null;
+}
+"""
+
+
+def _field_query(selector: str) -> dict:
+    """to_dom_query() plus the optional '@attr' suffix"""
+    attr = None
+    match = re.match(r'^(.*\S)@([\w-]+)$', selector)
+    if match:
+        selector, attr = match.groups()
+    query = to_dom_query(selector)
+    query['attr'] = attr
+    return query
+
+
+def _query_map(fields: Dict[str, List[str]]) -> dict:
+    """Translate {name: [selectors]} into in-page queries"""
+    return {name: [_field_query(s) for s in selectors] for name, selectors in fields.items()}
+
+
+def _script_arg(fields, item_selectors, limit, budget, required=None, stop=None) -> dict:
+    """Build the EXTRACT_SCRIPT argument"""
+    return {
+        'fields': _query_map(fields),
+        'items': [to_dom_query(s) for s in item_selectors] if item_selectors else None,
+        'required': list(required or []),
+        'limit': limit,
+        'stop': stop,
+        'deadline': (time.time() + budget) * 1000,
+    }
+
+
+# Playwright gets a little longer than the in-page deadline, so the page
+# normally answers with its partial result before the hard timeout fires.
+_GRACE = 0.5
+
+
+def extract_fields(page, fields: Dict[str, List[str]], budget: float = 2.0) -> Dict[str, Optional[str]]:
+    """
+    Read several fields from the page in one evaluation.
+    
+    Args:
+        page: Playwright page object
+        fields: {field name: selectors in priority order}
+        budget: Maximum seconds to spend, including waiting for late fields
+    
+    Returns:
+        dict: {field name: text or None} - missing fields are None
+    """
+    try:
+        handle = page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, None, None, budget),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        return handle.json_value()['values']
+    except Exception as e:
+        log_warning(f"Field extraction gave up after {budget}s: {e}")
+        return {name: None for name in fields}
+
+
+def extract_items(
+    page,
+    item_selectors: List[str],
+    fields: Dict[str, List[str]],
+    budget: float = 2.0,
+    limit: Optional[int] = None,
+    required: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Read fields from every item container (cart rows, product cards...) in
+    one evaluation. The first item selector with at least one usable
+    container is used.
+    
+    Args:
+        page: Playwright page object
+        item_selectors: Container selectors in priority order (CSS only)
+        fields: {field name: selectors relative to the container}
+        budget: Maximum seconds to spend, including waiting for items to render
+        limit: Maximum items to read (None = all)
+        required: Fields a container must have to be kept (others are skipped)
+    
+    Returns:
+        (items, selector): One dict per container and the container selector used
+    """
+    try:
+        handle = page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, item_selectors, limit, budget, required),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        result = handle.json_value()
+        return result['items'], result['selector']
+    except Exception as e:
+        log_warning(f"Item extraction gave up after {budget}s: {e}")
+        return [], None
+
+
+def extract_items_until(
+    page,
+    item_selectors: List[str],
+    fields: Dict[str, List[str]],
+    stop: dict,
+    budget: float = 2.0,
+    required: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[str], bool]:
+    """
+    extract_items() that stops at the first container whose key is known.
+    
+    The key is the first regex group of stop['pattern'] applied to the
+    field stop['field']; containers before the known one are returned.
+    
+    Args:
+        page: Playwright page object
+        item_selectors: Container selectors in priority order (CSS only)
+        fields: {field name: selectors relative to the container}
+        stop: {'field': name, 'pattern': JS-compatible regex, 'values': known keys}
+        budget: Maximum seconds to spend, including waiting for items to render
+        required: Fields a container must have to be kept (others are skipped)
+    
+    Returns:
+        (items, selector, stopped): stopped is True if a known key was reached
+    """
+    try:
+        handle = page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, item_selectors, None, budget, required, stop),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        result = handle.json_value()
+        return result['items'], result['selector'], result['stopped']
+    except Exception as e:
+        log_warning(f"Item extraction gave up after {budget}s: {e}")
+        return [], None, False
+
+
+async def extract_fields_async(page, fields: Dict[str, List[str]], budget: float = 2.0) -> Dict[str, Optional[str]]:
+    """
+    Async version of extract_fields (async Playwright page).
+    
+    Args:
+        page: Async Playwright page object
+        fields: {field name: selectors in priority order}
+        budget: Maximum seconds to spend, including waiting for late fields
+    
+    Returns:
+        dict: {field name: text or None} - missing fields are None
+    """
+    try:
+        handle = await page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, None, None, budget),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        return (await handle.json_value())['values']
+    except Exception as e:
+        log_warning(f"Field extraction gave up after {budget}s: {e}")
+        return {name: None for name in fields}
+
+
+async def extract_items_async(
+    page,
+    item_selectors: List[str],
+    fields: Dict[str, List[str]],
+    budget: float = 2.0,
+    limit: Optional[int] = None,
+    required: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Async version of extract_items (async Playwright page).
+    
+    Args:
+        page: Async Playwright page object
+        item_selectors: Container selectors in priority order (CSS only)
+        fields: {field name: selectors relative to the container}
+        budget: Maximum seconds to spend, including waiting for items to render
+        limit: Maximum items to read (None = all)
+        required: Fields a container must have to be kept (others are skipped)
+    
+    Returns:
+        (items, selector): One dict per container and the container selector used
+    """
+    try:
+        handle = await page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, item_selectors, limit, budget, required),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        result = await handle.json_value()
+        return result['items'], result['selector']
+    except Exception as e:
+        log_warning(f"Item extraction gave up after {budget}s: {e}")
+        return [], None
+
+
+async def extract_items_until_async(
+    page,
+    item_selectors: List[str],
+    fields: Dict[str, List[str]],
+    stop: dict,
+    budget: float = 2.0,
+    required: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[str], bool]:
+    """
+    Async version of extract_items_until (async Playwright page).
+    
+    Args:
+        page: Async Playwright page object
+        item_selectors: Container selectors in priority order (CSS only)
+        fields: {field name: selectors relative to the container}
+        stop: {'field': name, 'pattern': JS-compatible regex, 'values': known keys}
+        budget: Maximum seconds to spend, including waiting for items to render
+        required: Fields a container must have to be kept (others are skipped)
+    
+    Returns:
+        (items, selector, stopped): stopped is True if a known key was reached
+    """
+    try:
+        handle = await page.wait_for_function(
+            EXTRACT_SCRIPT, arg=_script_arg(fields, item_selectors, None, budget, required, stop),
+            polling=100, timeout=(budget + _GRACE) * 1000
+        )
+        result = await handle.json_value()
+        return result['items'], result['selector'], result['stopped']
+    except Exception as e:
+        log_warning(f"Item extraction gave up after {budget}s: {e}")
+        return [], None, False
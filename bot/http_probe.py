@@ -0,0 +1,324 @@
+"""
+HTTP Availability Probe
+=======================
+
+Checks availability without the browser: polls the product page (or its
+stock endpoint) over a pooled keep-alive requests.Session that carries the
+browser's cookies, and parses the response directly. The browser is only
+needed again for the add-to-cart click.
+
+One check is a single HTTP request (often a 304 when the server supports
+ETags) instead of a full page reload with all its scripts and images.
+The polling rate has a hard floor so we stay polite to the server.
+"""
+
+import re
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .network_detector import load_json_body, parse_stock_payload
+from .utils import log_success, log_error, log_info, log_warning, Timer, get_timestamp, extract_product_id
+
+
+# Never poll faster than this, whatever the caller asks for (seconds)
+POLITE_MIN_INTERVAL = 0.25
+
+# Back off up to this interval when the server pushes back (seconds)
+MAX_BACKOFF_INTERVAL = 30.0
+
+# Embedded JSON state in server-rendered pages
+_JSON_SCRIPT_RE = re.compile(
+    r'<script[^>]*type=["\']application/json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Server-rendered button/label markers (class names from the selector registry)
+_BUY_MARKERS = ('add-to-cart-buy-now-btn', 'pdp-button-add-to-cart', 'buy-now-btn')
+_SOLD_OUT_CLASSES = ('pdp-product-not-available',)
+_SOLD_OUT_TEXT = ('out of stock', 'sold out', 'currently unavailable')
+
+# Opening tag of an availability element, plus the text right after it
+_AVAILABILITY_RE = re.compile(
+    r'<[a-z][^>]*\sclass=["\']([^"\']*(?:availab|stock|sold-?out)[^"\']*)["\'][^>]*>([^<]*)',
+    re.IGNORECASE
+)
+
+# Opening tags carrying a buy marker
+_BUY_TAG_RE = re.compile(
+    r'<[a-z][^>]*(?:' + '|'.join(re.escape(m) for m in _BUY_MARKERS) + r')[^>]*>',
+    re.IGNORECASE
+)
+
+# disabled / aria-disabled="true" attribute inside a tag
+_DISABLED_RE = re.compile(r'\s(?:disabled(?=[\s=/>])|aria-disabled=["\']?true)', re.IGNORECASE)
+
+
+def _has_enabled_buy_button(html: str) -> bool:
+    """True if a buy/add-to-cart element is rendered without being disabled"""
+    return any(not _DISABLED_RE.search(tag.group(0)) for tag in _BUY_TAG_RE.finditer(html))
+
+
+def _has_sold_out_element(html: str) -> bool:
+    """
+    True if an availability element says the product is sold out.
+    
+    Only the page's availability elements count (a sold-out class, or
+    sold-out wording as their text): the same words in a review, a
+    recommendation card or a script elsewhere on the page say nothing about
+    this product.
+    """
+    for match in _AVAILABILITY_RE.finditer(html):
+        classes, text = match.group(1), match.group(2).strip().lower()
+        if any(c in classes.split() for c in _SOLD_OUT_CLASSES):
+            return True
+        if any(t in text for t in _SOLD_OUT_TEXT):
+            return True
+    return False
+
+
+def parse_stock_html(html: str, sku_id: Optional[str] = None) -> Optional[bool]:
+    """
+    Find stock information in a product page without building a DOM.
+    
+    Tries, in order: embedded JSON state, then the server-rendered
+    availability element and enabled buy buttons (sold-out pages may still
+    render a disabled buy button).
+    
+    Args:
+        html: Page HTML
+        sku_id: Only trust JSON entries for this SKU/item id
+    
+    Returns:
+        bool: True if in stock, False if sold out, None if the page says neither
+    """
+    for blob in _JSON_SCRIPT_RE.findall(html):
+        verdict = parse_stock_payload(load_json_body(blob), sku_id)
+        if verdict is not None:
+            return verdict
+    
+    if _has_sold_out_element(html):
+        return False
+    if _has_enabled_buy_button(html):
+        return True
+    return None
+
+
+class HttpAvailabilityProbe:
+    """
+    Polls a product/stock URL over plain HTTP.
+    
+    Usage:
+        probe = HttpAvailabilityProbe.from_context(page.context, stock_url)
+        if probe.wait_for_stock(max_wait=300):
+            page.reload()  # Browser takes over for the click
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        cookies: Optional[List[dict]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        sku_id: Optional[str] = None,
+        min_interval: float = 0.5,
+        timeout: float = 5.0,
+        pool_size: int = 2
+    ):
+        """
+        Initialize the HTTP probe.
+        
+        Args:
+            url: Product page or stock JSON endpoint to poll
+            cookies: Cookies in Playwright's context.cookies() format
+            headers: Extra request headers (e.g. the browser's User-Agent)
+            sku_id: Only trust stock entries for this SKU/item id (None = the
+                    item id in the URL, if any)
+            min_interval: Seconds between requests (never below POLITE_MIN_INTERVAL)
+            timeout: Per-request timeout in seconds
+            pool_size: Keep-alive connections kept open to the host
+        """
+        if min_interval < POLITE_MIN_INTERVAL:
+            log_warning(f"HTTP probe interval raised to {POLITE_MIN_INTERVAL}s (polite minimum)")
+            min_interval = POLITE_MIN_INTERVAL
+        
+        self.url = url
+        self.sku_id = sku_id
+        self.item_id = extract_product_id(url)
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self.timeout = timeout
+        self.timer = Timer()
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'text/html,application/json;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        if headers:
+            self.session.headers.update(headers)
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+        
+        # Conditional request state
+        self.etag = None
+        self.last_modified = None
+        self.last_verdict = None
+        
+        # Stats
+        self.checks = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.latencies = deque(maxlen=1000)
+        self.available_at = None
+    
+    @classmethod
+    def from_context(cls, context, url: str, page=None, **kwargs) -> 'HttpAvailabilityProbe':
+        """
+        Build a probe that shares a Playwright context's login cookies.
+        
+        Args:
+            context: Playwright browser context
+            url: Product page or stock JSON endpoint to poll
+            page: Optional page to copy the User-Agent from
+            **kwargs: Passed on to HttpAvailabilityProbe
+        
+        Returns:
+            HttpAvailabilityProbe: The probe
+        """
+        headers = dict(kwargs.pop('headers', None) or {})
+        if page is not None:
+            try:
+                headers.setdefault('User-Agent', page.evaluate("() => navigator.userAgent"))
+                headers.setdefault('Referer', page.url)
+            except:
+                pass
+        return cls(url, cookies=context.cookies(), headers=headers, **kwargs)
+    
+    def check(self) -> Optional[bool]:
+        """
+        Make one request and parse it.
+        
+        Returns:
+            bool: Stock verdict, None if unknown (error or no stock info)
+        """
+        self.checks += 1
+        conditional = {}
+        if self.etag:
+            conditional['If-None-Match'] = self.etag
+        if self.last_modified:
+            conditional['If-Modified-Since'] = self.last_modified
+        
+        start = time.perf_counter()
+        try:
+            response = self.session.get(self.url, headers=conditional, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.errors += 1
+            log_warning(f"HTTP probe failed: {e}")
+            return None
+        self.latencies.append(time.perf_counter() - start)
+        self.bytes_received += len(response.content)
+        
+        if response.status_code == 304:
+            self.not_modified += 1
+            self.interval = self.min_interval  # Server is answering normally again
+            return self.last_verdict
+        
+        if response.status_code in (429, 503):
+            self._back_off(response.headers.get('Retry-After'))
+            return None
+        
+        if response.status_code != 200:
+            self.errors += 1
+            log_warning(f"HTTP probe got status {response.status_code}")
+            return None
+        
+        # Server is happy again - return to the normal rate
+        self.interval = self.min_interval
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        
+        scope = self.sku_id or self.item_id
+        if 'json' in response.headers.get('Content-Type', ''):
+            verdict = parse_stock_payload(load_json_body(response.text), scope)
+        else:
+            verdict = parse_stock_html(response.text, scope)
+        
+        self.last_verdict = verdict
+        return verdict
+    
+    def _back_off(self, retry_after: Optional[str] = None):
+        """Slow down after the server asked us to"""
+        if retry_after and retry_after.strip().isdigit():
+            self.interval = min(float(retry_after), MAX_BACKOFF_INTERVAL)
+        else:
+            self.interval = min(self.interval * 2, MAX_BACKOFF_INTERVAL)
+        log_warning(f"Server pushed back, HTTP probe interval now {self.interval:.1f}s")
+    
+    def wait_for_stock(self, max_wait: float = 300) -> bool:
+        """
+        Poll until the product is in stock.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+        
+        Returns:
+            bool: True if in stock, False on timeout
+        """
+        log_info(f"HTTP probe polling {self.url} every {self.interval}s")
+        self.timer.start()
+        
+        while self.timer.elapsed() < max_wait:
+            started = time.perf_counter()
+            if self.check():
+                self.available_at = time.time()
+                log_success(f"[{get_timestamp()}] HTTP probe: in stock after {self.timer}")
+                self.log_stats()
+                return True
+            
+            # Keep the request rate, not just the gap between requests
+            pause = self.interval - (time.perf_counter() - started)
+            if pause > 0:
+                time.sleep(pause)
+        
+        log_error(f"HTTP probe timeout after {self.timer}")
+        self.log_stats()
+        return False
+    
+    def stats(self) -> dict:
+        """
+        Probe statistics.
+        
+        Returns:
+            dict: checks, not_modified, errors, bytes_per_check, p50_ms
+        """
+        latencies = sorted(self.latencies)
+        return {
+            'checks': self.checks,
+            'not_modified': self.not_modified,
+            'errors': self.errors,
+            'bytes_per_check': self.bytes_received / self.checks if self.checks else 0,
+            'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0,
+        }
+    
+    def log_stats(self):
+        """Log probe statistics"""
+        s = self.stats()
+        log_info(
+            f"HTTP probe: {s['checks']} checks ({s['not_modified']} not modified, "
+            f"{s['errors']} errors), {s['bytes_per_check']:.0f} bytes/check, "
+            f"p50 {s['p50_ms']:.1f}ms"
+        )
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
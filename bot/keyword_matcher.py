@@ -0,0 +1,290 @@
+"""
+Keyword Matcher
+===============
+
+Matches product titles against keyword rules, compiled once.
+
+Titles and keywords are normalised the same way: accents stripped
+("Pokémon" -> "pokemon"), case folded, punctuation turned into spaces.
+Every phrase of every rule goes into one word trie, so a title is split
+into words once and each word costs about one dict lookup (per-word results
+are memoised in the trie) no matter how many rules there are; only the
+rules that share a phrase with the title are evaluated. Verdicts are memoised
+by product id.
+
+Rule syntax (one rule per keyword string):
+    booster                   phrase at the start of a word ("boosters" too)
+    "card"                    whole word only (not "cardboard")
+    elite trainer & box       AND
+    tcg | trading card        OR
+    booster & !japanese       NOT ('-japanese' works too)
+
+A title matches when ANY rule matches and no exclude phrase is present.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize(text: str) -> str:
+    """
+    Normalise text for matching.
+    
+    Args:
+        text: Title or phrase
+    
+    Returns:
+        str: Accent-free, case-folded words separated by single spaces
+    """
+    if not text.isascii():
+        decomposed = unicodedata.normalize('NFKD', text)
+        text = ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    else:
+        text = text.lower()
+    return _NON_WORD.sub(' ', text).strip()
+
+
+# Title words remembered per index node (store vocabularies are small)
+WORD_CACHE_SIZE = 50000
+
+
+class _WordNode:
+    """One node of the word trie: phrases that continue or end after the words so far"""
+    
+    def __init__(self):
+        self.children = {}  # whole word -> _WordNode
+        self.whole = {}     # last word -> ids of whole-word phrases ending here
+        self.prefixes = {}  # last word -> ids of phrases ending here on any word it starts
+        self.lengths = []   # Distinct prefix lengths, ascending
+        self.steps = {}     # title word -> (ids, child), memoised
+    
+    def step(self, word: str) -> Tuple[tuple, Optional['_WordNode']]:
+        """
+        Phrases completed by a title word here, and the node to continue from.
+        
+        Args:
+            word: Normalised title word
+        """
+        cached = self.steps.get(word)
+        if cached is None:
+            ids = list(self.whole.get(word, ()))
+            for length in self.lengths:
+                if length > len(word):
+                    break
+                ids.extend(self.prefixes.get(word[:length], ()))
+            cached = (tuple(ids), self.children.get(word))
+            if len(self.steps) < WORD_CACHE_SIZE:
+                self.steps[word] = cached
+        return cached
+
+
+class _PhraseIndex:
+    """Word trie over normalised phrases"""
+    
+    def __init__(self, phrases: List[str], exact: List[bool]):
+        """
+        Build the index.
+        
+        Args:
+            phrases: Normalised phrases; a phrase's id is its index
+            exact: Per phrase, True if its last word must be a whole word
+        """
+        self.root = _WordNode()
+        self.nodes = [self.root]
+        
+        for phrase_id, phrase in enumerate(phrases):
+            words = phrase.split(' ')
+            node = self.root
+            for word in words[:-1]:
+                child = node.children.get(word)
+                if child is None:
+                    child = node.children[word] = _WordNode()
+                    self.nodes.append(child)
+                node = child
+            table = node.whole if exact[phrase_id] else node.prefixes
+            table.setdefault(words[-1], []).append(phrase_id)
+        
+        for node in self.nodes:
+            node.lengths = sorted({len(word) for word in node.prefixes})
+    
+    def scan(self, text: str) -> set:
+        """
+        Ids of the phrases present in text, each starting at a word start.
+        
+        Args:
+            text: Normalised text
+        """
+        found = set()
+        if not text:
+            return found
+        words = text.split(' ')
+        count = len(words)
+        
+        for start in range(count):
+            node, index = self.root, start
+            while True:
+                ids, node = node.step(words[index])
+                if ids:
+                    found.update(ids)
+                index += 1
+                if node is None or index == count:
+                    break
+        return found
+
+
+def _parse_rule(rule: str) -> List[Tuple[bool, List[Tuple[str, bool]]]]:
+    """
+    Parse one rule.
+    
+    Returns:
+        List of clauses (negated, [(normalised phrase, whole word only)])
+    """
+    clauses = []
+    for part in rule.split('&'):
+        part = part.strip()
+        negated = part[:1] in ('!', '-')
+        if negated:
+            part = part[1:].strip()
+        alternatives = []
+        for alt in part.split('|'):
+            alt = alt.strip()
+            exact = len(alt) >= 2 and alt[0] == alt[-1] == '"'
+            phrase = normalize(alt[1:-1] if exact else alt)
+            if phrase:
+                alternatives.append((phrase, exact))
+        if alternatives:
+            clauses.append((negated, alternatives))
+    return clauses
+
+
+class KeywordMatcher:
+    """
+    Compiled keyword rules.
+    
+    Usage:
+        matcher = KeywordMatcher(["booster & !japanese", "elite trainer"], exclude=["empty box"])
+        matcher.match("Pokémon TCG Booster Box", key="123")  # -> "booster & !japanese"
+    """
+    
+    def __init__(self, rules: List[str], exclude: Optional[List[str]] = None):
+        """
+        Compile the rules.
+        
+        Args:
+            rules: Keyword rules (see module docstring); ANY may match
+            exclude: Phrases that reject a title whatever rule matched
+        """
+        self.rules = []             # (rule text, [(negated, {phrase ids})])
+        self.exclude_ids = set()
+        self._phrase_ids = {}       # (phrase, exact) -> id
+        self._rules_by_phrase = {}  # phrase id -> indexes of rules it can satisfy, ascending
+        self._memo = {}             # key -> (title, matched rule or None)
+        self.hits = 0
+        self.misses = 0
+        
+        for text in rules:
+            clauses = []
+            for negated, alternatives in _parse_rule(text):
+                clauses.append((negated, {self._phrase_id(p, exact) for p, exact in alternatives}))
+            if not any(not negated for negated, _ in clauses):
+                continue  # A rule needs something to include
+            index = len(self.rules)
+            self.rules.append((text, clauses))
+            for negated, ids in clauses:
+                if not negated:
+                    for phrase_id in ids:
+                        self._rules_by_phrase.setdefault(phrase_id, []).append(index)
+        
+        for text in exclude or []:
+            phrase = normalize(text)
+            if phrase:
+                self.exclude_ids.add(self._phrase_id(phrase, False))
+        
+        phrases = [None] * len(self._phrase_ids)
+        exact_flags = [False] * len(self._phrase_ids)
+        for (phrase, exact), phrase_id in self._phrase_ids.items():
+            phrases[phrase_id] = phrase
+            exact_flags[phrase_id] = exact
+        self._index = _PhraseIndex(phrases, exact_flags)
+    
+    def _phrase_id(self, phrase: str, exact: bool) -> int:
+        """Id of a phrase, registering it if new"""
+        return self._phrase_ids.setdefault((phrase, exact), len(self._phrase_ids))
+    
+    def phrases_in(self, title: str) -> set:
+        """
+        Phrase ids present in a title (word-start aligned).
+        
+        Args:
+            title: Raw title
+        
+        Returns:
+            set: Matching phrase ids
+        """
+        return self._index.scan(normalize(title))
+    
+    def _evaluate(self, title: str) -> Optional[str]:
+        """Matching rule for a title, ignoring the memo"""
+        found = self.phrases_in(title)
+        if not found or not self.exclude_ids.isdisjoint(found):
+            return None
+        
+        # Rule lists are ascending, so each phrase only needs checking up to
+        # the best (lowest-index) matching rule found so far
+        best = None
+        for phrase_id in found:
+            for index in self._rules_by_phrase.get(phrase_id, ()):
+                if best is not None and index >= best:
+                    break
+                if all(ids.isdisjoint(found) == negated for negated, ids in self.rules[index][1]):
+                    best = index
+                    break
+        return None if best is None else self.rules[best][0]
+    
+    def match(self, title: str, key: Optional[str] = None) -> Optional[str]:
+        """
+        Find the rule a title matches.
+        
+        Args:
+            title: Product title
+            key: Memo key (product id); the verdict is reused while the title
+                 for that key stays the same
+        
+        Returns:
+            str: The first matching rule, None if no rule matches
+        """
+        if key is None:
+            return self._evaluate(title)
+        
+        cached = self._memo.get(key)
+        if cached is not None and cached[0] == title:
+            self.hits += 1
+            return cached[1]
+        
+        self.misses += 1
+        rule = self._evaluate(title)
+        self._memo[key] = (title, rule)
+        return rule
+    
+    def matches(self, title: str, key: Optional[str] = None) -> bool:
+        """True if any rule matches the title"""
+        return self.match(title, key) is not None
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Compiled size and memo usage.
+        
+        Returns:
+            dict: rules, phrases, index_nodes, memo_hits, memo_misses
+        """
+        return {
+            'rules': len(self.rules),
+            'phrases': len(self._phrase_ids),
+            'index_nodes': len(self._index.nodes),
+            'memo_hits': self.hits,
+            'memo_misses': self.misses,
+        }
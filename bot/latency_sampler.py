@@ -0,0 +1,215 @@
+"""
+Latency Sampler
+===============
+
+Measures the round trip to the target site in the background, without ever
+touching the page the bot is watching.
+
+A daemon thread sends a HEAD request for a small static file (the favicon)
+every `interval` seconds over its own kept-alive connection, so each sample
+is one warm round trip plus a negligible server time. The last `window`
+samples are kept; readers get percentiles from memory:
+- the precision trigger fires one_way() early
+- the reload scheduler splits reload time into network and server time
+- checkout sizes its confirmation wait with budget()
+
+Usage:
+    latency = LatencySampler(product_url).start()
+    latency.one_way()          # seconds, p50 RTT / 2
+    latency.budget(3)          # seconds for 3 round trips at p95
+    latency.stop()
+"""
+
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .deadline_scheduler import LatencyHistogram
+from .utils import log_info, log_warning
+
+
+# Requested on the site's origin: small, static, served from the edge
+PROBE_PATH = '/favicon.ico'
+
+
+class LatencySampler:
+    """
+    Rolling window of round-trip times to a site, sampled in a background thread.
+    
+    Usage:
+        latency = LatencySampler("https://www.lazada.sg/products/...", interval=1.0).start()
+        latency.rtt(95)
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        interval: float = 1.0,
+        window: int = 60,
+        timeout: float = 5.0,
+        path: str = PROBE_PATH,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize the sampler.
+        
+        Args:
+            url: Any URL on the site (only its origin is used)
+            interval: Seconds between background samples
+            window: Samples kept for the percentiles
+            timeout: Per-request timeout in seconds
+            path: Path requested on the origin
+            session: Session to reuse (None = own keep-alive session)
+        """
+        parts = urlsplit(url)
+        self.url = f"{parts.scheme}://{parts.netloc}{path}"
+        self.interval = interval
+        self.timeout = timeout
+        self.owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        
+        self.window = LatencyHistogram(maxlen=window)
+        self.failures = 0
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def sample(self) -> Optional[float]:
+        """
+        Take one sample now (blocking) and add it to the window.
+        
+        Returns:
+            float: Round trip in seconds, None if the request failed
+        """
+        start = time.perf_counter()
+        try:
+            self.session.head(self.url, timeout=self.timeout, allow_redirects=False)
+        except requests.RequestException:
+            self.failures += 1
+            return None
+        rtt = time.perf_counter() - start
+        self.add(rtt)
+        return rtt
+    
+    def add(self, rtt: float):
+        """Add a round trip measured elsewhere (seconds)"""
+        with self._lock:
+            self.window.add(rtt)
+    
+    def start(self, burst: int = 3) -> 'LatencySampler':
+        """
+        Open the connection, take a few samples (blocking), then keep
+        sampling in a background thread.
+        
+        Args:
+            burst: Samples taken right away, after the connection is open
+        
+        Returns:
+            LatencySampler: self
+        """
+        try:
+            self.session.head(self.url, timeout=self.timeout, allow_redirects=False)
+        except requests.RequestException as e:
+            log_warning(f"Latency sampler: {self.url} unreachable ({e})")
+        for _ in range(burst):
+            self.sample()
+        
+        rtt = self.rtt()
+        if rtt is not None:
+            log_info(f"Latency to {urlsplit(self.url).netloc}: {rtt * 1000:.0f}ms RTT")
+        
+        if self.interval and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='latency-sampler', daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop background sampling and close the connection (if ours)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+            self._thread = None
+        if self.owns_session:
+            self.session.close()
+    
+    def _run(self):
+        """Background loop: one sample every interval"""
+        while not self._stop.wait(self.interval):
+            self.sample()
+    
+    def rtt(self, p: float = 50) -> Optional[float]:
+        """
+        Round-trip percentile over the window.
+        
+        Args:
+            p: Percentile (0-100)
+        
+        Returns:
+            float: Seconds, None before the first sample
+        """
+        with self._lock:
+            return self.window.percentile(p)
+    
+    def one_way(self, p: float = 50, default: float = 0.0) -> float:
+        """
+        One-way latency estimate: half the round trip.
+        
+        Args:
+            p: Percentile of the round trip (0-100)
+            default: Returned before the first sample (seconds)
+        
+        Returns:
+            float: Seconds
+        """
+        rtt = self.rtt(p)
+        return rtt / 2 if rtt is not None else default
+    
+    def budget(self, round_trips: float = 1, p: float = 95, floor: float = 0.0) -> float:
+        """
+        Time to allow for a number of round trips.
+        
+        Args:
+            round_trips: Round trips the operation needs
+            p: Percentile of the round trip (0-100)
+            floor: Minimum budget in seconds (also used before the first sample)
+        
+        Returns:
+            float: Seconds
+        """
+        rtt = self.rtt(p)
+        if rtt is None:
+            return floor
+        return max(floor, rtt * round_trips)
+    
+    def stats(self) -> dict:
+        """
+        Window summary.
+        
+        Returns:
+            dict: count (all samples), p50, p95, p99, max in ms, failures
+        """
+        with self._lock:
+            summary = self.window.summary()
+        summary['failures'] = self.failures
+        return summary
+    
+    def log_stats(self):
+        """Log the RTT percentiles"""
+        s = self.stats()
+        if not s['count']:
+            return
+        log_info(
+            f"Latency: RTT p50 {s['p50']:.0f}ms / p95 {s['p95']:.0f}ms / max {s['max']:.0f}ms "
+            f"({s['count']} samples, {s['failures']} failed)"
+        )
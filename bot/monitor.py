@@ -6,12 +6,96 @@ Monitors a Lazada product page and detects when it becomes available.
 This is the FIRST component that runs in the sniper bot.
 """
 
+import json
 import time
 from datetime import datetime
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
-from .utils import log_success, log_error, log_info, log_warning, Timer, get_timestamp
+from .utils import (
+    log_success, log_error, log_info, log_warning, Timer, get_timestamp,
+    to_dom_query, DOM_QUERY_JS
+)
+from .deadline_scheduler import DeadlineScheduler
+from .extractor import extract_fields
+from .http_probe import HttpAvailabilityProbe
+from .network_detector import NetworkStockDetector
+from .reload_scheduler import ReloadScheduler
+from .selector_engine import SelectorEngine, get_selector_engine
+from .selector_registry import get_selectors
+
+
+# Shared verdict logic: Add to Cart, then Buy Now, same priority as the
+# locator path. A disabled match falls through to the next selector.
+BUTTON_VERDICT_JS = DOM_QUERY_JS + """
+const __buttonVerdict = (families) => {
+    const verdict = {button: null, selector: null, disabled: false, out_of_stock: false};
+    for (const family of ['add_to_cart', 'buy_now']) {
+        for (const q of families[family]) {
+            const el = __query(q);
+            if (!el) continue;
+            const disabled = !!el.disabled || el.hasAttribute('disabled');
+            if (verdict.button === null || !disabled) {
+                verdict.button = family;
+                verdict.selector = q.selector;
+                verdict.disabled = disabled;
+            }
+            if (!disabled) return verdict;
+        }
+    }
+    return verdict;
+};
+"""
+
+# Runs every selector family inside the page and returns a small verdict,
+# including whether an out-of-stock marker is present.
+PROBE_SCRIPT = """
+(families) => {
+""" + BUTTON_VERDICT_JS + """
+    const verdict = __buttonVerdict(families);
+    if (verdict.button && !verdict.disabled) return verdict;
+    verdict.out_of_stock = families.out_of_stock.some((q) => __query(q) !== null);
+    return verdict;
+}
+"""
+
+# Installed with add_init_script (survives reloads) and evaluated once on the
+# current document. Re-checks the buttons on every DOM mutation and calls the
+# exposed binding the moment one is present and enabled. Idle DOM = no work.
+OBSERVER_SCRIPT = """
+(() => {
+    const families = __FAMILIES__;
+""" + BUTTON_VERDICT_JS + """
+    const available = () => {
+        const v = __buttonVerdict(families);
+        return v.button && !v.disabled ? v : null;
+    };
+    const fire = (v) => {
+        if (window.__sniperFired) return;
+        window.__sniperFired = true;
+        v.detected_at = Date.now();
+        // Attribute flip wakes wait_for_function(polling='mutation') in Python
+        document.documentElement.setAttribute('data-sniper-available', v.button);
+        if (window.__sniperNotify) window.__sniperNotify(v);
+    };
+    const start = () => {
+        if (window.__sniperObserver) return;
+        const v = available();
+        if (v) { fire(v); return; }
+        const observer = new MutationObserver(() => {
+            const v = available();
+            if (v) { observer.disconnect(); fire(v); }
+        });
+        observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true,
+            attributeFilter: ['disabled', 'class'],
+        });
+        window.__sniperObserver = observer;
+    };
+    if (document.documentElement) start();
+    else document.addEventListener('readystatechange', start, {once: true});
+})();
+"""
 
 
 class ProductMonitor:
@@ -23,81 +107,228 @@ class ProductMonitor:
         is_available = monitor.wait_for_availability(max_wait=300)
     """
     
-    def __init__(self, page: Page, check_interval: float = 0.1):
+    def __init__(
+        self,
+        page: Page,
+        check_interval: float = 0.1,
+        probe_mode: str = 'evaluate',
+        detection_mode: str = 'poll',
+        reload_interval: Optional[float] = None,
+        selector_engine: Optional[SelectorEngine] = None
+    ):
         """
         Initialize product monitor.
         
         Args:
             page: Playwright page object
             check_interval: Seconds between checks (lower = faster, higher = less CPU)
+            probe_mode: 'evaluate' (one page.evaluate per check) or
+                        'locator' (one locator query per selector)
+            detection_mode: 'poll' (check every interval), 'push' (in-page
+                            MutationObserver notifies us, polling as fallback)
+                            'network' (parse the page's stock JSON responses)
+                            or 'http' (poll over plain HTTP, browser only for the click)
+            reload_interval: Base seconds between page reloads while waiting
+                             (None = never reload, rely on client-side updates)
+            selector_engine: Learns selector order (None = shared engine)
         """
         self.page = page
         self.check_interval = check_interval
+        self.probe_mode = probe_mode
+        self.detection_mode = detection_mode
         self.timer = Timer()
+        self.selector_engine = selector_engine or get_selector_engine()
+        
+        # Selectors come from the shared registry (bot/selector_registry.py)
+        self.add_to_cart_selectors = get_selectors('add_to_cart')
+        self.buy_now_selectors = get_selectors('buy_now')
+        self.out_of_stock_selectors = get_selectors('out_of_stock')
         
-        # Possible selectors for Add to Cart button
-        self.add_to_cart_selectors = [
-            'button.add-to-cart-buy-now-btn',
-            'button[class*="add-to-cart"]',
-            'button:has-text("Add to Cart")',
-            'button:has-text("ADD TO CART")',
-            '.pdp-button-add-to-cart',
-            '[data-spm-anchor-id*="cart"]',
-        ]
-        
-        # Possible selectors for Buy Now button
-        self.buy_now_selectors = [
-            'button.buy-now-btn',
-            'button[class*="buy-now"]',
-            'button:has-text("Buy Now")',
-            'button:has-text("BUY NOW")',
-            '.pdp-button-buy-now',
-        ]
-        
-        # Selectors for out-of-stock indicators
-        self.out_of_stock_selectors = [
-            'text=Out of Stock',
-            'text=Currently Unavailable',
-            'text=Sold Out',
-            '.pdp-product-not-available',
-        ]
+        # Playwright IPC accounting (each call is one round trip to the browser)
+        self.playwright_calls = 0
+        self.last_check_calls = 0
+        
+        # Push detection state (filled in by the in-page observer)
+        self.observer_attached = False
+        self.push_verdict = None
+        self.push_received_at = None
+        
+        # Network detection (see attach_network_detector)
+        self.network_detector = None
+        
+        # Out-of-browser detection (see attach_http_probe)
+        self.http_probe = None
+        
+        # Loop timing of the last polling run (see timing_stats)
+        self.schedule = None
+        
+        # Reloads keep a static page showing fresh server state
+        self.reloader = ReloadScheduler(page, interval=reload_interval) if reload_interval else None
+    
+    def _count_call(self, n: int = 1):
+        """Record Playwright round trips made by the current check"""
+        self.playwright_calls += n
+        self.last_check_calls += n
+    
+    def probe(self) -> dict:
+        """
+        Evaluate every selector family inside the page in ONE round trip.
+        
+        Returns:
+            dict: Verdict with keys 'button' ('add_to_cart', 'buy_now' or None),
+                  'selector', 'disabled' and 'out_of_stock'
+        """
+        ordered = self._ordered_selectors()
+        self._count_call()
+        verdict = self.page.evaluate(PROBE_SCRIPT, self._selector_families(ordered))
+        self._record_probe(ordered, verdict)
+        return verdict
+    
+    def _ordered_selectors(self) -> dict:
+        """Selector lists per family, best-performing first"""
+        return {
+            'add_to_cart': self.selector_engine.order('add_to_cart', self.add_to_cart_selectors),
+            'buy_now': self.selector_engine.order('buy_now', self.buy_now_selectors),
+            'out_of_stock': self.selector_engine.order('out_of_stock', self.out_of_stock_selectors),
+        }
+    
+    def _selector_families(self, ordered: Optional[dict] = None) -> dict:
+        """Selector lists in the form the in-page scripts expect"""
+        return {
+            family: [to_dom_query(s) for s in selectors]
+            for family, selectors in (ordered or self._ordered_selectors()).items()
+        }
+    
+    # Verdict bookkeeping and logging below is pure Python, shared by the sync
+    # and asyncio monitors: the ports only differ in how they talk to the page.
+    
+    def _record_probe(self, ordered: dict, verdict: dict):
+        """Credit the selector that found a clickable button in a probe() verdict"""
+        if verdict['button'] and not verdict['disabled']:
+            self.selector_engine.record_winner(
+                verdict['button'], ordered[verdict['button']], verdict['selector']
+            )
+    
+    @staticmethod
+    def _verdict_available(verdict: dict) -> bool:
+        """
+        Read a probe() verdict.
+        
+        Returns:
+            bool: True if a buy button is present and enabled
+        """
+        if verdict['button'] and not verdict['disabled']:
+            log_success(f"[{get_timestamp()}] Product available! (found: {verdict['selector']})")
+            return True
+        return False
+    
+    def _record_locator_hit(self, family: str, ordered: dict, selector: str):
+        """Credit the selector that found an enabled button in a locator check"""
+        self.selector_engine.record_winner(family, ordered[family], selector)
+        log_success(f"[{get_timestamp()}] Product available! (found: {selector})")
+    
+    def _log_reload_cadence(self):
+        """Log the reload cadence, if the page is reloaded at all"""
+        if self.reloader:
+            log_info(f"Reloading every ~{self.reloader.interval:.1f}s (adaptive)")
+    
+    def _log_poll_progress(self, checks: int):
+        """Log polling progress every 100 checks"""
+        if checks % 100 == 0:
+            check = self.schedule.check_times.summary()
+            log_info(
+                f"Check #{checks} ({self.timer.elapsed():.1f}s elapsed, "
+                f"p50 {check['p50']:.1f}ms / p99 {check['p99']:.1f}ms per check, "
+                f"{self.schedule.missed} deadlines missed, "
+                f"{self.last_check_calls} Playwright calls/check)"
+            )
+    
+    def _push_wait_time(self, remaining: float) -> float:
+        """Seconds to wait for a push: until it arrives or the next reload is due"""
+        if self.reloader:
+            return min(remaining, self.reloader.time_until_due())
+        return remaining
+    
+    def _log_push_result(self):
+        """Log a pushed availability verdict and its delivery delay"""
+        verdict = self.push_verdict or {}
+        if self.push_received_at and verdict.get('detected_at'):
+            delivery_ms = self.push_received_at * 1000 - verdict['detected_at']
+            log_info(f"Observer-to-Python delivery: {delivery_ms:.0f}ms")
+        log_success(
+            f"[{get_timestamp()}] Product available after {self.timer} "
+            f"(pushed: {verdict.get('selector')})"
+        )
+    
+    @staticmethod
+    def _empty_product_info() -> dict:
+        """get_product_info() result before anything is read"""
+        return {
+            'title': None,
+            'price': None,
+            'original_price': None,
+            'discount': None,
+            'available': False,
+        }
+    
+    @staticmethod
+    def _log_product_info(info: dict):
+        """Log the title and price read by get_product_info()"""
+        if info['title']:
+            log_info(f"Product: {info['title']}")
+        if info['price']:
+            log_info(f"Price: {info['price']}")
     
     def is_product_available(self) -> bool:
         """
         Check if product is currently available for purchase.
         
+        Returns:
+            bool: True if Add to Cart or Buy Now button is clickable
+        """
+        self.last_check_calls = 0
+        
+        if self.probe_mode == 'evaluate':
+            try:
+                return self._verdict_available(self.probe())
+            except Exception as e:
+                log_warning(f"Error checking availability: {e}")
+                return False
+        
+        return self._is_product_available_locators()
+    
+    def _is_product_available_locators(self) -> bool:
+        """
+        Legacy availability check: one locator query per selector.
+        Slower (up to 15 round trips) but useful for debugging selectors.
+        
         Returns:
             bool: True if Add to Cart or Buy Now button is clickable
         """
         try:
-            # Method 1: Check if Add to Cart button exists and is enabled
-            for selector in self.add_to_cart_selectors:
-                try:
-                    button = self.page.locator(selector).first
-                    if button.count() > 0:
-                        # Check if button is enabled (not disabled)
-                        is_disabled = button.get_attribute('disabled')
-                        if not is_disabled:
-                            log_success(f"[{get_timestamp()}] Product available! (found: {selector})")
-                            return True
-                except:
-                    continue
+            ordered = self._ordered_selectors()
             
+            # Method 1: Check if Add to Cart button exists and is enabled
             # Method 2: Check Buy Now button
-            for selector in self.buy_now_selectors:
-                try:
-                    button = self.page.locator(selector).first
-                    if button.count() > 0:
-                        is_disabled = button.get_attribute('disabled')
-                        if not is_disabled:
-                            log_success(f"[{get_timestamp()}] Product available! (found: {selector})")
-                            return True
-                except:
-                    continue
+            for family in ('add_to_cart', 'buy_now'):
+                for selector in ordered[family]:
+                    try:
+                        button = self.page.locator(selector).first
+                        self._count_call()
+                        if button.count() > 0:
+                            # Check if button is enabled (not disabled)
+                            self._count_call()
+                            is_disabled = button.get_attribute('disabled')
+                            if not is_disabled:
+                                self._record_locator_hit(family, ordered, selector)
+                                return True
+                    except:
+                        continue
             
             # Method 3: Check if out of stock message is NOT present
-            for selector in self.out_of_stock_selectors:
+            for selector in ordered['out_of_stock']:
                 try:
+                    self._count_call()
                     if self.page.locator(selector).count() > 0:
                         return False
                 except:
@@ -116,6 +347,49 @@ class ProductMonitor:
     ) -> bool:
         """
         Wait for product to become available.
+        In 'push' detection mode this waits on the in-page observer and only
+        polls if the observer cannot be attached.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Optional callback function called on each check (polling only)
+            
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        self._log_reload_cadence()
+        self.schedule = None
+        
+        try:
+            if self.detection_mode == 'network':
+                return self.attach_network_detector().wait_for_stock(max_wait, reloader=self.reloader)
+            
+            if self.detection_mode == 'http':
+                return self._wait_by_http(max_wait, on_check)
+            
+            if self.detection_mode == 'push' and self.attach_observer():
+                return self._wait_for_push(max_wait, on_check)
+            
+            return self._wait_by_polling(max_wait, on_check)
+        finally:
+            if self.schedule:
+                self.schedule.log_stats()
+            if self.reloader:
+                self.reloader.log_stats()
+    
+    def timing_stats(self) -> Optional[dict]:
+        """
+        Loop timing of the last polling run: check duration, inter-check gap
+        and lateness percentiles (ms) plus the missed-deadline count.
+        
+        Returns:
+            dict: DeadlineScheduler.stats(), None if nothing was polled yet
+        """
+        return self.schedule.stats() if self.schedule else None
+    
+    def _wait_by_polling(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Poll is_product_available() on a fixed check_interval cadence.
         
         Args:
             max_wait: Maximum seconds to wait
@@ -128,13 +402,22 @@ class ProductMonitor:
         log_info(f"Maximum wait time: {max_wait}s")
         
         self.timer.start()
+        self.schedule = DeadlineScheduler(self.check_interval)
         checks = 0
         
         while self.timer.elapsed() < max_wait:
+            # Sleeps until the next deadline, not for a full interval after the check
+            tick = self.schedule.wait_next()
             checks += 1
             
+            # Reload returns at commit, so this check already probes the new DOM
+            if self.reloader:
+                self.reloader.maybe_reload()
+            
             # Check if available
-            if self.is_product_available():
+            available = self.is_product_available()
+            self.schedule.record_check(time.perf_counter() - tick)
+            if available:
                 log_success(f"Product available after {self.timer} ({checks} checks)")
                 return True
             
@@ -142,18 +425,150 @@ class ProductMonitor:
             if on_check:
                 on_check(checks, self.timer.elapsed())
             
-            # Log progress every 100 checks
-            if checks % 100 == 0:
-                elapsed = self.timer.elapsed()
-                rate = checks / elapsed if elapsed > 0 else 0
-                log_info(f"Check #{checks} ({rate:.1f} checks/sec, {elapsed:.1f}s elapsed)")
-            
-            # Wait before next check
-            time.sleep(self.check_interval)
+            self._log_poll_progress(checks)
         
         log_error(f"Timeout after {self.timer} ({checks} checks)")
         return False
     
+    def attach_observer(self) -> bool:
+        """
+        Install the in-page MutationObserver and the Python callback binding.
+        
+        Returns:
+            bool: True if the observer is running on the current page
+        """
+        if self.observer_attached:
+            return True
+        
+        try:
+            script = OBSERVER_SCRIPT.replace(
+                '__FAMILIES__', json.dumps(self._selector_families())
+            )
+            self.page.expose_binding('__sniperNotify', self._on_push)
+            self.page.add_init_script(script)
+            self.page.evaluate(script)
+            self.observer_attached = True
+            log_success("Availability observer attached")
+            return True
+        except Exception as e:
+            log_warning(f"Could not attach observer, falling back to polling: {e}")
+            return False
+    
+    def attach_network_detector(
+        self,
+        url_patterns: Optional[List[str]] = None,
+        sku_id: Optional[str] = None
+    ) -> NetworkStockDetector:
+        """
+        Start parsing the page's stock/SKU JSON responses.
+        Attach before loading the page to also catch the initial payload.
+        
+        Args:
+            url_patterns: URL fragments of stock responses (None = defaults)
+            sku_id: Only trust stock entries for this SKU/item id
+            
+        Returns:
+            NetworkStockDetector: The attached detector
+        """
+        if self.network_detector is None:
+            self.network_detector = NetworkStockDetector(
+                self.page, url_patterns=url_patterns, sku_id=sku_id
+            )
+        self.network_detector.attach()
+        return self.network_detector
+    
+    def attach_http_probe(
+        self,
+        url: Optional[str] = None,
+        sku_id: Optional[str] = None,
+        min_interval: float = 0.5
+    ) -> HttpAvailabilityProbe:
+        """
+        Create the out-of-browser HTTP probe, sharing this page's cookies.
+        
+        Args:
+            url: Product page or stock endpoint to poll (None = current page URL)
+            sku_id: Only trust stock entries for this SKU/item id
+            min_interval: Seconds between HTTP requests (politely bounded)
+            
+        Returns:
+            HttpAvailabilityProbe: The probe
+        """
+        if self.http_probe is None:
+            self.http_probe = HttpAvailabilityProbe.from_context(
+                self.page.context, url or self.page.url, page=self.page,
+                sku_id=sku_id, min_interval=min_interval
+            )
+        return self.http_probe
+    
+    def _wait_by_http(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Wait on the HTTP probe, then reload once so the browser can click.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Passed on to the polling used after the reload
+            
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        timer = Timer().start()
+        if not self.attach_http_probe().wait_for_stock(max_wait):
+            return False
+        
+        # Hand over to the browser: fresh page, then confirm the button is there
+        self.refresh_page()
+        return self._wait_by_polling(max(max_wait - timer.elapsed(), 10), on_check)
+    
+    def _on_push(self, source, verdict: dict):
+        """Binding called from the page when a button becomes clickable"""
+        if self.push_verdict is None:
+            self.push_verdict = verdict
+            self.push_received_at = time.time()
+    
+    def _wait_for_push(self, max_wait: float, on_check: Optional[Callable] = None) -> bool:
+        """
+        Block until the observer reports availability. No polling from Python:
+        the page wakes us up through a DOM attribute flip.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Passed on to the polling fallback
+            
+        Returns:
+            bool: True if product became available, False if timeout
+        """
+        log_info("Waiting for availability push from page observer")
+        log_info(f"Maximum wait time: {max_wait}s")
+        
+        self.timer.start()
+        while True:
+            remaining = max_wait - self.timer.elapsed()
+            if remaining <= 0:
+                log_error(f"Timeout after {self.timer} (push mode)")
+                return False
+            
+            # The init script re-installs the observer on every reload
+            wait_for = self._push_wait_time(remaining)
+            
+            try:
+                self.page.wait_for_function(
+                    "() => document.documentElement.hasAttribute('data-sniper-available')",
+                    polling='mutation',
+                    timeout=max(wait_for, 0.001) * 1000
+                )
+                break
+            except PlaywrightTimeout:
+                if self.reloader:
+                    self.reloader.maybe_reload()
+            except Exception as e:
+                remaining = max_wait - self.timer.elapsed()
+                log_warning(f"Push wait failed ({e}), polling for remaining {remaining:.1f}s")
+                return self._wait_by_polling(max(remaining, 0), on_check)
+        
+        self._log_push_result()
+        return True
+    
     def continuous_monitor(
         self,
         callback: Callable,
@@ -169,74 +584,61 @@ class ProductMonitor:
         """
         interval = check_interval or self.check_interval
         log_info("Starting continuous monitoring (Ctrl+C to stop)")
+        self.schedule = DeadlineScheduler(interval)
         
         try:
             while True:
-                if self.is_product_available():
+                tick = self.schedule.wait_next()
+                if self.reloader:
+                    self.reloader.maybe_reload()
+                
+                available = self.is_product_available()
+                self.schedule.record_check(time.perf_counter() - tick)
+                if available:
                     # Call callback and check if we should continue
                     should_continue = callback()
                     if not should_continue:
                         break
                 
-                time.sleep(interval)
-                
         except KeyboardInterrupt:
             log_warning("Monitoring stopped by user")
+        finally:
+            self.schedule.log_stats()
     
-    def refresh_page(self):
-        """Refresh the product page"""
+    def refresh_page(self, wait_until: str = "domcontentloaded"):
+        """
+        Refresh the product page once (the monitor loops use self.reloader).
+        
+        Args:
+            wait_until: Load state to wait for ("commit" returns earliest)
+        """
         try:
             log_info("Refreshing page...")
-            self.page.reload(wait_until="domcontentloaded")
-            log_success("Page refreshed")
+            timer = Timer().start()
+            self.page.reload(wait_until=wait_until)
+            log_success(f"Page refreshed in {timer}")
         except Exception as e:
             log_error(f"Failed to refresh page: {e}")
     
-    def get_product_info(self) -> dict:
+    def get_product_info(self, budget: float = 2.0) -> dict:
         """
         Extract product information from page.
+        All fields are read in one evaluation; missing ones come back as None
+        once the budget is spent instead of each waiting out the page timeout.
+        
+        Args:
+            budget: Maximum seconds to wait for title/price to render
         
         Returns:
             dict: Product info (title, price, availability)
         """
-        info = {
-            'title': None,
-            'price': None,
-            'original_price': None,
-            'discount': None,
-            'available': False,
-        }
+        info = self._empty_product_info()
         
         try:
-            # Get product title
-            title_selectors = [
-                'h1.pdp-mod-product-badge-title',
-                '.pdp-product-title',
-                'h1[class*="title"]',
-            ]
-            for selector in title_selectors:
-                try:
-                    title = self.page.locator(selector).first.inner_text()
-                    if title:
-                        info['title'] = title.strip()
-                        break
-                except:
-                    continue
-            
-            # Get price
-            price_selectors = [
-                '.pdp-price',
-                'span[class*="price"]',
-                '.price-current',
-            ]
-            for selector in price_selectors:
-                try:
-                    price = self.page.locator(selector).first.inner_text()
-                    if price:
-                        info['price'] = price.strip()
-                        break
-                except:
-                    continue
+            info.update(extract_fields(self.page, {
+                'title': get_selectors('product_title'),
+                'price': get_selectors('product_price'),
+            }, budget=budget))
             
             # Check availability
             info['available'] = self.is_product_available()
@@ -246,24 +648,28 @@ class ProductMonitor:
         
         return info
     
-    def pre_load(self, url: str):
+    def pre_load(self, url: str) -> dict:
         """
         Pre-load product page before monitoring starts.
         
         Args:
             url: Product URL to load
+        
+        Returns:
+            dict: Product info read while pre-loading (see get_product_info)
         """
         log_info(f"Pre-loading product page...")
+        if self.detection_mode == 'network':
+            self.attach_network_detector()
+        
         try:
             self.page.goto(url, wait_until="domcontentloaded")
             log_success("Product page loaded")
             
             # Get and display product info
             info = self.get_product_info()
-            if info['title']:
-                log_info(f"Product: {info['title']}")
-            if info['price']:
-                log_info(f"Price: {info['price']}")
+            self._log_product_info(info)
+            return info
             
         except Exception as e:
             log_error(f"Failed to load product page: {e}")
@@ -0,0 +1,206 @@
+"""
+Multi-Product Monitor
+=====================
+
+Watches several product pages as tabs of ONE browser instead of one browser
+per product. A single loop probes the tabs in turn, staggered so the probes
+are spread evenly over the check interval, and hands back whichever product
+becomes available first.
+
+Chrome throttles timers in background tabs (down to once per second or
+less), which would delay the page's own stock polling in every tab but the
+focused one. Launch with BACKGROUND_THROTTLING_ARGS and call keep_active()
+on each tab to stop that.
+"""
+
+import heapq
+import time
+from typing import Callable, List, Optional, Tuple
+from playwright.sync_api import Page, BrowserContext
+
+from .monitor import ProductMonitor
+from .selector_engine import SelectorEngine
+from .utils import log_success, log_error, log_info, log_warning, Timer, get_timestamp
+
+
+# Chromium switches that stop background/occluded tabs from being throttled
+BACKGROUND_THROTTLING_ARGS = [
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+]
+
+
+def keep_active(page: Page) -> bool:
+    """
+    Make a tab behave as if it were focused and visible (Chromium only).
+    
+    Args:
+        page: Playwright page object
+    
+    Returns:
+        bool: True if the CDP overrides were applied
+    """
+    try:
+        session = page.context.new_cdp_session(page)
+        session.send("Emulation.setFocusEmulationEnabled", {"enabled": True})
+        session.send("Page.enable")
+        session.send("Page.setWebLifecycleState", {"state": "active"})
+        return True
+    except Exception as e:
+        log_warning(f"Could not disable tab throttling: {e}")
+        return False
+
+
+class MultiProductMonitor:
+    """
+    Monitors several product pages in one browser context.
+    
+    Usage:
+        multi = MultiProductMonitor(context, [url1, url2, url3])
+        multi.open_all()
+        winner = multi.wait_for_first_available(max_wait=300)
+        if winner:
+            url, page = winner
+    """
+    
+    def __init__(
+        self,
+        context: BrowserContext,
+        product_urls: List[str],
+        check_interval: float = 0.1,
+        reload_interval: Optional[float] = None,
+        selector_engine: Optional[SelectorEngine] = None
+    ):
+        """
+        Initialize multi-product monitor.
+        
+        Args:
+            context: Browser context to open the tabs in (shares the login)
+            product_urls: Product URLs to watch
+            check_interval: Seconds between checks of the SAME product
+            reload_interval: Base seconds between reloads of each tab (None = never)
+            selector_engine: Learns selector order (None = shared engine)
+        """
+        if not product_urls:
+            raise ValueError("No product URLs to monitor")
+        
+        self.context = context
+        self.product_urls = list(product_urls)
+        self.check_interval = check_interval
+        self.reload_interval = reload_interval
+        self.selector_engine = selector_engine
+        self.timer = Timer()
+        
+        # url -> ProductMonitor (filled in by open_all)
+        self.monitors = {}
+        self.probes = {url: 0 for url in self.product_urls}
+    
+    def open_all(self):
+        """Open and pre-load one tab per product"""
+        log_info(f"Opening {len(self.product_urls)} product tabs...")
+        
+        for url in self.product_urls:
+            page = self.context.new_page()
+            keep_active(page)
+            monitor = ProductMonitor(
+                page,
+                check_interval=self.check_interval,
+                reload_interval=self.reload_interval,
+                selector_engine=self.selector_engine
+            )
+            try:
+                monitor.pre_load(url)
+            except Exception as e:
+                log_warning(f"Skipping {url}: {e}")
+                page.close()
+                continue
+            self.monitors[url] = monitor
+        
+        log_success(f"Watching {len(self.monitors)} products in one browser")
+    
+    def wait_for_first_available(
+        self,
+        max_wait: float = 300,
+        on_check: Optional[Callable] = None
+    ) -> Optional[Tuple[str, Page]]:
+        """
+        Probe the tabs round-robin until one product becomes available.
+        
+        Each product is checked every check_interval; the tabs are offset
+        by check_interval / N so the probes are evenly spaced.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            on_check: Optional callback called after each probe with (url, probes, elapsed)
+        
+        Returns:
+            (url, page) of the product that flipped first, None on timeout
+        """
+        if not self.monitors:
+            log_error("No product tabs open - call open_all() first")
+            return None
+        
+        urls = list(self.monitors)
+        spacing = self.check_interval / len(urls)
+        log_info(
+            f"Monitoring {len(urls)} products (each every {self.check_interval}s, "
+            f"one probe every {spacing*1000:.0f}ms)"
+        )
+        
+        self.timer.start()
+        start = time.perf_counter()
+        schedule = [(start + i * spacing, i) for i in range(len(urls))]
+        heapq.heapify(schedule)
+        
+        while self.timer.elapsed() < max_wait:
+            due, i = heapq.heappop(schedule)
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            
+            url = urls[i]
+            monitor = self.monitors[url]
+            if monitor.reloader:
+                monitor.reloader.maybe_reload()
+            
+            self.probes[url] += 1
+            if monitor.is_product_available():
+                log_success(
+                    f"[{get_timestamp()}] First available after {self.timer}: {url}"
+                )
+                self.log_stats()
+                return url, monitor.page
+            
+            if on_check:
+                on_check(url, self.probes[url], self.timer.elapsed())
+            
+            # Don't try to catch up on missed slots, just keep the spacing
+            heapq.heappush(schedule, (max(due + self.check_interval, time.perf_counter()), i))
+        
+        log_error(f"Timeout after {self.timer} - no product became available")
+        self.log_stats()
+        return None
+    
+    def close_others(self, keep_url: str):
+        """
+        Close every tab except the winner to free browser resources.
+        
+        Args:
+            keep_url: URL of the tab to keep open
+        """
+        for url, monitor in list(self.monitors.items()):
+            if url == keep_url:
+                continue
+            try:
+                monitor.page.close()
+            except:
+                pass
+            del self.monitors[url]
+    
+    def log_stats(self):
+        """Log how often each product was probed"""
+        elapsed = self.timer.elapsed()
+        for url, count in self.probes.items():
+            rate = count / elapsed if elapsed > 0 else 0
+            log_info(f"  {count} probes ({rate:.1f}/s): {url}")
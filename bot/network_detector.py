@@ -0,0 +1,312 @@
+"""
+Network Stock Detector
+======================
+
+Detects availability from the product page's own stock/SKU JSON responses
+instead of from buttons. Reacts as soon as the payload arrives, before the
+page re-renders, and does not care about CSS class names.
+"""
+
+import json
+import time
+from typing import Any, Callable, List, Optional
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeout
+
+from .reload_scheduler import ReloadScheduler
+from .utils import log_success, log_info, log_warning, Timer, get_timestamp, extract_product_id
+
+
+# URL fragments of responses that may carry stock data
+DEFAULT_STOCK_URL_PATTERNS = [
+    'mtop.lazada',
+    '/pdp/',
+    'stock',
+    'sku',
+    'inventory',
+]
+
+# Keys whose value says "in stock" directly
+IN_STOCK_FLAGS = ['inStock', 'isInStock', 'in_stock', 'available', 'isAvailable']
+
+# Keys whose value says "sold out" directly
+SOLD_OUT_FLAGS = ['soldOut', 'isSoldOut', 'sold_out', 'outOfStock', 'isOutOfStock']
+
+# Keys holding a remaining quantity
+QUANTITY_KEYS = ['stock', 'quantity', 'stockQuantity', 'availableQuantity', 'stockNum', 'qty']
+
+# Keys identifying which SKU/item a dict describes
+ID_KEYS = ['skuId', 'sku_id', 'sku', 'itemId', 'item_id', 'id']
+
+# ID_KEYS naming a SKU of the entry above (the others name an entry of its own)
+SKU_ID_KEYS = ['skuId', 'sku_id', 'sku']
+
+
+def load_json_body(text: str) -> Any:
+    """
+    Parse a JSON or JSONP response body.
+    
+    Args:
+        text: Raw response text
+    
+    Returns:
+        Parsed JSON, or None if the body is not JSON
+    """
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    
+    # JSONP: callback({...})
+    start, end = text.find('{'), text.rfind('}')
+    if start == -1 or end <= start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+
+
+def _stock_from_dict(data: dict) -> Optional[bool]:
+    """Stock verdict carried directly by one dict (not its children)"""
+    for key in SOLD_OUT_FLAGS:
+        if isinstance(data.get(key), bool):
+            return not data[key]
+    for key in IN_STOCK_FLAGS:
+        if isinstance(data.get(key), bool):
+            return data[key]
+    for key in QUANTITY_KEYS:
+        value = data.get(key)
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            return value > 0
+        if isinstance(value, str) and value.strip().isdigit():
+            return int(value) > 0
+    return None
+
+
+def parse_stock_payload(data: Any, sku_id: Optional[str] = None) -> Optional[bool]:
+    """
+    Find stock information anywhere in a JSON payload.
+    
+    With a sku_id, only the entry carrying that id counts: its own stock
+    fields, its id-less sub-objects and its SKUs. Other items nested inside
+    it (recommendations, bundles) are out of scope unless they match too.
+    
+    Args:
+        data: Parsed JSON
+        sku_id: Only consider entries for this SKU/item id (None = any)
+    
+    Returns:
+        bool: True if any (matching) entry is in stock, False if stock info was
+              found but nothing is in stock, None if the payload has no stock info
+    """
+    verdicts = []
+    
+    def walk(node, in_scope):
+        if isinstance(node, dict):
+            if sku_id is not None:
+                if any(str(node.get(key)) == str(sku_id) for key in ID_KEYS if key in node):
+                    in_scope = True
+                elif any(key in node for key in ID_KEYS if key not in SKU_ID_KEYS):
+                    in_scope = False  # Another item nested in the matching one
+            if in_scope:
+                verdict = _stock_from_dict(node)
+                if verdict is not None:
+                    verdicts.append(verdict)
+            for value in node.values():
+                if isinstance(value, (dict, list)):
+                    walk(value, in_scope)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value, in_scope)
+    
+    walk(data, sku_id is None)
+    
+    if not verdicts:
+        return None
+    return any(verdicts)
+
+
+class NetworkStockDetector:
+    """
+    Watches page responses for stock/SKU JSON.
+    
+    Usage:
+        detector = NetworkStockDetector(page, sku_id="123456")
+        detector.attach()
+        page.reload()
+        is_available = detector.wait_for_stock(max_wait=60)
+    """
+    
+    def __init__(
+        self,
+        page: Page,
+        url_patterns: Optional[List[str]] = None,
+        sku_id: Optional[str] = None,
+        on_stock: Optional[Callable[[bool, str], None]] = None,
+        item_id: Optional[str] = None
+    ):
+        """
+        Initialize network stock detector.
+        
+        Args:
+            page: Playwright page object
+            url_patterns: URL fragments of responses worth parsing
+            sku_id: Only trust stock entries for this SKU/item id
+            on_stock: Optional callback(available, url) for every stock payload
+            item_id: Item id used when no sku_id is given (None = parsed from
+                     the page URL, so recommendation payloads for other items
+                     are ignored)
+        """
+        self.page = page
+        self.url_patterns = url_patterns or DEFAULT_STOCK_URL_PATTERNS
+        self.sku_id = sku_id
+        self.item_id = item_id
+        self.on_stock = on_stock
+        self.timer = Timer()
+        
+        self.attached = False
+        self.available = None       # Last verdict seen (None = no stock data yet)
+        self.available_at = None    # time.time() when in-stock data first landed
+        self.source_url = None      # Response that carried the in-stock verdict
+        self.payloads_parsed = 0
+        self._pending = []          # Matching responses not parsed yet
+    
+    def matches(self, response: Response) -> bool:
+        """
+        Cheap filter: could this response carry stock data?
+        Only looks at data already known to Python (no browser round trip).
+        """
+        if response.request.resource_type not in ('xhr', 'fetch', 'script', 'document'):
+            return False
+        url = response.url.lower()
+        return any(pattern.lower() in url for pattern in self.url_patterns)
+    
+    def attach(self):
+        """Start listening to page responses"""
+        if not self.attached:
+            self.page.on("response", self._on_response)
+            self.attached = True
+    
+    def detach(self):
+        """Stop listening to page responses"""
+        if self.attached:
+            self.page.remove_listener("response", self._on_response)
+            self.attached = False
+    
+    def _on_response(self, response: Response):
+        """Queue matching responses; bodies are read by process_pending()"""
+        if self.matches(response):
+            self._pending.append(response)
+    
+    def handle_response(self, response: Response) -> Optional[bool]:
+        """
+        Parse one response and update the detector state.
+        
+        Returns:
+            bool or None: Stock verdict carried by the response
+        """
+        if not self._is_json(response):
+            return None
+        try:
+            text = response.text()
+        except Exception:
+            return None  # Body gone (navigation) or not readable
+        return self.apply_body(text, response.url)
+    
+    @staticmethod
+    def _is_json(response: Response) -> bool:
+        """True if the response declares a JSON/JSONP body"""
+        content_type = response.headers.get('content-type', '')
+        return 'json' in content_type or 'javascript' in content_type
+    
+    def scope_id(self) -> Optional[str]:
+        """Id stock entries must belong to: the SKU, else the page's item (None = any)"""
+        return self.sku_id or self.item_id or extract_product_id(self.page.url)
+    
+    def apply_body(self, text: str, url: str) -> Optional[bool]:
+        """
+        Parse a response body and update the detector state.
+        
+        Args:
+            text: Response body
+            url: Response URL (for reporting)
+        
+        Returns:
+            bool or None: Stock verdict carried by the body
+        """
+        verdict = parse_stock_payload(load_json_body(text), self.scope_id())
+        if verdict is None:
+            return None
+        
+        self.payloads_parsed += 1
+        self.available = verdict
+        if verdict and self.available_at is None:
+            self.available_at = time.time()
+            self.source_url = url
+        
+        if self.on_stock:
+            self.on_stock(verdict, url)
+        return verdict
+    
+    def process_pending(self) -> bool:
+        """
+        Parse queued responses.
+        
+        Returns:
+            bool: True if any of them reported stock
+        """
+        found = False
+        while self._pending:
+            if self.handle_response(self._pending.pop(0)):
+                found = True
+        return found
+    
+    def wait_for_stock(self, max_wait: float = 300, reloader: Optional[ReloadScheduler] = None) -> bool:
+        """
+        Block until a stock payload says the product is available.
+        Sleeps inside Playwright's event wait, so nothing runs between responses.
+        
+        Args:
+            max_wait: Maximum seconds to wait
+            reloader: Optional scheduler; reloads make the page re-fetch stock
+        
+        Returns:
+            bool: True if stock was reported, False if timeout
+        """
+        self.attach()
+        self.timer.start()
+        log_info(f"Waiting for stock data in network responses (max {max_wait}s)")
+        
+        while True:
+            if self.process_pending():
+                log_success(
+                    f"[{get_timestamp()}] Stock reported by network after {self.timer} "
+                    f"({self.source_url})"
+                )
+                return True
+            
+            remaining = max_wait - self.timer.elapsed()
+            if remaining <= 0:
+                break
+            
+            wait_for = remaining
+            if reloader:
+                wait_for = min(remaining, reloader.time_until_due())
+            
+            try:
+                # The listener also receives this response and queues it
+                self.page.wait_for_event(
+                    "response", predicate=self.matches, timeout=max(wait_for, 0.001) * 1000
+                )
+            except PlaywrightTimeout:
+                if reloader:
+                    reloader.maybe_reload()
+            except Exception as e:
+                log_warning(f"Network wait interrupted: {e}")
+                time.sleep(0.05)
+        
+        log_warning(f"No in-stock payload after {self.timer} ({self.payloads_parsed} stock payloads seen)")
+        return False
@@ -0,0 +1,168 @@
+"""
+Precision Trigger
+=================
+
+Fires at an exact instant instead of somewhere within the last second.
+
+The wait has three phases:
+- coarse : plain sleeps (at most 1 s each, so a countdown can be shown)
+           until COARSE_MARGIN before the fire time
+- short  : 1 ms sleeps until SPIN_WINDOW before it (sleep overshoot is
+           typically 0.05-1 ms, far too coarse for the last stretch)
+- spin   : busy-read the clock until the fire time
+
+Firing `lead` seconds before the target (the one-way latency to the
+server) makes the first request arrive at the target instead of leaving
+then. Every fire records its overshoot (how late it actually fired), so
+the precision can be checked on the machine the bot runs on.
+
+Usage:
+    trigger = PrecisionTrigger()
+    wait_until(listing_time, pre_load_seconds=0, clock=clock, trigger=trigger, lead=0.012)
+    trigger.log_stats()
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+from .deadline_scheduler import LatencyHistogram
+from .utils import log_info
+
+
+# Stop coarse sleeping this long before the fire time (seconds)
+COARSE_MARGIN = 0.1
+
+# Busy-spin for the last stretch (seconds)
+SPIN_WINDOW = 0.002
+
+
+class PrecisionTrigger:
+    """
+    Coarse sleep, short sleeps, then a final spin on the clock.
+    
+    Usage:
+        trigger = PrecisionTrigger()
+        overshoot = trigger.wait(clock, fire_ns)
+        trigger.stats()['overshoot']['p99']
+    """
+    
+    def __init__(self, coarse_margin: float = COARSE_MARGIN, spin_window: float = SPIN_WINDOW):
+        """
+        Initialize the trigger.
+        
+        Args:
+            coarse_margin: Seconds before the fire time where coarse sleeping ends
+            spin_window: Seconds before the fire time where spinning starts
+        """
+        self.coarse_margin = coarse_margin
+        self.spin_window = spin_window
+        self.overshoot = LatencyHistogram(maxlen=1000)
+        self.fires = 0
+        self.late_calls = 0  # wait() called after the fire time had passed
+        self.last_fire_ns = None
+    
+    def _coarse_sleep(self, remaining: float, countdown: Optional[Callable]) -> float:
+        """Seconds to sleep in the coarse phase (0 = coarse phase is over)"""
+        if remaining <= self.coarse_margin:
+            return 0.0
+        if countdown:
+            countdown(remaining)
+        return min(1.0, remaining - self.coarse_margin)
+    
+    def _record(self, clock, fire_ns: int) -> float:
+        """Spin to the fire time, record and return the overshoot (seconds)"""
+        now = clock.now_ns()
+        if now > fire_ns + int(self.spin_window * 1e9):
+            self.late_calls += 1
+        while now < fire_ns:
+            now = clock.now_ns()
+        overshoot = (now - fire_ns) / 1e9
+        self.fires += 1
+        self.last_fire_ns = now
+        self.overshoot.add(overshoot)
+        return overshoot
+    
+    def wait(self, clock, fire_ns: int, countdown: Optional[Callable] = None) -> float:
+        """
+        Block until fire_ns on the given clock.
+        
+        Args:
+            clock: Anything with now_ns() (ClockService, ServerClock)
+            fire_ns: Fire time as Unix nanoseconds on that clock
+            countdown: Called with the remaining seconds during the coarse phase
+        
+        Returns:
+            float: Overshoot in seconds (how late it fired)
+        """
+        while True:
+            pause = self._coarse_sleep((fire_ns - clock.now_ns()) / 1e9, countdown)
+            if pause <= 0:
+                break
+            time.sleep(pause)
+        
+        spin_ns = int(self.spin_window * 1e9)
+        while True:
+            remaining = (fire_ns - spin_ns - clock.now_ns()) / 1e9
+            if remaining <= 0:
+                break
+            time.sleep(min(0.001, remaining))
+        
+        return self._record(clock, fire_ns)
+    
+    async def wait_async(self, clock, fire_ns: int, countdown: Optional[Callable] = None) -> float:
+        """
+        Async version of wait. Yields to the event loop until the spin window,
+        then blocks it for the last SPIN_WINDOW.
+        
+        Args:
+            clock: Anything with now_ns() (ClockService, ServerClock)
+            fire_ns: Fire time as Unix nanoseconds on that clock
+            countdown: Called with the remaining seconds during the coarse phase
+        
+        Returns:
+            float: Overshoot in seconds (how late it fired)
+        """
+        while True:
+            pause = self._coarse_sleep((fire_ns - clock.now_ns()) / 1e9, countdown)
+            if pause <= 0:
+                break
+            await asyncio.sleep(pause)
+        
+        spin_ns = int(self.spin_window * 1e9)
+        while True:
+            remaining = (fire_ns - spin_ns - clock.now_ns()) / 1e9
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(0.001, remaining))
+        
+        return self._record(clock, fire_ns)
+    
+    def stats(self) -> dict:
+        """
+        Fire precision.
+        
+        Returns:
+            dict: fires, late_calls, overshoot summary in ms (p50/p95/p99/max)
+        """
+        return {
+            'fires': self.fires,
+            'late_calls': self.late_calls,
+            'overshoot': self.overshoot.summary(),
+        }
+    
+    def log_stats(self):
+        """Log the overshoot of the fires so far"""
+        s = self.stats()
+        if not s['fires']:
+            return
+        o = s['overshoot']
+        if s['fires'] == 1:
+            log_info(f"Trigger fired {o['max'] * 1000:.0f}us after its target")
+        else:
+            log_info(
+                f"Trigger overshoot over {s['fires']} fires: p50 {o['p50'] * 1000:.0f}us / "
+                f"p99 {o['p99'] * 1000:.0f}us / max {o['max'] * 1000:.0f}us"
+            )
+        if s['late_calls']:
+            log_info(f"  {s['late_calls']} fire(s) were requested after their time had passed")
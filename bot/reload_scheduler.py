@@ -0,0 +1,166 @@
+"""
+Reload Scheduler
+================
+
+Decides when the monitored page should be reloaded so the monitor sees fresh
+server state, and records how long every reload took.
+"""
+
+import time
+from typing import Optional
+from playwright.sync_api import Page
+
+from .deadline_scheduler import LatencyHistogram
+from .utils import log_info, log_warning, format_duration
+
+
+class ReloadScheduler:
+    """
+    Reloads a page on a configurable, adaptive cadence.
+    
+    Reloads return at `wait_until="commit"` (response headers received), so
+    the monitor keeps probing the DOM while the new document streams in.
+    The interval stretches when reloads get slow or fail and relaxes back to
+    the base interval when they are fast again.
+    
+    Usage:
+        reloader = ReloadScheduler(page, interval=2.0)
+        while monitoring:
+            reloader.maybe_reload()
+            check()
+    """
+    
+    def __init__(
+        self,
+        page: Page,
+        interval: float = 2.0,
+        min_interval: float = 0.5,
+        max_interval: float = 10.0,
+        max_duty: float = 0.5,
+        adaptive: bool = True,
+        wait_until: str = "commit",
+        timeout: float = 10.0,
+        latency=None
+    ):
+        """
+        Initialize reload scheduler.
+        
+        Args:
+            page: Playwright page object
+            interval: Base seconds between reloads
+            min_interval: Never reload more often than this
+            max_interval: Never wait longer than this between reloads
+            max_duty: Max fraction of time spent reloading (adaptive mode)
+            adaptive: Stretch/relax the interval based on reload cost and failures
+            wait_until: Playwright load state the reload waits for
+            timeout: Seconds before a reload is abandoned
+            latency: LatencySampler, to tell network time from server time in the stats
+        """
+        self.page = page
+        self.base_interval = interval
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_duty = max_duty
+        self.adaptive = adaptive
+        self.wait_until = wait_until
+        self.timeout = timeout
+        self.latency = latency
+        
+        self.durations = LatencyHistogram(maxlen=1000)  # Seconds per successful reload
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_at = time.perf_counter()
+    
+    def time_until_due(self) -> float:
+        """Seconds until the next reload is due (0 if overdue)"""
+        return max(0.0, self.last_reload_at + self.interval - time.perf_counter())
+    
+    def due(self) -> bool:
+        """True if it is time to reload"""
+        return self.time_until_due() <= 0
+    
+    def maybe_reload(self) -> Optional[float]:
+        """
+        Reload if due.
+        
+        Returns:
+            float: Reload duration in seconds, None if no (successful) reload
+        """
+        if not self.due():
+            return None
+        return self.reload()
+    
+    def reload(self) -> Optional[float]:
+        """
+        Reload the page now.
+        
+        Returns:
+            float: Reload duration in seconds, None if the reload failed
+        """
+        start = time.perf_counter()
+        try:
+            self.page.reload(wait_until=self.wait_until, timeout=self.timeout * 1000)
+        except Exception as e:
+            self.failures += 1
+            self.last_reload_at = time.perf_counter()
+            self._adapt(None)
+            log_warning(f"Reload failed ({e}), next in {self.interval:.1f}s")
+            return None
+        
+        duration = time.perf_counter() - start
+        self.reloads += 1
+        self.durations.add(duration)
+        self.last_reload_at = time.perf_counter()
+        self._adapt(duration)
+        return duration
+    
+    def _adapt(self, duration: Optional[float]):
+        """Update the interval after a reload (duration None = failed)"""
+        if not self.adaptive:
+            return
+        
+        if duration is None:
+            # Back off while the site is struggling
+            target = self.interval * 2
+        else:
+            # Keep time spent reloading under max_duty, else relax to base
+            target = max(self.base_interval, duration / self.max_duty)
+            target = (self.interval + target) / 2
+        
+        self.interval = min(self.max_interval, max(self.min_interval, target))
+    
+    def stats(self) -> dict:
+        """
+        Reload statistics for this run.
+        
+        Returns:
+            dict: reloads, failures, interval (seconds), duration summary in
+                  ms and rtt_ms (p50 round trip, None without a latency sampler)
+        """
+        rtt = self.latency.rtt() if self.latency else None
+        return {
+            'reloads': self.reloads,
+            'failures': self.failures,
+            'interval': self.interval,
+            'duration': self.durations.summary(),
+            'rtt_ms': rtt * 1000 if rtt is not None else None,
+        }
+    
+    def log_stats(self):
+        """Print a one-line reload summary"""
+        stats = self.stats()
+        if not stats['reloads']:
+            log_info(f"Reloads: 0 ({stats['failures']} failed)")
+            return
+        duration = stats['duration']
+        network = ""
+        if stats['rtt_ms'] is not None:
+            # A commit-level reload is one round trip plus the server's time
+            network = f" ({format_duration(stats['rtt_ms'] / 1000)} of it network)"
+        log_info(
+            f"Reloads: {stats['reloads']} ({stats['failures']} failed), "
+            f"p50 {format_duration(duration['p50'] / 1000)}{network}, "
+            f"p95 {format_duration(duration['p95'] / 1000)}, "
+            f"interval now {stats['interval']:.1f}s"
+        )
@@ -0,0 +1,173 @@
+"""
+Render-Lite Mode
+================
+
+Makes the browser do as little rendering work as the bot can get away with:
+- CSS transitions and animations are cut to zero length, and Web Animations
+  (element.animate) finish at once, so a button that slides or fades in is
+  clickable as soon as it is in the DOM, and a cart modal is open as soon as
+  it is added
+- prefers-reduced-motion is forced, for sites that already honour it
+- the viewport is small (less to lay out and paint per frame) and rendered
+  at device scale factor 1
+- optionally, web fonts are replaced by a system font, so they are never
+  downloaded and text never waits for them
+
+The CSS is injected by an init script, so it is in place before the page's
+own styles on every navigation and reload.
+
+Usage:
+    context = browser.new_context(**render_lite_options())
+    apply_render_lite(context)
+"""
+
+import json
+from typing import Optional
+
+from .utils import log_info, log_warning
+
+
+# Smallest viewport that keeps Lazada's desktop layout; narrower windows get
+# tablet layouts the selector registry does not cover
+LITE_VIEWPORT = {'width': 1024, 'height': 640}
+
+# Wait for the add-to-cart modal: its animation is gone, only the render is left
+LITE_MODAL_WAIT = 0.05
+
+RENDER_LITE_CSS = """
+*, *::before, *::after {
+  transition-duration: 0s !important;
+  transition-delay: 0s !important;
+  animation-duration: 0s !important;
+  animation-delay: 0s !important;
+  animation-iteration-count: 1 !important;
+  scroll-behavior: auto !important;
+  caret-color: transparent !important;
+}
+"""
+
+# Added when fonts=False. Nothing uses the @font-face fonts any more, so the
+# browser never fetches them.
+NO_WEB_FONTS_CSS = """
+*, *::before, *::after {
+  font-family: Arial, Helvetica, sans-serif !important;
+}
+"""
+
+# Runs before any page script: adds the style sheet as soon as the document
+# element exists, and makes element.animate() jump to the end state
+RENDER_LITE_SCRIPT = """
+(css) => {
+  if (window.__renderLite) return;
+  window.__renderLite = true;
+  
+  const inject = () => {
+    const style = document.createElement('style');
+    style.id = '__render-lite';
+    style.textContent = css;
+    (document.head || document.documentElement).appendChild(style);
+  };
+  if (document.documentElement) {
+    inject();
+  } else {
+    new MutationObserver((_, observer) => {
+      if (document.documentElement) {
+        observer.disconnect();
+        inject();
+      }
+    }).observe(document, {childList: true});
+  }
+  
+  const animate = Element.prototype.animate;
+  if (animate) {
+    Element.prototype.animate = function (keyframes, options) {
+      const timing = typeof options === 'object' && options !== null ? options : {};
+      return animate.call(this, keyframes, {...timing, duration: 0, delay: 0, endDelay: 0, iterations: 1});
+    };
+  }
+}
+"""
+
+
+def render_lite_options(viewport: Optional[dict] = None) -> dict:
+    """
+    Browser context (or browser.new_page) options for render-lite mode.
+    
+    Args:
+        viewport: Viewport size (None = LITE_VIEWPORT)
+    
+    Returns:
+        dict: Keyword arguments for new_context() / new_page()
+    """
+    return {
+        'viewport': dict(viewport or LITE_VIEWPORT),
+        'device_scale_factor': 1,
+        'reduced_motion': 'reduce',
+    }
+
+
+def _init_script(fonts: bool) -> str:
+    """Init script source with the CSS for this mode baked in"""
+    css = RENDER_LITE_CSS if fonts else RENDER_LITE_CSS + NO_WEB_FONTS_CSS
+    return f"({RENDER_LITE_SCRIPT.strip()})({json.dumps(css)})"
+
+
+def _larger_than_lite(size: Optional[dict]) -> bool:
+    """True if a page's viewport is bigger than LITE_VIEWPORT"""
+    if not size:
+        return False  # No fixed viewport (follows the window)
+    return size['width'] > LITE_VIEWPORT['width'] or size['height'] > LITE_VIEWPORT['height']
+
+
+def apply_render_lite(target, fonts: bool = True) -> bool:
+    """
+    Switch a page or browser context to render-lite mode.
+    
+    Pages and contexts created with render_lite_options() already have the
+    viewport and reduced motion; for others they are set here (pages only).
+    Documents already loaded get the CSS on their next navigation or reload.
+    
+    Args:
+        target: Playwright page or browser context
+        fonts: False to replace web fonts with a system font
+    
+    Returns:
+        bool: True if the mode was applied
+    """
+    try:
+        target.add_init_script(_init_script(fonts))
+        if hasattr(target, 'emulate_media'):
+            target.emulate_media(reduced_motion='reduce')
+            if _larger_than_lite(target.viewport_size):
+                target.set_viewport_size(LITE_VIEWPORT)
+    except Exception as e:
+        log_warning(f"Could not enable render-lite mode: {e}")
+        return False
+    
+    log_info(f"Render-lite mode on (animations off{'' if fonts else ', web fonts off'})")
+    return True
+
+
+async def apply_render_lite_async(target, fonts: bool = True) -> bool:
+    """
+    Async version of apply_render_lite for playwright.async_api targets.
+    
+    Args:
+        target: Playwright page or browser context
+        fonts: False to replace web fonts with a system font
+    
+    Returns:
+        bool: True if the mode was applied
+    """
+    try:
+        await target.add_init_script(_init_script(fonts))
+        if hasattr(target, 'emulate_media'):
+            await target.emulate_media(reduced_motion='reduce')
+            if _larger_than_lite(target.viewport_size):
+                await target.set_viewport_size(LITE_VIEWPORT)
+    except Exception as e:
+        log_warning(f"Could not enable render-lite mode: {e}")
+        return False
+    
+    log_info(f"Render-lite mode on (animations off{'' if fonts else ', web fonts off'})")
+    return True
@@ -0,0 +1,368 @@
+"""
+Resource Blocker
+================
+
+Blocks the requests a stage of the bot never needs (images, fonts, video,
+analytics and ad scripts), so every reload downloads only what the monitor
+or checkout actually reads.
+
+On Chromium the blocking is done by the browser itself (the DevTools
+Network.setBlockedURLs list), not by request interception:
+- requests that are let through never wait for Python, even while the sync
+  API sleeps between checks
+- the HTTP cache stays on (Playwright turns it off on any page or context
+  with a route), so reloads keep serving first-party JS and CSS from cache
+
+Other browsers fall back to a route that only matches the blockable URLs;
+everything else is never intercepted, but the cache is off there.
+
+Rules match URLs (file extension per resource type, tracker hosts) and come
+from a named profile, which can be switched between stages (e.g. 'monitor'
+while waiting, 'checkout' once the product is found):
+- monitor  : stylesheets, images, fonts, media and trackers are blocked
+- checkout : stylesheets and images get through (the page has to lay out and
+             be clickable); fonts, media and trackers stay blocked
+- off      : nothing is blocked, requests are only counted
+
+Requests are counted per document load. A blocked request never reports a
+size, so bytes saved are estimated: from the Content-Length of the same URL
+seen unblocked earlier in the run, else the average for its resource type,
+else TYPICAL_SIZES.
+"""
+
+import re
+from collections import deque
+from typing import Dict, List, Optional
+
+from .retry import classify_error
+from .utils import log_info, log_warning
+
+
+# Third-party analytics, tag managers and ad networks (URL fragments).
+# Blocked by every profile except 'off', whatever their resource type.
+TRACKER_PATTERNS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'connect.facebook.net',
+    'facebook.com/tr',
+    'analytics.tiktok.com',
+    'criteo.com',
+    'criteo.net',
+    'hotjar.com',
+    'mmstat.com',           # Alibaba/Lazada analytics beacons
+    '/alilog/',
+    'arms-retcode',
+]
+
+# File extensions that identify a resource type from its URL
+TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'm3u8', 'mp3', 'ogg', 'mov'],
+    'stylesheet': ['css'],
+    'texttrack': ['vtt'],
+    'manifest': ['webmanifest'],
+}
+
+# Rough transfer sizes per resource type, used to estimate bytes saved until
+# the real size of an asset has been seen
+TYPICAL_SIZES = {
+    'image': 15000,
+    'media': 250000,
+    'font': 30000,
+    'stylesheet': 20000,
+    'script': 25000,
+}
+
+# Resource types (keys of TYPE_EXTENSIONS) blocked per profile
+BLOCK_PROFILES: Dict[str, dict] = {
+    'monitor': {
+        'block_types': ['stylesheet', 'image', 'media', 'font', 'texttrack', 'manifest'],
+        'block_trackers': True,
+    },
+    'checkout': {
+        'block_types': ['media', 'font', 'texttrack', 'manifest'],
+        'block_trackers': True,
+    },
+    'off': {
+        'block_types': [],
+        'block_trackers': False,
+    },
+}
+
+# Extension at the end of the path; Lazada's CDN also resizes with a suffix
+# ('...jpg_200x200q80.jpg_.webp'), so '_' may follow it
+_EXTENSION_END = r'(?:$|[?#_])'
+
+_TRACKER_RE = re.compile('|'.join(re.escape(p) for p in TRACKER_PATTERNS), re.IGNORECASE)
+
+_TYPE_RES = {
+    resource_type: re.compile(r'\.(?:' + '|'.join(extensions) + r')' + _EXTENSION_END, re.IGNORECASE)
+    for resource_type, extensions in TYPE_EXTENSIONS.items()
+}
+
+# Every URL some profile may block: the fallback route matches only these
+BLOCKABLE_RE = re.compile(
+    '|'.join([_TRACKER_RE.pattern] + [r.pattern for r in _TYPE_RES.values()]),
+    re.IGNORECASE
+)
+
+
+def block_patterns(profile: dict) -> List[str]:
+    """
+    Chromium blocked-URL wildcard patterns for a profile.
+    
+    Args:
+        profile: Entry of BLOCK_PROFILES
+    
+    Returns:
+        list: Patterns for Network.setBlockedURLs
+    """
+    patterns = []
+    if profile['block_trackers']:
+        patterns += [f"*{fragment}*" for fragment in TRACKER_PATTERNS]
+    for resource_type in profile['block_types']:
+        for extension in TYPE_EXTENSIONS[resource_type]:
+            patterns += [f"*.{extension}", f"*.{extension}?*", f"*.{extension}_*"]
+    return patterns
+
+
+class ResourceBlocker:
+    """
+    Blocks unneeded requests on a page or browser context by profile.
+    
+    Usage:
+        blocker = ResourceBlocker(context, profile='monitor')
+        blocker.attach()
+        ...                        # monitor, reloading as usual
+        blocker.use('checkout')    # before add to cart
+        blocker.log_stats()
+    """
+    
+    def __init__(self, target, profile: str = 'monitor'):
+        """
+        Initialize the blocker.
+        
+        Args:
+            target: Playwright page or browser context
+            profile: Name in BLOCK_PROFILES
+        """
+        self.target = target
+        self.profile_name = None
+        self.profile = None
+        
+        self.attached = False
+        self.sessions = []          # CDP sessions carrying the block list (Chromium)
+        self.routed = False         # True when blocking through the fallback route
+        self.known_sizes = {}       # URL without query -> bytes, from unblocked responses
+        self.type_sizes = {}        # resource type -> [total bytes, responses]
+        self.loads = deque(maxlen=200)  # Per document load: see _new_load()
+        self.current = self._new_load(None)
+        self.use(profile)
+    
+    def use(self, profile: str):
+        """
+        Switch profile (takes effect for the next request).
+        
+        Args:
+            profile: Name in BLOCK_PROFILES
+        """
+        if profile not in BLOCK_PROFILES:
+            raise ValueError(f"Unknown block profile: {profile} (have {', '.join(BLOCK_PROFILES)})")
+        if profile != self.profile_name:
+            self.profile_name = profile
+            self.profile = BLOCK_PROFILES[profile]
+            log_info(f"Resource blocking: '{profile}' profile")
+            if self.sessions:
+                self._update_sessions()
+    
+    def _context(self):
+        """Browser context of the target"""
+        return self.target if hasattr(self.target, 'pages') else self.target.context
+    
+    def _pages(self) -> list:
+        """Pages the block list has to be set on"""
+        return list(self.target.pages) if hasattr(self.target, 'pages') else [self.target]
+    
+    def _is_chromium(self) -> bool:
+        """True if the target runs in Chromium (the DevTools block list is available)"""
+        browser = self._context().browser
+        return browser is not None and browser.browser_type.name == 'chromium'
+    
+    def attach(self) -> 'ResourceBlocker':
+        """Install the block list (or the fallback route) and the request listeners"""
+        if not self.attached:
+            self.target.on("request", self._on_request)
+            self.target.on("requestfailed", self._on_request_failed)
+            self.target.on("response", self._on_response)
+            if self._is_chromium():
+                for page in self._pages():
+                    self._open_session(page)
+                if hasattr(self.target, 'pages'):
+                    self.target.on("page", self._open_session)
+            else:
+                self.target.route(BLOCKABLE_RE, self._handle_route)
+                self.routed = True
+            self.attached = True
+        return self
+    
+    def detach(self):
+        """Remove the block list (or route) and the listeners"""
+        if self.attached:
+            try:
+                if self.routed:
+                    self.target.unroute(BLOCKABLE_RE, self._handle_route)
+                for session in self.sessions:
+                    session.send("Network.setBlockedURLs", {"urls": []})
+                    session.detach()
+                if hasattr(self.target, 'pages') and not self.routed:
+                    self.target.remove_listener("page", self._open_session)
+                self.target.remove_listener("request", self._on_request)
+                self.target.remove_listener("requestfailed", self._on_request_failed)
+                self.target.remove_listener("response", self._on_response)
+            except Exception as e:
+                log_warning(f"Could not remove resource blocking: {e}")
+            self.sessions = []
+            self.routed = False
+            self.attached = False
+    
+    def _open_session(self, page):
+        """Give one page the block list of the current profile"""
+        try:
+            session = self._context().new_cdp_session(page)
+            session.send("Network.enable")
+            session.send("Network.setBlockedURLs", {"urls": block_patterns(self.profile)})
+            self.sessions.append(session)
+        except Exception as e:
+            if classify_error(e) != 'closed':
+                log_warning(f"Could not set the resource block list: {e}")
+    
+    def _update_sessions(self):
+        """Send the current profile's block list to every page"""
+        patterns = block_patterns(self.profile)
+        for session in list(self.sessions):
+            try:
+                session.send("Network.setBlockedURLs", {"urls": patterns})
+            except Exception:
+                self.sessions.remove(session)  # Page closed
+    
+    def block_reason(self, url: str) -> Optional[str]:
+        """
+        Decide whether the current profile blocks a URL.
+        
+        Args:
+            url: Request URL
+        
+        Returns:
+            str: 'tracker' or the blocked resource type, None to let it through
+        """
+        if self.profile['block_trackers'] and _TRACKER_RE.search(url):
+            return 'tracker'
+        for resource_type in self.profile['block_types']:
+            if _TYPE_RES[resource_type].search(url):
+                return resource_type
+        return None
+    
+    def _handle_route(self, route):
+        """Fallback route handler (blockable URLs only): abort or let through"""
+        try:
+            blocked = self.block_reason(route.request.url) is not None
+        except Exception:
+            blocked = False  # Never leave a request hanging on a bad decision
+        try:
+            if blocked:
+                route.abort("blockedbyclient")
+            else:
+                route.continue_()
+        except Exception as e:
+            if classify_error(e) != 'closed':
+                log_warning(f"Resource blocking route failed: {e}")
+    
+    @staticmethod
+    def _new_load(url: Optional[str]) -> dict:
+        """Counters for one document load"""
+        return {'url': url, 'requests': 0, 'blocked': 0, 'bytes_saved': 0, 'by_type': {}}
+    
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """URL without query/fragment, so cache-busting tokens map to one asset"""
+        return url.split('#', 1)[0].split('?', 1)[0]
+    
+    def estimated_size(self, url: str, resource_type: str) -> int:
+        """Bytes a blocked request would have cost (estimated from what was let through)"""
+        size = self.known_sizes.get(self._url_key(url))
+        if size is not None:
+            return size
+        total, count = self.type_sizes.get(resource_type, (0, 0))
+        return total // count if count else TYPICAL_SIZES.get(resource_type, 0)
+    
+    def _is_main_navigation(self, request) -> bool:
+        """True for the main-frame document request that starts a (re)load"""
+        try:
+            return request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:
+            return False
+    
+    def _on_request(self, request):
+        """Count a request (and start a new load on a main-frame navigation)"""
+        if self._is_main_navigation(request):
+            self.current = self._new_load(request.url)
+            self.loads.append(self.current)
+        self.current['requests'] += 1
+    
+    def _on_request_failed(self, request):
+        """Count the requests the block list (or route) refused"""
+        if 'BLOCKED_BY_CLIENT' not in (request.failure or '').upper():
+            return
+        load = self.current
+        resource_type = request.resource_type
+        load['blocked'] += 1
+        load['bytes_saved'] += self.estimated_size(request.url, resource_type)
+        load['by_type'][resource_type] = load['by_type'].get(resource_type, 0) + 1
+    
+    def _on_response(self, response):
+        """Learn asset sizes from responses that were let through"""
+        try:
+            length = int(response.headers.get('content-length', ''))
+        except ValueError:
+            return
+        self.known_sizes[self._url_key(response.url)] = length
+        total = self.type_sizes.setdefault(response.request.resource_type, [0, 0])
+        total[0] += length
+        total[1] += 1
+    
+    def stats(self) -> dict:
+        """
+        Blocking per document load.
+        
+        Returns:
+            dict: profile, loads, and per-load averages (blocked, allowed,
+                  bytes_saved) plus the last load's counters
+        """
+        loads = list(self.loads)
+        if not loads:
+            return {'profile': self.profile_name, 'loads': 0, 'blocked': 0.0,
+                    'allowed': 0.0, 'bytes_saved': 0.0, 'last': self.current}
+        return {
+            'profile': self.profile_name,
+            'loads': len(loads),
+            'blocked': sum(l['blocked'] for l in loads) / len(loads),
+            'allowed': sum(l['requests'] - l['blocked'] for l in loads) / len(loads),
+            'bytes_saved': sum(l['bytes_saved'] for l in loads) / len(loads),
+            'last': loads[-1],
+        }
+    
+    def log_stats(self):
+        """Log requests and bytes saved per reload"""
+        s = self.stats()
+        if not s['loads']:
+            return
+        by_type = ', '.join(f"{n} {t}" for t, n in sorted(s['last']['by_type'].items()))
+        log_info(
+            f"Resource blocking ({s['profile']}): {s['blocked']:.0f} requests blocked per load, "
+            f"~{s['bytes_saved'] / 1024:.0f} KB saved, {s['allowed']:.0f} let through "
+            f"({s['loads']} loads; last: {by_type or 'nothing blocked'})"
+        )
@@ -0,0 +1,284 @@
+"""
+Retry Engine
+============
+
+Retries a stage of the bot (add to cart, a checkout step) the way a drop
+needs it: fast at first, backing off only if failures persist, and never
+past the stage's deadline.
+
+Every failed attempt is classified:
+- timeout    : the page or server was slow          -> retry
+- navigation : the page navigated or re-rendered under the call
+               (detached element, destroyed context) -> retry
+- not-found  : the element is not there (yet)        -> retry
+- failed     : the call returned a falsy result      -> retry
+- error      : any other Playwright / network error  -> retry
+- closed     : page, context or browser is gone      -> give up
+- bug        : TypeError, AttributeError, ...        -> give up
+
+Pauses grow exponentially from base_delay (a few ms, so the first retry
+lands while the button is still being rendered) up to max_delay, with
+jitter so parallel tabs do not retry in lockstep.
+
+Usage:
+    engine = RetryEngine(max_attempts=5, deadline=3.0, name="Add to cart")
+    engine.run(click_button)
+    await engine.run_async(click_button_async)
+"""
+
+import asyncio
+import math
+import random
+import time
+from typing import Callable, List, Optional, Tuple
+
+import requests
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+
+from .utils import log_warning
+
+
+# First pause (seconds); each later one is `multiplier` times longer
+BASE_DELAY = 0.005
+
+# Longest pause between attempts (seconds)
+MAX_DELAY = 0.5
+
+# Messages of Playwright errors caused by a navigation or re-render mid-call
+_NAVIGATION_MARKERS = (
+    'execution context was destroyed',
+    'frame was detached',
+    'not attached to the dom',
+    'element is detached',
+    'navigation',
+    'net::err_aborted',
+)
+
+# Messages of errors after which nothing on the page can succeed
+_CLOSED_MARKERS = (
+    'has been closed',
+    'target closed',
+    'browser closed',
+    'connection closed',
+)
+
+# Programming errors: retrying would fail the same way
+_BUG_TYPES = (TypeError, AttributeError, NameError, KeyError, AssertionError)
+
+RETRYABLE = {'timeout', 'navigation', 'not-found', 'failed', 'error'}
+
+
+class ElementNotFound(Exception):
+    """A required element (button, link) is not on the page"""
+
+
+def _describe(error: BaseException) -> str:
+    """First line of an exception's message (its type if it has none)"""
+    message = str(error)
+    return message.splitlines()[0] if message else type(error).__name__
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Name the kind of failure an exception stands for.
+    
+    Args:
+        error: Exception raised by an attempt
+    
+    Returns:
+        str: 'closed', 'bug', 'timeout', 'navigation', 'not-found' or 'error'
+    """
+    message = str(error).lower()
+    if any(marker in message for marker in _CLOSED_MARKERS):
+        return 'closed'
+    if isinstance(error, _BUG_TYPES):
+        return 'bug'
+    if isinstance(error, (PlaywrightTimeout, requests.Timeout, asyncio.TimeoutError, TimeoutError)):
+        return 'timeout'
+    if isinstance(error, ElementNotFound):
+        return 'not-found'
+    if isinstance(error, PlaywrightError) and any(marker in message for marker in _NAVIGATION_MARKERS):
+        return 'navigation'
+    return 'error'
+
+
+class RetryEngine:
+    """
+    Runs an operation until it succeeds, a fatal error occurs, the attempts
+    run out or the deadline passes.
+    
+    A falsy return value counts as a failure. When the engine gives up, the
+    last exception is re-raised, or the last falsy value is returned.
+    
+    Usage:
+        engine = RetryEngine(max_attempts=5, deadline=3.0)
+        ok = engine.run(cart.add_to_cart_fast)
+        engine.stats()['failures']      # {'not-found': 2}
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        deadline: Optional[float] = None,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        multiplier: float = 2.0,
+        classify: Callable[[BaseException], str] = classify_error,
+        name: str = "Operation"
+    ):
+        """
+        Initialize the engine.
+        
+        Args:
+            max_attempts: Attempts in total, including the first
+            deadline: Seconds from the first attempt after which no new
+                      attempt starts (None = attempts only)
+            base_delay: Pause before the first retry (seconds)
+            max_delay: Longest pause between attempts (seconds)
+            multiplier: Growth of the pause per retry
+            classify: Maps an exception to a kind (see classify_error)
+            name: Stage name for log messages
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.classify = classify
+        self.name = name
+        
+        self.started = None
+        self.attempts = 0
+        self.failures: List[Tuple[str, str]] = []   # (kind, message) per failed attempt
+        self.gave_up = None                         # Why the last run stopped without success
+    
+    def remaining(self) -> float:
+        """Seconds left before the deadline (inf without a deadline)"""
+        if self.deadline is None or self.started is None:
+            return math.inf
+        return max(0.0, self.started + self.deadline - time.perf_counter())
+    
+    def backoff(self, retry: int) -> float:
+        """
+        Pause before a retry: exponential, capped, with the upper half jittered.
+        
+        Args:
+            retry: 0 for the first retry
+        
+        Returns:
+            float: Seconds
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def _begin(self):
+        """Reset the counters for a new run"""
+        self.started = time.perf_counter()
+        self.attempts = 0
+        self.failures = []
+        self.gave_up = None
+    
+    def _next_pause(self, kind: str, message: str) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether to go on.
+        
+        Returns:
+            float: Seconds to pause before the next attempt, None to give up
+        """
+        self.failures.append((kind, message))
+        if kind not in RETRYABLE:
+            self.gave_up = kind
+            return None
+        if self.attempts >= self.max_attempts:
+            self.gave_up = 'attempts'
+            return None
+        
+        remaining = self.remaining()
+        if remaining <= self.base_delay:
+            self.gave_up = 'deadline'
+            return None
+        # Close to the deadline, pause less and leave the last attempt some time
+        pause = min(self.backoff(self.attempts - 1), remaining / 2)
+        
+        log_warning(
+            f"{self.name}: attempt {self.attempts} failed ({kind}: {message[:80]}), "
+            f"retrying in {pause * 1000:.0f}ms"
+        )
+        return pause
+    
+    def run(self, func: Callable, *args, **kwargs):
+        """
+        Call func(*args, **kwargs) until it returns a truthy value.
+        
+        Returns:
+            The first truthy result, or the last falsy one when giving up
+        
+        Raises:
+            Exception: The last exception, when giving up after one
+        """
+        self._begin()
+        while True:
+            self.attempts += 1
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                pause = self._next_pause(self.classify(e), _describe(e))
+                if pause is None:
+                    raise
+            else:
+                if result:
+                    return result
+                pause = self._next_pause('failed', f"returned {result!r}")
+                if pause is None:
+                    return result
+            time.sleep(pause)
+    
+    async def run_async(self, func: Callable, *args, **kwargs):
+        """
+        Async version of run for coroutine functions. An attempt still
+        running at the deadline is cancelled (and counts as a timeout).
+        
+        Returns:
+            The first truthy result, or the last falsy one when giving up
+        
+        Raises:
+            Exception: The last exception, when giving up after one
+        """
+        self._begin()
+        while True:
+            self.attempts += 1
+            remaining = self.remaining()
+            try:
+                if remaining == math.inf:
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await asyncio.wait_for(func(*args, **kwargs), timeout=remaining)
+            except Exception as e:
+                pause = self._next_pause(self.classify(e), _describe(e))
+                if pause is None:
+                    raise
+            else:
+                if result:
+                    return result
+                pause = self._next_pause('failed', f"returned {result!r}")
+                if pause is None:
+                    return result
+            await asyncio.sleep(pause)
+    
+    def stats(self) -> dict:
+        """
+        Outcome of the last run.
+        
+        Returns:
+            dict: attempts, elapsed (seconds), failures by kind, gave_up
+                  (None, 'attempts', 'deadline' or a fatal kind)
+        """
+        by_kind = {}
+        for kind, _ in self.failures:
+            by_kind[kind] = by_kind.get(kind, 0) + 1
+        return {
+            'attempts': self.attempts,
+            'elapsed': time.perf_counter() - self.started if self.started is not None else 0.0,
+            'failures': by_kind,
+            'gave_up': self.gave_up,
+        }
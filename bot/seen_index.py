@@ -0,0 +1,378 @@
+"""
+Seen Products Index
+===================
+
+Remembers which store products have already been seen, across restarts.
+
+Ids live in SQLite (data/seen_products.db), keyed by store and product id
+with the time each product was first seen. An in-memory Bloom filter sits
+in front: most lookups are for new products, and the filter answers "not
+seen" for those without touching the database. Only filter hits are
+confirmed in SQLite, so a false positive costs one query, never a missed
+product.
+
+Memory stays flat however long the bot runs: the filter is sized for
+`capacity` ids (about 1.7 MB per million at 1% false positives) and the
+ids themselves stay on disk. The filter is saved next to the ids on close,
+so a restart loads it in one read instead of re-hashing every id.
+"""
+
+import math
+import random
+import sqlite3
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from .utils import log_info
+
+
+# Shared by every store monitor unless one is given a different file
+DEFAULT_SEEN_DB = Path(__file__).parent.parent / "data" / "seen_products.db"
+
+# Ids per SQLite lookup statement (stays under SQLITE_MAX_VARIABLE_NUMBER)
+LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_products (
+    store TEXT NOT NULL,
+    product_id TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    PRIMARY KEY (store, product_id)
+);
+CREATE TABLE IF NOT EXISTS seen_bloom (
+    store TEXT PRIMARY KEY,
+    capacity INTEGER NOT NULL,
+    error_rate REAL NOT NULL,
+    last_rowid INTEGER NOT NULL,
+    bits BLOB NOT NULL
+);
+"""
+
+
+def store_key(store_url: str) -> str:
+    """
+    Key identifying a store, whatever sort or paging parameters its URL has.
+    
+    Args:
+        store_url: Store URL
+    
+    Returns:
+        str: host + path, e.g. 'www.lazada.sg/shop/pokemon-store-online-singapore'
+    """
+    parts = urlsplit(store_url)
+    return (parts.netloc.lower() + parts.path).rstrip('/')
+
+
+def _block_masks(count: int, bits: int) -> List[int]:
+    """Fixed table of 64-bit words with `bits` bits set (same on every run)"""
+    rng = random.Random(0x5EED)
+    masks = []
+    for _ in range(count):
+        mask = 0
+        for bit in rng.sample(range(64), bits):
+            mask |= 1 << bit
+        masks.append(mask)
+    return masks
+
+
+# Every key sets BLOCK_BITS bits chosen from this table inside one 64-bit word
+BLOCK_BITS = 8
+BLOCK_MASKS = _block_masks(4096, BLOCK_BITS)
+
+# Extra space a blocked filter needs to match a classic one's error rate
+BLOCK_OVERHEAD = 1.4
+
+
+class BloomFilter:
+    """
+    Blocked Bloom filter over strings.
+    
+    A key's bits all fall in one 64-bit word, picked (with the bit pattern)
+    from a single CRC32 of the key, so adding or testing a key is one word
+    operation instead of a Python loop over k hash functions. CRC32 is
+    stable across runs (unlike hash()), so the bits can be saved and
+    loaded again.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01, bits: Optional[bytes] = None):
+        """
+        Size the filter.
+        
+        Args:
+            capacity: Ids it is sized for (more still works, with more false positives)
+            error_rate: Target false positive rate at capacity
+            bits: Saved filter bits (ignored unless sized for this capacity and error rate)
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        bits_per_key = -math.log(error_rate) / math.log(2) ** 2 * BLOCK_OVERHEAD
+        size = max(1, int(math.ceil(self.capacity * bits_per_key / 64)))
+        self.words = array('Q', bits if bits and len(bits) == 8 * size else bytes(8 * size))
+        self.loaded = bool(bits) and len(bits) == 8 * size
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the filter bits"""
+        return len(self.words) * self.words.itemsize
+    
+    def add(self, key: str):
+        """Add one key"""
+        h = zlib.crc32(key.encode())
+        self.words[h % len(self.words)] |= BLOCK_MASKS[h >> 20]
+    
+    def update(self, keys: Iterable[str]):
+        """Add many keys"""
+        words, size, masks, crc32 = self.words, len(self.words), BLOCK_MASKS, zlib.crc32
+        for key in keys:
+            h = crc32(key.encode())
+            words[h % size] |= masks[h >> 20]
+    
+    def __contains__(self, key: str) -> bool:
+        h = zlib.crc32(key.encode())
+        mask = BLOCK_MASKS[h >> 20]
+        return self.words[h % len(self.words)] & mask == mask
+    
+    def tobytes(self) -> bytes:
+        """Filter bits, for saving"""
+        return self.words.tobytes()
+
+
+class SeenIndex:
+    """
+    Persistent set of product ids seen in one store.
+    
+    Supports the set operations StoreMonitor uses (`in`, update(), len()),
+    so it can stand in for its in-memory seen_products set.
+    
+    Usage:
+        seen = SeenIndex(store_url)
+        monitor = StoreMonitor(page, store_url, keywords, seen_index=seen)
+    """
+    
+    def __init__(
+        self,
+        store_url: str,
+        path: Optional[Path] = DEFAULT_SEEN_DB,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01
+    ):
+        """
+        Open (or create) the index for a store.
+        
+        Args:
+            store_url: Store URL (sort/paging parameters are ignored)
+            path: SQLite file (None = in-memory database, nothing persisted)
+            capacity: Ids the Bloom filter is sized for; it is rebuilt twice
+                      as large if the store outgrows it
+            error_rate: Bloom filter false positive rate at capacity
+        """
+        self.store = store_key(store_url)
+        self.path = Path(path) if path else None
+        self.error_rate = error_rate
+        
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path) if self.path else ':memory:')
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        
+        self.count = self.conn.execute(
+            "SELECT COUNT(*) FROM seen_products WHERE store = ?", (self.store,)
+        ).fetchone()[0]
+        self.bloom = None
+        if not self._load_bloom():
+            self._rebuild_bloom(max(capacity, self.count * 2))
+        
+        # Stats
+        self.lookups = 0
+        self.bloom_rejects = 0      # Answered "not seen" without SQLite
+        self.false_positives = 0    # Bloom said maybe, SQLite said no
+    
+    def _add_rows_after(self, rowid: int):
+        """Add every stored id with a higher rowid to the Bloom filter"""
+        cursor = self.conn.execute(
+            "SELECT product_id FROM seen_products WHERE store = ? AND rowid > ?", (self.store, rowid)
+        )
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            self.bloom.update(row[0] for row in rows)
+    
+    def _rebuild_bloom(self, capacity: int):
+        """Size a new Bloom filter and load every stored id into it"""
+        self.bloom = BloomFilter(capacity, self.error_rate)
+        self._add_rows_after(0)
+    
+    def _load_bloom(self) -> bool:
+        """
+        Load the saved Bloom filter, catching up on ids stored after it was
+        saved (e.g. the last run crashed before close()).
+        
+        Returns:
+            bool: False if there is no usable saved filter
+        """
+        row = self.conn.execute(
+            "SELECT capacity, error_rate, last_rowid, bits FROM seen_bloom WHERE store = ?", (self.store,)
+        ).fetchone()
+        if not row:
+            return False
+        capacity, error_rate, last_rowid, bits = row
+        if error_rate != self.error_rate or self.count > capacity:
+            return False
+        max_rowid = self.conn.execute("SELECT MAX(rowid) FROM seen_products").fetchone()[0] or 0
+        if last_rowid > max_rowid:
+            return False  # Rows were deleted since; rowids may have been reused
+        self.bloom = BloomFilter(capacity, error_rate, bits)
+        if not self.bloom.loaded:
+            return False
+        self._add_rows_after(last_rowid)
+        return True
+    
+    def save(self):
+        """Save the Bloom filter so the next start can skip rebuilding it"""
+        last_rowid = self.conn.execute("SELECT MAX(rowid) FROM seen_products").fetchone()[0] or 0
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO seen_bloom (store, capacity, error_rate, last_rowid, bits) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.store, self.bloom.capacity, self.bloom.error_rate, last_rowid, self.bloom.tobytes())
+            )
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __contains__(self, product_id: str) -> bool:
+        self.lookups += 1
+        if product_id not in self.bloom:
+            self.bloom_rejects += 1
+            return False
+        found = self.conn.execute(
+            "SELECT 1 FROM seen_products WHERE store = ? AND product_id = ?", (self.store, product_id)
+        ).fetchone() is not None
+        if not found:
+            self.false_positives += 1
+        return found
+    
+    def add(self, product_id: str, first_seen: Optional[float] = None) -> bool:
+        """
+        Mark one product as seen.
+        
+        Returns:
+            bool: True if it was not seen before
+        """
+        return self.update([product_id], first_seen) == 1
+    
+    def update(self, product_ids: Iterable[str], first_seen: Optional[float] = None) -> int:
+        """
+        Mark many products as seen in one transaction. Ids already stored
+        keep their original first-seen time.
+        
+        Args:
+            product_ids: Product ids
+            first_seen: Unix time to record (default: now)
+        
+        Returns:
+            int: Ids that were not seen before
+        """
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return 0
+        stamp = time.time() if first_seen is None else first_seen
+        
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_products (store, product_id, first_seen) VALUES (?, ?, ?)",
+                ((self.store, product_id, stamp) for product_id in ids)
+            )
+        added = self.conn.total_changes - before
+        
+        self.count += added
+        if self.count > self.bloom.capacity:
+            log_info(f"Seen index passed {self.bloom.capacity} ids - resizing its Bloom filter")
+            self._rebuild_bloom(self.bloom.capacity * 2)
+        else:
+            self.bloom.update(ids)
+        return added
+    
+    def seen_many(self, product_ids: Iterable[str]) -> Set[str]:
+        """
+        Bulk lookup.
+        
+        Args:
+            product_ids: Product ids to check
+        
+        Returns:
+            set: The ids that have been seen
+        """
+        ids = [str(product_id) for product_id in product_ids]
+        maybe = [product_id for product_id in ids if product_id in self.bloom]
+        self.lookups += len(ids)
+        self.bloom_rejects += len(ids) - len(maybe)
+        
+        seen = set()
+        for start in range(0, len(maybe), LOOKUP_CHUNK):
+            chunk = maybe[start:start + LOOKUP_CHUNK]
+            rows = self.conn.execute(
+                f"SELECT product_id FROM seen_products WHERE store = ? "
+                f"AND product_id IN ({','.join('?' * len(chunk))})",
+                [self.store] + chunk
+            )
+            seen.update(row[0] for row in rows)
+        self.false_positives += len(set(maybe) - seen)
+        return seen
+    
+    def first_seen(self, product_id: str) -> Optional[float]:
+        """Unix time the product was first seen, None if never"""
+        row = self.conn.execute(
+            "SELECT first_seen FROM seen_products WHERE store = ? AND product_id = ?",
+            (self.store, str(product_id))
+        ).fetchone()
+        return row[0] if row else None
+    
+    def recent(self, limit: int) -> List[str]:
+        """
+        Most recently stored ids, latest first.
+        
+        Args:
+            limit: Maximum ids to return
+        """
+        rows = self.conn.execute(
+            "SELECT product_id FROM seen_products WHERE store = ? ORDER BY rowid DESC LIMIT ?",
+            (self.store, limit)
+        )
+        return [row[0] for row in rows]
+    
+    def clear(self):
+        """Forget every product of this store"""
+        with self.conn:
+            self.conn.execute("DELETE FROM seen_products WHERE store = ?", (self.store,))
+            self.conn.execute("DELETE FROM seen_bloom WHERE store = ?", (self.store,))
+        self.count = 0
+        self._rebuild_bloom(self.bloom.capacity)
+    
+    def stats(self) -> dict:
+        """
+        Size and lookup counters.
+        
+        Returns:
+            dict: ids, bloom_bytes, lookups, bloom_rejects, false_positives
+        """
+        return {
+            'ids': self.count,
+            'bloom_bytes': self.bloom.nbytes,
+            'lookups': self.lookups,
+            'bloom_rejects': self.bloom_rejects,
+            'false_positives': self.false_positives,
+        }
+    
+    def close(self):
+        """Save the Bloom filter and close the database"""
+        self.save()
+        self.conn.close()
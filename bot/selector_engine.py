@@ -0,0 +1,295 @@
+"""
+Selector Engine
+===============
+
+Learns which selector in a candidate list actually matches on Lazada and
+tries that one first. Hit rates and query costs are saved to disk, so after
+warm-up a lookup usually costs a single query instead of walking the list.
+"""
+
+import atexit
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .selector_registry import family_locator
+from .utils import log_warning
+
+
+# Shared by every manager unless one is given a different file
+DEFAULT_STATS_FILE = Path(__file__).parent.parent / "data" / "selector_stats.json"
+
+# A selector tried this many times without a single hit is considered dead
+DEAD_AFTER_TRIES = 20
+
+
+class SelectorEngine:
+    """
+    Orders selector candidates by observed hit rate and query cost.
+    
+    Statistics are only recorded for lookups that found something: the
+    winning selector gets a hit and every selector tried before it a miss.
+    Lookups where nothing matches (e.g. the product is not on sale yet) say
+    nothing about which selector is right, so they leave the stats alone.
+    
+    Usage:
+        engine = get_selector_engine()
+        button = engine.find(page, 'add_to_cart', selectors)
+    """
+    
+    def __init__(self, stats_file: Optional[Path] = DEFAULT_STATS_FILE, autosave_every: int = 50):
+        """
+        Initialize selector engine.
+        
+        Args:
+            stats_file: JSON file to load/save statistics (None = memory only)
+            autosave_every: Save after this many recorded results (0 = only on exit)
+        """
+        self.stats_file = Path(stats_file) if stats_file else None
+        self.autosave_every = autosave_every
+        self.stats: Dict[str, dict] = {}
+        self._unsaved = 0
+        self.load()
+    
+    @staticmethod
+    def _key(family: str, selector: str) -> str:
+        return f"{family}::{selector}"
+    
+    def _entry(self, family: str, selector: str) -> dict:
+        key = self._key(family, selector)
+        if key not in self.stats:
+            self.stats[key] = {'hits': 0, 'tries': 0, 'cost': None}
+        return self.stats[key]
+    
+    def hit_rate(self, family: str, selector: str) -> float:
+        """Smoothed hit rate (0.5 for a selector never tried)"""
+        entry = self.stats.get(self._key(family, selector))
+        if not entry:
+            return 0.5
+        return (entry['hits'] + 1) / (entry['tries'] + 2)
+    
+    def is_dead(self, family: str, selector: str) -> bool:
+        """True if the selector keeps losing and has never won"""
+        entry = self.stats.get(self._key(family, selector))
+        return bool(entry) and entry['hits'] == 0 and entry['tries'] >= DEAD_AFTER_TRIES
+    
+    def order(self, family: str, selectors: List[str]) -> List[str]:
+        """
+        Sort candidates best-first: live before dead, higher hit rate first,
+        cheaper query first, then the original (hand-written) priority.
+        
+        Args:
+            family: Name of the selector family (e.g. 'add_to_cart')
+            selectors: Candidate selectors in their default priority
+        
+        Returns:
+            List[str]: Candidates in the order they should be tried
+        """
+        def score(item):
+            index, selector = item
+            entry = self.stats.get(self._key(family, selector)) or {}
+            cost = entry.get('cost')
+            return (
+                self.is_dead(family, selector),
+                -self.hit_rate(family, selector),
+                cost if cost is not None else float('inf'),
+                index,
+            )
+        
+        return [selector for _, selector in sorted(enumerate(selectors), key=score)]
+    
+    def record(self, family: str, selector: str, hit: bool, cost: Optional[float] = None):
+        """
+        Record the outcome of one selector query.
+        
+        Args:
+            family: Name of the selector family
+            selector: Selector that was queried
+            hit: True if it matched
+            cost: Seconds the query took (optional)
+        """
+        entry = self._entry(family, selector)
+        entry['tries'] += 1
+        if hit:
+            entry['hits'] += 1
+        self.record_cost(family, selector, cost)
+        
+        self._unsaved += 1
+        if self.autosave_every and self._unsaved >= self.autosave_every:
+            self.save()
+    
+    def record_cost(self, family: str, selector: str, cost: Optional[float]):
+        """Fold a query duration into the selector's moving average"""
+        if cost is None:
+            return
+        entry = self._entry(family, selector)
+        entry['cost'] = cost if entry['cost'] is None else 0.8 * entry['cost'] + 0.2 * cost
+    
+    def record_winner(self, family: str, ordered: List[str], winner: str):
+        """
+        Record a lookup that walked `ordered` and stopped at `winner`.
+        Everything before the winner counts as a miss.
+        """
+        for selector in ordered:
+            if selector == winner:
+                self.record(family, selector, hit=True)
+                return
+            self.record(family, selector, hit=False)
+    
+    def is_trusted(self, family: str, selector: str) -> bool:
+        """True if the selector has won before and wins more than it loses"""
+        entry = self.stats.get(self._key(family, selector))
+        return bool(entry) and entry['hits'] > 0 and self.hit_rate(family, selector) >= 0.5
+    
+    def find(self, root, family: str, selectors: List[str]):
+        """
+        Find the first matching element in as few round trips as possible:
+        1. the learned winner, if there is one (1 query in the common case)
+        2. the whole family as one compiled query - nothing there = done
+        3. the remaining candidates, best first, to learn which one matched
+        
+        Args:
+            root: Playwright page or locator to search in
+            family: Name of the selector family
+            selectors: Candidate selectors in their default priority
+        
+        Returns:
+            Locator: First match, or None if no selector matched
+        """
+        ordered = self.order(family, selectors)
+        costs = {}
+        
+        def query(selector):
+            start = time.perf_counter()
+            try:
+                locator = root.locator(selector).first
+                found = locator.count() > 0
+            except Exception:
+                locator, found = None, False
+            costs[selector] = time.perf_counter() - start
+            return locator if found else None
+        
+        def won(selector, locator):
+            for tried, cost in costs.items():
+                self.record(family, tried, hit=(tried == selector), cost=cost)
+            return locator
+        
+        if self.is_trusted(family, ordered[0]):
+            locator = query(ordered[0])
+            if locator:
+                return won(ordered[0], locator)
+        
+        try:
+            any_match = family_locator(root, family, selectors).count() > 0
+        except Exception:
+            any_match = True  # Can't tell - walk the list
+        
+        if any_match:
+            for selector in ordered:
+                if selector in costs:
+                    continue
+                locator = query(selector)
+                if locator:
+                    return won(selector, locator)
+        
+        # Nothing matched: keep the costs, not the misses
+        for tried, cost in costs.items():
+            self.record_cost(family, tried, cost)
+        return None
+    
+    async def find_async(self, root, family: str, selectors: List[str]):
+        """
+        Async twin of find() for playwright.async_api pages and locators.
+        
+        Args:
+            root: Async Playwright page or locator to search in
+            family: Name of the selector family
+            selectors: Candidate selectors in their default priority
+        
+        Returns:
+            Locator: First match, or None if no selector matched
+        """
+        ordered = self.order(family, selectors)
+        costs = {}
+        
+        async def query(selector):
+            start = time.perf_counter()
+            try:
+                locator = root.locator(selector).first
+                found = await locator.count() > 0
+            except Exception:
+                locator, found = None, False
+            costs[selector] = time.perf_counter() - start
+            return locator if found else None
+        
+        def won(selector, locator):
+            for tried, cost in costs.items():
+                self.record(family, tried, hit=(tried == selector), cost=cost)
+            return locator
+        
+        if self.is_trusted(family, ordered[0]):
+            locator = await query(ordered[0])
+            if locator:
+                return won(ordered[0], locator)
+        
+        try:
+            any_match = await family_locator(root, family, selectors).count() > 0
+        except Exception:
+            any_match = True  # Can't tell - walk the list
+        
+        if any_match:
+            for selector in ordered:
+                if selector in costs:
+                    continue
+                locator = await query(selector)
+                if locator:
+                    return won(selector, locator)
+        
+        for tried, cost in costs.items():
+            self.record_cost(family, tried, cost)
+        return None
+    
+    def load(self):
+        """Load statistics from disk (missing or corrupt file = start fresh)"""
+        if not self.stats_file or not self.stats_file.exists():
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.stats = data.get('stats', {})
+        except Exception as e:
+            log_warning(f"Ignoring unreadable selector stats ({e})")
+            self.stats = {}
+    
+    def save(self):
+        """Write statistics to disk atomically"""
+        self._unsaved = 0
+        if not self.stats_file:
+            return
+        try:
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.stats_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'stats': self.stats}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.stats_file)
+        except Exception as e:
+            log_warning(f"Could not save selector stats: {e}")
+
+
+_shared_engine = None
+
+
+def get_selector_engine() -> SelectorEngine:
+    """
+    Get the engine shared by all bot components (saved on exit).
+    
+    Returns:
+        SelectorEngine: Shared instance
+    """
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = SelectorEngine()
+        atexit.register(_shared_engine.save)
+    return _shared_engine
@@ -0,0 +1,227 @@
+"""
+Selector Registry
+=================
+
+The one place where Lazada selectors live. Every bot component pulls its
+selector lists from here, so when Lazada changes its markup only this file
+needs updating (bump REGISTRY_VERSION when you do).
+
+Each family is also precompiled into a single Playwright query: CSS members
+are joined into one selector list and 'text=' members are chained with
+locator.or_(), so checking a whole family costs one browser round trip.
+"""
+
+from typing import Dict, List, Optional
+
+
+REGISTRY_VERSION = "2024.12.1"
+
+SELECTOR_FAMILIES: Dict[str, List[str]] = {
+    # Product page
+    'add_to_cart': [
+        'button.add-to-cart-buy-now-btn',
+        'button[class*="add-to-cart"]',
+        'button:has-text("Add to Cart")',
+        'button:has-text("ADD TO CART")',
+        '.pdp-button-add-to-cart',
+        '[data-spm-anchor-id*="cart"]',
+    ],
+    'buy_now': [
+        'button.buy-now-btn',
+        'button[class*="buy-now"]',
+        'button:has-text("Buy Now")',
+        'button:has-text("BUY NOW")',
+        '.pdp-button-buy-now',
+    ],
+    'out_of_stock': [
+        'text=Out of Stock',
+        'text=Currently Unavailable',
+        'text=Sold Out',
+        '.pdp-product-not-available',
+    ],
+    'product_title': [
+        'h1.pdp-mod-product-badge-title',
+        '.pdp-product-title',
+        'h1[class*="title"]',
+    ],
+    'product_price': [
+        '.pdp-price',
+        'span[class*="price"]',
+        '.price-current',
+    ],
+    
+    # Cart
+    'cart_icon': [
+        '.cart-icon',
+        '[class*="cart-icon"]',
+        'a[href*="/cart"]',
+    ],
+    'cart_count': [
+        '.cart-num',
+        '[class*="cart-num"]',
+        '.cart-count',
+    ],
+    'cart_success': [
+        'text=Added to Cart',
+        'text=Item added',
+        'text=Successfully added',
+        '.success-message',
+    ],
+    'cart_modal_close': [
+        'button:has-text("Continue Shopping")',
+        'button:has-text("Close")',
+        '.modal-close',
+        '[class*="close-button"]',
+    ],
+    'cart_empty': [
+        'text=Your shopping cart is empty',
+        'text=No items',
+        '.empty-cart',
+    ],
+    'cart_item': [
+        '.cart-item',
+        '[class*="cart-item"]',
+        '.item-container',
+    ],
+    'cart_item_name': [  # Relative to a cart_item
+        '.item-title',
+        '[class*="title"]',
+    ],
+    'cart_item_price': [
+        '.item-price',
+        '[class*="price"]',
+    ],
+    'cart_item_quantity': [
+        'input[type="number"]',
+    ],
+    'cart_delete': [
+        'button:has-text("Delete")',
+        'button:has-text("Remove")',
+        '.delete-btn',
+        '[class*="delete"]',
+    ],
+    
+    # Checkout
+    'checkout': [
+        'button:has-text("Proceed to Checkout")',
+        'button:has-text("Checkout")',
+        'button:has-text("CHECK OUT")',
+        '.checkout-button',
+        '[class*="checkout-btn"]',
+        'button[data-spm*="checkout"]',
+    ],
+    'place_order': [
+        'button:has-text("Place Order")',
+        'button:has-text("PLACE ORDER")',
+        'button:has-text("Confirm Order")',
+        '.place-order-btn',
+        '[class*="place-order"]',
+        'button.next-btn',
+    ],
+    'shipping_address': [
+        '.delivery-address',
+        '[class*="address"]',
+        'text=/.*Street.*/',
+        'text=/.*Postal Code.*/',
+    ],
+    'order_total': [
+        '.order-total',
+        '[class*="total-price"]',
+        'text=/Total.*SGD/',
+    ],
+    'order_success': [
+        'text=Order Placed',
+        'text=Thank you for your order',
+        'text=Order confirmed',
+        '.order-success',
+    ],
+    
+    # Store page
+    'store_item': [
+        '.Bm3ON',  # Lazada's current product card class
+        '[data-item-id]',
+        '.item-card',
+        '[class*="item"]',
+        '.product-item',
+    ],
+    'store_title': [
+        '.RfADt',  # Lazada's current title class
+        '.title',
+        '[class*="title"]',
+        '.name',
+        '[class*="name"]',
+        'img[alt]',  # Fallback to image alt text
+    ],
+    'store_product_link': [
+        'a[href*="/products/"]',
+    ],
+}
+
+PAYMENT_SELECTORS: Dict[str, str] = {
+    'cod': 'text=Cash on Delivery',
+    'credit_card': 'text=Credit/Debit Card',
+    'online_banking': 'text=Online Banking',
+}
+
+
+def compile_family(selectors: List[str]) -> dict:
+    """
+    Split a selector list into one CSS selector list plus the 'text='
+    selectors that cannot be part of a CSS list.
+    
+    Args:
+        selectors: Playwright selectors
+    
+    Returns:
+        dict: {'css': str or None, 'text': [str, ...]}
+    """
+    css = [s for s in selectors if not s.startswith('text=')]
+    text = [s for s in selectors if s.startswith('text=')]
+    return {'css': ', '.join(css) if css else None, 'text': text}
+
+
+# Precompiled once at import
+COMPILED_FAMILIES: Dict[str, dict] = {
+    family: compile_family(selectors) for family, selectors in SELECTOR_FAMILIES.items()
+}
+
+
+def get_selectors(family: str) -> List[str]:
+    """
+    Get a copy of a family's selectors in default priority order.
+    
+    Args:
+        family: Family name (e.g. 'add_to_cart')
+    
+    Returns:
+        List[str]: Selectors (a copy - safe to modify)
+    """
+    return list(SELECTOR_FAMILIES[family])
+
+
+def family_locator(root, family: str, selectors: Optional[List[str]] = None):
+    """
+    Build one locator matching ANY selector of a family.
+    No browser call happens until the locator is used, and then it is
+    a single round trip for the whole family.
+    
+    Note: matches come back in document order, not selector priority.
+    
+    Args:
+        root: Playwright page or locator to search in
+        family: Family name
+        selectors: Override the registry list (e.g. a component's customised copy)
+    
+    Returns:
+        Locator: Combined locator (use .first for a single element)
+    """
+    if selectors is None:
+        compiled = COMPILED_FAMILIES[family]
+    else:
+        compiled = compile_family(selectors)
+    
+    parts = ([compiled['css']] if compiled['css'] else []) + compiled['text']
+    locator = root.locator(parts[0])
+    for part in parts[1:]:
+        locator = locator.or_(root.locator(part))
+    return locator
@@ -0,0 +1,314 @@
+"""
+Server Clock
+============
+
+Estimates the target site's own clock, which is what decides when a listing
+at 12:00:00 opens - not pool.ntp.org.
+
+A burst of HEAD requests goes over one kept-alive connection. Every answer
+says what time the server thought it was while the request was in flight:
+the Date header (1 s resolution), or a finer timestamp when the site sends
+one (SERVER_TIME_HEADERS, Alibaba's EagleEye trace id). With the request
+sent at local time `sent` and answered at `received`, a server timestamp T
+of resolution r bounds the offset (server minus local) to
+
+    T - received  <=  offset  <  T + r - sent
+
+The bounds of all answers are intersected. With only Date headers, each
+request is timed so the server should be crossing a second boundary while
+it is in flight: whether the answer shows the old or the new second then
+halves the interval, until it is as narrow as one round trip. The estimate
+is the middle of the interval and its uncertainty is half its width.
+
+Local times are time.monotonic_ns(), so system clock steps do not matter.
+
+Usage:
+    clock = ServerClock("https://www.lazada.sg/")
+    clock.calibrate()
+    clock.now()            # server time, from memory
+    wait_until(listing_time, clock=clock)
+"""
+
+import math
+import re
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .clock import get_clock
+from .utils import log_success, log_info, log_warning
+
+
+# Headers carrying the server time as Unix seconds or milliseconds
+SERVER_TIME_HEADERS = ['X-Server-Time', 'X-Timestamp', 'X-Request-Time']
+
+# Alibaba/Lazada trace ids: 8 hex digits of server IP, then the time in ms
+_EAGLEEYE_RE = re.compile(r'^[0-9a-fA-F]{8}(\d{13})')
+
+# Stop once the server clock is known this well (seconds)
+TARGET_UNCERTAINTY = 0.005
+
+# Leave at least this long before a timed request is sent (seconds)
+_SCHEDULE_MARGIN = 0.02
+
+
+def parse_server_time(headers) -> Optional[Tuple[float, float]]:
+    """
+    Server time from response headers, finest source first.
+    
+    Args:
+        headers: Response headers (case-insensitive mapping)
+    
+    Returns:
+        (unix seconds, resolution in seconds), None if the headers carry no time
+    """
+    trace = headers.get('EagleEye-TraceId', '')
+    match = _EAGLEEYE_RE.match(trace)
+    if match:
+        return int(match.group(1)) / 1000, 0.001
+    
+    for name in SERVER_TIME_HEADERS:
+        value = headers.get(name)
+        if value:
+            try:
+                number = float(value)
+            except ValueError:
+                continue
+            if number > 1e11:
+                return number / 1000, 0.001  # Milliseconds
+            return number, (0.001 if '.' in value else 1.0)
+    
+    date = headers.get('Date')
+    if date:
+        try:
+            return parsedate_to_datetime(date).timestamp(), 1.0
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+class ServerClock:
+    """
+    Clock of a remote HTTP server, served from memory once calibrated.
+    
+    Same reading methods as ClockService (now, now_ns, time), so either can
+    drive wait_until().
+    
+    Usage:
+        clock = ServerClock(product_url)
+        if clock.calibrate():
+            print(clock.offset_from_local(), clock.uncertainty)
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        timeout: float = 5.0
+    ):
+        """
+        Initialize the server clock.
+        
+        Args:
+            url: Any URL on the server (only its origin is requested)
+            session: Session to reuse (None = own keep-alive session)
+            timeout: Per-request timeout in seconds
+        """
+        parts = urlsplit(url)
+        self.url = f"{parts.scheme}://{parts.netloc}/"
+        self.timeout = timeout
+        self.owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        
+        # Offset bounds: server Unix ns = monotonic ns + offset
+        self.lo_ns = None
+        self.hi_ns = None
+        self.requests = 0
+        self.conflicts = 0          # Answers outside the interval (clock jump / other backend)
+        self.resolution = None      # Finest timestamp resolution seen (seconds)
+        self.rtts = []              # Seconds per request
+    
+    @property
+    def calibrated(self) -> bool:
+        return self.lo_ns is not None
+    
+    @property
+    def offset_ns(self) -> int:
+        """Best offset estimate: server Unix ns minus monotonic ns"""
+        return (self.lo_ns + self.hi_ns) // 2
+    
+    @property
+    def uncertainty(self) -> Optional[float]:
+        """Half the width of the offset interval, in seconds"""
+        if not self.calibrated:
+            return None
+        return (self.hi_ns - self.lo_ns) / 2e9
+    
+    def sample(self) -> bool:
+        """
+        Send one HEAD request and narrow the offset interval with its answer.
+        
+        Returns:
+            bool: True if the answer carried a usable server time
+        """
+        sent = time.monotonic_ns()
+        try:
+            response = self.session.head(self.url, timeout=self.timeout, allow_redirects=False)
+        except requests.RequestException as e:
+            log_warning(f"Server clock request failed: {e}")
+            return False
+        received = time.monotonic_ns()
+        self.requests += 1
+        self.rtts.append((received - sent) / 1e9)
+        
+        stamp = parse_server_time(response.headers)
+        if stamp is None:
+            return False
+        server_time, resolution = stamp
+        self.resolution = min(resolution, self.resolution or resolution)
+        
+        server_ns = int(server_time * 1e9)
+        lo = server_ns - received
+        hi = server_ns + int(resolution * 1e9) - sent
+        if not self.calibrated:
+            self.lo_ns, self.hi_ns = lo, hi
+        elif lo > self.hi_ns or hi < self.lo_ns:
+            self.conflicts += 1     # Start over from this answer
+            self.lo_ns, self.hi_ns = lo, hi
+        else:
+            self.lo_ns, self.hi_ns = max(self.lo_ns, lo), min(self.hi_ns, hi)
+        return True
+    
+    def _next_send_time(self) -> int:
+        """
+        Monotonic ns to send the next request at, so that (by the current
+        estimate) the server crosses a whole second while answering it.
+        """
+        rtt_ns = int(sorted(self.rtts)[len(self.rtts) // 2] * 1e9)
+        earliest = time.monotonic_ns() + int(_SCHEDULE_MARGIN * 1e9)
+        # Server time at the middle of a request sent at `earliest`
+        arrival = earliest + rtt_ns // 2 + self.offset_ns
+        boundary = math.ceil(arrival / 1e9) * 1_000_000_000
+        return boundary - self.offset_ns - rtt_ns // 2
+    
+    def calibrate(self, max_requests: int = 10, target: float = TARGET_UNCERTAINTY) -> bool:
+        """
+        Estimate the server clock.
+        
+        Takes at most max_requests HEAD requests (about one per second while
+        second boundaries are being probed). The first one opens the
+        connection and is not used, so later ones measure a warm round trip.
+        
+        Args:
+            max_requests: Request budget
+            target: Stop once the uncertainty is below this (seconds)
+        
+        Returns:
+            bool: True if the server clock is known
+        """
+        try:
+            self.session.head(self.url, timeout=self.timeout, allow_redirects=False)
+        except requests.RequestException as e:
+            log_warning(f"Server clock: {self.url} unreachable ({e})")
+            return False
+        
+        for _ in range(max_requests):
+            if self.calibrated and self.uncertainty <= target:
+                break
+            if self.calibrated and self.resolution >= 1.0:
+                delay = (self._next_send_time() - time.monotonic_ns()) / 1e9
+                if delay > 0:
+                    time.sleep(delay)
+            self.sample()
+        
+        if not self.calibrated:
+            log_warning(f"Server clock: no time in {self.url} responses")
+            return False
+        self.log_stats()
+        return True
+    
+    def now_ns(self) -> int:
+        """Current server time as Unix nanoseconds (no I/O)"""
+        return time.monotonic_ns() + self.offset_ns
+    
+    def time(self) -> float:
+        """Current server time as Unix seconds, like time.time() (no I/O)"""
+        return self.now_ns() / 1e9
+    
+    def now(self) -> datetime:
+        """Current server time as a local datetime, like datetime.now() (no I/O)"""
+        return datetime.fromtimestamp(self.time())
+    
+    def offset_from_local(self) -> float:
+        """Seconds the server clock is ahead (+) or behind (-) the system clock"""
+        return (self.now_ns() - time.time_ns()) / 1e9
+    
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Calibration state.
+        
+        Returns:
+            dict: calibrated, requests, conflicts, offset_ms (vs system clock),
+                  uncertainty_ms, median_rtt_ms, resolution (seconds)
+        """
+        rtts = sorted(self.rtts)
+        return {
+            'calibrated': self.calibrated,
+            'requests': self.requests,
+            'conflicts': self.conflicts,
+            'offset_ms': self.offset_from_local() * 1000 if self.calibrated else None,
+            'uncertainty_ms': self.uncertainty * 1000 if self.calibrated else None,
+            'median_rtt_ms': rtts[len(rtts) // 2] * 1000 if rtts else None,
+            'resolution': self.resolution,
+        }
+    
+    def log_stats(self):
+        """Log the calibration result"""
+        s = self.stats()
+        if not s['calibrated']:
+            return
+        source = 'Date header' if s['resolution'] >= 1.0 else 'server timestamp'
+        log_success(
+            f"Server clock: {s['offset_ms']:+.1f}ms vs system clock, ±{s['uncertainty_ms']:.1f}ms "
+            f"({s['requests']} requests, {source}, RTT {s['median_rtt_ms']:.0f}ms)"
+        )
+        if s['conflicts']:
+            log_warning(f"Server clock: {s['conflicts']} inconsistent answers (several backends?)")
+    
+    def close(self):
+        """Close the connection (if the session is ours)"""
+        if self.owns_session:
+            self.session.close()
+
+
+def calibrate_server_clock(url: str, max_requests: int = 10):
+    """
+    Clock to schedule against: the site's, or NTP if it cannot be read.
+    
+    Args:
+        url: Any URL on the target site
+        max_requests: Request budget for the calibration
+    
+    Returns:
+        ServerClock or ClockService: Object with now() / time() / now_ns()
+    """
+    log_info(f"Calibrating against the server clock of {urlsplit(url).netloc}...")
+    clock = ServerClock(url)
+    try:
+        if clock.calibrate(max_requests=max_requests):
+            return clock
+    finally:
+        clock.close()
+    
+    log_warning("Falling back to NTP time for scheduling")
+    return get_clock()
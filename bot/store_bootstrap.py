@@ -0,0 +1,221 @@
+"""
+Store Catalog Bootstrap
+=======================
+
+Enumerates every page of a store's catalog before monitoring starts, so
+products below the first screen are baselined as "seen" instead of
+triggering later as if they were new.
+
+Catalog pages (?ajax=true&page=N) are fetched concurrently by a small pool
+of HTTP workers sharing the browser's cookies. Page 1 tells us how many
+pages there are; the rest are fetched in parallel and merged in listing
+order. Stores that do not serve catalog JSON fall back to scrolling the
+store page in the browser (StoreMonitor.scroll_to_end).
+"""
+
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .catalog_capture import parse_catalog_payload
+from .network_detector import load_json_body
+from .utils import log_success, log_warning, with_query
+
+
+# Hard cap on catalog pages, whatever the store reports
+MAX_CATALOG_PAGES = 500
+
+# Retries per page when the server pushes back (429/503)
+PAGE_RETRIES = 3
+
+
+def catalog_page_count(data, default: Optional[int] = None) -> Optional[int]:
+    """
+    Number of catalog pages announced by a catalog payload.
+    
+    Args:
+        data: Parsed catalog JSON (Lazada: mainInfo.totalResults / pageSize)
+        default: Returned when the payload does not say
+    
+    Returns:
+        int: Page count, or default
+    """
+    try:
+        info = data['mainInfo']
+        total, size = int(info['totalResults']), int(info['pageSize'])
+        return max(1, math.ceil(total / size)) if size else default
+    except (KeyError, TypeError, ValueError):
+        return default
+
+
+class StoreBootstrap:
+    """
+    Fetches every catalog page of a store over parallel HTTP workers.
+    
+    Usage:
+        boot = StoreBootstrap.from_context(page.context, store_url)
+        products = boot.run()
+        boot.close()
+    """
+    
+    def __init__(
+        self,
+        store_url: str,
+        cookies: Optional[List[dict]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        workers: int = 4,
+        timeout: float = 10.0
+    ):
+        """
+        Initialize the bootstrap.
+        
+        Args:
+            store_url: Store URL (listing sort parameters are kept)
+            cookies: Cookies in Playwright's context.cookies() format
+            headers: Extra request headers (e.g. the browser's User-Agent)
+            workers: Catalog pages fetched at the same time
+            timeout: Per-request timeout in seconds
+        """
+        self.store_url = store_url
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json,text/plain,*/*',
+            'Accept-Encoding': 'gzip, deflate',
+            'X-Requested-With': 'XMLHttpRequest',
+        })
+        if headers:
+            self.session.headers.update(headers)
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+        
+        # Stats
+        self.pages_fetched = 0
+        self.failed_pages = []
+        self.seconds = 0.0
+    
+    @classmethod
+    def from_context(cls, context, store_url: str, page=None, **kwargs) -> 'StoreBootstrap':
+        """
+        Build a bootstrap that shares a Playwright context's cookies.
+        
+        Args:
+            context: Playwright browser context
+            store_url: Store URL
+            page: Optional page to copy the User-Agent from
+            **kwargs: Passed on to StoreBootstrap
+        
+        Returns:
+            StoreBootstrap: The bootstrap
+        """
+        headers = dict(kwargs.pop('headers', None) or {})
+        if page is not None:
+            try:
+                headers.setdefault('User-Agent', page.evaluate("() => navigator.userAgent"))
+            except:
+                pass
+        headers.setdefault('Referer', store_url)
+        return cls(store_url, cookies=context.cookies(), headers=headers, **kwargs)
+    
+    def page_url(self, number: int) -> str:
+        """Catalog JSON URL for one page"""
+        return with_query(self.store_url, {'ajax': 'true', 'page': number})
+    
+    def fetch_page(self, number: int) -> Tuple[List[dict], Optional[int]]:
+        """
+        Fetch and parse one catalog page.
+        
+        Args:
+            number: Page number (1-based)
+        
+        Returns:
+            (products, page count announced by the page or None)
+        """
+        url = self.page_url(number)
+        for attempt in range(PAGE_RETRIES + 1):
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.RequestException as e:
+                log_warning(f"Catalog page {number} failed: {e}")
+                break
+            
+            if response.status_code in (429, 503) and attempt < PAGE_RETRIES:
+                retry_after = response.headers.get('Retry-After', '')
+                time.sleep(min(float(retry_after), 10.0) if retry_after.isdigit() else 0.5 * 2 ** attempt)
+                continue
+            if response.status_code != 200:
+                log_warning(f"Catalog page {number} got status {response.status_code}")
+                break
+            
+            self.pages_fetched += 1
+            data = load_json_body(response.text)
+            return parse_catalog_payload(data, response.url), catalog_page_count(data)
+        
+        self.failed_pages.append(number)
+        return [], None
+    
+    def run(self, max_pages: int = MAX_CATALOG_PAGES) -> List[dict]:
+        """
+        Fetch the whole catalog.
+        
+        When page 1 announces the page count, the remaining pages are fetched
+        in one parallel sweep. Otherwise pages are fetched in waves of
+        `workers` until a wave comes back empty.
+        
+        Args:
+            max_pages: Never fetch more pages than this
+        
+        Returns:
+            List of products ('id', 'title', 'url') in listing order, no duplicates
+        """
+        started = time.perf_counter()
+        first, page_count = self.fetch_page(1)
+        pages = {1: first}
+        
+        if first:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                if page_count:
+                    numbers = list(range(2, min(page_count, max_pages) + 1))
+                    pages.update(zip(numbers, (p for p, _ in pool.map(self.fetch_page, numbers))))
+                else:
+                    number = 2
+                    while number <= max_pages:
+                        numbers = list(range(number, min(number + self.workers, max_pages + 1)))
+                        wave = [p for p, _ in pool.map(self.fetch_page, numbers)]
+                        pages.update(zip(numbers, wave))
+                        if not all(wave):
+                            break
+                        number += self.workers
+        
+        products, seen = [], set()
+        for number in sorted(pages):
+            for product in pages[number]:
+                if product['id'] not in seen:
+                    seen.add(product['id'])
+                    products.append(product)
+        
+        self.seconds = time.perf_counter() - started
+        if products:
+            log_success(
+                f"Catalog bootstrap: {len(products)} products from {self.pages_fetched} pages "
+                f"in {self.seconds:.2f}s ({self.workers} workers)"
+            )
+        if self.failed_pages:
+            log_warning(f"Catalog pages not fetched: {self.failed_pages}")
+        return products
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
@@ -4,13 +4,83 @@ Store Monitor
 
 Monitors a Lazada store page for new products matching keywords.
 This is useful when you don't have a direct product URL yet.
+
+In 'network' mode the product list is read from the store's catalog JSON
+responses (bot/catalog_capture.py) as they arrive; the DOM scan is only
+used when the store page does not load its grid that way.
+
+With incremental=True the store is listed newest first and each refresh
+only walks the cards above the first product already seen, so a steady-state
+scan costs as much as the number of new listings, not the store size.
+
+Before a refreshed grid is parsed, a one-evaluation probe fingerprints it
+(card count + hash of product ids); when nothing changed, which is almost
+every refresh, the full extraction is skipped.
+
+bootstrap() baselines the whole catalog (every page, fetched in parallel by
+bot/store_bootstrap.py) before monitoring starts. With a persistent
+seen_index (bot/seen_index.py) the baseline survives restarts: a monitor
+that finds its store already indexed skips it and starts detecting at once.
 """
 
 import time
-from typing import List, Optional
+from collections import deque
+from typing import List, Optional, Tuple, Union
 from playwright.sync_api import Page
 
-from .utils import log_success, log_error, log_info, log_warning, Timer, get_timestamp
+from .utils import log_success, log_error, log_info, log_warning, Timer, get_timestamp, with_query, extract_product_id, PRODUCT_ID_PATTERN
+from .selector_engine import SelectorEngine, get_selector_engine
+from .selector_registry import get_selectors
+from .extractor import extract_items, extract_items_until
+from .catalog_capture import CatalogCapture
+from .store_bootstrap import StoreBootstrap, MAX_CATALOG_PAGES
+from .keyword_matcher import KeywordMatcher
+from .seen_index import SeenIndex
+
+
+# Query parameters that make a store list its newest products first.
+# Adjust if Lazada renames the sort option in the store's sort menu.
+NEWEST_FIRST_PARAMS = {'sort': 'newest'}
+
+# Newest seen ids handed to the page as stop markers for incremental scans
+FRONTIER_SIZE = 50
+
+# Card count + FNV-1a hash of the product ids (query strings carry per-load
+# tracking tokens, so whole hrefs would change on every refresh). Uses the
+# first container selector with linked cards, like the extractor; null if
+# no card is rendered.
+GRID_FINGERPRINT_SCRIPT = """
+([items, link, pattern]) => {
+    const idRe = new RegExp(pattern);
+    for (const css of items) {
+        let cards;
+        try { cards = document.querySelectorAll(css); } catch (e) { continue; }
+        let count = 0, hash = 0x811c9dc5;
+        for (const card of cards) {
+            const a = card.querySelector(link);
+            if (!a) continue;
+            const href = a.getAttribute('href') || '';
+            const match = idRe.exec(href);
+            const key = match ? match[1] : href.split('?')[0];
+            for (let i = 0; i < key.length; i++) {
+                hash = Math.imul(hash ^ key.charCodeAt(i), 0x01000193);
+            }
+            hash = Math.imul(hash ^ 0x2c, 0x01000193);
+            count++;
+        }
+        if (count) return count + ':' + (hash >>> 0).toString(16);
+    }
+    return null;
+}
+"""
+
+# Scrolls to the bottom and reports how many product cards are rendered
+SCROLL_SCRIPT = """
+(css) => {
+    window.scrollTo(0, document.documentElement.scrollHeight);
+    return document.querySelectorAll(css).length;
+}
+"""
 
 
 class StoreMonitor:
@@ -22,12 +92,20 @@ class StoreMonitor:
         product_url = monitor.wait_for_product(max_wait=300)
     """
     
+    catalog_capture_class = CatalogCapture
+    
     def __init__(
         self, 
         page: Page, 
         store_url: str, 
         product_keywords: List[str],
-        check_interval: float = 2.0
+        check_interval: float = 2.0,
+        selector_engine: Optional[SelectorEngine] = None,
+        detection_mode: str = 'dom',
+        catalog_timeout: float = 10.0,
+        incremental: bool = False,
+        exclude_keywords: Optional[List[str]] = None,
+        seen_index: Optional[SeenIndex] = None
     ):
         """
         Initialize store monitor.
@@ -35,154 +113,395 @@ class StoreMonitor:
         Args:
             page: Playwright page object
             store_url: URL of the store to monitor
-            product_keywords: List of keywords to match (e.g., ["iPhone", "15", "Pro"])
+            product_keywords: Keyword rules, ANY may match (e.g., ["booster & !japanese",
+                              "elite trainer"], syntax in bot/keyword_matcher.py)
             check_interval: Seconds between checks (slower than product monitor)
+            selector_engine: Learns selector order (None = shared engine)
+            detection_mode: 'dom' (scrape the rendered grid) or 'network' (read
+                            the catalog JSON responses, DOM scan as fallback)
+            catalog_timeout: Seconds to wait for catalog responses after a refresh
+            incremental: List newest first and stop each scan at the first
+                         product already seen
+            exclude_keywords: Phrases that reject a title whatever rule matched
+            seen_index: Persistent seen products (None = in-memory set, rebuilt
+                        by a baseline scan on every start)
         """
         self.page = page
         self.store_url = store_url
         self.product_keywords = [kw.lower() for kw in product_keywords]
+        self.matcher = KeywordMatcher(product_keywords, exclude=exclude_keywords)
         self.check_interval = check_interval
         self.timer = Timer()
-        self.seen_products = set()  # Track products we've already seen
+        self.selector_engine = selector_engine or get_selector_engine()
+        self.seen_products: Union[set, SeenIndex] = seen_index if seen_index is not None else set()
+        self.resumed = len(self.seen_products) > 0  # Baseline in place (earlier run or bootstrap)
+        self.detection_mode = detection_mode
+        self.catalog_timeout = catalog_timeout
+        self.catalog = self.catalog_capture_class(page) if detection_mode == 'network' else None
+        
+        # Incremental scanning
+        self.incremental = incremental
+        self.scan_url = with_query(store_url, NEWEST_FIRST_PARAMS) if incremental else store_url
+        self.frontier = []                          # Newest seen ids, newest first
+        if self.resumed and incremental:
+            self.frontier = self.seen_products.recent(FRONTIER_SIZE)
+        self.cards_examined = deque(maxlen=1000)    # Cards looked at per refresh
+        
+        # Grid fingerprint pre-check
+        self.last_fingerprint = None    # Fingerprint of the grid parsed last
+        self.full_parses = 0
+        self.parses_skipped = 0
         
         log_info(f"Store Monitor initialized for: {store_url}")
         log_info(f"Searching for keywords: {product_keywords}")
+        if exclude_keywords:
+            log_info(f"Excluding: {exclude_keywords}")
+        if self.resumed:
+            log_info(f"Resuming with {len(self.seen_products)} products already seen")
         
-        # Selectors for product listings on store page
-        self.product_item_selectors = [
-            '.Bm3ON',  # Lazada's current product card class
-            '[data-item-id]',
-            '.item-card',
-            '[class*="item"]',
-            '.product-item',
-        ]
-        
-        self.product_link_selector = 'a[href*="/products/"]'
-        self.product_title_selectors = [
-            '.RfADt',  # Lazada's current title class
-            '.title',
-            '[class*="title"]',
-            '.name',
-            '[class*="name"]',
-            'img[alt]',  # Fallback to image alt text
-        ]
+        # Selectors come from the shared registry (bot/selector_registry.py)
+        self.product_item_selectors = get_selectors('store_item')
+        self.product_link_selector = get_selectors('store_product_link')[0]
+        self.product_title_selectors = get_selectors('store_title')
     
     def load_store_page(self):
         """Load the store page"""
         try:
             log_info(f"Loading store page...")
-            self.page.goto(self.store_url, wait_until="domcontentloaded")
+            if self.catalog:
+                self.catalog.attach()
+                self.page.goto(self.scan_url, wait_until="commit")
+                found = sum(len(batch) for batch in self.catalog.batches(max_wait=self.catalog_timeout))
+                if found:
+                    log_success(f"Store page loaded ({found} products from catalog responses)")
+                    return
+                log_warning("No catalog responses seen - using DOM scans")
+                self.page.wait_for_load_state("domcontentloaded")
+            else:
+                self.page.goto(self.scan_url, wait_until="domcontentloaded")
             time.sleep(2)  # Wait for products to load
             log_success("Store page loaded")
         except Exception as e:
             log_error(f"Failed to load store page: {e}")
             raise
     
-    def get_all_products(self) -> List[dict]:
+    def _card_fields(self) -> dict:
+        """Fields read from each product card, title selectors in learned order"""
+        title_selectors = self.selector_engine.order('store_title', self.product_title_selectors)
+        return {
+            'url': [f"{self.product_link_selector}@href"],
+            # Fall back to the link's own text
+            'title': title_selectors + [self.product_link_selector],
+        }
+    
+    def _to_products(self, rows: List[dict]) -> List[dict]:
+        """Turn raw card rows into product dicts with absolute URLs and ids"""
+        products = []
+        for row in rows:
+            url = row['url']
+            
+            # Make URL absolute
+            if url.startswith('/'):
+                url = f"https://www.lazada.sg{url}"
+            
+            product_id = self._extract_product_id(url)
+            if product_id and row['title']:
+                products.append({
+                    'id': product_id,
+                    'title': row['title'],
+                    'url': url
+                })
+        return products
+    
+    def get_all_products(self, budget: float = 1.0) -> List[dict]:
         """
         Get all products currently visible on the store page.
         
+        Every card is read in one in-page evaluation, so the cost of a scan
+        barely grows with the number of cards.
+        
+        Args:
+            budget: Maximum seconds to wait for cards to render
+        
         Returns:
             List of dicts with 'title', 'url', 'id'
         """
-        products = []
+        item_selectors = self.selector_engine.order('store_item', self.product_item_selectors)
+        rows, selector = extract_items(
+            self.page, item_selectors, self._card_fields(),
+            budget=budget, required=['url', 'title']
+        )
+        return self._scanned_products(rows, item_selectors, selector, log_found=True)
+    
+    def get_new_products(self, budget: float = 1.0) -> List[dict]:
+        """
+        Get the products listed above the first already-seen one.
+        
+        Needs the newest-first listing (incremental=True). The page stops
+        reading cards at the first frontier id; anything else already seen
+        ends the list here.
+        
+        Args:
+            budget: Maximum seconds to wait for cards to render
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id', newest first
+        """
+        item_selectors = self.selector_engine.order('store_item', self.product_item_selectors)
+        rows, selector, stopped = extract_items_until(
+            self.page, item_selectors, self._card_fields(), self._stop_marker(),
+            budget=budget, required=['url', 'title']
+        )
+        return self._new_since_frontier(self._scanned_products(rows, item_selectors, selector), stopped)
+    
+    # Scan bookkeeping below is pure Python, shared by the sync and asyncio
+    # monitors: the ports only differ in how they talk to the page.
+    
+    def _scanned_products(
+        self,
+        rows: List[dict],
+        item_selectors: List[str],
+        selector: Optional[str],
+        log_found: bool = False
+    ) -> List[dict]:
+        """
+        Book one card extraction and turn its rows into products.
+        
+        Args:
+            rows: Card rows read from the page
+            item_selectors: Card selectors, in the order they were tried
+            selector: Selector that found the cards (None = no card found)
+            log_found: Log how many cards the selector found
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id'
+        """
+        if selector:
+            if log_found:
+                log_info(f"Found {len(rows)} product elements using: {selector}")
+            self.selector_engine.record_winner('store_item', item_selectors, selector)
+        else:
+            self.last_fingerprint = None  # Nothing parsed - do not skip this grid next time
+        return self._to_products(rows)
+    
+    def _stop_marker(self) -> dict:
+        """extract_items_until() stop argument: the frontier ids in card URLs"""
+        return {'field': 'url', 'pattern': PRODUCT_ID_PATTERN, 'values': self.frontier}
+    
+    def _new_since_frontier(self, products: List[dict], stopped: bool) -> List[dict]:
+        """
+        Cut an incremental scan at the first seen product and record it.
         
+        Args:
+            products: Products read above the stop marker, newest first
+            stopped: True if the page stopped reading at a frontier id
+        
+        Returns:
+            List of new products, newest first
+        """
+        new, hit_seen = self._until_seen(products)
+        self._record_scan(new, len(new) + (1 if stopped or hit_seen else 0))
+        return new
+    
+    def _until_seen(self, products: List[dict]) -> Tuple[List[dict], bool]:
+        """
+        Cut a newest-first product list at the first already-seen product.
+        
+        Returns:
+            (new products, True if a seen product was reached)
+        """
+        for index, product in enumerate(products):
+            if product['id'] in self.seen_products:
+                return products[:index], True
+        return products, False
+    
+    def _record_scan(self, new: List[dict], examined: int):
+        """Record one incremental scan and move the frontier up"""
+        self.cards_examined.append(examined)
+        self.frontier = ([p['id'] for p in new] + self.frontier)[:FRONTIER_SIZE]
+    
+    def _remember(self, products: List[dict]):
+        """Mark products as seen (and as the frontier on a first scan)"""
+        if not self.frontier:
+            self.frontier = [p['id'] for p in products[:FRONTIER_SIZE]]
+        # Oldest first, so a SeenIndex's recent() lists the newest first
+        self.seen_products.update(p['id'] for p in reversed(products))
+    
+    def _fingerprint_arg(self) -> list:
+        """GRID_FINGERPRINT_SCRIPT argument"""
+        item_selectors = self.selector_engine.order('store_item', self.product_item_selectors)
+        return [item_selectors, self.product_link_selector, PRODUCT_ID_PATTERN]
+    
+    def grid_fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint the product grid in one cheap evaluation.
+        
+        Returns:
+            str: 'count:hash' of the product ids on the grid, None if no
+                 card is rendered (or the page could not be evaluated)
+        """
         try:
-            # Find all product items
-            for selector in self.product_item_selectors:
-                try:
-                    items = self.page.locator(selector).all()
-                    
-                    if len(items) > 0:
-                        log_info(f"Found {len(items)} product elements using: {selector}")
-                        
-                        for item in items:
-                            try:
-                                # Get product link
-                                link = item.locator(self.product_link_selector).first
-                                if link.count() == 0:
-                                    continue
-                                
-                                url = link.get_attribute('href')
-                                if not url:
-                                    continue
-                                
-                                # Make URL absolute
-                                if url.startswith('/'):
-                                    url = f"https://www.lazada.sg{url}"
-                                
-                                # Get product title - try multiple methods
-                                title = None
-                                
-                                # Method 1: Try title selectors
-                                for title_sel in self.product_title_selectors:
-                                    try:
-                                        title_elem = item.locator(title_sel).first
-                                        if title_elem.count() > 0:
-                                            if title_sel == 'img[alt]':
-                                                title = title_elem.get_attribute('alt')
-                                            else:
-                                                title = title_elem.inner_text().strip()
-                                            if title:
-                                                break
-                                    except:
-                                        continue
-                                
-                                # Method 2: Try getting from link itself
-                                if not title:
-                                    try:
-                                        title = link.inner_text().strip()
-                                    except:
-                                        pass
-                                
-                                # Extract product ID from URL
-                                product_id = self._extract_product_id(url)
-                                
-                                if product_id and title:
-                                    products.append({
-                                        'id': product_id,
-                                        'title': title,
-                                        'url': url
-                                    })
-                            except Exception as e:
-                                continue
-                        
-                        if products:
-                            break  # Found products, don't try other selectors
-                            
-                except Exception as e:
-                    continue
+            return self.page.evaluate(GRID_FINGERPRINT_SCRIPT, self._fingerprint_arg())
+        except Exception:
+            return None
+    
+    def _grid_unchanged(self, fingerprint: Optional[str]) -> bool:
+        """
+        Count one pre-check.
         
-        except Exception as e:
-            log_warning(f"Error getting products: {e}")
+        Args:
+            fingerprint: grid_fingerprint() of the refreshed page
         
-        return products
+        Returns:
+            bool: True if this is the grid parsed last time (skip parsing it)
+        """
+        if fingerprint is not None and fingerprint == self.last_fingerprint:
+            self.parses_skipped += 1
+            return True
+        self.last_fingerprint = fingerprint
+        self.full_parses += 1
+        return False
+    
+    def probe_stats(self) -> dict:
+        """
+        How often the grid pre-check saved a full parse.
+        
+        Returns:
+            dict: checks, skipped, parsed, skip_rate (0-1)
+        """
+        checks = self.parses_skipped + self.full_parses
+        return {
+            'checks': checks,
+            'skipped': self.parses_skipped,
+            'parsed': self.full_parses,
+            'skip_rate': self.parses_skipped / checks if checks else 0.0,
+        }
+    
+    def log_probe_stats(self):
+        """Log how often the full grid parse was skipped"""
+        s = self.probe_stats()
+        if s['checks']:
+            log_info(
+                f"Grid pre-check: {s['skipped']}/{s['checks']} refreshes unchanged "
+                f"({s['skip_rate']:.0%} full parses skipped)"
+            )
+    
+    def scan_stats(self) -> dict:
+        """
+        Cards examined per incremental refresh.
+        
+        Returns:
+            dict: scans, last, avg, max
+        """
+        counts = list(self.cards_examined)
+        if not counts:
+            return {'scans': 0, 'last': 0, 'avg': 0.0, 'max': 0}
+        return {
+            'scans': len(counts),
+            'last': counts[-1],
+            'avg': sum(counts) / len(counts),
+            'max': max(counts),
+        }
+    
+    def log_scan_stats(self):
+        """Log cards examined per incremental refresh"""
+        s = self.scan_stats()
+        if s['scans']:
+            log_info(
+                f"Incremental scans: {s['scans']} refreshes, cards examined "
+                f"avg {s['avg']:.1f} / max {s['max']} (store has {len(self.seen_products)} seen)"
+            )
+    
+    def scroll_to_end(self, max_rounds: int = 100, settle: float = 1.5) -> int:
+        """
+        Scroll an infinite-scroll store page until no more cards load.
+        
+        Args:
+            max_rounds: Maximum scrolls
+            settle: Seconds to wait for more cards after each scroll
+        
+        Returns:
+            int: Product cards rendered at the end
+        """
+        css = ', '.join(self.product_item_selectors)
+        count = 0
+        for _ in range(max_rounds):
+            try:
+                count = self.page.evaluate(SCROLL_SCRIPT, css)
+                self.page.wait_for_function(
+                    "([css, n]) => document.querySelectorAll(css).length > n",
+                    arg=[css, count], timeout=settle * 1000
+                )
+            except Exception:
+                break  # Nothing more loaded within settle
+        return count
+    
+    def bootstrap(self, workers: int = 4, max_pages: int = MAX_CATALOG_PAGES) -> int:
+        """
+        Mark the store's whole catalog as seen before monitoring.
+        
+        Fetches every catalog page over parallel HTTP workers (sharing the
+        browser's cookies). If the store serves no catalog JSON, the store
+        page is scrolled to the end and scanned instead.
+        
+        Args:
+            workers: Catalog pages fetched at the same time
+            max_pages: Never fetch more pages than this
+        
+        Returns:
+            int: Products now marked as seen
+        """
+        if self.resumed:
+            log_info(f"📚 Baseline already in place ({len(self.seen_products)} products) - skipping bootstrap")
+            return len(self.seen_products)
+        log_info(f"📚 Bootstrapping store catalog ({workers} workers)...")
+        boot = StoreBootstrap.from_context(self.page.context, self.scan_url, page=self.page, workers=workers)
+        try:
+            products = boot.run(max_pages=max_pages)
+        finally:
+            boot.close()
+        
+        if not products:
+            log_warning("No catalog JSON - scrolling the store page instead")
+            self.load_store_page()
+            cards = self.scroll_to_end()
+            products = self.get_all_products()
+            log_info(f"Scrolled to {cards} cards")
+        
+        self._remember(products)
+        # The baseline replaces wait_for_product's initial scan
+        self.resumed = len(self.seen_products) > 0
+        log_success(f"Baseline: {len(self.seen_products)} products marked as seen")
+        return len(products)
+    
+    def current_products(self) -> List[dict]:
+        """
+        Products on the store right now: the ones captured from catalog
+        responses in network mode, otherwise a DOM scan.
+        
+        Returns:
+            List of dicts with 'title', 'url', 'id'
+        """
+        if self.catalog and self.catalog.products:
+            return list(self.catalog.products.values())
+        return self.get_all_products()
     
     def _extract_product_id(self, url: str) -> Optional[str]:
         """Extract product ID from URL"""
-        try:
-            if '-i' in url:
-                return url.split('-i')[1].split('.')[0].split('?')[0]
-        except:
-            pass
-        return url  # Use full URL as ID if can't extract
+        return extract_product_id(url) or url  # Use full URL as ID if can't extract
     
-    def matches_keywords(self, title: str) -> bool:
+    def matches_keywords(self, title: str, product_id: Optional[str] = None) -> bool:
         """
-        Check if product title matches ANY of the keyword sets.
+        Check if product title matches ANY of the keyword rules.
         
         Args:
             title: Product title to check
+            product_id: Memoises the verdict for this product
             
         Returns:
-            bool: True if any keyword found in title
+            bool: True if any rule matches and no exclude phrase is present
         """
-        title_lower = title.lower()
-        
-        # Check if ANY keyword matches (more flexible for Pokemon products)
-        matches = any(keyword in title_lower for keyword in self.product_keywords)
-        
-        return matches
+        return self.matcher.matches(title, key=product_id)
     
     def find_matching_product(self) -> Optional[dict]:
         """
@@ -191,8 +510,18 @@ class StoreMonitor:
         Returns:
             dict with product info if found, None otherwise
         """
-        products = self.get_all_products()
+        return self._match_new(self.current_products())
+    
+    def _first_match(self, products: List[dict]) -> Optional[dict]:
+        """
+        First product that is new and matches the keywords.
+        
+        Args:
+            products: Products to check
         
+        Returns:
+            dict with product info if found, None otherwise
+        """
         log_info(f"Checking {len(products)} products...")
         
         for product in products:
@@ -201,65 +530,203 @@ class StoreMonitor:
                 continue
             
             # Check if matches keywords
-            if self.matches_keywords(product['title']):
+            rule = self.matcher.match(product['title'], key=product['id'])
+            if rule:
                 log_success(f"[{get_timestamp()}] ✨ FOUND MATCH!")
                 log_success(f"Product: {product['title']}")
+                log_info(f"Rule: {rule}")
                 log_info(f"URL: {product['url']}")
                 return product
         
         return None
     
-    def wait_for_product(self, max_wait: float = 300, initial_scan_only: bool = False) -> Optional[str]:
+    def _check_catalog(self) -> Optional[dict]:
         """
-        Wait for a matching product to appear.
+        Refresh and match products from catalog responses as each one lands
+        (no settle delay, no DOM scan).
+        
+        Returns:
+            dict with product info if found, None otherwise
+        """
+        self.catalog.discard_pending()
+        try:
+            log_info(f"🔄 Refreshing store page...")
+            self.page.reload(wait_until="commit")
+        except Exception as e:
+            log_warning(f"Refresh failed: {e}")
+            return None
+        
+        scan = self._catalog_scan()
+        product = None
+        for batch in self.catalog.batches(max_wait=self.catalog_timeout):
+            product, done = self._take_catalog_batch(batch, scan)
+            if done:
+                break
+        
+        if scan['batches']:
+            self._finish_catalog_scan(scan)
+            return product
+        
+        log_warning("No catalog response after refresh - scanning DOM")
+        self.page.wait_for_load_state("domcontentloaded")
+        if self.incremental:
+            return self._check_new_cards()
+        return self._match_new(self.get_all_products())
+    
+    @staticmethod
+    def _catalog_scan() -> dict:
+        """Running totals of one catalog refresh (see _take_catalog_batch)"""
+        return {'batches': 0, 'new': [], 'examined': 0}
+    
+    def _take_catalog_batch(self, batch: List[dict], scan: dict) -> Tuple[Optional[dict], bool]:
+        """
+        Match one catalog response of a refresh.
         
         Args:
-            max_wait: Maximum seconds to wait
-            initial_scan_only: If True, only scan once without monitoring
-            
+            batch: Products from the response
+            scan: _catalog_scan() totals of this refresh, updated in place
+        
         Returns:
-            str: Product URL if found, None if timeout
+            (matching product or None, True if no more batches are needed)
+        """
+        scan['batches'] += 1
+        hit_seen = False
+        if self.incremental:
+            # Catalog pages come newest first: stop at the first seen id
+            batch, hit_seen = self._until_seen(batch)
+            scan['new'] += batch
+            scan['examined'] += len(batch) + (1 if hit_seen else 0)
+        else:
+            scan['new'] += self._unseen(batch)
+        product = self._first_match(batch)
+        return product, bool(product) or hit_seen
+    
+    def _finish_catalog_scan(self, scan: dict):
+        """Mark the new products of a catalog refresh as seen (and record an incremental one)"""
+        if self.incremental:
+            self._record_scan(scan['new'], scan['examined'])
+        self._remember(scan['new'])
+    
+    def _check_new_cards(self) -> Optional[dict]:
+        """
+        Match only the cards listed since the last scan (incremental mode).
+        
+        Returns:
+            dict with product info if found, None otherwise
         """
+        return self._match_new(self.get_new_products())
+    
+    def _match_new(self, products: List[dict]) -> Optional[dict]:
+        """
+        First new match among scanned products. Every new product, the match
+        included, is then marked as seen, so a persistent seen_index does not
+        trigger on it again after a restart.
+        
+        Args:
+            products: Products read by one scan
+        
+        Returns:
+            dict with product info if found, None otherwise
+        """
+        product = self._first_match(products)
+        self._remember(self._unseen(products))
+        return product
+    
+    def _unseen(self, products: List[dict]) -> List[dict]:
+        """Products not marked as seen yet"""
+        return [p for p in products if p['id'] not in self.seen_products]
+    
+    def _seed_seen(self, products: List[dict]):
+        """Mark the products of the initial scan as seen"""
+        self._remember(products)
+        log_info(f"Found {len(products)} existing products")
+        log_info("(These will be ignored - only NEW products will trigger)")
+        log_info("\n👀 Now monitoring for NEW products...\n")
+    
+    def _log_monitoring_start(self, mode: str = ""):
+        """Log the monitoring banner"""
         log_info("=" * 60)
-        log_info("🔍 STORE MONITORING ACTIVE")
+        log_info(f"🔍 STORE MONITORING ACTIVE{mode}")
         log_info("=" * 60)
         log_info(f"Keywords: {self.product_keywords}")
         log_info(f"Check interval: {self.check_interval}s")
         log_info("=" * 60)
+    
+    def _log_found(self, checks: int):
+        """Log a detection and the scan statistics"""
+        log_success("=" * 60)
+        log_success(f"🎯 PRODUCT FOUND after {self.timer.elapsed():.1f}s ({checks} checks)")
+        log_success("=" * 60)
+        self.log_scan_stats()
+        self.log_probe_stats()
+    
+    def _log_no_match(self, checks: int, unchanged: bool):
+        """Log a check that found nothing new"""
+        if unchanged:
+            examined = " (grid unchanged)"
+        else:
+            examined = f" ({self.cards_examined[-1]} cards examined)" if self.cards_examined else ""
+        log_info(f"Check #{checks} at {self.timer.elapsed():.1f}s - No new matches yet...{examined}")
+    
+    def _log_timeout(self, checks: int):
+        """Log a timeout and the scan statistics"""
+        log_error(f"⏰ Timeout after {self.timer} ({checks} checks)")
+        self.log_scan_stats()
+        self.log_probe_stats()
+    
+    def _matching(self, products: List[dict]) -> List[dict]:
+        """Products whose title matches the keywords, seen or not"""
+        return [p for p in products if self.matches_keywords(p['title'], p['id'])]
+    
+    def wait_for_product(self, max_wait: float = 300, initial_scan_only: bool = False) -> Optional[str]:
+        """
+        Wait for a matching product to appear.
         
+        Args:
+            max_wait: Maximum seconds to wait
+            initial_scan_only: If True, only scan once without monitoring
+            
+        Returns:
+            str: Product URL if found, None if timeout
+        """
+        self._log_monitoring_start()
         self.timer.start()
         checks = 0
         
-        if not initial_scan_only:
+        if not initial_scan_only and not self.resumed:
             # Initial scan to populate seen_products
             log_info("\n📋 Initial scan - identifying existing products...")
-            initial_products = self.get_all_products()
-            for p in initial_products:
-                self.seen_products.add(p['id'])
-            log_info(f"Found {len(initial_products)} existing products")
-            log_info("(These will be ignored - only NEW products will trigger)")
-            log_info("\n👀 Now monitoring for NEW products...\n")
+            self._seed_seen(self.current_products())
+        elif self.resumed:
+            log_info(f"\n👀 {len(self.seen_products)} products already known - monitoring for NEW products...\n")
         
         while self.timer.elapsed() < max_wait:
             checks += 1
+            unchanged = False
             
-            # Refresh the page to get latest products
-            if checks > 1:  # Skip refresh on first check
-                try:
-                    log_info(f"🔄 Refreshing store page...")
-                    self.page.reload(wait_until="domcontentloaded")
-                    time.sleep(2)  # Wait for products to load
-                except Exception as e:
-                    log_warning(f"Refresh failed: {e}")
-            
-            # Look for matching product
-            product = self.find_matching_product()
+            if self.catalog and checks > 1:
+                product = self._check_catalog()
+            else:
+                # Refresh the page to get latest products
+                if checks > 1:  # Skip refresh on first check
+                    try:
+                        log_info(f"🔄 Refreshing store page...")
+                        self.page.reload(wait_until="domcontentloaded")
+                        time.sleep(2)  # Wait for products to load
+                    except Exception as e:
+                        log_warning(f"Refresh failed: {e}")
+                
+                # Look for matching product - unless the grid did not change
+                unchanged = not self.catalog and self._grid_unchanged(self.grid_fingerprint())
+                if unchanged:
+                    product = None
+                elif self.incremental:
+                    product = self._check_new_cards()
+                else:
+                    product = self.find_matching_product()
             
             if product:
-                elapsed = self.timer.elapsed()
-                log_success("=" * 60)
-                log_success(f"🎯 PRODUCT FOUND after {elapsed:.1f}s ({checks} checks)")
-                log_success("=" * 60)
+                self._log_found(checks)
                 return product['url']
             
             if initial_scan_only:
@@ -267,13 +734,12 @@ class StoreMonitor:
                 return None
             
             # Log progress
-            elapsed = self.timer.elapsed()
-            log_info(f"Check #{checks} at {elapsed:.1f}s - No new matches yet...")
+            self._log_no_match(checks, unchanged)
             
             # Wait before next check
             time.sleep(self.check_interval)
         
-        log_error(f"⏰ Timeout after {self.timer} ({checks} checks)")
+        self._log_timeout(checks)
         return None
     
     def scan_current_products(self) -> List[dict]:
@@ -284,12 +750,5 @@ class StoreMonitor:
         Returns:
             List of matching products
         """
-        products = self.get_all_products()
-        matching = []
-        
-        for product in products:
-            if self.matches_keywords(product['title']):
-                matching.append(product)
-        
-        return matching
+        return self._matching(self.current_products())
 
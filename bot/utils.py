@@ -2,10 +2,13 @@
 Utility functions for the sniper bot
 """
 
+import asyncio
+import functools
+import re
 import time
 from datetime import datetime
 from typing import Optional
-import ntplib
+from urllib.parse import urlparse, urlencode, parse_qsl, urlunparse
 from colorama import Fore, Style, init
 
 # Initialize colorama for colored output
@@ -14,22 +17,32 @@ init(autoreset=True)
 
 def get_accurate_time() -> datetime:
     """
-    Get accurate time from NTP server to ensure precise timing.
+    Get accurate time from the shared NTP-disciplined clock (bot/clock.py).
+    The first call syncs with NTP; later calls are served from memory.
     Falls back to system time if NTP is unavailable.
     
     Returns:
         datetime: Current time
     """
-    try:
-        ntp_client = ntplib.NTPClient()
-        response = ntp_client.request('pool.ntp.org', timeout=2)
-        return datetime.fromtimestamp(response.tx_time)
-    except:
-        # Fall back to system time
-        return datetime.now()
+    from .clock import get_clock  # bot.clock imports this module
+    return get_clock().now()
+
 
+def _print_countdown(remaining: float):
+    """Show the time left before the start"""
+    if remaining > 60:
+        print(f"{Fore.YELLOW}⏰ Waiting... {remaining/60:.1f} minutes until start", end='\r')
+    else:
+        print(f"{Fore.YELLOW}⏰ Waiting... {remaining:.1f} seconds until start", end='\r')
 
-def wait_until(target_time: datetime, pre_load_seconds: int = 5):
+
+def wait_until(
+    target_time: datetime,
+    pre_load_seconds: float = 5,
+    clock=None,
+    trigger=None,
+    lead: float = 0.0
+) -> Optional[float]:
     """
     Wait until target time, with countdown display.
     Starts actual monitoring {pre_load_seconds} before target time.
@@ -37,64 +50,136 @@ def wait_until(target_time: datetime, pre_load_seconds: int = 5):
     Args:
         target_time: When to start sniping
         pre_load_seconds: Start monitoring this many seconds early
+        clock: Clock target_time is on, e.g. a calibrated ServerClock
+               (None = shared NTP clock)
+        trigger: PrecisionTrigger for a sub-millisecond finish (None = return
+                 within the last second's sleep)
+        lead: Return this much earlier still, e.g. the one-way latency so the
+              next request reaches the server at the target time (seconds)
+    
+    Returns:
+        float: Overshoot in seconds when a trigger is used, else None
     """
-    start_time = target_time.timestamp() - pre_load_seconds
+    if clock is None:
+        from .clock import get_clock
+        clock = get_clock()
+    start_time = target_time.timestamp() - pre_load_seconds - lead
     
-    while True:
-        current_time = get_accurate_time()
-        remaining = start_time - current_time.timestamp()
-        
-        if remaining <= 0:
-            break
-        
-        if remaining > 60:
-            print(f"{Fore.YELLOW}⏰ Waiting... {remaining/60:.1f} minutes until start", end='\r')
-        else:
-            print(f"{Fore.YELLOW}⏰ Waiting... {remaining:.1f} seconds until start", end='\r')
-        
-        time.sleep(min(1, remaining))
+    overshoot = None
+    if trigger is not None:
+        overshoot = trigger.wait(clock, int(start_time * 1e9), countdown=_print_countdown)
+    else:
+        while True:
+            remaining = start_time - clock.time()  # From memory, no NTP round trip
+            
+            if remaining <= 0:
+                break
+            
+            _print_countdown(remaining)
+            time.sleep(min(1, remaining))
     
     print(f"\n{Fore.GREEN}🎯 Starting product monitoring!")
+    return overshoot
 
 
-def calculate_latency(page) -> float:
+async def wait_until_async(
+    target_time: datetime,
+    pre_load_seconds: float = 5,
+    clock=None,
+    trigger=None,
+    lead: float = 0.0
+) -> Optional[float]:
     """
-    Estimate network latency by measuring navigation time.
+    Async version of wait_until. The first NTP sync (if not done yet) runs
+    in a worker thread so other tasks keep running during the countdown.
     
     Args:
-        page: Playwright page object
-        
+        target_time: When to start sniping
+        pre_load_seconds: Start monitoring this many seconds early
+        clock: Clock target_time is on (None = shared NTP clock)
+        trigger: PrecisionTrigger for a sub-millisecond finish (blocks the
+                 event loop for its last SPIN_WINDOW)
+        lead: Return this much earlier still (seconds)
+    
     Returns:
-        float: Estimated latency in seconds
+        float: Overshoot in seconds when a trigger is used, else None
     """
+    if clock is None:
+        from .clock import get_clock
+        clock = await asyncio.get_running_loop().run_in_executor(None, get_clock)
+    start_time = target_time.timestamp() - pre_load_seconds - lead
+    
+    overshoot = None
+    if trigger is not None:
+        overshoot = await trigger.wait_async(clock, int(start_time * 1e9), countdown=_print_countdown)
+    else:
+        while True:
+            remaining = start_time - clock.time()
+            
+            if remaining <= 0:
+                break
+            
+            _print_countdown(remaining)
+            await asyncio.sleep(min(1, remaining))
+    
+    print(f"\n{Fore.GREEN}🎯 Starting product monitoring!")
+    return overshoot
+
+
+def calculate_latency(page, samples: int = 5) -> float:
+    """
+    Estimate network latency to the page's site over a separate connection.
+    The page itself is never navigated. For a continuous estimate, keep a
+    LatencySampler (bot/latency_sampler.py) running instead.
+    
+    Args:
+        page: Playwright page object (only its URL is used)
+        samples: Round trips to measure
+    
+    Returns:
+        float: Median round trip in seconds
+    """
+    from .latency_sampler import LatencySampler  # bot.latency_sampler imports this module
+    url = page.url if page.url.startswith('http') else "https://www.lazada.sg/"
+    sampler = LatencySampler(url, interval=0)
     try:
-        start = time.time()
-        page.goto("https://www.lazada.sg/favicon.ico", wait_until="domcontentloaded")
-        latency = time.time() - start
-        return latency
-    except:
-        return 0.15  # Default estimate: 150ms
+        sampler.start(burst=samples)
+        return sampler.rtt() or 0.15  # Default estimate: 150ms
+    finally:
+        sampler.stop()
 
 
-def retry_on_failure(max_attempts: int = 3, delay: float = 0.5):
+def retry_on_failure(max_attempts: int = 3, delay: float = 0.5, deadline: Optional[float] = None):
     """
-    Decorator to retry a function on failure.
+    Decorator to retry a function on failure (see bot/retry.py).
+    Works on both regular functions and coroutine functions.
+    
+    An exception or a falsy return value is a failure. Pauses start at a few
+    milliseconds and back off exponentially; fatal errors (closed page,
+    programming errors) are not retried.
     
     Args:
-        max_attempts: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        max_attempts: Maximum number of attempts
+        delay: Longest pause between attempts in seconds
+        deadline: Stop retrying this many seconds after the first attempt
     """
+    from .retry import RetryEngine, BASE_DELAY  # bot.retry imports this module
+    
     def decorator(func):
+        def engine():
+            return RetryEngine(max_attempts=max_attempts, deadline=deadline,
+                               base_delay=min(BASE_DELAY, delay), max_delay=delay,
+                               name=func.__name__)
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await engine().run_async(func, *args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts - 1:
-                        raise e
-                    print(f"{Fore.YELLOW}⚠️  Attempt {attempt + 1} failed, retrying...")
-                    time.sleep(delay)
-            return None
+            return engine().run(func, *args, **kwargs)
         return wrapper
     return decorator
 
@@ -135,6 +220,22 @@ def save_screenshot(page, filename: str = "error.png"):
         log_error(f"Failed to save screenshot: {e}")
 
 
+async def save_screenshot_async(page, filename: str = "error.png"):
+    """
+    Save screenshot for debugging (async Playwright page).
+    
+    Args:
+        page: Async Playwright page object
+        filename: Filename to save screenshot
+    """
+    try:
+        filepath = f"screenshots/{filename}"
+        await page.screenshot(path=filepath)
+        log_info(f"Screenshot saved: {filepath}")
+    except Exception as e:
+        log_error(f"Failed to save screenshot: {e}")
+
+
 def get_timestamp() -> str:
     """Get current timestamp as formatted string"""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
@@ -146,7 +247,7 @@ def format_duration(seconds: float) -> str:
     
     Args:
         seconds: Duration in seconds
-        
+    
     Returns:
         str: Formatted duration
     """
@@ -188,13 +289,62 @@ class Timer:
         return format_duration(self.elapsed())
 
 
+def to_dom_query(selector: str) -> dict:
+    """
+    Translate a Playwright selector into a query that plain DOM code can run.
+    
+    Supports CSS, 'text=...', 'text=/regex/' and the ':has-text("...")' suffix,
+    which covers every selector used by the bot.
+    
+    Args:
+        selector: Playwright selector string
+    
+    Returns:
+        dict: {'selector', 'css', 'text', 'regex'} - unused keys are None
+    """
+    if selector.startswith('text='):
+        text = selector[len('text='):]
+        if len(text) > 1 and text.startswith('/') and text.endswith('/'):
+            return {'selector': selector, 'css': None, 'text': None, 'regex': text[1:-1]}
+        return {'selector': selector, 'css': None, 'text': text.strip('"\'').lower(), 'regex': None}
+    
+    match = re.match(r'^(.*):has-text\((["\'])(.*)\2\)$', selector)
+    if match:
+        return {'selector': selector, 'css': match.group(1) or '*', 'text': match.group(3).lower(), 'regex': None}
+    
+    return {'selector': selector, 'css': selector, 'text': None, 'regex': None}
+
+
+# JavaScript helper shared by the in-page scripts: resolves a to_dom_query()
+# dict to the first matching element (or null), mirroring Playwright semantics.
+DOM_QUERY_JS = """
+const __norm = (s) => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+const __query = (q, root) => {
+    root = root || document;
+    if (q.css === null) {
+        const body = document.body;
+        const text = body ? body.innerText || body.textContent : '';
+        if (q.regex !== null) return new RegExp(q.regex).test(text) ? body : null;
+        return __norm(text).includes(q.text) ? body : null;
+    }
+    let els;
+    try { els = root.querySelectorAll(q.css); } catch (e) { return null; }
+    if (q.text === null) return els[0] || null;
+    for (const el of els) {
+        if (__norm(el.textContent).includes(q.text)) return el;
+    }
+    return null;
+};
+"""
+
+
 def validate_url(url: str) -> bool:
     """
     Validate if URL is a valid Lazada product URL.
     
     Args:
         url: URL to validate
-        
+    
     Returns:
         bool: True if valid Lazada URL
     """
@@ -205,22 +355,37 @@ def validate_url(url: str) -> bool:
     return any(pattern in url.lower() for pattern in valid_patterns)
 
 
+# .../<slug>-i<item id>[-s<sku id>].html (also evaluated in the page)
+PRODUCT_ID_PATTERN = r'-i(\d+)(?:-s\d+)?\.html'
+
+
 def extract_product_id(url: str) -> Optional[str]:
     """
     Extract product ID from Lazada URL.
     
     Args:
         url: Lazada product URL
-        
+    
     Returns:
         str: Product ID if found, None otherwise
     """
-    try:
-        # Lazada URLs typically have format: /products/name-i12345678.html
-        if '-i' in url:
-            product_id = url.split('-i')[1].split('.')[0].split('?')[0]
-            return product_id
-    except:
-        pass
-    return None
+    # The slug may contain '-i' too, so match the numeric id before .html
+    match = re.search(PRODUCT_ID_PATTERN, url or '')
+    return match.group(1) if match else None
+
 
+def with_query(url: str, params: dict) -> str:
+    """
+    Set query parameters on a URL, keeping the ones already there.
+    
+    Args:
+        url: URL to extend
+        params: Parameters to set
+    
+    Returns:
+        str: URL with the parameters
+    """
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query))
+    query.update(params)
+    return urlunparse(parts._replace(query=urlencode(query)))
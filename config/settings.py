@@ -5,6 +5,8 @@ Configuration settings for Lazada Sniper Bot
 import os
 from pathlib import Path
 
+from bot.multi_monitor import BACKGROUND_THROTTLING_ARGS
+
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -18,6 +20,11 @@ BROWSER_CONFIG = {
     "headless": False,  # Set to True for faster, invisible browser
     "slow_mo": 50,      # Milliseconds to slow down operations (for learning)
     "timeout": 30000,   # Default timeout in milliseconds
+    # Keep background tabs running at full speed (see bot/multi_monitor.py)
+    "args": list(BACKGROUND_THROTTLING_ARGS),
+    # Render-lite mode, opt-in (see bot/render_lite.py): no animations, small viewport
+    "render_lite": False,
+    "web_fonts": True,  # False = system font only, web fonts never load (render-lite)
 }
 
 # Timing settings
@@ -25,13 +32,20 @@ TIMING_CONFIG = {
     "check_interval": 0.1,      # Seconds between availability checks
     "max_wait_time": 300,       # Maximum seconds to wait for product
     "pre_load_time": 60,        # Seconds before listing to start monitoring
+    "reload_interval": 2.0,     # Base seconds between product page reloads (adaptive)
+    "server_clock": True,       # Schedule on Lazada's clock (HTTP Date headers), not NTP's
+    "clock_probes": 10,         # HEAD requests for the server clock calibration (~1 per second)
+    "latency_probe_interval": 1.0,  # Seconds between background RTT samples (0 = off)
 }
 
 # Bot behavior settings
 BOT_CONFIG = {
     "auto_purchase": False,     # WARNING: Set to True to auto-complete purchase
-    "max_retries": 3,           # Retry attempts for failed operations
+    "max_retries": 8,           # Attempts per stage, within its deadline (first retries ms apart)
     "screenshot_on_error": True, # Save screenshot when errors occur
+    # Opt-in: block images/fonts/media/trackers while monitoring, loosened for
+    # checkout (profiles in bot/resource_blocker.py); False loads pages in full
+    "block_resources": False,
 }
 
 # User credentials (DO NOT COMMIT REAL CREDENTIALS)
@@ -46,14 +60,8 @@ LOG_CONFIG = {
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 }
 
-# Selectors (these may need to be updated as Lazada changes their website)
-SELECTORS = {
-    "add_to_cart_button": "button.add-to-cart-buy-now-btn",
-    "buy_now_button": "button.buy-now-btn",
-    "cart_icon": ".cart-icon",
-    "checkout_button": "button[data-spm-anchor-id*='checkout']",
-    "place_order_button": "button.next-btn",
-}
+# Selectors live in bot/selector_registry.py (versioned, shared by all components).
+# Update them there when Lazada changes their website.
 
 # Notification settings
 NOTIFICATION_CONFIG = {
@@ -0,0 +1,86 @@
+"""
+HTTP Probe vs Browser Reload Benchmark
+======================================
+
+Compares one availability check done two ways against the stand-in server:
+- browser : page.reload() + evaluate probe (what reload-based monitoring does)
+- http    : one request over the pooled keep-alive session (HttpAvailabilityProbe)
+
+Reports time, requests and bytes the server had to send per check.
+
+Usage:
+    python examples/benchmark_http_probe.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.monitor import ProductMonitor
+from bot.http_probe import HttpAvailabilityProbe
+from standin_server import StandInLazada
+
+
+CHECKS = 50
+
+
+def measure(server: StandInLazada, check) -> dict:
+    """Run `check` CHECKS times and return per-check costs"""
+    requests_before = sum(server.requests.values())
+    bytes_before = server.bytes_sent
+    cpu_before = time.process_time()
+    start = time.perf_counter()
+    
+    for _ in range(CHECKS):
+        check()
+    
+    return {
+        'ms': (time.perf_counter() - start) / CHECKS * 1000,
+        'cpu_ms': (time.process_time() - cpu_before) / CHECKS * 1000,
+        'requests': (sum(server.requests.values()) - requests_before) / CHECKS,
+        'bytes': (server.bytes_sent - bytes_before) / CHECKS,
+    }
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  HTTP PROBE vs BROWSER RELOAD")
+    print("="*60)
+    
+    # page_poll_ms=0: the page fetches stock once per load, no background polling
+    server = StandInLazada(page_poll_ms=0)
+    server.start()
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        monitor = ProductMonitor(page)
+        monitor.pre_load(server.product_url)
+        
+        def browser_check():
+            page.reload(wait_until="load")
+            monitor.is_product_available()
+        
+        browser_result = measure(server, browser_check)
+        
+        probe = HttpAvailabilityProbe.from_context(page.context, server.product_url, page=page)
+        http_result = measure(server, probe.check)
+        probe.close()
+        browser.close()
+    
+    server.stop()
+    
+    print(f"\n{'':<10} {'ms/check':>10} {'py cpu ms':>10} {'requests':>9} {'bytes':>9}")
+    for name, r in (('browser', browser_result), ('http', http_result)):
+        print(f"{name:<10} {r['ms']:>10.2f} {r['cpu_ms']:>10.2f} {r['requests']:>9.1f} {r['bytes']:>9.0f}")
+    
+    print("\n💡 'py cpu' is this process only - the browser's own rendering CPU")
+    print("   is extra on the browser path and zero on the http path.")
+
+
+if __name__ == "__main__":
+    main()
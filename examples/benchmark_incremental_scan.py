@@ -0,0 +1,86 @@
+"""
+Incremental Store Scan Benchmark
+================================
+
+Compares one store refresh scan on newest-first stand-in stores with 500 and
+5000 product cards, while a few products are listed between refreshes:
+- full        : StoreMonitor.get_all_products (every card)
+- incremental : StoreMonitor.get_new_products (stops at the first seen card)
+
+Reports scan time and cards examined per refresh.
+
+Usage:
+    python examples/benchmark_incremental_scan.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.store_monitor import StoreMonitor
+from standin_server import StandInLazada
+
+
+CARD_COUNTS = [500, 5000]
+NEW_PER_REFRESH = [0, 1, 3, 0, 2, 0, 0, 5, 1, 0]
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  STORE SCAN: FULL vs INCREMENTAL")
+    print("="*60)
+    
+    results = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        
+        for count in CARD_COUNTS:
+            server = StandInLazada(store_items=count)
+            server.start()
+            monitor = StoreMonitor(page, server.store_url, ["pokemon"], incremental=True)
+            page.goto(monitor.scan_url, wait_until="load")
+            monitor._remember(monitor.get_all_products())
+            
+            full_ms, incremental_ms, full_cards = [], [], []
+            for refresh, new_count in enumerate(NEW_PER_REFRESH):
+                for n in range(new_count):
+                    server.add_store_product(f"New Listing {refresh}-{n}")
+                page.reload(wait_until="load")
+                
+                start = time.perf_counter()
+                full_cards.append(len(monitor.get_all_products()))
+                full_ms.append((time.perf_counter() - start) * 1000)
+                
+                start = time.perf_counter()
+                new = monitor.get_new_products()
+                incremental_ms.append((time.perf_counter() - start) * 1000)
+                monitor._remember(new)
+            
+            stats = monitor.scan_stats()
+            results.append((
+                count,
+                sum(full_ms) / len(full_ms), sum(full_cards) / len(full_cards),
+                sum(incremental_ms) / len(incremental_ms), stats['avg'], stats['max'],
+            ))
+            server.stop()
+        
+        browser.close()
+    
+    print(f"\n{'cards':>6} {'full ms':>9} {'examined':>9} {'incr ms':>9} {'examined':>9} {'max':>5}")
+    for count, full_ms, full_cards, incr_ms, incr_avg, incr_max in results:
+        print(
+            f"{count:>6} {full_ms:>9.1f} {full_cards:>9.0f} "
+            f"{incr_ms:>9.1f} {incr_avg:>9.1f} {incr_max:>5}"
+        )
+    
+    print(f"\n💡 {sum(NEW_PER_REFRESH)} products listed over {len(NEW_PER_REFRESH)} refreshes;")
+    print("   incremental examines the new cards plus the one seen card it stops at.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Availability Probe Benchmark
+============================
+
+Compares the two ProductMonitor probe modes on a fake product page:
+- 'locator'  : one Playwright call per selector (up to 15 per check)
+- 'evaluate' : one page.evaluate per check
+
+Runs offline - the page is injected with set_content, no Lazada needed.
+
+Usage:
+    python examples/benchmark_probe.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.monitor import ProductMonitor
+
+
+# Worst case for the locator path: nothing matches until the out-of-stock text
+FAKE_PDP = """
+<html><body>
+  <h1 class="pdp-mod-product-badge-title">Fake Product</h1>
+  <span class="pdp-price">$19.90</span>
+  <div class="pdp-product-not-available">Out of Stock</div>
+</body></html>
+"""
+
+
+def run_mode(page, mode: str, checks: int = 200) -> dict:
+    """Run `checks` availability checks and return timing stats"""
+    monitor = ProductMonitor(page, check_interval=0, probe_mode=mode)
+    
+    start = time.perf_counter()
+    for _ in range(checks):
+        monitor.is_product_available()
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'mode': mode,
+        'checks_per_sec': checks / elapsed,
+        'ms_per_check': elapsed / checks * 1000,
+        'calls_per_check': monitor.playwright_calls / checks,
+    }
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  AVAILABILITY PROBE BENCHMARK")
+    print("="*60)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.set_content(FAKE_PDP)
+        
+        results = [run_mode(page, 'locator'), run_mode(page, 'evaluate')]
+        browser.close()
+    
+    for r in results:
+        print(f"\n🔎 {r['mode']}")
+        print(f"   ⚡ {r['checks_per_sec']:.1f} checks/sec")
+        print(f"   ⏱️  {r['ms_per_check']:.2f}ms per check")
+        print(f"   📡 {r['calls_per_check']:.1f} Playwright calls per check")
+    
+    speedup = results[1]['checks_per_sec'] / results[0]['checks_per_sec']
+    print(f"\n📊 evaluate mode is {speedup:.1f}x faster per check")
+
+
+if __name__ == "__main__":
+    main()
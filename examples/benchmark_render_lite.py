@@ -0,0 +1,128 @@
+"""
+Render-Lite Benchmark
+=====================
+
+Compares a normal page with a render-lite page (bot/render_lite.py) on the
+animated stand-in product page, where buttons slide in, the cart modal pops
+in and a banner repaints forever:
+- click latency : stock flips -> Add to Cart clicked WITHOUT force=True
+                  (Playwright waits until the button is visible and stable)
+- modal latency : click -> "Continue Shopping" in the modal clicked
+- renderer CPU  : main-thread task time per second of an idle monitored tab,
+                  plus style recalcs and layouts (Chrome DevTools metrics)
+
+Usage:
+    python examples/benchmark_render_lite.py
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.render_lite import render_lite_options, apply_render_lite
+from standin_server import StandInLazada
+
+
+ROUNDS = 10
+IDLE_SECONDS = 5.0
+
+# What a default desktop window looks like
+NORMAL_OPTIONS = {'viewport': {'width': 1920, 'height': 1080}, 'device_scale_factor': 1}
+
+
+def click_latency(page, server: StandInLazada) -> tuple:
+    """Flip stock once, return (ms until Add to Cart clicked, ms until modal closed)"""
+    server.set_stock(0)
+    page.goto(server.product_url, wait_until="load")
+    time.sleep(0.2)
+    
+    start = time.perf_counter()
+    server.set_stock(10)
+    page.click("button.add-to-cart-buy-now-btn", timeout=5000)
+    clicked = time.perf_counter()
+    page.click(".modal-close", timeout=5000)
+    closed = time.perf_counter()
+    return (clicked - start) * 1000, (closed - clicked) * 1000
+
+
+def renderer_load(page) -> dict:
+    """Main-thread work of an idle tab over IDLE_SECONDS"""
+    session = page.context.new_cdp_session(page)
+    session.send("Performance.enable")
+    
+    def metrics():
+        return {m['name']: m['value'] for m in session.send("Performance.getMetrics")['metrics']}
+    
+    before = metrics()
+    time.sleep(IDLE_SECONDS)
+    after = metrics()
+    session.detach()
+    
+    delta = lambda name: after.get(name, 0) - before.get(name, 0)
+    return {
+        'cpu_pct': delta('TaskDuration') / IDLE_SECONDS * 100,
+        'recalcs_per_sec': delta('RecalcStyleCount') / IDLE_SECONDS,
+        'layouts_per_sec': delta('LayoutCount') / IDLE_SECONDS,
+    }
+
+
+def run_mode(browser, server: StandInLazada, lite: bool) -> dict:
+    """Measure one mode in a fresh context"""
+    context = browser.new_context(**(render_lite_options() if lite else NORMAL_OPTIONS))
+    if lite:
+        apply_render_lite(context)
+    page = context.new_page()
+    
+    clicks, modals = [], []
+    for _ in range(ROUNDS):
+        click_ms, modal_ms = click_latency(page, server)
+        clicks.append(click_ms)
+        modals.append(modal_ms)
+    
+    page.goto(server.product_url, wait_until="load")
+    load = renderer_load(page)
+    context.close()
+    
+    return {
+        'mode': 'render-lite' if lite else 'normal',
+        'click_ms': statistics.median(clicks),
+        'modal_ms': statistics.median(modals),
+        **load,
+    }
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  RENDER-LITE BENCHMARK")
+    print("="*60)
+    
+    server = StandInLazada(page_poll_ms=50, render_delay_ms=0, animations=True)
+    server.start()
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        results = [run_mode(browser, server, lite=False), run_mode(browser, server, lite=True)]
+        browser.close()
+    server.stop()
+    
+    print(f"\n{ROUNDS} stock flips per mode (medians), {IDLE_SECONDS:.0f}s idle tab")
+    for r in results:
+        print(f"\n🖥️  {r['mode']}")
+        print(f"   ⚡ Add to Cart clickable after: {r['click_ms']:.0f}ms")
+        print(f"   🪟 Cart modal clickable after:  {r['modal_ms']:.0f}ms")
+        print(f"   🔥 Renderer main thread busy:   {r['cpu_pct']:.1f}%")
+        print(f"   🎨 Style recalcs/s: {r['recalcs_per_sec']:.0f}, layouts/s: {r['layouts_per_sec']:.0f}")
+    
+    normal, lite = results
+    print(f"\n📊 render-lite: {normal['click_ms'] - lite['click_ms']:.0f}ms sooner to click, "
+          f"{normal['modal_ms'] - lite['modal_ms']:.0f}ms sooner past the modal, "
+          f"{normal['cpu_pct'] - lite['cpu_pct']:.1f} points less renderer CPU per tab")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Resource Blocking Benchmark
+===========================
+
+Reloads the stand-in product and store pages, loaded with heavy assets
+(stylesheet, web font, images, video, first- and third-party scripts),
+under each ResourceBlocker profile:
+- off      : everything loads (requests are only counted)
+- monitor  : stylesheets, images, fonts, media and trackers blocked
+- checkout : layout assets too; fonts, media and trackers blocked
+
+Per reload it reports the bytes and requests the server actually served,
+the blocker's own count and bytes-saved estimate, and the reload time. The
+stand-in sends Cache-Control: no-store, so this is the cold-cache cost.
+
+A second pass serves the assets as cacheable and adds a run without any
+blocker: 'off' must be served as little as no blocker at all, i.e. the
+blocker must not cost the HTTP cache (a Playwright route would turn it off).
+
+Usage:
+    python examples/benchmark_resource_blocking.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.resource_blocker import ResourceBlocker
+from bot.monitor import ProductMonitor
+from standin_server import StandInLazada
+
+
+RELOADS = 10
+PROFILES = ['off', 'monitor', 'checkout']
+
+
+def run_profile(browser, server: StandInLazada, url: str, profile: Optional[str]) -> dict:
+    """Load url, reload it RELOADS times under one profile (None = no blocker), return per-reload stats"""
+    context = browser.new_context()
+    blocker = ResourceBlocker(context, profile=profile).attach() if profile else None
+    page = context.new_page()
+    page.goto(url, wait_until="load")
+    
+    bytes_before = server.bytes_sent
+    requests_before = sum(server.requests.values())
+    start = time.perf_counter()
+    for _ in range(RELOADS):
+        page.reload(wait_until="load")
+    elapsed = time.perf_counter() - start
+    
+    # The page must still work for the bot
+    title = ProductMonitor(page).get_product_info(budget=1.0)['title'] if 'products' in url else None
+    stats = blocker.stats() if blocker else {'blocked': 0.0, 'bytes_saved': 0.0}
+    context.close()
+    
+    return {
+        'profile': profile or 'none',
+        'kb_served': (server.bytes_sent - bytes_before) / RELOADS / 1024,
+        'requests_served': (sum(server.requests.values()) - requests_before) / RELOADS,
+        'blocked': stats['blocked'],
+        'kb_saved_estimate': stats['bytes_saved'] / 1024,
+        'ms_per_reload': elapsed / RELOADS * 1000,
+        'title': title,
+    }
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  RESOURCE BLOCKING BENCHMARK")
+    print("="*60)
+    
+    server = StandInLazada(heavy_assets=True, page_poll_ms=0, store_items=40)
+    cached = StandInLazada(heavy_assets=True, cache_assets=True, page_poll_ms=0, store_items=40)
+    server.start()
+    cached.start()
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        results = {}
+        for name, url in (('product page', server.product_url), ('store page', server.store_url)):
+            results[name] = [run_profile(browser, server, url, profile) for profile in PROFILES]
+        warm = [run_profile(browser, cached, cached.product_url, profile) for profile in [None] + PROFILES]
+        browser.close()
+    server.stop()
+    cached.stop()
+    
+    for name, rows in results.items():
+        print(f"\n📄 {name}, {RELOADS} reloads per profile")
+        print(f"   {'profile':<9} {'KB served':>10} {'requests':>9} {'blocked':>8} {'KB saved (est.)':>16} {'ms/reload':>10}")
+        for r in rows:
+            print(f"   {r['profile']:<9} {r['kb_served']:>10.0f} {r['requests_served']:>9.1f} "
+                  f"{r['blocked']:>8.1f} {r['kb_saved_estimate']:>16.0f} {r['ms_per_reload']:>10.1f}")
+        base = rows[0]
+        for r in rows[1:]:
+            print(f"   {r['profile']}: {1 - r['kb_served'] / base['kb_served']:.0%} fewer bytes, "
+                  f"{base['requests_served'] - r['requests_served']:.0f} fewer requests per reload")
+        for r in rows:
+            if r['title'] is not None and not r['title']:
+                print(f"   ⚠️  product title not readable with '{r['profile']}' profile")
+    
+    print(f"\n📄 product page, cacheable assets (warm cache), {RELOADS} reloads per profile")
+    print(f"   {'profile':<9} {'KB served':>10} {'requests':>9} {'ms/reload':>10}")
+    for r in warm:
+        print(f"   {r['profile']:<9} {r['kb_served']:>10.0f} {r['requests_served']:>9.1f} {r['ms_per_reload']:>10.1f}")
+    no_blocker, off = warm[0], warm[1]
+    if off['kb_served'] > no_blocker['kb_served'] + 1:
+        print(f"   ⚠️  the blocker costs the HTTP cache: {off['kb_served'] - no_blocker['kb_served']:.0f} KB more per reload")
+    else:
+        print("   HTTP cache kept: the blocker adds no bytes per reload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Seen Index Benchmark
+====================
+
+One million product ids in the persistent seen index (bot/seen_index.py)
+against the in-memory set StoreMonitor used to keep:
+- bulk insert   : SeenIndex.update() in 10k batches
+- restart       : reopening the database (saved Bloom filter, no rescan)
+- lookups       : `id in seen` for new ids (Bloom filter only) and seen ids
+                  (Bloom filter + SQLite)
+- bulk lookup   : SeenIndex.seen_many() on a 10k mixed batch
+- memory        : Python heap held by the set vs by the index
+
+No browser needed. The database goes to a temporary directory.
+
+Usage:
+    python examples/benchmark_seen_index.py
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.seen_index import SeenIndex
+
+
+IDS = 1_000_000
+BATCH = 10_000
+LOOKUPS = 100_000
+STORE_URL = "https://www.lazada.sg/shop/fake-store/"
+
+
+def timed(func) -> tuple:
+    """Run func, return (seconds, result)"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def heap_mb(func) -> tuple:
+    """Run func, return (MB of Python heap still held by its result, result)"""
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 1e6, result
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  SEEN INDEX")
+    print("="*60)
+    
+    ids = [str(100000000 + n) for n in range(IDS)]
+    new_ids = [str(900000000 + n) for n in range(LOOKUPS)]
+    
+    set_mb, seen_set = heap_mb(lambda: set(ids))
+    set_miss, _ = timed(lambda: sum(i in seen_set for i in new_ids))
+    del seen_set
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "seen.db"
+        
+        def fill():
+            index = SeenIndex(STORE_URL, path=path)
+            for start in range(0, IDS, BATCH):
+                index.update(ids[start:start + BATCH])
+            index.close()
+        
+        insert_s, _ = timed(fill)
+        db_mb = sum(f.stat().st_size for f in Path(tmp).iterdir()) / 1e6
+        
+        restart_s, (index_mb, index) = timed(lambda: heap_mb(lambda: SeenIndex(STORE_URL, path=path)))
+        miss_s, missed = timed(lambda: sum(i in index for i in new_ids))
+        false_positives = index.stats()['false_positives']
+        hit_s, hits = timed(lambda: sum(i in index for i in ids[:LOOKUPS]))
+        mixed = ids[:BATCH // 2] + new_ids[:BATCH // 2]
+        bulk_s, found = timed(lambda: index.seen_many(mixed))
+        stats = index.stats()
+        index.close()
+    
+    per_lookup = lambda seconds: seconds / LOOKUPS * 1e6
+    
+    print(f"\n{IDS:,} ids, {LOOKUPS:,} lookups of each kind")
+    print(f"  bulk insert:          {insert_s:>8.2f} s   ({insert_s / IDS * 1e6:.1f} us/id)")
+    print(f"  restart (reopen):     {restart_s * 1000:>8.1f} ms  (no baseline scan)")
+    print(f"  lookup, new id:       {per_lookup(miss_s):>8.2f} us  (set: {per_lookup(set_miss):.2f} us)")
+    print(f"  lookup, seen id:      {per_lookup(hit_s):>8.2f} us")
+    print(f"  seen_many, 10k mixed: {bulk_s * 1000:>8.1f} ms  ({len(found)} seen)")
+    print(f"  Bloom false positives: {false_positives} of {LOOKUPS:,} new ids ({false_positives / LOOKUPS:.2%})")
+    print(f"\n  memory, set():        {set_mb:>8.1f} MB  (grows with every id)")
+    print(f"  memory, SeenIndex:    {index_mb:>8.1f} MB  (Bloom filter {stats['bloom_bytes'] / 1e6:.1f} MB, flat)")
+    print(f"  on disk:              {db_mb:>8.1f} MB")
+    
+    assert missed == 0 and hits == LOOKUPS, "lookup mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Store Scan Benchmark
+====================
+
+Times one store refresh scan (StoreMonitor.get_all_products) on stand-in
+store pages with 50, 500 and 5000 product cards:
+- per-card : the old loop - locators, count(), get_attribute() and
+             inner_text() for every card (one round trip each)
+- bulk     : one in-page evaluation returning [{id, title, url}]
+- probe    : the grid fingerprint pre-check that replaces the bulk scan on
+             refreshes where nothing changed
+
+Usage:
+    python examples/benchmark_store_scan.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.store_monitor import StoreMonitor
+from standin_server import StandInLazada
+
+
+CARD_COUNTS = [50, 500, 5000]
+BULK_RUNS = 5
+
+
+def per_card_scan(monitor: StoreMonitor) -> list:
+    """The pre-bulk get_all_products: several IPC round trips per card"""
+    products = []
+    for selector in monitor.product_item_selectors:
+        items = monitor.page.locator(selector).all()
+        if not items:
+            continue
+        for item in items:
+            link = item.locator(monitor.product_link_selector).first
+            if link.count() == 0:
+                continue
+            url = link.get_attribute('href')
+            title = None
+            for title_sel in monitor.product_title_selectors:
+                title_elem = item.locator(title_sel).first
+                if title_elem.count() > 0:
+                    title = title_elem.inner_text().strip()
+                    if title:
+                        break
+            if url and title:
+                products.append({'id': monitor._extract_product_id(url), 'title': title, 'url': url})
+        if products:
+            break
+    return products
+
+
+def timed(scan) -> tuple:
+    """Run one scan, return (seconds, products found)"""
+    start = time.perf_counter()
+    products = scan()
+    return time.perf_counter() - start, len(products)
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  STORE SCAN: PER-CARD vs BULK vs PROBE")
+    print("="*60)
+    
+    results = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        
+        for count in CARD_COUNTS:
+            server = StandInLazada(store_items=count)
+            server.start()
+            page.goto(server.store_url, wait_until="load")
+            monitor = StoreMonitor(page, server.store_url, ["pokemon"])
+            
+            per_card_s, per_card_n = timed(lambda: per_card_scan(monitor))
+            bulk = [timed(monitor.get_all_products) for _ in range(BULK_RUNS)]
+            bulk_s = sorted(t for t, _ in bulk)[len(bulk) // 2]
+            probes = [timed(lambda: [monitor.grid_fingerprint()])[0] for _ in range(BULK_RUNS)]
+            probe_s = sorted(probes)[len(probes) // 2]
+            results.append((count, per_card_s, per_card_n, bulk_s, bulk[0][1], probe_s))
+            server.stop()
+        
+        browser.close()
+    
+    print(f"\n{'cards':>6} {'per-card ms':>12} {'found':>6} {'bulk ms':>9} {'found':>6} {'speedup':>8} {'probe ms':>9}")
+    for count, per_card_s, per_card_n, bulk_s, bulk_n, probe_s in results:
+        print(
+            f"{count:>6} {per_card_s*1000:>12.1f} {per_card_n:>6} "
+            f"{bulk_s*1000:>9.1f} {bulk_n:>6} {per_card_s/bulk_s:>7.0f}x {probe_s*1000:>9.1f}"
+        )
+    
+    print(f"\n💡 bulk and probe ms are the median of {BULK_RUNS} runs; per-card is a single scan.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Offline Clock Service Test
+==========================
+
+Checks bot/clock.py against the stand-in NTP responder, whose offset is
+known, and compares it with the old get_accurate_time() (one ntplib query
+per call, server transmit time taken as "now"):
+1. Accuracy with jittery and lossy round trips
+2. Cost per time read
+3. Server outage: the last good offset is kept
+4. Offset change: the next sync follows it
+
+Usage:
+    python examples/offline_clock.py
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import ntplib
+from bot.clock import ClockService
+from standin_ntp import StandInNTP
+
+
+OFFSET = 1.5  # Seconds the stand-in NTP clock is ahead
+SCENARIOS = [
+    ("quiet network", dict(base_delay_ms=2, jitter_ms=1)),
+    ("jittery network", dict(base_delay_ms=10, jitter_ms=40)),
+    ("jittery + 20% loss", dict(base_delay_ms=10, jitter_ms=40, loss=0.2)),
+]
+READS = 100_000
+
+
+def old_error_ms(port: int, tries: int = 8) -> float:
+    """Median error of one-query-per-read NTP time, in ms"""
+    client = ntplib.NTPClient()
+    errors = []
+    for _ in range(tries):
+        try:
+            response = client.request('127.0.0.1', port=port, timeout=1)
+        except ntplib.NTPException:
+            continue
+        errors.append(abs(time.time() + OFFSET - response.tx_time) * 1000)
+    return statistics.median(errors)
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  CLOCK SERVICE - OFFLINE TEST")
+    print("="*60)
+    
+    # 1. Accuracy
+    print(f"\n🎯 Offset error (stand-in clock {OFFSET:+.1f}s ahead)")
+    print(f"   {'network':<20} {'ClockService':>13} {'one query/read':>15}")
+    for name, options in SCENARIOS:
+        ntp = StandInNTP(offset=OFFSET, **options)
+        port = ntp.start()
+        clock = ClockService(servers=['127.0.0.1'], port=port, refresh_interval=0, timeout=0.5)
+        clock.sync()
+        error = abs(clock.system_offset() - OFFSET) * 1000
+        old = old_error_ms(port)
+        ntp.stop()
+        print(f"   {name:<20} {error:>10.2f} ms {old:>12.2f} ms")
+    
+    # 2. Cost per read
+    ntp = StandInNTP(offset=OFFSET, base_delay_ms=10)
+    port = ntp.start()
+    clock = ClockService(servers=['127.0.0.1'], port=port, refresh_interval=0)
+    clock.sync()
+    
+    start = time.perf_counter()
+    for _ in range(READS):
+        clock.now()
+    memory_us = (time.perf_counter() - start) / READS * 1e6
+    
+    client = ntplib.NTPClient()
+    start = time.perf_counter()
+    for _ in range(20):
+        client.request('127.0.0.1', port=port, timeout=1)
+    query_us = (time.perf_counter() - start) / 20 * 1e6
+    print(f"\n⚡ Time read: {memory_us:.2f} us from memory vs {query_us / 1000:.1f} ms per NTP query "
+          f"({query_us / memory_us:,.0f}x)")
+    
+    # 4. Offset change (before the outage, the responder is still up)
+    ntp.offset = OFFSET + 0.050
+    clock.sync()
+    followed = abs(clock.system_offset() - ntp.offset) * 1000
+    print(f"\n🔁 Stand-in clock moved +50ms: next sync is {followed:.2f} ms off")
+    
+    # 3. Outage
+    before = clock.offset_ns
+    ntp.stop()
+    ok = clock.sync()
+    kept = clock.offset_ns == before
+    print(f"\n📴 Responder down: sync {'succeeded?!' if ok else 'failed'}, "
+          f"offset {'kept' if kept else 'LOST'} (still {clock.system_offset() * 1000:+.1f} ms)")
+    
+    assert followed < 5 and not ok and kept, "clock service misbehaved"
+
+
+if __name__ == "__main__":
+    main()
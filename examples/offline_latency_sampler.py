@@ -0,0 +1,68 @@
+"""
+Offline Latency Sampler Test
+============================
+
+Runs bot/latency_sampler.py against a stand-in server whose response delay
+stands in for the network round trip, then changes that delay mid-run to
+check the rolling window follows it. calculate_latency() is run on a page
+object too: it only reads the page's URL, it never navigates it.
+
+Usage:
+    python examples/offline_latency_sampler.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.latency_sampler import LatencySampler
+from bot.utils import calculate_latency
+from standin_server import StandInLazada
+
+
+PHASES = [20, 60, 20]  # Response delay (ms) per phase
+PHASE_SECONDS = 2.0
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  LATENCY SAMPLER - OFFLINE TEST")
+    print("="*60 + "\n")
+    
+    server = StandInLazada(response_delay_ms=PHASES[0])
+    server.start()
+    
+    # Fast cadence and a short window so a phase change shows within a phase
+    latency = LatencySampler(server.base_url, interval=0.05, window=20).start()
+    
+    rows = []
+    try:
+        for delay_ms in PHASES:
+            server.response_delay_ms = delay_ms
+            time.sleep(PHASE_SECONDS)
+            rows.append((delay_ms, latency.rtt(50) * 1000, latency.rtt(95) * 1000,
+                         latency.one_way() * 1000, latency.budget(3) * 1000))
+        
+        page = SimpleNamespace(url=server.base_url + "/products/standin-i1-s1.html")
+        measured = calculate_latency(page) * 1000
+    finally:
+        latency.stop()
+        server.stop()
+    
+    print(f"\n{'delay':>6} {'p50':>7} {'p95':>7} {'one-way':>8} {'3 RTT':>7}  (ms)")
+    for delay_ms, p50, p95, one_way, budget in rows:
+        print(f"{delay_ms:>6} {p50:>7.1f} {p95:>7.1f} {one_way:>8.1f} {budget:>7.1f}")
+    latency.log_stats()
+    print(f"\ncalculate_latency(): {measured:.1f}ms (separate connection, page untouched)")
+    
+    for delay_ms, p50, _, _, _ in rows:
+        assert delay_ms <= p50 < delay_ms + 15, f"p50 {p50:.1f}ms does not follow a {delay_ms}ms delay"
+    print("\n✅ The window follows the round trip within one phase")
+
+
+if __name__ == "__main__":
+    main()
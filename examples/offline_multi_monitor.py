@@ -0,0 +1,71 @@
+"""
+Offline Multi-Product Monitor Test
+==================================
+
+Watches several stand-in product pages as tabs of one browser. Each stand-in
+flips to in-stock at a different time; the monitor should report the
+earliest one, with probes spread evenly across the tabs.
+
+The stand-in pages poll their stock API with setInterval, so this also
+shows whether background tabs are being throttled.
+
+Usage:
+    python examples/offline_multi_monitor.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.multi_monitor import MultiProductMonitor, BACKGROUND_THROTTLING_ARGS
+from standin_server import StandInLazada
+
+
+# Seconds until each stand-in product comes into stock
+FLIP_TIMES = [8.0, 4.0, 6.0, 10.0, 12.0]
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  MULTI-PRODUCT MONITOR - OFFLINE TEST")
+    print("="*60)
+    
+    servers = [StandInLazada(stock_after=t, page_poll_ms=200) for t in FLIP_TIMES]
+    for server in servers:
+        server.start()
+    expected = servers[FLIP_TIMES.index(min(FLIP_TIMES))]
+    print(f"\n🧪 {len(servers)} stand-in products, first flips after {min(FLIP_TIMES)}s\n")
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=BACKGROUND_THROTTLING_ARGS)
+        context = browser.new_context()
+        
+        multi = MultiProductMonitor(
+            context, [s.product_url for s in servers], check_interval=0.1
+        )
+        multi.open_all()
+        winner = multi.wait_for_first_available(max_wait=30)
+        detected_at = time.time()
+        browser.close()
+    
+    for server in servers:
+        server.stop()
+    
+    print("\n📊 RESULTS:")
+    if not winner:
+        print("  ❌ Nothing detected")
+        return
+    
+    url, _ = winner
+    print(f"  Winner: {url}")
+    print(f"  Correct product: {url == expected.product_url}")
+    if expected.flipped_at:
+        print(f"  Stock flip -> detected: {(detected_at - expected.flipped_at)*1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Offline Network Detector Test
+=============================
+
+Runs ProductMonitor in 'network' detection mode against the local stand-in
+server and compares when the stock JSON landed with when the page rendered
+the Add to Cart button.
+
+Usage:
+    python examples/offline_network_detector.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.monitor import ProductMonitor
+from standin_server import StandInLazada
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  NETWORK DETECTOR - OFFLINE TEST")
+    print("="*60)
+    
+    server = StandInLazada(stock_after=3.0, page_poll_ms=200, render_delay_ms=150)
+    server.start()
+    print(f"\n🧪 Stand-in server: {server.product_url}")
+    print("   Stock flips after 3s\n")
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        
+        monitor = ProductMonitor(page, detection_mode='network')
+        monitor.pre_load(server.product_url)
+        
+        available = monitor.wait_for_availability(max_wait=15)
+        detector = monitor.network_detector
+        
+        # When did the DOM catch up?
+        page.wait_for_selector('button.add-to-cart-buy-now-btn', timeout=5000)
+        rendered_at = time.time()
+        browser.close()
+    
+    server.stop()
+    
+    print("\n📊 RESULTS:")
+    print(f"  Detected: {available}")
+    if available and server.flipped_at:
+        print(f"  Stock flip -> JSON detected: {(detector.available_at - server.flipped_at)*1000:.0f}ms")
+        print(f"  JSON detected -> button rendered: {(rendered_at - detector.available_at)*1000:.0f}ms")
+        print(f"  Stock payloads parsed: {detector.payloads_parsed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Offline Retry Engine Test
+=========================
+
+Replays add-to-cart failures seen during drops against the old retry
+decorator (fixed 0.5 s pause, exceptions only) and bot/retry.py:
+- the button renders 40 ms after the first attempt (a falsy result)
+- the button renders 40 ms late, reported as ElementNotFound
+- the page re-renders under the first click (navigation race)
+- the page is closed (fatal: must not be retried)
+
+No browser is needed: each scenario is a small function that fails the
+way the cart does.
+
+Usage:
+    python examples/offline_retry.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import Error as PlaywrightError
+from bot.retry import RetryEngine, ElementNotFound
+
+
+def old_retry(func, max_attempts: int = 3, delay: float = 0.5):
+    """The retry_on_failure loop this engine replaced"""
+    for attempt in range(max_attempts):
+        try:
+            return func()
+        except Exception:
+            if attempt == max_attempts - 1:
+                raise
+            time.sleep(delay)
+    return None
+
+
+def button_after(ms: float, raises: bool):
+    """Add to cart that works once the button has rendered"""
+    start = time.perf_counter()
+    
+    def attempt():
+        if time.perf_counter() - start < ms / 1000:
+            if raises:
+                raise ElementNotFound("Add to Cart button not found")
+            return False
+        return True
+    return attempt
+
+
+def race_once():
+    """Add to cart whose first click hits a re-render"""
+    calls = []
+    
+    def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            raise PlaywrightError("Element is not attached to the DOM")
+        return True
+    return attempt
+
+
+def closed_page():
+    """Add to cart on a closed page, counting the attempts"""
+    calls = []
+    
+    def attempt():
+        calls.append(1)
+        raise PlaywrightError(f"Target page, context or browser has been closed (call {len(calls)})")
+    return attempt
+
+
+SCENARIOS = [
+    ("button late (falsy)", lambda: button_after(40, raises=False)),
+    ("button late (raises)", lambda: button_after(40, raises=True)),
+    ("navigation race", race_once),
+    ("page closed", closed_page),
+]
+
+
+def run(strategy, make_attempt) -> tuple:
+    """Run one scenario; returns (outcome, milliseconds)"""
+    attempt = make_attempt()
+    start = time.perf_counter()
+    try:
+        result = strategy(attempt)
+        outcome = "added" if result else "gave up"
+    except Exception as e:
+        outcome = "fatal" if 'closed' in str(e) and 'call 1)' in str(e) else "raised"
+    return outcome, (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  RETRY ENGINE - OFFLINE TEST")
+    print("="*60 + "\n")
+    
+    engine = RetryEngine(max_attempts=8, deadline=3.0, name="Add to cart")
+    rows = []
+    for name, make_attempt in SCENARIOS:
+        old = run(old_retry, make_attempt)
+        new = run(engine.run, make_attempt)
+        rows.append((name, old, new))
+    
+    print(f"\n{'scenario':<22} {'old decorator':>20} {'retry engine':>20}")
+    for name, (old_outcome, old_ms), (new_outcome, new_ms) in rows:
+        print(f"{name:<22} {old_outcome:>10} {old_ms:>7.0f}ms {new_outcome:>10} {new_ms:>7.0f}ms")
+    
+    outcomes = {name: new[0] for name, _, new in rows}
+    assert outcomes["button late (falsy)"] == "added", "a falsy result must be retried"
+    assert outcomes["page closed"] == "fatal", "a closed page must not be retried"
+    assert all(new[1] < 200 for name, _, new in rows), "retries should take milliseconds"
+    print("\n✅ Late buttons and races recovered in milliseconds; closed page not retried")
+
+
+if __name__ == "__main__":
+    main()
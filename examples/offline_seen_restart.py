@@ -0,0 +1,95 @@
+"""
+Offline Seen Index Restart Test
+===============================
+
+A found product must stay found across restarts. With a persistent
+seen_index the second run skips the baseline (it resumes), so unless the
+first run marked the product it returned as seen, the same listing would
+trigger - and be bought - again at once.
+
+For each scan mode (full DOM scan, incremental newest-first scan):
+1. run 1 watches a stand-in store until a matching product is listed
+2. run 2 reopens the same seen index on the same store and must not
+   report anything within a few checks
+
+Usage:
+    python examples/offline_seen_restart.py
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.store_monitor import StoreMonitor
+from bot.seen_index import SeenIndex
+from standin_server import StandInLazada
+
+
+LIST_AFTER = 2.0  # Seconds until the matching product is listed
+NEW_TITLE = "Pokemon TCG Prismatic Evolutions Booster Bundle"
+
+
+def watch(browser, server, db_path: Path, incremental: bool, max_wait: float, list_product: bool = False):
+    """One bot run against the store; returns (found URL or None, resumed)"""
+    index = SeenIndex(server.store_url, path=db_path)
+    page = browser.new_page()
+    try:
+        monitor = StoreMonitor(
+            page, server.store_url, ["prismatic"],
+            check_interval=0.5, incremental=incremental, seen_index=index
+        )
+        monitor.load_store_page()
+        if list_product:
+            threading.Timer(LIST_AFTER, server.add_store_product, args=(NEW_TITLE,)).start()
+        return monitor.wait_for_product(max_wait=max_wait), monitor.resumed
+    finally:
+        page.close()
+        index.close()
+
+
+def run_mode(browser, incremental: bool) -> dict:
+    """Find a product, restart on the same index, watch again"""
+    server = StandInLazada(store_items=40)
+    server.start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "seen.db"
+            first, _ = watch(browser, server, db_path, incremental, max_wait=30, list_product=True)
+            second, resumed = watch(browser, server, db_path, incremental, max_wait=3)
+    finally:
+        server.stop()
+    return {'found': bool(first), 'resumed': resumed, 'retriggered': bool(second)}
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  SEEN INDEX RESTART - OFFLINE TEST")
+    print("="*60)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        results = {
+            'full scan': run_mode(browser, incremental=False),
+            'incremental': run_mode(browser, incremental=True),
+        }
+        browser.close()
+    
+    print("\n📊 RESULTS:")
+    print(f"{'mode':<12} {'found':>6} {'resumed':>8} {'re-triggered':>13}")
+    for mode, r in results.items():
+        print(f"{mode:<12} {str(r['found']):>6} {str(r['resumed']):>8} {str(r['retriggered']):>13}")
+    
+    for mode, r in results.items():
+        assert r['found'], f"{mode}: run 1 did not find the listed product"
+        assert r['resumed'], f"{mode}: run 2 did not resume from the seen index"
+        assert not r['retriggered'], f"{mode}: run 2 triggered on the product run 1 found"
+    print("\n✅ A product found once does not trigger again after a restart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Offline Server Clock Test
+=========================
+
+Calibrates bot/server_clock.py against stand-in servers whose clocks are
+deliberately skewed, and checks the estimate against the known skew:
+- Date header only (1 s resolution): second-boundary probing
+- X-Server-Time header (ms): plain round-trip bounds
+- with 0 ms and 30 ms of server-side delay (the delay sits before the
+  timestamp, the most lopsided split a round trip can have)
+
+A single Date header read (what a naive "server time" check would do) is
+shown for comparison.
+
+Usage:
+    python examples/offline_server_clock.py
+"""
+
+import sys
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import requests
+from bot.server_clock import ServerClock
+from standin_server import StandInLazada
+
+
+SCENARIOS = [
+    # (skew seconds, response delay ms, ms timestamp header)
+    (2.345, 0, False),
+    (-0.750, 30, False),
+    (2.345, 0, True),
+    (-0.750, 30, True),
+]
+
+
+def naive_error_ms(server: StandInLazada) -> float:
+    """Error of taking one Date header as the server time"""
+    response = requests.head(server.base_url + "/", timeout=5)
+    date = parsedate_to_datetime(response.headers['Date']).timestamp()
+    return (date - server.server_time()) * 1000
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  SERVER CLOCK CALIBRATION - OFFLINE TEST")
+    print("="*60 + "\n")
+    
+    rows = []
+    for skew, delay_ms, ms_header in SCENARIOS:
+        server = StandInLazada(clock_skew=skew, response_delay_ms=delay_ms, server_time_header=ms_header)
+        server.start()
+        clock = ServerClock(server.base_url)
+        start = time.perf_counter()
+        clock.calibrate()
+        seconds = time.perf_counter() - start
+        naive = naive_error_ms(server)
+        clock.close()
+        server.stop()
+        
+        s = clock.stats()
+        rows.append({
+            'skew': skew, 'delay': delay_ms, 'source': 'X-Server-Time' if ms_header else 'Date',
+            'error': s['offset_ms'] - skew * 1000, 'uncertainty': s['uncertainty_ms'],
+            'requests': s['requests'], 'seconds': seconds, 'naive': naive,
+        })
+    
+    print(f"\n{'skew':>7} {'delay':>6} {'source':<14} {'error':>8} {'±':>7} {'requests':>9} {'time':>6}  {'1 Date read':>11}")
+    for r in rows:
+        print(f"{r['skew']:>+6.3f}s {r['delay']:>4}ms {r['source']:<14} {r['error']:>6.1f}ms "
+              f"{r['uncertainty']:>5.1f}ms {r['requests']:>9} {r['seconds']:>5.1f}s  {r['naive']:>9.0f}ms")
+    
+    # The true skew must lie inside the reported interval (1 ms slack for rounding)
+    for r in rows:
+        assert abs(r['error']) <= r['uncertainty'] + 1.0, f"estimate outside its own bounds: {r}"
+    print("\n✅ Every estimate is within its reported uncertainty")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Offline Store Bootstrap Test
+============================
+
+1. Baselines a 5000-product stand-in store (125 catalog pages, 30ms per
+   response) over parallel HTTP workers and compares worker counts.
+2. Loads an infinite-scroll stand-in store page and shows how many products
+   a plain scan sees before and after StoreMonitor.scroll_to_end().
+
+Usage:
+    python examples/offline_store_bootstrap.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.store_bootstrap import StoreBootstrap
+from bot.store_monitor import StoreMonitor
+from standin_server import StandInLazada
+
+
+STORE_SIZE = 5000
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  STORE CATALOG BOOTSTRAP - OFFLINE TEST")
+    print("="*60)
+    
+    server = StandInLazada(store_items=STORE_SIZE, store_page_size=40, response_delay_ms=30)
+    server.start()
+    
+    print(f"\n📚 HTTP bootstrap of {STORE_SIZE} products:")
+    print(f"{'workers':>8} {'products':>9} {'pages':>6} {'seconds':>8}")
+    for workers in WORKER_COUNTS:
+        boot = StoreBootstrap(server.store_url, workers=workers)
+        products = boot.run()
+        boot.close()
+        print(f"{workers:>8} {len(products):>9} {boot.pages_fetched:>6} {boot.seconds:>8.2f}")
+    server.stop()
+    
+    # Infinite scroll fallback
+    server = StandInLazada(store_items=400, store_xhr=True, infinite_scroll=True, render_delay_ms=50)
+    server.start()
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        monitor = StoreMonitor(page, server.store_url, ["pokemon"])
+        monitor.load_store_page()
+        before = len(monitor.get_all_products())
+        monitor.scroll_to_end(settle=1.0)
+        after = len(monitor.get_all_products())
+        browser.close()
+    server.stop()
+    
+    print(f"\n📜 Infinite-scroll store with 400 products:")
+    print(f"  Visible after load:      {before}")
+    print(f"  Visible after scrolling: {after}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Offline Store Catalog Capture Test
+==================================
+
+Runs StoreMonitor against a client-rendered stand-in store (the grid is
+filled from catalog JSON) in both detection modes:
+- dom     : reload, settle 2s, scrape the rendered cards
+- network : reload, match products from the catalog JSON as it lands
+
+A matching product is listed a few seconds in; the test reports how long
+each mode took to notice it.
+
+Usage:
+    python examples/offline_store_capture.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+from bot.store_monitor import StoreMonitor
+from standin_server import StandInLazada
+
+
+LIST_AFTER = 3.0  # Seconds until the matching product is listed
+NEW_TITLE = "Pokemon TCG Prismatic Evolutions Booster Bundle"
+
+
+def run_mode(browser, mode: str) -> dict:
+    """Watch a fresh stand-in store in one detection mode"""
+    server = StandInLazada(store_items=120, store_xhr=True, store_page_size=40)
+    server.start()
+    listed = {}
+    
+    def list_product():
+        listed['product'] = server.add_store_product(NEW_TITLE)
+        listed['at'] = time.time()
+    
+    page = browser.new_page()
+    monitor = StoreMonitor(
+        page, server.store_url, ["prismatic"],
+        check_interval=0.5, detection_mode=mode
+    )
+    monitor.load_store_page()
+    threading.Timer(LIST_AFTER, list_product).start()
+    
+    url = monitor.wait_for_product(max_wait=30)
+    found_at = time.time()
+    page.close()
+    server.stop()
+    
+    return {
+        'found': bool(url) and listed['product']['id'] in url,
+        'latency_ms': (found_at - listed['at']) * 1000 if url and 'at' in listed else None,
+        'catalog_payloads': monitor.catalog.payloads_parsed if monitor.catalog else 0,
+    }
+
+
+def main():
+    """Main function"""
+    print("\n" + "="*60)
+    print("  STORE CATALOG CAPTURE - OFFLINE TEST")
+    print("="*60)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        results = {mode: run_mode(browser, mode) for mode in ('dom', 'network')}
+        browser.close()
+    
+    print("\n📊 RESULTS:")
+    print(f"{'mode':<10} {'found':>6} {'listed -> found ms':>19} {'catalog payloads':>17}")
+    for mode, r in results.items():
+        latency = f"{r['latency_ms']:.0f}" if r['latency_ms'] is not None else "-"
+        print(f"{mode:<10} {str(r['found']):>6} {latency:>19} {r['catalog_payloads']:>17}")
+
+
+if __name__ == "__main__":
+    main()
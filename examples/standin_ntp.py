@@ -0,0 +1,145 @@
+"""
+Stand-in NTP Responder
+======================
+
+A local UDP server that answers SNTP requests with a configurable clock
+offset, network delay and packet loss, so bot/clock.py can be checked
+offline against a known truth.
+
+Delays are simulated on both legs of the round trip: the request is held
+`outbound` seconds before its receive timestamp is taken, the answer
+`inbound` seconds after its transmit timestamp. Unequal legs are exactly
+what NTP cannot see, so they show up as offset error.
+
+Usage:
+    ntp = StandInNTP(offset=1.5, jitter_ms=20)
+    port = ntp.start()
+    clock = ClockService(servers=['127.0.0.1'], port=port).start()
+    ...
+    ntp.stop()
+"""
+
+import random
+import socket
+import threading
+import time
+from typing import Optional
+
+import ntplib
+
+
+class StandInNTP:
+    """
+    Local SNTP responder with a known offset.
+    
+    Usage:
+        ntp = StandInNTP(offset=-0.25)
+        port = ntp.start()
+        ntp.stop()
+    """
+    
+    def __init__(
+        self,
+        port: int = 0,
+        offset: float = 0.0,
+        base_delay_ms: float = 5.0,
+        jitter_ms: float = 0.0,
+        loss: float = 0.0,
+        seed: Optional[int] = 1
+    ):
+        """
+        Initialize the responder.
+        
+        Args:
+            port: UDP port (0 = any free port)
+            offset: Seconds the served clock is ahead of the system clock
+            base_delay_ms: Delay on each leg of the round trip
+            jitter_ms: Extra random delay (0..jitter_ms) per leg, independently
+            loss: Fraction of requests dropped without an answer
+            seed: Random seed (None = unseeded)
+        """
+        self.port = port
+        self.offset = offset
+        self.base_delay_ms = base_delay_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self.random = random.Random(seed)
+        
+        self.requests = 0
+        self.dropped = 0
+        
+        self._sock = None
+        self._thread = None
+        self._running = False
+    
+    def leg_delay(self) -> float:
+        """Seconds one leg of the round trip takes"""
+        return (self.base_delay_ms + self.random.uniform(0, self.jitter_ms)) / 1000
+    
+    def start(self) -> int:
+        """
+        Start answering in a background thread.
+        
+        Returns:
+            int: UDP port
+        """
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(('127.0.0.1', self.port))
+        self._sock.settimeout(0.2)
+        self.port = self._sock.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self.port
+    
+    def stop(self):
+        """Stop the responder"""
+        self._running = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+    
+    def _serve(self):
+        """Answer requests one at a time (like a busy single-threaded server)"""
+        while self._running:
+            try:
+                data, client = self._sock.recvfrom(256)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self.requests += 1
+            if self.random.random() < self.loss:
+                self.dropped += 1
+                continue
+            
+            request = ntplib.NTPPacket()
+            try:
+                request.from_data(data)
+            except ntplib.NTPException:
+                continue
+            
+            time.sleep(self.leg_delay())
+            answer = ntplib.NTPPacket(version=request.version, mode=4)
+            answer.stratum = 2
+            answer.orig_timestamp = request.tx_timestamp
+            answer.recv_timestamp = ntplib.system_to_ntp_time(time.time() + self.offset)
+            answer.ref_timestamp = answer.recv_timestamp - 16
+            answer.tx_timestamp = ntplib.system_to_ntp_time(time.time() + self.offset)
+            wire = answer.to_data()
+            time.sleep(self.leg_delay())
+            self._sock.sendto(wire, client)
+
+
+if __name__ == "__main__":
+    ntp = StandInNTP(offset=1.5, jitter_ms=10)
+    port = ntp.start()
+    print(f"Serving NTP on 127.0.0.1:{port}, 1.5s ahead of this machine. Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        ntp.stop()
@@ -0,0 +1,533 @@
+"""
+Stand-in Lazada Server
+======================
+
+A tiny local HTTP server that imitates the parts of Lazada the bot talks to,
+so features can be tried offline and benchmarked without hitting the real site.
+
+Routes:
+    /products/fake-product-i<ID>.html   Product page (embeds the stock state,
+                                        then polls the stock API)
+    /api/stock?itemId=<ID>              Stock/SKU JSON
+    /shop/fake-store/                   Store page, one product card per
+                                        store product in listing order
+                                        (?sort=newest: newest first)
+    /shop/fake-store/?ajax=true&page=N  Store catalog JSON (the page fills its
+                                        grid from this when store_xhr=True)
+    /assets/<name>                      Page assets (heavy_assets=True): styles,
+                                        web font, images, video, scripts
+                                        (browser-cacheable with cache_assets=True)
+    /alilog/beacon.gif                  Analytics beacon fired by analytics.js,
+                                        which is served from a third-party host
+                                        (localhost instead of 127.0.0.1)
+
+With animations=True the product page animates like a storefront: buttons
+slide in, Add to Cart opens a modal that pops in, and a banner and spinner
+animate forever.
+
+Responses carry an ETag and answer If-None-Match with 304, like a CDN would.
+Their Date header comes from the server's own clock, which can be skewed
+(clock_skew) and can also be sent in milliseconds (X-Server-Time).
+
+Usage:
+    server = StandInLazada(stock_after=3.0)
+    base_url = server.start()
+    ...
+    server.stop()
+"""
+
+import json
+import threading
+import zlib
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlparse, parse_qs
+
+
+ITEM_ID = "123456"
+PRODUCT_PATH = f"/products/fake-product-i{ITEM_ID}.html"
+STORE_PATH = "/shop/fake-store/"
+ASSET_PATH = "/assets/"
+
+
+def _padded(text: str, size: int) -> bytes:
+    """Text padded with a trailing comment to about size bytes"""
+    return (text + "\n/*" + "x" * max(0, size - len(text) - 5) + "*/").encode('utf-8')
+
+
+# What a real storefront drags in besides its HTML and data calls. Sizes are
+# in the range of what Lazada pages transfer per asset.
+ASSETS = {
+    'style.css': ('text/css', _padded(
+        "@font-face { font-family: 'Shop Sans'; src: url('/assets/shop-sans.woff2'); }\n"
+        "body { font-family: 'Shop Sans', sans-serif; }\n"
+        ".shop-header { background: url('/assets/banner.jpg'); }", 40000)),
+    'app.js': ('application/javascript', _padded("window.__app = {ready: true};", 30000)),
+    'analytics.js': ('application/javascript', _padded(
+        "new Image().src = new URL('/alilog/beacon.gif?t=' + Date.now(), document.currentScript.src);",
+        60000)),
+    'shop-sans.woff2': ('font/woff2', bytes(80000)),
+    'banner.jpg': ('image/jpeg', bytes(120000)),
+    'hero.jpg': ('image/jpeg', bytes(200000)),
+    'thumb.jpg': ('image/jpeg', bytes(15000)),   # Served for every /assets/thumb-<id>.jpg
+    'promo.mp4': ('video/mp4', bytes(600000)),
+    'manifest.json': ('application/manifest+json', b'{"name": "Fake Lazada"}'),
+}
+
+# Injected before </head> and </body> when heavy_assets=True
+ASSETS_HEAD_HTML = """  <link rel="stylesheet" href="/assets/style.css">
+  <link rel="manifest" href="/assets/manifest.json">
+  <script src="/assets/app.js"></script>
+  <script async src="__THIRD_PARTY__/assets/analytics.js"></script>
+"""
+ASSETS_BODY_HTML = """  <img class="hero" src="/assets/hero.jpg" alt="">
+  <video src="/assets/promo.mp4" preload="auto" muted></video>
+"""
+
+# Injected before </body> when animations=True: buttons slide in, the cart
+# modal fades in, and a banner and spinner animate forever (repainting the
+# page every frame, like a storefront carousel)
+ANIMATIONS_HTML = """  <style>
+    #buttons button { animation: slide-in 400ms ease-out; }
+    @keyframes slide-in { from { transform: translateY(60px); opacity: 0; } }
+    .cart-modal { position: fixed; top: 30%; left: 30%; padding: 24px; background: #fff;
+                  box-shadow: 0 4px 24px #0004; animation: pop-in 300ms ease-out; }
+    @keyframes pop-in { from { transform: scale(0.8); opacity: 0; } }
+    .banner { height: 120px; background: linear-gradient(90deg, #f60, #fc0, #f60);
+              background-size: 200% 100%; animation: slide 2s linear infinite; }
+    @keyframes slide { to { background-position: -200% 0; } }
+    .spinner { width: 24px; height: 24px; border: 3px solid #ccc; border-top-color: #f60;
+               border-radius: 50%; animation: spin 0.8s linear infinite; }
+    @keyframes spin { to { transform: rotate(360deg); } }
+  </style>
+  <div class="banner"></div>
+  <div class="spinner"></div>
+  <script>
+    document.addEventListener('click', (e) => {
+      if (e.target.matches('.add-to-cart-buy-now-btn')) {
+        document.body.insertAdjacentHTML('beforeend',
+          '<div class="cart-modal">Added to cart <button class="modal-close">Continue Shopping</button></div>');
+      } else if (e.target.matches('.modal-close')) {
+        e.target.closest('.cart-modal').remove();
+      }
+    });
+  </script>
+"""
+
+# The page fetches its stock JSON and re-renders the buttons RENDER_DELAY_MS
+# later, like a real PDP doing framework work between data and DOM.
+PDP_HTML = """<!doctype html>
+<html><head><title>Fake Product</title></head>
+<body>
+  <h1 class="pdp-mod-product-badge-title">Fake Pokemon TCG Booster Box</h1>
+  <span class="pdp-price">$199.00</span>
+  <script id="pdp-state" type="application/json">__STATE__</script>
+  <div id="buttons">
+    <div class="pdp-product-not-available">Out of Stock</div>
+  </div>
+  <script>
+    const RENDER_DELAY_MS = __RENDER_DELAY_MS__;
+    const render = (stock) => {
+      const box = document.getElementById('buttons');
+      if (stock > 0) {
+        box.innerHTML = '<button class="add-to-cart-buy-now-btn">Add to Cart</button>'
+                      + '<button class="buy-now-btn">Buy Now</button>';
+      }
+    };
+    const poll = async () => {
+      const res = await fetch('/api/stock?itemId=__ITEM_ID__');
+      const data = await res.json();
+      const stock = data.data.item.skus[0].stock;
+      setTimeout(() => render(stock), RENDER_DELAY_MS);
+      if (stock === 0 && __POLL_MS__ > 0) setTimeout(poll, __POLL_MS__);
+    };
+    poll();
+  </script>
+</body></html>
+"""
+
+# Card markup follows the class names in the selector registry (store_item,
+# store_title, store_product_link), padded like a real card.
+STORE_HTML = """<!doctype html>
+<html><head><title>Fake Store</title></head>
+<body>
+  <div class="shop-header"><h1 class="shop-name">Fake Store</h1></div>
+  <div class="product-list">
+__CARDS__
+  </div>
+</body></html>
+"""
+
+STORE_CARD_HTML = """    <div class="Bm3ON" data-qa-locator="product-item" data-item-id="__ID__">
+      <div class="picture-wrapper"><a href="/products/__SLUG__-i__ID__.html"><img alt="__TITLE__" src="__THUMB__"></a></div>
+      <div class="RfADt"><a href="/products/__SLUG__-i__ID__.html" title="__TITLE__">__TITLE__</a></div>
+      <div class="aBrP0"><span class="ooOxS">$__PRICE__</span></div>
+      <div class="_6uN7R"><span class="rating">4.8</span><span class="sold">120 sold</span></div>
+    </div>"""
+
+# Client-rendered store page: fetches every catalog page, then renders the
+# cards RENDER_DELAY_MS later. With INFINITE_SCROLL it fetches one page at a
+# time, the next one when the user scrolls to the bottom.
+STORE_XHR_HTML = """<!doctype html>
+<html><head><title>Fake Store</title></head>
+<body>
+  <div class="shop-header"><h1 class="shop-name">Fake Store</h1></div>
+  <div class="product-list" id="grid"></div>
+  <script>
+    const RENDER_DELAY_MS = __RENDER_DELAY_MS__;
+    const INFINITE_SCROLL = __INFINITE_SCROLL__;
+    const esc = (s) => s.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/"/g, '&quot;');
+    const card = (p) => `<div class="Bm3ON" data-item-id="${p.itemId}">`
+      + `<div class="picture-wrapper"><a href="${p.productUrl}"><img alt="${esc(p.name)}" src="__THUMB__"></a></div>`
+      + `<div class="RfADt"><a href="${p.productUrl}" title="${esc(p.name)}">${esc(p.name)}</a></div>`
+      + `<div class="aBrP0"><span class="ooOxS">$${p.price}</span></div></div>`;
+    const sort = new URLSearchParams(location.search).get('sort') || '';
+    let next = 1, loading = false;
+    const load = async () => {
+      if (loading || next === null) return;
+      loading = true;
+      const items = [];
+      do {
+        const res = await fetch(`?ajax=true&page=${next}&sort=${sort}`);
+        const data = await res.json();
+        items.push(...data.mods.listItems);
+        const more = next * data.mainInfo.pageSize < data.mainInfo.totalResults;
+        next = more ? next + 1 : null;
+      } while (next !== null && !INFINITE_SCROLL);
+      setTimeout(() => {
+        document.getElementById('grid').insertAdjacentHTML('beforeend', items.map(card).join(''));
+        loading = false;
+      }, RENDER_DELAY_MS);
+    };
+    window.addEventListener('scroll', () => {
+      if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) load();
+    });
+    load();
+  </script>
+</body></html>
+"""
+
+
+class StandInLazada:
+    """
+    Local stand-in for the Lazada endpoints used by the bot.
+    
+    Usage:
+        server = StandInLazada(stock_after=3.0)
+        base_url = server.start()
+        page.goto(server.product_url)
+    """
+    
+    def __init__(
+        self,
+        port: int = 0,
+        stock_after: Optional[float] = None,
+        page_poll_ms: int = 500,
+        render_delay_ms: int = 150,
+        store_items: int = 40,
+        store_xhr: bool = False,
+        store_page_size: int = 40,
+        infinite_scroll: bool = False,
+        response_delay_ms: int = 0,
+        heavy_assets: bool = False,
+        cache_assets: bool = False,
+        animations: bool = False,
+        clock_skew: float = 0.0,
+        server_time_header: bool = False
+    ):
+        """
+        Initialize the stand-in server.
+        
+        Args:
+            port: Port to listen on (0 = any free port)
+            stock_after: Seconds after start() when stock flips to available
+                         (None = only when set_stock() is called)
+            page_poll_ms: How often the fake PDP re-fetches stock (0 = never)
+            render_delay_ms: Delay between stock data and button render
+            store_items: Products already listed on the store page
+            store_xhr: Store page fills its grid from the catalog JSON
+                       instead of being server-rendered
+            store_page_size: Products per catalog JSON page
+            infinite_scroll: Client-rendered store page loads one catalog
+                             page at a time as it is scrolled
+            response_delay_ms: Extra delay before every response (network RTT)
+            heavy_assets: Product and store pages load a stylesheet, web font,
+                          images (a thumbnail per store card), a video, a
+                          first-party script and a third-party analytics script
+            cache_assets: Assets may be cached for an hour (default: no-store,
+                          like every other response)
+            animations: Product page animates (see ANIMATIONS_HTML)
+            clock_skew: Seconds the server clock is ahead of this machine's
+            server_time_header: Also send the server time in ms (X-Server-Time)
+        """
+        self.port = port
+        self.stock_after = stock_after
+        self.page_poll_ms = page_poll_ms
+        self.render_delay_ms = render_delay_ms
+        self.store_xhr = store_xhr
+        self.store_page_size = store_page_size
+        self.infinite_scroll = infinite_scroll
+        self.response_delay_ms = response_delay_ms
+        self.heavy_assets = heavy_assets
+        self.cache_assets = cache_assets
+        self.animations = animations
+        self.clock_skew = clock_skew
+        self.server_time_header = server_time_header
+        
+        self.stock = 0
+        self.started_at = None
+        self.flipped_at = None  # time.time() when stock became > 0
+        self.requests = {}      # path -> hit count
+        self.bytes_sent = 0     # response body bytes
+        
+        # Store listing, oldest first
+        self.store_products = []
+        for n in range(store_items):
+            self.add_store_product(f"Stand-in Accessory {n + 1}")
+        
+        self._httpd = None
+        self._thread = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    @property
+    def third_party_url(self) -> str:
+        """Same server under another host name, so the browser sees another site"""
+        return f"http://localhost:{self.port}"
+    
+    @property
+    def product_url(self) -> str:
+        return f"{self.base_url}{PRODUCT_PATH}"
+    
+    @property
+    def store_url(self) -> str:
+        return f"{self.base_url}{STORE_PATH}"
+    
+    def add_store_product(self, title: str, item_id: Optional[str] = None) -> dict:
+        """
+        List a new product on the store page.
+        
+        Args:
+            title: Product title
+            item_id: Item id (None = next free id)
+        
+        Returns:
+            dict: The listed product ('id', 'title')
+        """
+        product = {
+            'id': item_id or str(900000000 + len(self.store_products)),
+            'title': title,
+        }
+        self.store_products.append(product)
+        return product
+    
+    def listed_products(self, sort: Optional[str] = None) -> list:
+        """Store products in listing order ('newest' = newest first)"""
+        if sort == 'newest':
+            return list(reversed(self.store_products))
+        return list(self.store_products)
+    
+    def store_html(self, sort: Optional[str] = None) -> str:
+        """Render the store page in listing order"""
+        cards = []
+        for product in self.listed_products(sort):
+            slug = '-'.join(product['title'].lower().split())
+            title = escape(product['title'])
+            thumb = f"{ASSET_PATH}thumb-{product['id']}.jpg" if self.heavy_assets else "data:,"
+            cards.append(STORE_CARD_HTML
+                         .replace('__THUMB__', thumb)
+                         .replace('__ID__', product['id'])
+                         .replace('__SLUG__', slug)
+                         .replace('__TITLE__', title)
+                         .replace('__PRICE__', '19.90'))
+        return STORE_HTML.replace('__CARDS__', '\n'.join(cards))
+    
+    def with_assets(self, html: str) -> str:
+        """Add the heavy assets to a page (no-op unless heavy_assets=True)"""
+        if not self.heavy_assets:
+            return html
+        head = ASSETS_HEAD_HTML.replace('__THIRD_PARTY__', self.third_party_url)
+        return html.replace('</head>', '\n' + head + '</head>').replace('</body>', ASSETS_BODY_HTML + '</body>')
+    
+    def store_catalog(self, page: int, sort: Optional[str] = None) -> dict:
+        """One page of the store catalog JSON in listing order"""
+        listed = self.listed_products(sort)
+        start = (page - 1) * self.store_page_size
+        items = []
+        for product in listed[start:start + self.store_page_size]:
+            slug = '-'.join(product['title'].lower().split())
+            items.append({
+                'itemId': product['id'],
+                'nid': product['id'],
+                'name': product['title'],
+                'productUrl': f"/products/{slug}-i{product['id']}.html",
+                'price': '19.90',
+            })
+        return {
+            'mainInfo': {'page': page, 'pageSize': self.store_page_size, 'totalResults': len(listed)},
+            'mods': {'listItems': items},
+        }
+    
+    def server_time(self) -> float:
+        """The server's clock (Unix seconds), clock_skew ahead of this machine's"""
+        return time.time() + self.clock_skew
+    
+    def set_stock(self, stock: int):
+        """Change the stock level served by /api/stock"""
+        if stock > 0 and self.stock == 0:
+            self.flipped_at = time.time()
+        self.stock = stock
+    
+    def current_stock(self) -> int:
+        """Stock level right now (applies the scheduled flip)"""
+        if (self.stock_after is not None and self.stock == 0
+                and time.time() - self.started_at >= self.stock_after):
+            self.set_stock(10)
+        return self.stock
+    
+    def stock_state(self, item_id: str) -> dict:
+        """Stock/SKU data for an item, as served by the API and embedded in the page"""
+        return {'item': {
+            'itemId': item_id,
+            'skus': [{'skuId': f"{item_id}001", 'stock': self.current_stock()}],
+        }}
+    
+    def start(self) -> str:
+        """
+        Start serving in a background thread.
+        
+        Returns:
+            str: Base URL of the server
+        """
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like the real site
+            
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+            
+            def date_time_string(self, timestamp=None):
+                return super().date_time_string(server.server_time() if timestamp is None else timestamp)
+            
+            def do_HEAD(self):
+                server.handle(self, head=True)
+            
+            def do_GET(self):
+                server.handle(self)
+        
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+    
+    def stop(self):
+        """Stop the server"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+    
+    def handle(self, request: BaseHTTPRequestHandler, head: bool = False):
+        """Route one request"""
+        url = urlparse(request.path)
+        query = parse_qs(url.query)
+        self.requests[url.path] = self.requests.get(url.path, 0) + 1
+        if self.response_delay_ms:
+            time.sleep(self.response_delay_ms / 1000)
+        
+        if url.path == PRODUCT_PATH:
+            body = (PDP_HTML
+                    .replace('__STATE__', json.dumps(self.stock_state(ITEM_ID)))
+                    .replace('__ITEM_ID__', ITEM_ID)
+                    .replace('__POLL_MS__', str(self.page_poll_ms))
+                    .replace('__RENDER_DELAY_MS__', str(self.render_delay_ms)))
+            if self.animations:
+                body = body.replace('</body>', ANIMATIONS_HTML + '</body>')
+            self.send(request, 200, 'text/html; charset=utf-8', self.with_assets(body), head)
+        elif url.path == STORE_PATH and query.get('ajax') == ['true']:
+            page = int(query.get('page', ['1'])[0])
+            catalog = self.store_catalog(page, query.get('sort', [None])[0])
+            self.send(request, 200, 'application/json', json.dumps(catalog), head)
+        elif url.path == STORE_PATH:
+            if self.store_xhr:
+                thumb = f"{ASSET_PATH}thumb-${{p.itemId}}.jpg" if self.heavy_assets else "data:,"
+                body = (STORE_XHR_HTML
+                        .replace('__THUMB__', thumb)
+                        .replace('__RENDER_DELAY_MS__', str(self.render_delay_ms))
+                        .replace('__INFINITE_SCROLL__', 'true' if self.infinite_scroll else 'false'))
+            else:
+                body = self.store_html(query.get('sort', [None])[0])
+            self.send(request, 200, 'text/html; charset=utf-8', self.with_assets(body), head)
+        elif url.path == '/api/stock':
+            item_id = query.get('itemId', [ITEM_ID])[0]
+            payload = {'success': True, 'data': self.stock_state(item_id)}
+            self.send(request, 200, 'application/json', json.dumps(payload), head)
+        elif url.path.startswith(ASSET_PATH):
+            name = url.path[len(ASSET_PATH):]
+            if name.startswith('thumb-'):
+                name = 'thumb.jpg'
+            if name in ASSETS:
+                content_type, data = ASSETS[name]
+                cache_control = 'max-age=3600' if self.cache_assets else 'no-store'
+                self.send(request, 200, content_type, data, head, cache_control=cache_control)
+            else:
+                self.send(request, 404, 'text/plain', 'not found', head)
+        elif url.path == '/alilog/beacon.gif':
+            self.send(request, 200, 'image/gif', b'GIF89a\x01\x00\x01\x00\x00\x00\x00;', head)
+        else:
+            self.send(request, 404, 'text/plain', 'not found', head)
+    
+    def send(
+        self,
+        request: BaseHTTPRequestHandler,
+        status: int,
+        content_type: str,
+        body,
+        head: bool = False,
+        headers: Optional[dict] = None,
+        cache_control: str = 'no-store'
+    ):
+        """Write a complete response (304 if the client already has it)"""
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        etag = f'"{zlib.crc32(data):08x}"'
+        if status == 200 and request.headers.get('If-None-Match') == etag:
+            request.send_response(304)
+            request.send_header('ETag', etag)
+            request.send_header('Content-Length', '0')
+            request.end_headers()
+            return
+        
+        request.send_response(status)
+        if self.server_time_header:
+            request.send_header('X-Server-Time', str(int(self.server_time() * 1000)))
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(data)))
+        request.send_header('Cache-Control', cache_control)
+        if status == 200:
+            request.send_header('ETag', etag)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        if not head:
+            request.wfile.write(data)
+            self.bytes_sent += len(data)
+
+
+if __name__ == "__main__":
+    server = StandInLazada(stock_after=30)
+    server.start()
+    print(f"Serving fake product at {server.product_url}")
+    print("Stock flips to available after 30s. Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -11,10 +11,18 @@ Usage:
     python examples/test_timing.py
 """
 
+import sys
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from playwright.sync_api import sync_playwright
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot.clock import ClockService
+from bot.deadline_scheduler import LatencyHistogram
+from bot.precision_trigger import PrecisionTrigger
+
 
 def test_check_speed():
     """Test how many checks we can perform per second"""
@@ -163,44 +171,45 @@ def test_button_click_speed():
         browser.close()
 
 
-def test_timing_precision():
-    """Test timing precision"""
+def test_timing_precision(shots: int = 10):
+    """Test timing precision: plain sleeping vs the bot's precision trigger"""
     print("\n" + "="*60)
     print("TEST 4: Timing Precision")
     print("="*60)
-    print("\nTesting ability to hit exact timing...")
+    print(f"\nHitting {shots} targets 0.5s apart, two ways...")
     
-    # Set target 5 seconds in future
-    target_time = datetime.now() + timedelta(seconds=5)
-    print(f"\n🎯 Target time: {target_time.strftime('%H:%M:%S.%f')[:-3]}")
-    print("⏰ Waiting for target time...\n")
+    clock = ClockService()  # Not started: system clock, read from memory
     
-    # Wait until target
-    while datetime.now() < target_time:
-        remaining = (target_time - datetime.now()).total_seconds()
-        print(f"   {remaining:.3f}s remaining", end='\r')
-        
-        if remaining < 0.1:
-            time.sleep(0.001)  # Very precise at the end
-        elif remaining < 1:
-            time.sleep(0.01)
-        else:
-            time.sleep(0.1)
+    # The old wait loop: sleep until the target, at most 1 s at a time
+    plain = LatencyHistogram()
+    for _ in range(shots):
+        target_ns = clock.now_ns() + 500_000_000
+        while True:
+            remaining = (target_ns - clock.now_ns()) / 1e9
+            if remaining <= 0:
+                break
+            time.sleep(min(1, remaining))
+        plain.add((clock.now_ns() - target_ns) / 1e9)
     
-    actual_time = datetime.now()
-    difference = (actual_time - target_time).total_seconds() * 1000
+    # Coarse sleep, 1 ms sleeps, then a spin for the last 2 ms
+    trigger = PrecisionTrigger()
+    for _ in range(shots):
+        trigger.wait(clock, clock.now_ns() + 500_000_000)
     
-    print(f"\n\n✅ Actual time: {actual_time.strftime('%H:%M:%S.%f')[:-3]}")
-    print(f"📊 Difference: {difference:.0f}ms {'early' if difference < 0 else 'late'}")
+    print(f"\n  {'':<18}{'p50':>9}{'p99':>9}{'max':>9}  (late by, us)")
+    for name, summary in (("sleep loop", plain.summary()),
+                          ("precision trigger", trigger.stats()['overshoot'])):
+        print(f"  {name:<18}" + ''.join(f"{summary[k] * 1000:>9.0f}" for k in ('p50', 'p99', 'max')))
     
+    worst = trigger.stats()['overshoot']['max']
     print("\n💡 ANALYSIS:")
-    if abs(difference) < 50:
-        print("  ✅ Excellent timing precision!")
-    elif abs(difference) < 100:
-        print("  ✅ Good timing precision")
+    if worst < 0.1:
+        print("  ✅ Excellent timing precision (trigger within 0.1ms)")
+    elif worst < 1:
+        print("  ✅ Good timing precision (trigger within 1ms)")
     else:
-        print("  ⚠️  Timing could be better")
-    print("  The sniper bot uses similar logic for precision timing")
+        print("  ⚠️  Timing could be better (busy machine?)")
+    print("  The sniper bot fires its first request this way, one-way latency early")
 
 
 def main():
@@ -252,7 +261,7 @@ def main():
         print("  - Use force clicks (bot does this automatically)")
         print("  - Be logged in and payment info saved beforehand")
         print("\n" + "="*60)
-        
+    
     except KeyboardInterrupt:
         print("\n\n⚠️  Tests interrupted by user")
     except Exception as e:
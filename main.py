@@ -16,14 +16,22 @@ Usage:
 """
 
 import sys
+from typing import List, Optional
 from datetime import datetime, timedelta
 from playwright.sync_api import sync_playwright
 
-from config.settings import BROWSER_CONFIG, BOT_CONFIG, LAZADA_BASE_URL
-from bot import ProductMonitor, CartManager, CheckoutManager
+from config.settings import BROWSER_CONFIG, BOT_CONFIG, TIMING_CONFIG, LAZADA_BASE_URL
+from bot import ProductMonitor, CartManager, CheckoutManager, MultiProductMonitor
+from bot.cart import MODAL_WAIT
+from bot.render_lite import render_lite_options, apply_render_lite, LITE_MODAL_WAIT
+from bot.resource_blocker import ResourceBlocker
+from bot.clock import get_clock
+from bot.server_clock import calibrate_server_clock
+from bot.precision_trigger import PrecisionTrigger
+from bot.latency_sampler import LatencySampler
 from bot.utils import (
     log_success, log_error, log_info, log_warning,
-    wait_until, get_accurate_time, validate_url, Timer
+    wait_until, validate_url, Timer
 )
 
 
@@ -37,7 +45,8 @@ class LazadaSniper:
         product_url: str,
         listing_time: datetime,
         auto_purchase: bool = False,
-        headless: bool = False
+        headless: bool = False,
+        watch_urls: Optional[List[str]] = None
     ):
         """
         Initialize the sniper bot.
@@ -47,23 +56,60 @@ class LazadaSniper:
             listing_time: When the product becomes available
             auto_purchase: If True, automatically complete purchase (DANGEROUS!)
             headless: If True, run browser in background
+            watch_urls: Extra product URLs to watch in other tabs of the same
+                        browser - whichever product is available first is bought
         """
-        if not validate_url(product_url):
-            raise ValueError(f"Invalid Lazada URL: {product_url}")
+        for url in [product_url] + (watch_urls or []):
+            if not validate_url(url):
+                raise ValueError(f"Invalid Lazada URL: {url}")
         
         self.product_url = product_url
+        self.watch_urls = watch_urls or []
         self.listing_time = listing_time
         self.auto_purchase = auto_purchase
         self.headless = headless
+        self.render_lite = BROWSER_CONFIG.get('render_lite', False)
+        self.modal_wait = LITE_MODAL_WAIT if self.render_lite else MODAL_WAIT
         
+        self.clock = None  # What listing_time is measured on (see _schedule_clock)
+        self.trigger = PrecisionTrigger()
+        self.latency = None  # Background RTT sampler (see _start_latency_sampler)
         self.browser = None
         self.page = None
         self.monitor = None
+        self.multi_monitor = None
         self.cart = None
         self.checkout = None
+        self.blocker = None
         
         self.overall_timer = Timer()
     
+    def _schedule_clock(self):
+        """Clock the listing time is read on: Lazada's own (server Date headers) or NTP"""
+        if TIMING_CONFIG.get('server_clock'):
+            return calibrate_server_clock(self.product_url, max_requests=TIMING_CONFIG.get('clock_probes', 10))
+        return get_clock()
+    
+    def _start_latency_sampler(self):
+        """RTT sampler on its own connection, so the watched page is never disturbed"""
+        interval = TIMING_CONFIG.get('latency_probe_interval', 0)
+        if not interval:
+            return None
+        return LatencySampler(self.product_url, interval=interval).start()
+    
+    def _stop_latency_sampler(self):
+        """Log the RTT window and stop sampling"""
+        if self.latency:
+            self.latency.log_stats()
+            self.latency.stop()
+    
+    def _trigger_lead(self) -> float:
+        """One-way latency to Lazada (seconds): from the sampler, else half the clock calibration RTT"""
+        if self.latency and self.latency.rtt() is not None:
+            return self.latency.one_way()
+        rtt_ms = self.clock.stats().get('median_rtt_ms')
+        return rtt_ms / 2000 if rtt_ms else 0.0
+    
     def setup(self):
         """Setup browser and components"""
         log_info("🚀 Initializing Lazada Sniper Bot...")
@@ -71,7 +117,9 @@ class LazadaSniper:
         log_info(f"⏰ Listing time: {self.listing_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Check if listing time is in the future
-        current_time = get_accurate_time()
+        self.clock = self._schedule_clock()
+        self.latency = self._start_latency_sampler()
+        current_time = self.clock.now()
         if self.listing_time <= current_time:
             log_warning("⚠️  Listing time is in the past! Starting immediately...")
         else:
@@ -83,17 +131,39 @@ class LazadaSniper:
         playwright = sync_playwright().start()
         self.browser = playwright.chromium.launch(
             headless=self.headless,
-            slow_mo=BROWSER_CONFIG.get('slow_mo', 0)
+            slow_mo=BROWSER_CONFIG.get('slow_mo', 0),
+            args=BROWSER_CONFIG.get('args', [])
         )
         
         # Create page
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(BROWSER_CONFIG['timeout'])
+        context = self.browser.new_context(**(render_lite_options() if self.render_lite else {}))
+        context.set_default_timeout(BROWSER_CONFIG['timeout'])
+        if self.render_lite:
+            apply_render_lite(context, fonts=BROWSER_CONFIG.get('web_fonts', True))
+        if BOT_CONFIG.get('block_resources'):
+            self.blocker = ResourceBlocker(context, profile='monitor').attach()
+        self.page = context.new_page()
+        
+        # Several products: one tab each, same browser
+        if self.watch_urls:
+            self.multi_monitor = MultiProductMonitor(
+                context,
+                [self.product_url] + self.watch_urls,
+                check_interval=0.05,
+                reload_interval=TIMING_CONFIG['reload_interval']
+            )
         
         # Initialize components
-        self.monitor = ProductMonitor(self.page, check_interval=0.05)
-        self.cart = CartManager(self.page)
-        self.checkout = CheckoutManager(self.page, auto_purchase=self.auto_purchase)
+        self.monitor = ProductMonitor(
+            self.page,
+            check_interval=0.05,
+            detection_mode='push',
+            reload_interval=TIMING_CONFIG['reload_interval']
+        )
+        if self.monitor.reloader:
+            self.monitor.reloader.latency = self.latency
+        self.cart = CartManager(self.page, modal_wait=self.modal_wait)
+        self.checkout = CheckoutManager(self.page, auto_purchase=self.auto_purchase, latency=self.latency)
         
         log_success("✅ Setup complete!")
     
@@ -101,11 +171,14 @@ class LazadaSniper:
         """Pre-load the product page"""
         log_info("📄 Pre-loading product page...")
         
+        if self.multi_monitor:
+            self.page.close()
+            self.multi_monitor.open_all()
+            return
+        
         try:
-            self.monitor.pre_load(self.product_url)
-            
-            # Get product info
-            info = self.monitor.get_product_info()
+            # Product info is read once, while pre-loading
+            info = self.monitor.pre_load(self.product_url)
             
             print("\n" + "="*60)
             print("📦 PRODUCT INFORMATION")
@@ -116,26 +189,46 @@ class LazadaSniper:
                 print(f"Price: {info['price']}")
             print(f"Currently Available: {info['available']}")
             print("="*60 + "\n")
-            
+        
         except Exception as e:
             log_error(f"Failed to pre-load: {e}")
             raise
     
     def wait_for_listing_time(self):
         """Wait until listing time"""
-        current_time = get_accurate_time()
+        current_time = self.clock.now()
         
         if self.listing_time > current_time:
             log_info("⏰ Waiting for listing time...")
-            wait_until(self.listing_time, pre_load_seconds=5)
+            # Fire one one-way trip early, so the reload reaches Lazada at the listing time
+            wait_until(self.listing_time, pre_load_seconds=0, clock=self.clock,
+                       trigger=self.trigger, lead=self._trigger_lead())
+            self._fire_first_reload()
+            self.trigger.log_stats()
         else:
             log_info("🎯 Starting immediately (listing time already passed)")
     
+    def _fire_first_reload(self):
+        """
+        Reload the watched page(s) right away; the pre-loaded copies predate the listing.
+        Goes through the reload scheduler, so its cadence restarts from this reload
+        instead of firing a second one that would cancel it.
+        """
+        monitors = self.multi_monitor.monitors.values() if self.multi_monitor else [self.monitor]
+        for monitor in monitors:
+            if monitor.reloader:
+                monitor.reloader.reload()
+            else:
+                monitor.refresh_page(wait_until="commit")
+    
     def monitor_and_snipe(self) -> bool:
         """Monitor for availability and snipe immediately"""
         log_info("👀 Starting product monitoring...")
         log_info("⚡ Will attempt to add to cart the instant it's available!")
         
+        if self.multi_monitor:
+            return self._snipe_first_available()
+        
         # Check if already available
         if self.monitor.is_product_available():
             log_success("Product already available!")
@@ -147,12 +240,34 @@ class LazadaSniper:
         
         return is_available
     
+    def _snipe_first_available(self) -> bool:
+        """Watch every product tab and switch to whichever flips first"""
+        winner = self.multi_monitor.wait_for_first_available(max_wait=300)
+        if not winner:
+            return False
+        
+        self.product_url, self.page = winner
+        self.page.bring_to_front()
+        self.multi_monitor.close_others(self.product_url)
+        
+        # Cart and checkout work on the winning tab
+        self.monitor = self.multi_monitor.monitors[self.product_url]
+        self.cart = CartManager(self.page, modal_wait=self.modal_wait)
+        self.checkout = CheckoutManager(self.page, auto_purchase=self.auto_purchase, latency=self.latency)
+        log_success(f"🎯 Sniping: {self.product_url}")
+        return True
+    
     def add_to_cart(self) -> bool:
         """Add product to cart"""
         log_info("🛒 Adding to cart...")
         
+        # Cart and checkout pages need their layout (stylesheets, images)
+        if self.blocker:
+            self.blocker.log_stats()
+            self.blocker.use('checkout')
+        
         # Try to add to cart with retry
-        success = self.cart.add_to_cart_with_retry(use_buy_now=False)
+        success = self.cart.add_to_cart_with_retry(use_buy_now=False, max_attempts=BOT_CONFIG.get('max_retries', 3))
         
         if not success:
             log_error("Failed to add to cart!")
@@ -249,18 +364,19 @@ class LazadaSniper:
                     log_info("Closing browser...")
             
             return True
-            
+        
         except KeyboardInterrupt:
             log_warning("\n⚠️  Interrupted by user")
             return False
-            
+        
         except Exception as e:
             log_error(f"❌ Critical error: {e}")
             import traceback
             traceback.print_exc()
             return False
-            
+        
         finally:
+            self._stop_latency_sampler()
             if self.browser:
                 self.browser.close()
                 log_info("Browser closed")
@@ -300,6 +416,9 @@ def main():
     # Or list 5 minutes from now for testing:
     # LISTING_TIME = datetime.now() + timedelta(minutes=5)
     
+    # Optional: more products to watch in other tabs (first available wins)
+    WATCH_URLS = []
+    
     # Auto-purchase setting (DANGEROUS - will complete purchase!)
     AUTO_PURCHASE = False  # Set to True to automatically complete purchase
     
@@ -330,7 +449,8 @@ def main():
         product_url=PRODUCT_URL,
         listing_time=LISTING_TIME,
         auto_purchase=AUTO_PURCHASE,
-        headless=HEADLESS
+        headless=HEADLESS,
+        watch_urls=WATCH_URLS
     )
     
     try:
@@ -0,0 +1,303 @@
+"""
+Lazada Listing Sniper Bot - asyncio Entry Point
+===============================================
+
+Same flow as main.py, built on playwright.async_api. The NTP time sync runs
+while the browser launches, and monitoring/reloads share one event loop.
+Uses uvloop when it is installed (pip install uvloop).
+
+⚠️  IMPORTANT:
+- For EDUCATIONAL purposes only
+- May violate Lazada's Terms of Service
+- Use at your own risk
+- Set AUTO_PURCHASE=False for safety (manual completion)
+
+Usage:
+    python main_async.py
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from playwright.async_api import async_playwright
+
+from config.settings import BROWSER_CONFIG, BOT_CONFIG, TIMING_CONFIG
+from bot.aio import (
+    AsyncProductMonitor, AsyncCartManager, AsyncCheckoutManager, AsyncResourceBlocker, run
+)
+from bot.utils import (
+    log_success, log_error, log_info, log_warning,
+    wait_until_async
+)
+from bot.render_lite import render_lite_options, apply_render_lite_async
+from main import LazadaSniper
+
+
+class AsyncLazadaSniper(LazadaSniper):
+    """
+    Async sniper bot. Same configuration as LazadaSniper.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.playwright = None
+    
+    async def _launch_browser(self):
+        """Start Playwright and open the product tab"""
+        log_info("🌐 Launching browser...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=BROWSER_CONFIG.get('slow_mo', 0),
+            args=BROWSER_CONFIG.get('args', [])
+        )
+        self.page = await self.browser.new_page(**(render_lite_options() if self.render_lite else {}))
+        self.page.set_default_timeout(BROWSER_CONFIG['timeout'])
+        if self.render_lite:
+            await apply_render_lite_async(self.page, fonts=BROWSER_CONFIG.get('web_fonts', True))
+        if BOT_CONFIG.get('block_resources'):
+            self.blocker = await AsyncResourceBlocker(self.page, profile='monitor').attach()
+    
+    async def setup(self):
+        """Setup browser and components (clock calibration overlaps the launch)"""
+        log_info("🚀 Initializing Lazada Sniper Bot (async)...")
+        log_info(f"📍 Target: {self.product_url}")
+        log_info(f"⏰ Listing time: {self.listing_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        if self.watch_urls:
+            log_warning("watch_urls needs main.py (multi-tab monitor) - watching product_url only")
+        
+        loop = asyncio.get_running_loop()
+        self.clock, self.latency, _ = await asyncio.gather(
+            loop.run_in_executor(None, self._schedule_clock),
+            loop.run_in_executor(None, self._start_latency_sampler),
+            self._launch_browser()
+        )
+        current_time = self.clock.now()
+        
+        if self.listing_time <= current_time:
+            log_warning("⚠️  Listing time is in the past! Starting immediately...")
+        else:
+            time_until = (self.listing_time - current_time).total_seconds()
+            log_info(f"⏳ Time until listing: {time_until/60:.1f} minutes")
+        
+        self.monitor = AsyncProductMonitor(
+            self.page,
+            check_interval=0.05,
+            detection_mode='push',
+            reload_interval=TIMING_CONFIG['reload_interval']
+        )
+        if self.monitor.reloader:
+            self.monitor.reloader.latency = self.latency
+        self.cart = AsyncCartManager(self.page, modal_wait=self.modal_wait)
+        self.checkout = AsyncCheckoutManager(self.page, auto_purchase=self.auto_purchase, latency=self.latency)
+        
+        log_success("✅ Setup complete!")
+    
+    async def pre_load(self):
+        """Pre-load the product page"""
+        log_info("📄 Pre-loading product page...")
+        
+        try:
+            info = await self.monitor.pre_load(self.product_url)
+            
+            print("\n" + "="*60)
+            print("📦 PRODUCT INFORMATION")
+            print("="*60)
+            if info['title']:
+                print(f"Title: {info['title']}")
+            if info['price']:
+                print(f"Price: {info['price']}")
+            print(f"Currently Available: {info['available']}")
+            print("="*60 + "\n")
+        
+        except Exception as e:
+            log_error(f"Failed to pre-load: {e}")
+            raise
+    
+    async def wait_for_listing_time(self):
+        """Wait until listing time"""
+        if self.listing_time > self.clock.now():
+            log_info("⏰ Waiting for listing time...")
+            await wait_until_async(self.listing_time, pre_load_seconds=0, clock=self.clock,
+                                   trigger=self.trigger, lead=self._trigger_lead())
+            await self._fire_first_reload()
+            self.trigger.log_stats()
+        else:
+            log_info("🎯 Starting immediately (listing time already passed)")
+    
+    async def _fire_first_reload(self):
+        """Reload the watched page right away (through the scheduler, which restarts its cadence)"""
+        if self.monitor.reloader:
+            await self.monitor.reloader.reload()
+        else:
+            await self.monitor.refresh_page(wait_until="commit")
+    
+    async def monitor_and_snipe(self) -> bool:
+        """Monitor for availability and snipe immediately"""
+        log_info("👀 Starting product monitoring...")
+        log_info("⚡ Will attempt to add to cart the instant it's available!")
+        
+        if await self.monitor.is_product_available():
+            log_success("Product already available!")
+            return True
+        
+        return await self.monitor.wait_for_availability(max_wait=300)
+    
+    async def add_to_cart(self) -> bool:
+        """Add product to cart"""
+        log_info("🛒 Adding to cart...")
+        
+        if self.blocker:
+            self.blocker.log_stats()
+            self.blocker.use('checkout')
+        
+        if not await self.cart.add_to_cart_with_retry(use_buy_now=False, max_attempts=BOT_CONFIG.get('max_retries', 3)):
+            log_error("Failed to add to cart!")
+            return False
+        
+        log_info("✓ Verifying item in cart...")
+        if not await self.cart.verify_in_cart():
+            log_warning("Could not verify item in cart, but continuing...")
+        
+        return True
+    
+    async def process_checkout(self) -> bool:
+        """Process checkout"""
+        log_info("💳 Processing checkout...")
+        
+        if not await self.cart.go_to_cart():
+            log_error("Failed to navigate to cart!")
+            return False
+        
+        if not await self.checkout.proceed_to_checkout():
+            log_error("Failed to proceed to checkout!")
+            return False
+        
+        await self.checkout.verify_shipping_address()
+        summary = await self.checkout.get_order_summary()
+        
+        if summary['total']:
+            print("\n" + "="*60)
+            print("💰 ORDER SUMMARY")
+            print("="*60)
+            print(f"Total: {summary['total']}")
+            print("="*60 + "\n")
+        
+        if self.auto_purchase:
+            log_warning("⚠️  Auto-purchase is ENABLED!")
+            return await self.checkout.complete_purchase()
+        else:
+            log_info("✅ Ready to checkout!")
+            log_info("💡 AUTO_PURCHASE is disabled - complete purchase manually")
+            log_info("🖱️  Click 'Place Order' button in the browser when ready")
+            return True
+    
+    async def run(self):
+        """Main execution flow"""
+        try:
+            self.overall_timer.start()
+            
+            await self.setup()
+            await self.pre_load()
+            await self.wait_for_listing_time()
+            
+            if not await self.monitor_and_snipe():
+                log_error("❌ Failed to detect product availability!")
+                return False
+            
+            if not await self.add_to_cart():
+                log_error("❌ Failed to add to cart!")
+                return False
+            
+            if not await self.process_checkout():
+                log_error("❌ Failed to process checkout!")
+                return False
+            
+            elapsed = self.overall_timer.elapsed()
+            print("\n" + "="*60)
+            print("🎉 SNIPER BOT COMPLETED SUCCESSFULLY!")
+            print("="*60)
+            print(f"⏱️  Total time: {elapsed:.2f} seconds")
+            print("="*60 + "\n")
+            
+            if not self.auto_purchase:
+                log_info("Browser will stay open - complete purchase manually")
+                log_info("Press Ctrl+C when done")
+                await asyncio.Event().wait()  # Keep browser open
+            
+            return True
+        
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            log_warning("\n⚠️  Interrupted by user")
+            return False
+        
+        except Exception as e:
+            log_error(f"❌ Critical error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        
+        finally:
+            self._stop_latency_sampler()
+            if self.browser:
+                await self.browser.close()
+                log_info("Browser closed")
+            if self.playwright:
+                await self.playwright.stop()
+
+
+def main():
+    """Main entry point"""
+    print("\n" + "="*60)
+    print("  LAZADA LISTING SNIPER BOT (async)")
+    print("="*60)
+    print("\n⚠️  DISCLAIMER:")
+    print("This bot is for EDUCATIONAL purposes only!")
+    print("Using automation may violate Lazada's Terms of Service.")
+    print("Use at your own risk!\n")
+    print("="*60 + "\n")
+    
+    # ============================================
+    # CONFIGURATION - EDIT THESE VALUES
+    # ============================================
+    
+    PRODUCT_URL = "https://www.lazada.sg/products/your-product-url-here"
+    LISTING_TIME = datetime(2024, 12, 25, 12, 0, 0)
+    # LISTING_TIME = datetime.now() + timedelta(minutes=5)
+    AUTO_PURCHASE = False  # Set to True to automatically complete purchase
+    HEADLESS = False       # Set to True to hide browser
+    USE_UVLOOP = True      # Ignored if uvloop is not installed
+    
+    # ============================================
+    # END CONFIGURATION
+    # ============================================
+    
+    if "your-product-url-here" in PRODUCT_URL:
+        log_error("❌ Please set PRODUCT_URL in main_async.py!")
+        sys.exit(1)
+    
+    if AUTO_PURCHASE:
+        log_warning("⚠️  AUTO_PURCHASE IS ENABLED!")
+        log_warning("⚠️  This will automatically complete the purchase!")
+        response = input("Are you sure? Type 'YES' to continue: ")
+        if response != "YES":
+            log_info("Cancelled by user")
+            sys.exit(0)
+    
+    sniper = AsyncLazadaSniper(
+        product_url=PRODUCT_URL,
+        listing_time=LISTING_TIME,
+        auto_purchase=AUTO_PURCHASE,
+        headless=HEADLESS
+    )
+    
+    try:
+        success = run(sniper.run(), use_uvloop=USE_UVLOOP)
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        log_warning("\n👋 Goodbye!")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
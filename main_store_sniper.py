@@ -15,11 +15,19 @@ import sys
 from datetime import datetime, timedelta
 from playwright.sync_api import sync_playwright
 
-from config.settings import BROWSER_CONFIG
+from config.settings import BROWSER_CONFIG, BOT_CONFIG, TIMING_CONFIG
 from bot import ProductMonitor, CartManager, CheckoutManager, StoreMonitor
+from bot.cart import MODAL_WAIT
+from bot.render_lite import render_lite_options, apply_render_lite, LITE_MODAL_WAIT
+from bot.resource_blocker import ResourceBlocker
+from bot.clock import get_clock
+from bot.server_clock import calibrate_server_clock
+from bot.precision_trigger import PrecisionTrigger
+from bot.latency_sampler import LatencySampler
+from bot.seen_index import SeenIndex
 from bot.utils import (
     log_success, log_error, log_info, log_warning,
-    wait_until, get_accurate_time, Timer
+    wait_until, Timer
 )
 
 
@@ -54,16 +62,49 @@ class LazadaStoreSniper:
         self.auto_purchase = auto_purchase
         self.headless = headless
         self.check_interval = check_interval
+        self.render_lite = BROWSER_CONFIG.get('render_lite', False)
+        self.modal_wait = LITE_MODAL_WAIT if self.render_lite else MODAL_WAIT
         
+        self.clock = None  # What listing_time is measured on (see _schedule_clock)
+        self.trigger = PrecisionTrigger()
+        self.latency = None  # Background RTT sampler (see _start_latency_sampler)
         self.browser = None
         self.page = None
         self.store_monitor = None
+        self.seen_index = None
         self.product_monitor = None
         self.cart = None
         self.checkout = None
+        self.blocker = None
         
         self.overall_timer = Timer()
     
+    def _schedule_clock(self):
+        """Clock the start time is read on: Lazada's own (server Date headers) or NTP"""
+        if TIMING_CONFIG.get('server_clock'):
+            return calibrate_server_clock(self.store_url, max_requests=TIMING_CONFIG.get('clock_probes', 10))
+        return get_clock()
+    
+    def _start_latency_sampler(self):
+        """RTT sampler on its own connection, so the store page is never disturbed"""
+        interval = TIMING_CONFIG.get('latency_probe_interval', 0)
+        if not interval:
+            return None
+        return LatencySampler(self.store_url, interval=interval).start()
+    
+    def _stop_latency_sampler(self):
+        """Log the RTT window and stop sampling"""
+        if self.latency:
+            self.latency.log_stats()
+            self.latency.stop()
+    
+    def _trigger_lead(self) -> float:
+        """One-way latency to Lazada (seconds): from the sampler, else half the clock calibration RTT"""
+        if self.latency and self.latency.rtt() is not None:
+            return self.latency.one_way()
+        rtt_ms = self.clock.stats().get('median_rtt_ms')
+        return rtt_ms / 2000 if rtt_ms else 0.0
+    
     def setup(self):
         """Setup browser and components"""
         print("\n" + "="*60)
@@ -76,7 +117,9 @@ class LazadaStoreSniper:
         print("="*60)
         
         # Check timing
-        current_time = get_accurate_time()
+        self.clock = self._schedule_clock()
+        self.latency = self._start_latency_sampler()
+        current_time = self.clock.now()
         if self.listing_time <= current_time:
             log_warning("⚠️  Start time is in the past - starting immediately!")
         else:
@@ -88,29 +131,41 @@ class LazadaStoreSniper:
         playwright = sync_playwright().start()
         self.browser = playwright.chromium.launch(
             headless=self.headless,
-            slow_mo=BROWSER_CONFIG.get('slow_mo', 0)
+            slow_mo=BROWSER_CONFIG.get('slow_mo', 0),
+            args=BROWSER_CONFIG.get('args', [])
         )
         
-        self.page = self.browser.new_page()
+        self.page = self.browser.new_page(**(render_lite_options() if self.render_lite else {}))
         self.page.set_default_timeout(BROWSER_CONFIG['timeout'])
+        if self.render_lite:
+            apply_render_lite(self.page, fonts=BROWSER_CONFIG.get('web_fonts', True))
+        if BOT_CONFIG.get('block_resources'):
+            self.blocker = ResourceBlocker(self.page, profile='monitor').attach()
         
-        # Initialize store monitor
+        # Initialize store monitor (seen products persist across restarts)
+        self.seen_index = SeenIndex(self.store_url)
         self.store_monitor = StoreMonitor(
             self.page, 
             self.store_url, 
             self.product_keywords,
-            check_interval=self.check_interval
+            check_interval=self.check_interval,
+            detection_mode='network',  # Catalog JSON first, DOM scan as fallback
+            seen_index=self.seen_index
         )
         
         log_success("✅ Setup complete!\n")
     
     def wait_for_listing_time(self):
         """Wait until listing time"""
-        current_time = get_accurate_time()
+        current_time = self.clock.now()
         
         if self.listing_time > current_time:
             log_info("⏰ Waiting for start time...")
-            wait_until(self.listing_time, pre_load_seconds=5)
+            # Fire one one-way trip early: the store page load that follows
+            # reaches Lazada at the start time
+            wait_until(self.listing_time, pre_load_seconds=0, clock=self.clock,
+                       trigger=self.trigger, lead=self._trigger_lead())
+            self.trigger.log_stats()
         else:
             log_info("🎯 Starting immediately (start time already passed)")
     
@@ -140,7 +195,7 @@ class LazadaStoreSniper:
         
         Args:
             product_url: URL of product to snipe
-            
+        
         Returns:
             bool: Success
         """
@@ -149,17 +204,22 @@ class LazadaStoreSniper:
         log_info(f"📍 URL: {product_url}")
         print("="*60 + "\n")
         
+        # Product, cart and checkout pages need their layout (stylesheets, images)
+        if self.blocker:
+            self.blocker.log_stats()
+            self.blocker.use('checkout')
+        
         # Navigate to product page
         log_info("📄 Loading product page...")
         self.page.goto(product_url, wait_until="domcontentloaded")
         
         # Initialize product monitor and cart
         self.product_monitor = ProductMonitor(self.page, check_interval=0.05)
-        self.cart = CartManager(self.page)
-        self.checkout = CheckoutManager(self.page, auto_purchase=self.auto_purchase)
+        self.cart = CartManager(self.page, modal_wait=self.modal_wait)
+        self.checkout = CheckoutManager(self.page, auto_purchase=self.auto_purchase, latency=self.latency)
         
         # Get product info
-        info = self.product_monitor.get_product_info()
+        info = self.product_monitor.get_product_info(budget=0.5)
         if info['title']:
             log_success(f"Product: {info['title']}")
         if info['price']:
@@ -178,7 +238,7 @@ class LazadaStoreSniper:
         
         # Add to cart
         log_info("\n🛒 Adding to cart...")
-        if not self.cart.add_to_cart_with_retry():
+        if not self.cart.add_to_cart_with_retry(max_attempts=BOT_CONFIG.get('max_retries', 3)):
             log_error("❌ Failed to add to cart!")
             return False
         
@@ -224,6 +284,9 @@ class LazadaStoreSniper:
             # Setup
             self.setup()
             
+            # Baseline the whole catalog while there is still time
+            self.store_monitor.bootstrap()
+            
             # Wait for listing time
             self.wait_for_listing_time()
             
@@ -251,7 +314,7 @@ class LazadaStoreSniper:
                         log_info("Closing browser...")
             
             return success
-            
+        
         except KeyboardInterrupt:
             log_warning("\n⚠️  Interrupted by user")
             return False
@@ -261,6 +324,9 @@ class LazadaStoreSniper:
             traceback.print_exc()
             return False
         finally:
+            self._stop_latency_sampler()
+            if self.seen_index is not None:
+                self.seen_index.close()
             if self.browser:
                 self.browser.close()
                 log_info("Browser closed")
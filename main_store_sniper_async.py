@@ -0,0 +1,303 @@
+"""
+Lazada Store Sniper - asyncio Entry Point
+=========================================
+
+Same flow as main_store_sniper.py, built on playwright.async_api.
+The NTP time sync runs while the browser launches.
+Uses uvloop when it is installed (pip install uvloop).
+
+⚠️  EDUCATIONAL PURPOSES ONLY
+May violate Terms of Service - Use at your own risk!
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from playwright.async_api import async_playwright
+
+from config.settings import BROWSER_CONFIG, BOT_CONFIG
+from bot.aio import (
+    AsyncProductMonitor, AsyncCartManager, AsyncCheckoutManager, AsyncStoreMonitor,
+    AsyncResourceBlocker, run
+)
+from bot.utils import (
+    log_success, log_error, log_info, log_warning,
+    wait_until_async
+)
+from bot.render_lite import render_lite_options, apply_render_lite_async
+from bot.seen_index import SeenIndex
+from main_store_sniper import LazadaStoreSniper
+
+
+class AsyncLazadaStoreSniper(LazadaStoreSniper):
+    """
+    Async store sniper. Same configuration as LazadaStoreSniper.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.playwright = None
+    
+    async def _launch_browser(self):
+        """Start Playwright and open the store tab"""
+        log_info("\n🌐 Launching browser...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=BROWSER_CONFIG.get('slow_mo', 0),
+            args=BROWSER_CONFIG.get('args', [])
+        )
+        self.page = await self.browser.new_page(**(render_lite_options() if self.render_lite else {}))
+        self.page.set_default_timeout(BROWSER_CONFIG['timeout'])
+        if self.render_lite:
+            await apply_render_lite_async(self.page, fonts=BROWSER_CONFIG.get('web_fonts', True))
+        if BOT_CONFIG.get('block_resources'):
+            self.blocker = await AsyncResourceBlocker(self.page, profile='monitor').attach()
+    
+    async def setup(self):
+        """Setup browser and components (clock calibration overlaps the launch)"""
+        print("\n" + "="*60)
+        print("🚀 LAZADA STORE SNIPER BOT (async)")
+        print("="*60)
+        log_info(f"📍 Store: {self.store_url}")
+        log_info(f"🔍 Keywords: {', '.join(self.product_keywords)}")
+        log_info(f"⏰ Start time: {self.listing_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        log_info(f"🔄 Check interval: {self.check_interval}s")
+        print("="*60)
+        
+        loop = asyncio.get_running_loop()
+        self.clock, self.latency, _ = await asyncio.gather(
+            loop.run_in_executor(None, self._schedule_clock),
+            loop.run_in_executor(None, self._start_latency_sampler),
+            self._launch_browser()
+        )
+        current_time = self.clock.now()
+        
+        if self.listing_time <= current_time:
+            log_warning("⚠️  Start time is in the past - starting immediately!")
+        else:
+            time_until = (self.listing_time - current_time).total_seconds()
+            log_info(f"⏳ Time until start: {time_until/60:.1f} minutes")
+        
+        self.seen_index = SeenIndex(self.store_url)
+        self.store_monitor = AsyncStoreMonitor(
+            self.page,
+            self.store_url,
+            self.product_keywords,
+            check_interval=self.check_interval,
+            detection_mode='network',  # Catalog JSON first, DOM scan as fallback
+            seen_index=self.seen_index
+        )
+        
+        log_success("✅ Setup complete!\n")
+    
+    async def wait_for_listing_time(self):
+        """Wait until listing time"""
+        if self.listing_time > self.clock.now():
+            log_info("⏰ Waiting for start time...")
+            await wait_until_async(self.listing_time, pre_load_seconds=0, clock=self.clock,
+                                   trigger=self.trigger, lead=self._trigger_lead())
+            self.trigger.log_stats()
+        else:
+            log_info("🎯 Starting immediately (start time already passed)")
+    
+    async def find_product(self) -> str:
+        """
+        Monitor store and find product URL.
+        
+        Returns:
+            str: Product URL
+        """
+        log_info("🔍 Starting store monitoring...\n")
+        
+        await self.store_monitor.load_store_page()
+        product_url = await self.store_monitor.wait_for_product(max_wait=300)
+        
+        if not product_url:
+            raise Exception("❌ Product not found within timeout!")
+        
+        return product_url
+    
+    async def snipe_product(self, product_url: str) -> bool:
+        """
+        Snipe the found product.
+        
+        Args:
+            product_url: URL of product to snipe
+        
+        Returns:
+            bool: Success
+        """
+        print("\n" + "="*60)
+        log_info(f"🎯 SNIPING PRODUCT")
+        log_info(f"📍 URL: {product_url}")
+        print("="*60 + "\n")
+        
+        if self.blocker:
+            self.blocker.log_stats()
+            self.blocker.use('checkout')
+        
+        log_info("📄 Loading product page...")
+        await self.page.goto(product_url, wait_until="domcontentloaded")
+        
+        self.product_monitor = AsyncProductMonitor(self.page, check_interval=0.05)
+        self.cart = AsyncCartManager(self.page, modal_wait=self.modal_wait)
+        self.checkout = AsyncCheckoutManager(self.page, auto_purchase=self.auto_purchase, latency=self.latency)
+        
+        info = await self.product_monitor.get_product_info(budget=0.5)
+        if info['title']:
+            log_success(f"Product: {info['title']}")
+        if info['price']:
+            log_info(f"Price: {info['price']}")
+        
+        if not await self.product_monitor.is_product_available():
+            log_error("❌ Product not available for purchase!")
+            log_warning("Possible reasons:")
+            log_warning("  - Product sold out")
+            log_warning("  - Need to select size/variant first")
+            log_warning("  - Page hasn't fully loaded")
+            return False
+        
+        log_success("✅ Product is available!")
+        
+        log_info("\n🛒 Adding to cart...")
+        if not await self.cart.add_to_cart_with_retry(max_attempts=BOT_CONFIG.get('max_retries', 3)):
+            log_error("❌ Failed to add to cart!")
+            return False
+        
+        log_info("🛒 Navigating to cart...")
+        if not await self.cart.go_to_cart():
+            log_error("❌ Failed to navigate to cart!")
+            return False
+        
+        log_info("💳 Proceeding to checkout...")
+        if not await self.checkout.proceed_to_checkout():
+            log_error("❌ Failed to proceed to checkout!")
+            return False
+        
+        await self.checkout.verify_shipping_address()
+        
+        summary = await self.checkout.get_order_summary()
+        if summary['total']:
+            print("\n" + "="*60)
+            print("💰 ORDER SUMMARY")
+            print("="*60)
+            print(f"Total: {summary['total']}")
+            print("="*60 + "\n")
+        
+        if self.auto_purchase:
+            log_warning("⚠️  Auto-purchase is ENABLED!")
+            return await self.checkout.complete_purchase()
+        else:
+            log_info("✅ Ready for checkout!")
+            log_info("💡 AUTO_PURCHASE is disabled - complete manually")
+            log_info("🖱️  Click 'Place Order' in the browser when ready")
+            return True
+    
+    async def run(self):
+        """Main execution"""
+        try:
+            self.overall_timer.start()
+            
+            await self.setup()
+            await self.store_monitor.bootstrap()
+            await self.wait_for_listing_time()
+            
+            product_url = await self.find_product()
+            success = await self.snipe_product(product_url)
+            
+            if success:
+                elapsed = self.overall_timer.elapsed()
+                print("\n" + "="*60)
+                print("🎉 SNIPER BOT COMPLETED SUCCESSFULLY!")
+                print("="*60)
+                print(f"⏱️  Total time: {elapsed:.2f} seconds")
+                print("="*60 + "\n")
+                
+                if not self.auto_purchase:
+                    log_info("Browser will stay open for manual completion")
+                    log_info("Press Ctrl+C when done")
+                    await asyncio.Event().wait()  # Keep browser open
+            
+            return success
+        
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            log_warning("\n⚠️  Interrupted by user")
+            return False
+        except Exception as e:
+            log_error(f"❌ Critical error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        finally:
+            self._stop_latency_sampler()
+            if self.seen_index is not None:
+                self.seen_index.close()
+            if self.browser:
+                await self.browser.close()
+                log_info("Browser closed")
+            if self.playwright:
+                await self.playwright.stop()
+
+
+def main():
+    """Main entry point"""
+    print("\n" + "="*60)
+    print("  LAZADA POKEMON STORE SNIPER (async)")
+    print("="*60)
+    print("\n⚠️  DISCLAIMER:")
+    print("This bot is for EDUCATIONAL purposes only!")
+    print("Using automation may violate Lazada's Terms of Service.")
+    print("Use at your own risk!\n")
+    print("="*60 + "\n")
+    
+    # ============================================
+    # CONFIGURATION (see main_store_sniper.py for options)
+    # ============================================
+    
+    STORE_URL = "https://www.lazada.sg/shop/pokemon-store-online-singapore"
+    PRODUCT_KEYWORDS = [
+        "tcg",
+        "trading card",
+        "booster",
+        "elite trainer",
+        "collection box",
+        "pokemon center original",
+    ]
+    LISTING_TIME = datetime.now()
+    CHECK_INTERVAL = 3.0
+    AUTO_PURCHASE = False  # Set to True to auto-complete purchase (DANGEROUS!)
+    HEADLESS = False       # Set to True to hide browser
+    USE_UVLOOP = True      # Ignored if uvloop is not installed
+    
+    # ============================================
+    # END CONFIGURATION
+    # ============================================
+    
+    if AUTO_PURCHASE:
+        log_warning("⚠️  AUTO_PURCHASE IS ENABLED!")
+        log_warning("⚠️  This will automatically complete purchases!")
+        response = input("Are you sure? Type 'YES' to continue: ")
+        if response != "YES":
+            log_info("Cancelled by user")
+            sys.exit(0)
+    
+    sniper = AsyncLazadaStoreSniper(
+        store_url=STORE_URL,
+        product_keywords=PRODUCT_KEYWORDS,
+        listing_time=LISTING_TIME,
+        auto_purchase=AUTO_PURCHASE,
+        headless=HEADLESS,
+        check_interval=CHECK_INTERVAL
+    )
+    
+    try:
+        success = run(sniper.run(), use_uvloop=USE_UVLOOP)
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        log_warning("\n👋 Goodbye!")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()